@@ -0,0 +1,41 @@
+-- 회원별 최신 위치 테이블 (member_location_log_t에서 회원별 GPS 시간이 가장 늦은 로그 1건)
+-- 그룹 멤버 지도(GET /group-members/member/{group_id})가 위치 로그 전체를 MAX(mlt_gps_time)로
+-- 집계하지 않고 이 테이블과 한 번 JOIN 하여 최신 위치를 가져옵니다.
+-- 위치 로그 저장 시 같은 트랜잭션에서 갱신되며(GPS 시간이 더 늦은 로그만 반영),
+-- 아래 INSERT ... SELECT로 기존 로그의 최신 위치를 한 번 채웁니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+CREATE TABLE IF NOT EXISTS member_last_position_t (
+    mt_idx INT NOT NULL COMMENT '회원 인덱스',
+    mlp_lat DECIMAL(16,14) NULL COMMENT '위도',
+    mlp_long DECIMAL(17,14) NULL COMMENT '경도',
+    mlp_accuacy FLOAT NULL COMMENT '위치값(수평 정확도)',
+    mlp_speed FLOAT NULL COMMENT '속도(m/s)',
+    mlp_battery SMALLINT NULL COMMENT '배터리',
+    mlp_gps_time DATETIME NOT NULL COMMENT 'GPS 시간',
+    mlp_udate DATETIME NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
+
+    PRIMARY KEY (mt_idx)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='회원별 최신 위치';
+
+-- 기존 로그로 초기 데이터 채우기 (같은 GPS 시간의 로그가 여러 건이면 mlt_idx가 가장 큰 로그)
+INSERT INTO member_last_position_t (mt_idx, mlp_lat, mlp_long, mlp_accuacy, mlp_speed, mlp_battery, mlp_gps_time)
+SELECT mll.mt_idx, mll.mlt_lat, mll.mlt_long, mll.mlt_accuacy, mll.mlt_speed, mll.mlt_battery, mll.mlt_gps_time
+FROM member_location_log_t mll
+INNER JOIN (
+    SELECT mt_idx, MAX(mlt_gps_time) AS max_time
+    FROM member_location_log_t
+    WHERE mlt_gps_time IS NOT NULL
+    GROUP BY mt_idx
+) latest ON mll.mt_idx = latest.mt_idx AND mll.mlt_gps_time = latest.max_time
+ORDER BY mll.mlt_idx
+ON DUPLICATE KEY UPDATE
+    mlp_lat = VALUES(mlp_lat),
+    mlp_long = VALUES(mlp_long),
+    mlp_accuacy = VALUES(mlp_accuacy),
+    mlp_speed = VALUES(mlp_speed),
+    mlp_battery = VALUES(mlp_battery),
+    mlp_gps_time = VALUES(mlp_gps_time);
+
+-- 확인
+SELECT COUNT(*) AS members_with_position FROM member_last_position_t;
@@ -0,0 +1,39 @@
+-- 회원별 일일 위치 로그 요약 테이블 (member_location_log_t 롤업)
+-- 위치 로그 수집 시 증분 갱신되며, 과거 데이터는 backfill로 채웁니다.
+--   python -m app.crud.location_daily_summary --start 2025-01-01 --end 2025-12-31
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+CREATE TABLE IF NOT EXISTS member_location_daily_summary_t (
+    mt_idx INT NOT NULL COMMENT '회원 인덱스',
+    mlds_date DATE NOT NULL COMMENT '요약 날짜 (GPS 시간 기준)',
+
+    mlds_point_count INT NOT NULL DEFAULT 0 COMMENT '위치 로그 수',
+    mlds_first_time DATETIME NULL COMMENT '첫 GPS 시간',
+    mlds_last_time DATETIME NULL COMMENT '마지막 GPS 시간',
+    mlds_path_km DOUBLE NOT NULL DEFAULT 0 COMMENT '전체 경로 거리(km)',
+    mlds_moving_meters DOUBLE NOT NULL DEFAULT 0 COMMENT '이동 거리(m, 속도 필터 적용)',
+    mlds_moving_seconds INT NOT NULL DEFAULT 0 COMMENT '이동 시간(초, 속도 필터 적용)',
+    mlds_stay_count INT NOT NULL DEFAULT 0 COMMENT '체류 횟수',
+    mlds_step_count INT NOT NULL DEFAULT 0 COMMENT '걸음수 기록 수',
+    mlds_min_steps INT NULL COMMENT '최소 걸음수',
+    mlds_max_steps INT NULL COMMENT '최대 걸음수',
+    mlds_last_steps INT NULL COMMENT '마지막 걸음수',
+    mlds_battery_count INT NOT NULL DEFAULT 0 COMMENT '배터리 기록 수',
+    mlds_first_battery SMALLINT NULL COMMENT '첫 배터리',
+    mlds_last_battery SMALLINT NULL COMMENT '마지막 배터리',
+
+    mlds_last_lat DECIMAL(16,14) NULL COMMENT '마지막 로그 위도',
+    mlds_last_long DECIMAL(17,14) NULL COMMENT '마지막 로그 경도',
+    mlds_move_time DATETIME NULL COMMENT '이동거리 계산 대상 마지막 로그 시간',
+    mlds_move_lat DECIMAL(16,14) NULL COMMENT '이동거리 계산 대상 마지막 로그 위도',
+    mlds_move_long DECIMAL(17,14) NULL COMMENT '이동거리 계산 대상 마지막 로그 경도',
+    mlds_stay_label ENUM('stay','move') NULL COMMENT '체류 계산 대상 마지막 로그 구분',
+    mlds_stay_start DATETIME NULL COMMENT '현재 체류 구간 시작 시간',
+    mlds_stay_counted ENUM('Y','N') NULL DEFAULT 'N' COMMENT '현재 체류 구간 집계 여부',
+
+    mlds_rebuild ENUM('Y','N') NOT NULL DEFAULT 'N' COMMENT '재계산 필요 여부 (순서가 어긋난 로그 수신 시)',
+    mlds_udate DATETIME NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
+
+    PRIMARY KEY (mt_idx, mlds_date),
+    KEY idx_mlds_rebuild (mlds_rebuild, mlds_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='회원별 일일 위치 로그 요약';
@@ -0,0 +1,13 @@
+-- 위치 로그 기간 조회용 복합 인덱스 (member_location_log_t)
+-- /daily-counts, /daily-counts-simple, /member-activity 등은 회원 목록 + GPS 시간 범위
+--   (mt_idx IN (...) AND mlt_gps_time >= :start AND mlt_gps_time < :end)로 조회합니다.
+-- InnoDB 보조 인덱스에는 기본 키(mlt_idx)가 포함되므로, COUNT(*)/MIN/MAX(mlt_gps_time) 집계는
+-- 테이블 행을 읽지 않고 이 인덱스만으로 처리됩니다 (EXPLAIN Extra: Using index).
+-- 적용 전후 실행 계획과 응답 시간 비교:
+--   python -m benchmarks.location_log_ranges --group-id <그룹 ID> --days 14
+-- 대용량 테이블은 온라인 DDL(ALGORITHM=INPLACE, LOCK=NONE)로 쓰기를 막지 않고 생성합니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+ALTER TABLE member_location_log_t
+    ADD INDEX idx_mlt_mt_idx_gps_time (mt_idx, mlt_gps_time),
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,59 @@
+-- 위치 로그 테이블 월별 RANGE 파티션 (member_location_log_t)
+-- 모든 기간의 위치 로그가 한 테이블에 쌓여 월이 지날수록 기간 조회가 느려지므로,
+-- GPS 시간(mlt_gps_time) 기준 월별 파티션(pYYYYMM)으로 나눠 기간 조회가 해당 월 파티션만 읽도록 합니다.
+--
+-- - MySQL 파티션 테이블은 모든 PRIMARY/UNIQUE 키에 파티션 컬럼이 포함되어야 하므로
+--   기본 키를 (mlt_idx, mlt_gps_time)으로 변경합니다. (mlt_idx AUTO_INCREMENT는 그대로 유지)
+-- - 파티션 경계는 TO_DAYS(해당 월 다음 달 1일) 값이며, 주석에 날짜를 함께 적었습니다.
+-- - 이후 파티션은 스케줄러 작업(maintain_location_log_partitions, 매일 03:30)이
+--   pmax를 나눠 LOCATION_LOG_PARTITION_MONTHS_AHEAD개월 앞까지 미리 생성합니다.
+-- - LOCATION_LOG_RETENTION_MONTHS를 설정하면 보관 기간이 지난 파티션을
+--   LOCATION_LOG_ARCHIVE_DIR에 gzip JSONL로 보관한 뒤 DROP PARTITION으로 삭제합니다.
+--   (일별 카운트/요약은 member_location_daily_summary_t에 남으므로 달력/요약 화면은 유지됩니다)
+-- 수동 확인:
+--   python -m app.services.location_partition_service --dry-run
+--
+-- 테이블 전체를 다시 쓰는 작업이므로 대용량 운영 DB에서는 점검 시간에 실행하거나
+-- pt-online-schema-change / gh-ost 등 온라인 스키마 변경 도구 사용을 권장합니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+ALTER TABLE member_location_log_t
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (mlt_idx, mlt_gps_time);
+
+ALTER TABLE member_location_log_t
+PARTITION BY RANGE (TO_DAYS(mlt_gps_time)) (
+    PARTITION p_before VALUES LESS THAN (739617),  -- 2025-01-01 이전 전체
+    PARTITION p202501 VALUES LESS THAN (739648),  -- < 2025-02-01
+    PARTITION p202502 VALUES LESS THAN (739676),  -- < 2025-03-01
+    PARTITION p202503 VALUES LESS THAN (739707),  -- < 2025-04-01
+    PARTITION p202504 VALUES LESS THAN (739737),  -- < 2025-05-01
+    PARTITION p202505 VALUES LESS THAN (739768),  -- < 2025-06-01
+    PARTITION p202506 VALUES LESS THAN (739798),  -- < 2025-07-01
+    PARTITION p202507 VALUES LESS THAN (739829),  -- < 2025-08-01
+    PARTITION p202508 VALUES LESS THAN (739860),  -- < 2025-09-01
+    PARTITION p202509 VALUES LESS THAN (739890),  -- < 2025-10-01
+    PARTITION p202510 VALUES LESS THAN (739921),  -- < 2025-11-01
+    PARTITION p202511 VALUES LESS THAN (739951),  -- < 2025-12-01
+    PARTITION p202512 VALUES LESS THAN (739982),  -- < 2026-01-01
+    PARTITION p202601 VALUES LESS THAN (740013),  -- < 2026-02-01
+    PARTITION p202602 VALUES LESS THAN (740041),  -- < 2026-03-01
+    PARTITION p202603 VALUES LESS THAN (740072),  -- < 2026-04-01
+    PARTITION p202604 VALUES LESS THAN (740102),  -- < 2026-05-01
+    PARTITION p202605 VALUES LESS THAN (740133),  -- < 2026-06-01
+    PARTITION p202606 VALUES LESS THAN (740163),  -- < 2026-07-01
+    PARTITION p202607 VALUES LESS THAN (740194),  -- < 2026-08-01
+    PARTITION p202608 VALUES LESS THAN (740225),  -- < 2026-09-01
+    PARTITION p202609 VALUES LESS THAN (740255),  -- < 2026-10-01
+    PARTITION p202610 VALUES LESS THAN (740286),  -- < 2026-11-01
+    PARTITION p202611 VALUES LESS THAN (740316),  -- < 2026-12-01
+    PARTITION p202612 VALUES LESS THAN (740347),  -- < 2027-01-01
+    PARTITION p202701 VALUES LESS THAN (740378),  -- < 2027-02-01
+    PARTITION pmax VALUES LESS THAN MAXVALUE
+);
+
+-- 확인
+SELECT partition_name, partition_description, table_rows
+FROM information_schema.partitions
+WHERE table_schema = DATABASE() AND table_name = 'member_location_log_t'
+ORDER BY partition_ordinal_position;
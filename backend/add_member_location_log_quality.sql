@@ -0,0 +1,16 @@
+-- 위치 로그 GPS 품질 플래그 (member_location_log_t.mlt_quality)
+-- 수집 시 회원별 직전 정상 위치와 비교해 한 번만 판정하여 저장합니다. (app/services/location_quality.py)
+--   0: 정상, 1: 저정확도(정확도 없음 또는 LOCATION_FILTER_MAX_ACCURACY 초과),
+--   2: 튐(직전 정상 위치에서 LOCATION_FILTER_MAX_SPEED_KMH보다 빠르게 이동해야 닿는 위치), 4: 좌표 없음
+-- 이동거리/체류/지도 마커 조회는 mt_idx = ? AND mlt_quality = 0 AND mlt_gps_time 범위로
+-- 아래 인덱스를 타고 정상 로그만 읽습니다.
+-- 컬럼 추가 전 로그는 0(정상)으로 채워지며, 필요하면 기간을 정해 다시 판정합니다:
+--   python -m app.services.location_quality --start 2025-01-01 --end 2025-01-31
+-- 대용량 테이블은 온라인 DDL(ALGORITHM=INPLACE, LOCK=NONE)로 쓰기를 막지 않고 적용합니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+ALTER TABLE member_location_log_t
+    ADD COLUMN mlt_quality TINYINT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'GPS 품질 플래그 (0: 정상, 1: 저정확도, 2: 튐, 4: 좌표 없음)' AFTER stay_long,
+    ADD INDEX idx_mlt_mt_idx_quality_gps_time (mt_idx, mlt_quality, mlt_gps_time),
+    ALGORITHM=INPLACE, LOCK=NONE;
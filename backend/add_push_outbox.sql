@@ -0,0 +1,27 @@
+-- 푸시 전송 대기열 (outbox) 테이블
+-- 스케줄러/API는 행만 추가하고, push_outbox_service 워커가 일괄 전송 후 push_log_t에 기록합니다.
+-- 일시적 오류는 지수 백오프로 재시도하며, 재시도 한도 초과 또는 토큰 무효 시 dead 상태로 보관합니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+CREATE TABLE IF NOT EXISTS push_outbox_t (
+    pot_idx INT NOT NULL AUTO_INCREMENT COMMENT '대기열 인덱스',
+    mt_idx INT NULL COMMENT '수신 회원 인덱스',
+    sst_idx INT NULL COMMENT '관련 일정/장소 인덱스',
+    pot_token VARCHAR(255) NULL COMMENT 'FCM 토큰',
+    pot_title VARCHAR(100) NULL COMMENT '푸시 제목',
+    pot_content VARCHAR(500) NULL COMMENT '푸시 내용',
+    pot_condition VARCHAR(50) NULL COMMENT 'push_log_t.plt_condition',
+    pot_memo VARCHAR(50) NULL COMMENT 'push_log_t.plt_memo',
+    pot_json TEXT NULL COMMENT 'push_log_t.push_json',
+    pot_status ENUM('pending','sending','sent','dead') NOT NULL DEFAULT 'pending' COMMENT '전송 상태',
+    pot_attempts SMALLINT NOT NULL DEFAULT 0 COMMENT '전송 시도 횟수',
+    pot_next_attempt_at DATETIME NOT NULL COMMENT '다음 전송 시도 시각',
+    pot_claimed_at DATETIME NULL COMMENT '워커가 가져간 시각',
+    pot_last_error VARCHAR(255) NULL COMMENT '마지막 전송 오류',
+    pot_wdate DATETIME NULL COMMENT '등록일시',
+    pot_sdate DATETIME NULL COMMENT '전송 완료(또는 dead 처리) 일시',
+
+    PRIMARY KEY (pot_idx),
+    KEY idx_pot_status_next (pot_status, pot_next_attempt_at),
+    KEY idx_pot_mt_idx (mt_idx)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='푸시 전송 대기열';
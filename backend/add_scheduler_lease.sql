@@ -0,0 +1,14 @@
+-- 스케줄러 리더 선출용 임대(lease) 테이블
+-- 여러 API 워커 중 임대를 가진 1개 워커만 스케줄 작업을 실행합니다.
+-- 임대는 주기적으로 갱신하며, 만료되면(워커 중단) 다른 워커가 가져갑니다.
+-- 작업 저장소 테이블(apscheduler_jobs)은 스케줄러 시작 시 자동 생성됩니다.
+-- 실행 전 반드시 데이터베이스 백업을 수행하세요!
+
+CREATE TABLE IF NOT EXISTS scheduler_lease_t (
+    sls_name VARCHAR(50) NOT NULL COMMENT '임대 이름',
+    sls_owner VARCHAR(100) NOT NULL COMMENT '임대 보유 워커 (호스트:PID:ID)',
+    sls_expires_at DATETIME NOT NULL COMMENT '임대 만료 시각 (DB 시각 기준)',
+    sls_udate DATETIME NULL COMMENT '마지막 갱신일시',
+
+    PRIMARY KEY (sls_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='스케줄러 리더 임대';
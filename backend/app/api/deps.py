@@ -1 +1 @@
-from app.db.session import get_db 
\ No newline at end of file
+from app.db.session import get_db, get_async_db
\ No newline at end of file
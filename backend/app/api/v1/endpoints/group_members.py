@@ -1,8 +1,15 @@
-from typing import List, Optional
+import asyncio
+import json
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.api import deps
+from app.core.config import settings
+from app.crud.crud_auth import get_current_member
+from app.db.session import AsyncSessionLocal
+from app.services.location_stream import location_stream_hub
 from app.models.member import Member
 from app.models.group_detail import GroupDetail
 from app.schemas.member import MemberResponse
@@ -21,10 +28,9 @@ def get_group_members(
     그룹에 속한 멤버 목록과 그룹 상세 정보, 최신 위치 정보를 조회합니다.
     """
     try:
-        logger.info(f"📋 [GET_GROUP_MEMBERS] 그룹 멤버 조회 시작 - group_id: {group_id}")
-        
-        # 1단계: 그룹 멤버 기본 정보 조회 (빠른 쿼리)
-        basic_query = text("""
+        # 그룹 멤버 기본 정보와 최신 위치를 한 번에 조회
+        # (최신 위치는 위치 로그 저장 시 갱신되는 member_last_position_t에서 PK로 JOIN)
+        members_query = text("""
             SELECT 
                 sgd.sgdt_idx,
                 sgd.sgt_idx,
@@ -41,9 +47,15 @@ def get_group_members(
                 m.mt_weather_tmn,
                 m.mt_weather_tmx,
                 m.mt_weather_sky,
-                m.mt_weather_date
+                m.mt_weather_date,
+                mlp.mlp_lat,
+                mlp.mlp_long,
+                mlp.mlp_speed,
+                mlp.mlp_battery,
+                mlp.mlp_gps_time
             FROM smap_group_detail_t sgd
             JOIN member_t m ON sgd.mt_idx = m.mt_idx
+            LEFT JOIN member_last_position_t mlp ON mlp.mt_idx = sgd.mt_idx
             WHERE sgd.sgt_idx = :group_id 
                 AND sgd.sgdt_show = 'Y'
                 AND sgd.sgdt_discharge = 'N'
@@ -55,51 +67,11 @@ def get_group_members(
                 m.mt_name
         """)
         
-        basic_result = db.execute(basic_query, {"group_id": group_id}).fetchall()
-        logger.info(f"📊 [GET_GROUP_MEMBERS] 기본 정보 조회 완료 - 멤버 수: {len(basic_result)}")
-        
-        # 2단계: 모든 멤버의 최신 위치 정보를 한 번에 조회 (더 효율적)
-        member_ids = [row.mt_idx for row in basic_result]
-        location_data = {}
+        basic_result = db.execute(members_query, {"group_id": group_id}).fetchall()
         
-        if member_ids:
-            # IN 절을 사용하여 한 번에 모든 멤버의 최신 위치 조회
-            location_query = text("""
-                SELECT DISTINCT
-                    mll1.mt_idx,
-                    mll1.mlt_lat,
-                    mll1.mlt_long,
-                    mll1.mlt_speed,
-                    mll1.mlt_battery,
-                    mll1.mlt_gps_time
-                FROM member_location_log_t mll1
-                INNER JOIN (
-                    SELECT mt_idx, MAX(mlt_gps_time) as max_time
-                    FROM member_location_log_t
-                    WHERE mt_idx IN :member_ids 
-                        AND mlt_gps_time IS NOT NULL
-                    GROUP BY mt_idx
-                ) mll2 ON mll1.mt_idx = mll2.mt_idx AND mll1.mlt_gps_time = mll2.max_time
-            """)
-            
-            location_results = db.execute(location_query, {"member_ids": tuple(member_ids)}).fetchall()
-            
-            # 위치 데이터를 딕셔너리로 변환
-            for loc in location_results:
-                location_data[loc.mt_idx] = {
-                    "mlt_lat": float(loc.mlt_lat) if loc.mlt_lat else None,
-                    "mlt_long": float(loc.mlt_long) if loc.mlt_long else None,
-                    "mlt_speed": float(loc.mlt_speed) if loc.mlt_speed else None,
-                    "mlt_battery": int(loc.mlt_battery) if loc.mlt_battery else None,
-                    "mlt_gps_time": str(loc.mlt_gps_time) if loc.mlt_gps_time else None,
-                }
-        
-        # 3단계: 결과 데이터 조합
+        # 결과 데이터 조합
         members = []
         for row in basic_result:
-            # 해당 멤버의 위치 정보 가져오기
-            location_info = location_data.get(row.mt_idx, {})
-            
             member_data = {
                 # 그룹 상세 정보
                 "sgdt_idx": row.sgdt_idx,
@@ -122,11 +94,11 @@ def get_group_members(
                 "mt_weather_date": row.mt_weather_date,
                 
                 # 최신 위치 정보
-                "mlt_lat": location_info.get("mlt_lat"),
-                "mlt_long": location_info.get("mlt_long"),
-                "mlt_speed": location_info.get("mlt_speed"),
-                "mlt_battery": location_info.get("mlt_battery"),
-                "mlt_gps_time": location_info.get("mlt_gps_time"),
+                "mlt_lat": float(row.mlp_lat) if row.mlp_lat else None,
+                "mlt_long": float(row.mlp_long) if row.mlp_long else None,
+                "mlt_speed": float(row.mlp_speed) if row.mlp_speed else None,
+                "mlt_battery": int(row.mlp_battery) if row.mlp_battery else None,
+                "mlt_gps_time": str(row.mlp_gps_time) if row.mlp_gps_time else None,
                 
                 # 호환성을 위한 추가 필드
                 "id": str(row.mt_idx),
@@ -136,10 +108,8 @@ def get_group_members(
             }
             
             members.append(member_data)
-            
-            logger.info(f"👤 [GET_GROUP_MEMBERS] 멤버 정보 - ID: {row.mt_idx}, 이름: {row.mt_name}, 권한: O={row.sgdt_owner_chk}/L={row.sgdt_leader_chk}")
         
-        logger.info(f"✅ [GET_GROUP_MEMBERS] 그룹 멤버 조회 완료 - 총 {len(members)}명")
+        logger.debug(f"✅ [GET_GROUP_MEMBERS] 그룹 멤버 조회 완료 - group_id: {group_id}, 총 {len(members)}명")
         return members
         
     except Exception as e:
@@ -217,4 +187,102 @@ def remove_member_from_group(
     db.add(group_detail)
     db.commit()
     
-    return {"success": True, "message": "Member removed from group successfully"} 
\ No newline at end of file
+    return {"success": True, "message": "Member removed from group successfully"} 
+
+_STREAM_MEMBER_IDS_SQL = text("""
+    SELECT DISTINCT sgd.mt_idx
+    FROM smap_group_detail_t sgd
+    JOIN member_t m ON sgd.mt_idx = m.mt_idx
+    WHERE sgd.sgt_idx = :group_id
+        AND sgd.sgdt_show = 'Y'
+        AND sgd.sgdt_discharge = 'N'
+        AND sgd.sgdt_exit = 'N'
+        AND m.mt_status = 1
+""")
+
+_STREAM_SNAPSHOT_SQL = text("""
+    SELECT mt_idx, mlp_lat, mlp_long, mlp_speed, mlp_battery, mlp_gps_time
+    FROM member_last_position_t
+    WHERE mt_idx IN :member_ids
+""")
+
+
+async def _load_stream_member_ids(group_id: int) -> List[int]:
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(_STREAM_MEMBER_IDS_SQL, {"group_id": group_id})).fetchall()
+    return [row.mt_idx for row in rows]
+
+
+async def _load_stream_snapshot(member_ids: List[int]) -> List[Dict]:
+    """멤버들의 최신 위치 (GET /member/{group_id}와 같은 필드 형식)"""
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(_STREAM_SNAPSHOT_SQL, {"member_ids": tuple(member_ids)})).fetchall()
+    return [
+        {
+            "mt_idx": row.mt_idx,
+            "mlt_lat": float(row.mlp_lat) if row.mlp_lat else None,
+            "mlt_long": float(row.mlp_long) if row.mlp_long else None,
+            "mlt_speed": float(row.mlp_speed) if row.mlp_speed else None,
+            "mlt_battery": int(row.mlp_battery) if row.mlp_battery else None,
+            "mlt_gps_time": str(row.mlp_gps_time) if row.mlp_gps_time else None
+        }
+        for row in rows
+    ]
+
+
+def _sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("/stream/{group_id}")
+async def stream_group_member_locations(
+    group_id: int,
+    current_member: Member = Depends(get_current_member)
+):
+    """
+    그룹 멤버 실시간 위치 스트림 (Server-Sent Events)
+
+    - 연결 직후 `snapshot` 이벤트로 멤버들의 최신 위치 목록을 보내고,
+      이후 위치 로그가 저장될 때마다 `positions` 이벤트로 위치가 바뀐 멤버만 보냅니다.
+    - 클라이언트가 느리면 멤버별 최신 위치 1건으로 합쳐 보냅니다.
+    - 새 위치가 없으면 LOCATION_STREAM_HEARTBEAT초마다 keep-alive 주석을 보냅니다.
+    - Bearer 토큰이 필요하며, 그룹의 활성 멤버만 구독할 수 있습니다.
+    """
+    member_ids = await _load_stream_member_ids(group_id)
+    if current_member.mt_idx not in member_ids:
+        raise HTTPException(status_code=403, detail="그룹 멤버만 실시간 위치를 조회할 수 있습니다.")
+
+    # 구독을 먼저 등록한 뒤 스냅샷을 읽어, 그 사이에 저장된 위치도 놓치지 않도록 함
+    subscription = location_stream_hub.subscribe(group_id, member_ids)
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="Too many live location connections")
+    try:
+        snapshot = await _load_stream_snapshot(member_ids)
+    except Exception:
+        location_stream_hub.unsubscribe(subscription)
+        raise
+    subscription.seed(snapshot)
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        next_refresh = loop.time() + settings.LOCATION_STREAM_MEMBER_REFRESH
+        try:
+            yield "retry: 5000\n\n" + _sse_event("snapshot", snapshot)
+            while True:
+                batch = await subscription.next_batch(settings.LOCATION_STREAM_HEARTBEAT)
+                yield _sse_event("positions", batch) if batch else ": ping\n\n"
+
+                if loop.time() >= next_refresh:
+                    next_refresh = loop.time() + settings.LOCATION_STREAM_MEMBER_REFRESH
+                    try:
+                        location_stream_hub.update_members(subscription, await _load_stream_member_ids(group_id))
+                    except Exception as e:
+                        logger.warning(f"실시간 위치 스트림 멤버 재조회 실패 - group_id: {group_id}, {e}")
+        finally:
+            location_stream_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
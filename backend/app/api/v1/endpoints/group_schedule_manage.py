@@ -10,6 +10,7 @@ from app.models.group_detail import GroupDetail
 from app.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse
 from app.schemas.fcm_notification import FCMSendRequest
 from app.services.firebase_service import firebase_service
+from app.services.group_stats_service import group_stats_service
 from app.models.push_log import PushLog
 from datetime import datetime
 import logging
@@ -17,6 +18,12 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+
+def invalidate_schedule_stats(group_id: int, mt_idx: Optional[int]) -> None:
+    """raw SQL로 일정을 변경한 뒤 그룹 통계 캐시 무효화 (ORM 이벤트가 발생하지 않으므로 커밋 후 직접 호출)"""
+    group_stats_service.invalidate_group(group_id)
+    group_stats_service.invalidate_member(mt_idx)
+
 class GroupScheduleManager:
     """그룹 스케줄 관리 클래스"""
     
@@ -1275,6 +1282,8 @@ def create_group_schedule(
                 logger.warning(f"⚠️ [CREATE_SCHEDULE] 반복 일정 생성 실패: {e}")
                 # 반복 일정 생성 실패해도 메인 일정은 유지
         
+        invalidate_schedule_stats(group_id, target_member_id)
+        
         # 푸시 알림 전송 (생성자와 대상자가 다른 경우에만)
         try:
             logger.info(f"🔔 [CREATE_SCHEDULE] 푸시 알림 전송 시작 - editor_id: {editor_id}, editor_name: {editor_name}, target_member_id: {target_member_id}")
@@ -1604,6 +1613,7 @@ def update_group_schedule_with_repeat_option(
             updated_count = 1
         
         db.commit()
+        invalidate_schedule_stats(group_id, schedule_result.mt_idx)
         
         logger.info(f"✅ [UPDATE_REPEAT_SCHEDULE] 스케줄 수정 완료 - 수정된 개수: {updated_count}")
         
@@ -1949,6 +1959,7 @@ def delete_group_schedule_with_repeat_option(
             deleted_count = result.rowcount
         
         db.commit()
+        invalidate_schedule_stats(group_id, schedule_result.mt_idx)
         
         logger.info(f"✅ [DELETE_REPEAT_SCHEDULE] 스케줄 삭제 완료 - 삭제된 개수: {deleted_count}")
         
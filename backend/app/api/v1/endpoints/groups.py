@@ -13,6 +13,7 @@ from app.models.schedule import Schedule
 from app.models.location import Location
 from app.models.member import Member
 from app.schemas.group import GroupCreate, GroupUpdate, GroupResponse
+from app.services.group_stats_service import group_stats_service
 from app.core.config import settings
 from datetime import datetime, timedelta
 from app.models.enums import ShowEnum
@@ -438,118 +439,13 @@ def get_group_stats(
             logger.error(f"[GET_GROUP_STATS] 그룹을 찾을 수 없음 - group_id: {group_id}")
             raise HTTPException(status_code=404, detail="Group not found")
         
-        logger.info(f"[GET_GROUP_STATS] 그룹 정보 - sgt_title: {group.sgt_title}, sgt_show: {group.sgt_show}")
-        
-        # 그룹 멤버 목록 조회
-        group_members = db.query(GroupDetail).filter(
-            GroupDetail.sgt_idx == group_id,
-            GroupDetail.sgdt_exit == 'N',
-            GroupDetail.sgdt_show == 'Y'
-        ).all()
-        
-        member_ids = [gm.mt_idx for gm in group_members]
-        logger.info(f"[GET_GROUP_STATS] 그룹 멤버 수: {len(member_ids)}, 멤버 IDs: {member_ids}")
-        
-        if not member_ids:
+        # 멤버별 주간 일정/장소 수를 집계 쿼리 1회로 조회 (그룹별 짧은 TTL 캐시)
+        result = group_stats_service.get_stats(db, group)
+
+        if not result["member_stats"]:
             logger.warning(f"[GET_GROUP_STATS] 그룹에 멤버가 없음 - group_id: {group_id}")
-            return {
-                "group_id": group_id,
-                "group_title": group.sgt_title,
-                "member_count": 0,
-                "weekly_schedules": 0,
-                "total_locations": 0,
-                "member_stats": []
-            }
-        
-        # 1주일 전부터 현재까지의 날짜 범위
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=7)
-        
-        logger.info(f"[GET_GROUP_STATS] 조회 기간: {start_date} ~ {end_date}")
-        
-        # 각 멤버별 통계 데이터 수집
-        member_stats = []
-        total_weekly_schedules = 0
-        total_locations = 0
-        
-        for member_id in member_ids:
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 통계 조회 시작")
-            
-            # 멤버 정보 조회
-            member = db.query(Member).filter(Member.mt_idx == member_id).first()
-            if not member:
-                logger.warning(f"[GET_GROUP_STATS] 멤버 정보를 찾을 수 없음 - mt_idx: {member_id}")
-                continue
-            
-            # 1주일간 일정 개수 조회
-            weekly_schedules_query = db.query(func.count(Schedule.sst_idx)).filter(
-                Schedule.mt_idx == member_id,
-                Schedule.sst_show == 'Y',
-                Schedule.sst_sdate >= start_date,
-                Schedule.sst_sdate <= end_date
-            )
-            weekly_schedules = weekly_schedules_query.scalar() or 0
-            
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 주간 일정 쿼리: {weekly_schedules_query}")
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 주간 일정 개수: {weekly_schedules}")
-            
-            # 위치 데이터 개수 조회 (전체)
-            member_locations_query = db.query(func.count(Location.slt_idx)).filter(
-                Location.mt_idx == member_id,
-                Location.slt_show == 'Y'
-            )
-            member_locations = member_locations_query.scalar() or 0
-            
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 전체 위치 쿼리: {member_locations_query}")
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 전체 위치 개수: {member_locations}")
-            
-            # 이번 주 위치 데이터 개수
-            weekly_locations_query = db.query(func.count(Location.slt_idx)).filter(
-                Location.mt_idx == member_id,
-                Location.slt_show == 'Y',
-                Location.slt_wdate >= start_date,
-                Location.slt_wdate <= end_date
-            )
-            weekly_locations = weekly_locations_query.scalar() or 0
-            
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 주간 위치 쿼리: {weekly_locations_query}")
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member_id} 주간 위치 개수: {weekly_locations}")
-            
-            member_stat = {
-                "mt_idx": member_id,
-                "mt_name": member.mt_name or f"멤버 {member_id}",
-                "mt_nickname": member.mt_nickname or member.mt_name or f"멤버 {member_id}",
-                "weekly_schedules": weekly_schedules,
-                "total_locations": member_locations,
-                "weekly_locations": weekly_locations,
-                "is_owner": any(gm.sgdt_owner_chk == 'Y' for gm in group_members if gm.mt_idx == member_id),
-                "is_leader": any(gm.sgdt_leader_chk == 'Y' for gm in group_members if gm.mt_idx == member_id)
-            }
-            
-            member_stats.append(member_stat)
-            total_weekly_schedules += weekly_schedules
-            total_locations += member_locations
-            
-            logger.info(f"[GET_GROUP_STATS] 멤버 {member.mt_name}: 주간일정={weekly_schedules}, 전체위치={member_locations}, 주간위치={weekly_locations}")
-        
-        # 그룹 전체 통계
-        result = {
-            "group_id": group_id,
-            "group_title": group.sgt_title,
-            "member_count": len(member_stats),
-            "weekly_schedules": total_weekly_schedules,
-            "total_locations": total_locations,
-            "stats_period": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "days": 7
-            },
-            "member_stats": member_stats
-        }
-        
-        logger.info(f"[GET_GROUP_STATS] 통계 조회 완료 - 멤버수: {len(member_stats)}, 주간일정: {total_weekly_schedules}, 전체위치: {total_locations}")
-        logger.info(f"[GET_GROUP_STATS] 최종 결과: {result}")
-        
+        logger.info(f"[GET_GROUP_STATS] 통계 조회 완료 - 멤버수: {result['member_count']}, 주간일정: {result['weekly_schedules']}, 전체위치: {result['total_locations']}")
+
         return result
         
     except HTTPException:
@@ -1,12 +1,23 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.location import Location
 from app.schemas.location import LocationCreate, LocationUpdate, LocationResponse
+from app.services.group_stats_service import group_stats_service
 
 router = APIRouter()
 
+def _invalidate_location_stats(db: Session, location_id: int) -> None:
+    """raw SQL로 위치를 수정한 뒤 소유 회원의 그룹 통계 캐시 무효화 (ORM 이벤트가 발생하지 않음)"""
+    row = db.execute(
+        text("SELECT mt_idx FROM smap_location_t WHERE slt_idx = :location_id"),
+        {"location_id": location_id}
+    ).fetchone()
+    if row:
+        group_stats_service.invalidate_member(row[0])
+
 @router.get("/", response_model=List[LocationResponse])
 def get_locations(
     db: Session = Depends(deps.get_db),
@@ -139,6 +150,7 @@ def create_location(
         # SQL 실행
         result = db.execute(sql, params)
         db.commit()
+        group_stats_service.invalidate_member(params["mt_idx"])
         
         # 생성된 레코드 ID 가져오기 (MySQL/MariaDB 기준)
         if hasattr(result, 'lastrowid'):
@@ -209,6 +221,7 @@ def update_location_notification(
         
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Location not found")
+        _invalidate_location_stats(db, location_id)
         
         return {
             "success": True,
@@ -263,6 +276,7 @@ def update_location(
         
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Location not found")
+        _invalidate_location_stats(db, location_id)
         
         return {
             "success": True,
@@ -395,6 +409,7 @@ def create_member_location(
         # SQL 실행
         result = db.execute(sql, params)
         db.commit()
+        group_stats_service.invalidate_member(member_id)
         
         # 생성된 레코드 ID 가져오기
         if hasattr(result, 'lastrowid') and result.lastrowid:
@@ -1232,7 +1232,7 @@ async def test_ios_push_delivery(
                     )
                 )
 
-                response = messaging.send(message)
+                response = firebase_service._send_message(message, "test_direct")
                 logger.info(f"✅ [TEST DIRECT] Firebase Console 방식 테스트 완료: {response}")
             except messaging.UnregisteredError:
                 logger.warning(f"🚨 [TEST DIRECT] 토큰이 등록되지 않음: {member.mt_token_id[:30]}...")
@@ -1,9 +1,12 @@
 import traceback
 import logging
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Tuple
-from ....db.session import get_db
+from ....db.session import get_db, get_async_db
 from ....schemas.member_location_log import (
     MemberLocationLogCreate, 
     MemberLocationLogUpdate, 
@@ -17,7 +20,11 @@ from ....schemas.member_location_log import (
     LocationLogSummaryResponse
 )
 from ....crud import member_location_log as location_log_crud
+from ....crud import location_daily_summary as daily_summary_crud
+from ....services.location_ingest_service import location_ingest_service
 from ....core.config import settings
+from ....core.compact_encoding import compact_response, negotiate_format
+from ....core.trajectory import DEFAULT_SIMPLIFY_TOLERANCE_M
 import jwt
 
 router = APIRouter()
@@ -46,15 +53,69 @@ def _get_mt_idx_from_token(request: Request) -> Tuple[Optional[int], Optional[st
     except Exception as e:
         return None, f"토큰 검증 실패: {str(e)}"
 
+def _simplify_params(body: dict, default_max_points: Optional[int] = None) -> Tuple[float, Optional[int]]:
+    """act 요청의 경로 단순화 파라미터 검증 (GET 조회의 tolerance ge=0, max_points ge=2와 동일)"""
+    try:
+        tolerance = float(body.get("tolerance", DEFAULT_SIMPLIFY_TOLERANCE_M))
+        max_points = body.get("max_points", default_max_points)
+        if max_points is not None:
+            if isinstance(max_points, float) and not max_points.is_integer():
+                raise ValueError(max_points)
+            max_points = int(max_points)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="tolerance must be a number and max_points an integer")
+    if not tolerance >= 0:
+        raise HTTPException(status_code=400, detail="tolerance must be >= 0")
+    if max_points is not None and max_points < 2:
+        raise HTTPException(status_code=400, detail="max_points must be >= 2")
+    return tolerance, max_points
+
+def _build_batch_log(mt_idx: int, body: dict, item: dict) -> MemberLocationLogCreate:
+    """배치 항목(mlt_gps_data 요소)을 위치 로그 생성 스키마로 변환 및 검증"""
+    single = {
+        "act": "create_location_log",  # 내부 검증용
+        "mt_idx": mt_idx,
+        "mlt_lat": item.get("mlt_lat"),
+        "mlt_long": item.get("mlt_long"),
+        "mlt_accuacy": item.get("mlt_accuracy") or item.get("mlt_accuacy"),  # 스키마에 맞게 mlt_accuacy 사용
+        "mlt_speed": item.get("mlt_speed"),
+        "mlt_altitude": item.get("mlt_altitude"),
+        # iOS 배치 필드명 호환: mlt_timestamp → mlt_gps_time (스키마 호환성)
+        "mlt_gps_time": item.get("mlt_timestamp") or item.get("mlt_gps_time"),
+        "source": body.get("source", "ios-app"),
+        "mlt_location_chk": item.get("mlt_location_chk"),
+        "mlt_fine_location": item.get("mlt_fine_location"),
+        "mlt_battery": item.get("mlt_battery"),
+        "mt_health_work": item.get("mt_health_work"),
+    }
+    return MemberLocationLogCreate(**single)
+
+def _batch_log_dict(log: MemberLocationLogCreate, received_at: datetime) -> dict:
+    """
+    배치 저장 응답용 위치 로그 (단건 응답의 MemberLocationLog.to_dict()와 같은 키)
+
+    multi-row INSERT와 write-behind 수집기는 생성된 mlt_idx를 돌려주지 않으므로 mlt_idx는 None,
+    mlt_wdate는 요청 수신 시각입니다.
+    """
+    return {"mlt_idx": None, **log.model_dump(mode="json"), "mlt_wdate": received_at.isoformat()}
+
 @router.post("/member-location-logs")
 async def handle_location_log_request(
     request: Request,
     db: Session = Depends(get_db)
 ):
-    """위치 로그 관련 요청 처리"""
+    """위치 로그 관련 요청 처리 (본문만 비동기로 읽고, 동기 세션을 쓰는 act 처리는 스레드풀에서 실행)"""
     # print("==== FastAPI /api/v1/member-location-logs 진입 ====")
     try:
         body = await request.json()
+    except Exception as e:
+        logger.error(f"Unexpected error in location log request: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return await run_in_threadpool(_handle_location_log_act, request, body, db)
+
+def _handle_location_log_act(request: Request, body: dict, db: Session):
+    """POST /member-location-logs act별 처리 (동기 DB 작업이 이벤트 루프를 막지 않도록 스레드풀에서 호출)"""
+    try:
         act = body.get("act")
         
         if not act:
@@ -115,13 +176,16 @@ async def handle_location_log_request(
                 
                 start_date = body.get("start_date")
                 end_date = body.get("end_date")
+                tolerance, max_points = _simplify_params(body)
                 
                 path_data = location_log_crud.get_location_path(
-                    db, mt_idx, start_date, end_date
+                    db, mt_idx, start_date, end_date, tolerance, max_points
                 )
                 
                 return {"result": "Y", "data": path_data.model_dump()}
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting location path: {str(e)}")
                 logger.error(traceback.format_exc())
@@ -146,35 +210,38 @@ async def handle_location_log_request(
                 if not consent:
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="위치 정보 수집 동의가 필요합니다.")
 
-                # 배치 전송 처리: mlt_gps_data 배열이 있으면 배치로 저장
+                # 배치 전송 처리: mlt_gps_data 배열이 있으면 전체를 먼저 검증한 뒤 한 번에 저장
                 if isinstance(body.get("mlt_gps_data"), list) and body.get("mlt_gps_data"):
-                    created = []
+                    valid_logs = []
                     errors = []
                     for idx, item in enumerate(body["mlt_gps_data"]):
                         try:
-                            single = {
-                                "act": "create_location_log",  # 내부 검증용
-                                "mt_idx": final_mt_idx,
-                                "mlt_lat": item.get("mlt_lat"),
-                                "mlt_long": item.get("mlt_long"),
-                                "mlt_accuacy": item.get("mlt_accuracy") or item.get("mlt_accuacy"),  # 스키마에 맞게 mlt_accuacy 사용
-                                "mlt_speed": item.get("mlt_speed"),
-                                "mlt_altitude": item.get("mlt_altitude"),
-                                # iOS 배치 필드명 호환: mlt_timestamp → mlt_gps_time (스키마 호환성)
-                                "mlt_gps_time": item.get("mlt_timestamp") or item.get("mlt_gps_time"),
-                                "source": body.get("source", "ios-app"),
-                                "mlt_location_chk": item.get("mlt_location_chk"),
-                                "mlt_fine_location": item.get("mlt_fine_location"),
-                                "mlt_battery": item.get("mlt_battery"),
-                                "mt_health_work": item.get("mt_health_work"),
-                            }
-                            log_data = MemberLocationLogCreate(**single)
-                            result = location_log_crud.create_location_log(db, log_data)
-                            created.append(result.to_dict())
+                            valid_logs.append((idx, _build_batch_log(final_mt_idx, body, item)))
                         except Exception as e:
                             logger.warning(f"Batch item {idx} failed: {str(e)}")
                             errors.append({"index": idx, "error": str(e)})
-                    return {"result": "Y" if created else "N", "created_count": len(created), "errors": errors, "data": created[:10]}
+
+                    created_count = 0
+                    queued = False
+                    if valid_logs and location_ingest_service.is_running():
+                        # write-behind 수집기에 위임하고 즉시 응답 (버퍼가 가득 차면 클라이언트가 재시도)
+                        if not location_ingest_service.submit([log for _, log in valid_logs]):
+                            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="위치 로그 수집 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+                        created_count = len(valid_logs)
+                        queued = True
+                    elif valid_logs:
+                        try:
+                            created_count = location_log_crud.create_location_logs_bulk(db, [log for _, log in valid_logs])
+                        except Exception as e:
+                            # 단일 트랜잭션이므로 저장 실패 시 검증을 통과한 항목 모두 실패 처리
+                            logger.error(f"Batch insert failed ({len(valid_logs)} items): {str(e)}")
+                            errors.extend({"index": idx, "error": str(e)} for idx, _ in valid_logs)
+                            errors.sort(key=lambda err: err["index"])
+                            valid_logs = []
+
+                    received_at = datetime.now()
+                    created = [_batch_log_dict(log, received_at) for _, log in valid_logs[:10]]
+                    return {"result": "Y" if created_count else "N", "created_count": created_count, "queued": queued, "errors": errors, "data": created}
 
                 # 단건 처리
                 # print(f"📍 [BACKEND] 위치 로그 생성 요청 수신 (단건):")
@@ -317,11 +384,22 @@ async def handle_location_log_request(
                 if not date:
                     raise HTTPException(status_code=400, detail="date is required (YYYY-MM-DD format)")
                 
-                path_data = location_log_crud.get_member_daily_location_path(db, mt_idx, date)
+                tolerance, max_points = _simplify_params(body)
+                compact_format = negotiate_format(request, body.get("format"))
+                if compact_format:
+                    path_data = location_log_crud.get_member_daily_location_path_compact(
+                        db, mt_idx, date, compact_format, tolerance, max_points
+                    )
+                    logger.info(f"Retrieved daily location path for member {mt_idx} on {date}: {path_data['points']['count']} points ({compact_format})")
+                    return compact_response(request, {"result": "Y", "data": path_data})
+                
+                path_data = location_log_crud.get_member_daily_location_path(db, mt_idx, date, tolerance, max_points)
                 
                 logger.info(f"Retrieved daily location path for member {mt_idx} on {date}: {len(path_data.points)} points")
                 return {"result": "Y", "data": path_data.model_dump()}
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting daily location path: {str(e)}")
                 logger.error(traceback.format_exc())
@@ -396,14 +474,26 @@ async def handle_location_log_request(
                 date = body.get("date")
                 min_speed = body.get("min_speed", 1.0)
                 max_accuracy = body.get("max_accuracy", 50.0)
+                tolerance, max_markers = _simplify_params(body, default_max_points=200)
                 
                 if not mt_idx:
                     raise HTTPException(status_code=400, detail="mt_idx is required")
                 if not date:
                     raise HTTPException(status_code=400, detail="date is required (YYYY-MM-DD format)")
                 
+                compact_format = negotiate_format(request, body.get("format"))
+                if compact_format:
+                    map_markers = location_log_crud.get_member_map_markers_compact(
+                        db, mt_idx, date, compact_format, min_speed, max_accuracy, tolerance, max_markers
+                    )
+                    return compact_response(request, {
+                        "result": "Y",
+                        "data": map_markers,
+                        "total_markers": map_markers["count"]
+                    })
+                
                 map_markers = location_log_crud.get_member_map_markers(
-                    db, mt_idx, date, min_speed, max_accuracy
+                    db, mt_idx, date, min_speed, max_accuracy, tolerance, max_markers
                 )
                 
                 logger.info(f"Retrieved map markers for member {mt_idx} on {date}: {len(map_markers)} markers")
@@ -413,6 +503,8 @@ async def handle_location_log_request(
                     "total_markers": len(map_markers)
                 }
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting map markers: {str(e)}")
                 logger.error(traceback.format_exc())
@@ -516,11 +608,11 @@ async def get_member_location_logs(
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     limit: int = Query(100, description="조회할 로그 수"),
     offset: int = Query(0, description="건너뛸 로그 수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """회원의 위치 로그 목록 조회 (GET 방식)"""
     try:
-        logs = location_log_crud.get_member_location_logs(
+        logs = await location_log_crud.get_member_location_logs_async(
             db, mt_idx, start_date, end_date, limit, offset
         )
         result = [log.to_dict() for log in logs]
@@ -530,7 +622,7 @@ async def get_member_location_logs(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/summary")
-async def get_location_summary(
+def get_location_summary(
     mt_idx: int,
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
@@ -545,15 +637,17 @@ async def get_location_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/path")
-async def get_location_path(
+def get_location_path(
     mt_idx: int,
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    tolerance: float = Query(DEFAULT_SIMPLIFY_TOLERANCE_M, ge=0, description="경로 단순화 허용 오차(m), 0이면 일직선 위의 중복 포인트만 제거"),
+    max_points: Optional[int] = Query(None, ge=2, description="최대 포인트 수"),
     db: Session = Depends(get_db)
 ):
     """위치 경로 및 요약 정보 조회 (GET 방식)"""
     try:
-        path_data = location_log_crud.get_location_path(db, mt_idx, start_date, end_date)
+        path_data = location_log_crud.get_location_path(db, mt_idx, start_date, end_date, tolerance, max_points)
         return {"result": "Y", "data": path_data.model_dump()}
     except Exception as e:
         logger.error(f"Error getting location path: {str(e)}")
@@ -565,11 +659,11 @@ async def get_daily_location_logs(
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
     limit: int = Query(1000, description="조회할 로그 수"),
     offset: int = Query(0, description="건너뛸 로그 수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 회원의 특정 날짜 위치 로그 조회 (GET 방식)"""
     try:
-        logs = location_log_crud.get_member_location_logs_by_exact_date(
+        logs = await location_log_crud.get_member_location_logs_by_exact_date_async(
             db, mt_idx, date, limit, offset
         )
         
@@ -582,7 +676,7 @@ async def get_daily_location_logs(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/summary")
-async def get_daily_location_summary(
+def get_daily_location_summary(
     mt_idx: int,
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db)
@@ -605,7 +699,7 @@ async def get_daily_location_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/path")
-async def get_daily_location_path(
+def get_daily_location_path(
     mt_idx: int,
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db)
@@ -624,7 +718,7 @@ async def get_daily_location_path(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/members-with-logs")
-async def get_members_with_logs(
+def get_members_with_logs(
     group_id: int = Query(..., description="그룹 ID"),
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db)
@@ -645,7 +739,7 @@ async def get_members_with_logs(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/daily-summary")
-async def get_member_location_logs_daily_summary(
+def get_member_location_logs_daily_summary(
     mt_idx: int,
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
@@ -678,7 +772,7 @@ async def get_member_location_logs_daily_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/stay-times")
-async def get_member_stay_times(
+def get_member_stay_times(
     mt_idx: int,
     date: str = Query(..., description="분석할 날짜 (YYYY-MM-DD 형식)"),
     min_speed: float = Query(1.0, description="체류/이동 구분 기준 속도"),
@@ -711,22 +805,38 @@ async def get_member_stay_times(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/member-location-logs/{mt_idx}/map-markers")
-async def get_member_map_markers(
+def get_member_map_markers(
+    request: Request,
     mt_idx: int,
     date: str = Query(..., description="조회할 날짜 (YYYY-MM-DD 형식)"),
     min_speed: float = Query(1.0, description="최소 속도 값"),
     max_accuracy: float = Query(50.0, description="최대 정확도 값"),
+    tolerance: float = Query(DEFAULT_SIMPLIFY_TOLERANCE_M, ge=0, description="경로 단순화 허용 오차(m)"),
+    max_points: Optional[int] = Query(200, ge=2, description="최대 마커 수"),
+    format: Optional[str] = Query(None, description="압축 응답 형식 (columnar | polyline)"),
     db: Session = Depends(get_db)
 ):
     """
     특정 회원의 특정 날짜 지도 마커용 이동로그 데이터 조회 (GET 방식)
     제공된 SQL 쿼리를 기반으로 구현된 API (데이터 샘플링 포함)
+    format 쿼리 또는 Accept 헤더로 압축 형식(app.core.compact_encoding)을 선택할 수 있습니다.
     """
     try:
         logger.info(f"[GET] Map markers API 호출: mt_idx={mt_idx}, date={date}, min_speed={min_speed}, max_ㅣaccuracy={max_accuracy}")
         
+        compact_format = negotiate_format(request, format)
+        if compact_format:
+            map_markers = location_log_crud.get_member_map_markers_compact(
+                db, mt_idx, date, compact_format, min_speed, max_accuracy, tolerance, max_points
+            )
+            return compact_response(request, {
+                "result": "Y",
+                "data": map_markers,
+                "total_markers": map_markers["count"]
+            })
+        
         map_markers = location_log_crud.get_member_map_markers(
-            db, mt_idx, date, min_speed, max_accuracy
+            db, mt_idx, date, min_speed, max_accuracy, tolerance, max_points
         )
         
         logger.info(f"[GET] Map markers API 응답: member={mt_idx}, date={date}, 마커 수={len(map_markers)}개")
@@ -746,18 +856,75 @@ async def get_member_map_markers(
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+def _build_daily_count_grid(group_members, counts: dict, end_date, days: int) -> Tuple[list, list]:
+    """
+    활동 달력 데이터 생성 (멤버별 일별 카운트, 그룹 일별 합계)
+
+    날짜 표시값은 날짜마다 한 번만 계산하고, 멤버×날짜 칸을 한 번 순회하면서 합계도 함께 누적합니다.
+    """
+    from datetime import timedelta
+
+    day_dates = [end_date - timedelta(days=offset) for offset in range(days)]
+    day_infos = [
+        {
+            "date": str(day),
+            "formatted_date": day.strftime("%m.%d"),
+            "day_of_week": day.strftime("%a"),
+            "is_today": day == end_date,
+            "is_weekend": day.weekday() >= 5
+        }
+        for day in day_dates
+    ]
+    totals = [0] * days
+
+    member_daily_counts = []
+    for member in group_members:
+        member_counts = []
+        for index, day in enumerate(day_dates):
+            count = counts.get((member.mt_idx, day), 0)
+            totals[index] += count
+            info = day_infos[index]
+            member_counts.append({
+                "date": info["date"],
+                "count": count,
+                "formatted_date": info["formatted_date"],
+                "day_of_week": info["day_of_week"],
+                "is_today": info["is_today"],
+                "is_weekend": info["is_weekend"]
+            })
+        member_daily_counts.append({
+            "member_id": member.mt_idx,
+            "member_name": member.mt_name,
+            "member_photo": getattr(member, 'mt_file1', None),  # Member 모델에는 mt_file1이 실제 photo 필드
+            "member_gender": getattr(member, 'mt_gender', None),
+            "daily_counts": member_counts
+        })
+
+    total_daily_counts = [
+        {
+            "date": info["date"],
+            "count": totals[index],
+            "formatted_date": info["formatted_date"],
+            "day_of_week": info["day_of_week"],
+            "is_today": info["is_today"],
+            "is_weekend": info["is_weekend"]
+        }
+        for index, info in enumerate(day_infos)
+    ]
+    return member_daily_counts, total_daily_counts
+
 @router.get("/daily-counts")
 async def get_daily_location_counts(
     group_id: int = Query(..., description="그룹 ID"),
     days: int = Query(14, description="조회할 일수 (기본값: 14일)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     최근 N일간 그룹 멤버들의 일별 위치 기록 카운트를 반환합니다.
     """
     try:
-        from datetime import datetime, timedelta
-        from sqlalchemy import func, and_, text
+        from datetime import datetime, time, timedelta
+        from sqlalchemy import func, and_, text, select
         from ....models.member import Member
         from ....models.group import Group
         from ....models.member_location_log import MemberLocationLog
@@ -771,14 +938,16 @@ async def get_daily_location_counts(
         # 그룹 멤버 확인
         from ....models.group_detail import GroupDetail
         
-        group_members = db.query(Member).join(
-            GroupDetail, Member.mt_idx == GroupDetail.mt_idx
-        ).filter(
-            GroupDetail.sgt_idx == group_id,
-            GroupDetail.sgdt_exit == 'N',
-            GroupDetail.sgdt_discharge == 'N', 
-            GroupDetail.sgdt_show == 'Y'
-        ).all()
+        group_members = (await db.execute(
+            select(Member).join(
+                GroupDetail, Member.mt_idx == GroupDetail.mt_idx
+            ).where(
+                GroupDetail.sgt_idx == group_id,
+                GroupDetail.sgdt_exit == 'N',
+                GroupDetail.sgdt_discharge == 'N', 
+                GroupDetail.sgdt_show == 'Y'
+            )
+        )).scalars().all()
         
         if not group_members:
             logger.warning(f"그룹 {group_id}에 멤버가 없습니다.")
@@ -786,87 +955,9 @@ async def get_daily_location_counts(
         
         member_ids = [member.mt_idx for member in group_members]
         
-        # 일별 위치 기록 카운트 조회
-        # SQL 쿼리로 직접 날짜별 카운트를 가져옴
-        query = text("""
-            SELECT 
-                mt_idx as member_idx,
-                DATE(mlt_gps_time) as log_date,
-                COUNT(DISTINCT mlt_idx) as count
-            FROM member_location_log_t 
-            WHERE mt_idx IN :member_ids
-            AND DATE(mlt_gps_time) BETWEEN :start_date AND :end_date
-            GROUP BY mt_idx, DATE(mlt_gps_time)
-            ORDER BY mt_idx, log_date DESC
-        """)
-        
-        result = db.execute(query, {
-            "member_ids": tuple(member_ids),
-            "start_date": start_date,
-            "end_date": end_date
-        }).fetchall()
-        
-        # 결과를 딕셔너리로 변환 (멤버ID -> 날짜 -> 카운트)
-        member_count_dict = {}
-        for row in result:
-            member_id = row.member_idx
-            date_str = str(row.log_date)
-            count = row.count
-            
-            if member_id not in member_count_dict:
-                member_count_dict[member_id] = {}
-            member_count_dict[member_id][date_str] = count
-        
-        # 멤버별 일별 카운트 데이터 생성
-        member_daily_counts = []
-        for member in group_members:
-            member_counts = []
-            current_date = end_date
-            
-            for i in range(days):
-                date_str = str(current_date)
-                count = member_count_dict.get(member.mt_idx, {}).get(date_str, 0)
-                
-                member_counts.append({
-                    "date": date_str,
-                    "count": count,
-                    "formatted_date": current_date.strftime("%m.%d"),
-                    "day_of_week": current_date.strftime("%a"),
-                    "is_today": current_date == end_date,
-                    "is_weekend": current_date.weekday() >= 5
-                })
-                
-                current_date -= timedelta(days=1)
-            
-            member_daily_counts.append({
-                "member_id": member.mt_idx,
-                "member_name": member.mt_name,
-                "member_photo": getattr(member, 'mt_file1', None),  # Member 모델에는 mt_file1이 실제 photo 필드
-                "member_gender": getattr(member, 'mt_gender', None),
-                "daily_counts": member_counts
-            })
-        
-        # 전체 그룹의 일별 총 카운트도 계산 (기존 로직 유지)
-        total_daily_counts = []
-        current_date = end_date
-        
-        for i in range(days):
-            date_str = str(current_date)
-            total_count = sum(
-                member_count_dict.get(member.mt_idx, {}).get(date_str, 0) 
-                for member in group_members
-            )
-            
-            total_daily_counts.append({
-                "date": date_str,
-                "count": total_count,
-                "formatted_date": current_date.strftime("%m.%d"),
-                "day_of_week": current_date.strftime("%a"),
-                "is_today": current_date == end_date,
-                "is_weekend": current_date.weekday() >= 5
-            })
-            
-            current_date -= timedelta(days=1)
+        # 일별 위치 기록 카운트 조회 (수집 시 갱신되는 일일 요약 테이블 사용)
+        counts = await daily_summary_crud.get_daily_point_counts_async(db, member_ids, start_date, end_date)
+        member_daily_counts, total_daily_counts = _build_daily_count_grid(group_members, counts, end_date, days)
         
         logger.info(f"멤버별 일별 카운트 조회 완료: {len(member_daily_counts)}명, {days}일간 데이터")
         
@@ -891,14 +982,14 @@ async def get_daily_location_counts(
 async def get_daily_location_counts_simple(
     group_id: int = Query(..., description="그룹 ID"),
     days: int = Query(14, description="조회할 일수 (기본값: 14일)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     멤버별 일별 위치 기록 카운트를 간단한 텍스트 형태로 반환합니다.
     """
     try:
-        from datetime import datetime, timedelta
-        from sqlalchemy import func, and_, text
+        from datetime import datetime, time, timedelta
+        from sqlalchemy import func, and_, text, select
         from ....models.member import Member
         from ....models.group import Group
         from ....models.member_location_log import MemberLocationLog
@@ -912,44 +1003,28 @@ async def get_daily_location_counts_simple(
         # 그룹 멤버 확인
         from ....models.group_detail import GroupDetail
         
-        group_members = db.query(Member).join(
-            GroupDetail, Member.mt_idx == GroupDetail.mt_idx
-        ).filter(
-            GroupDetail.sgt_idx == group_id,
-            GroupDetail.sgdt_exit == 'N',
-            GroupDetail.sgdt_discharge == 'N', 
-            GroupDetail.sgdt_show == 'Y'
-        ).all()
+        group_members = (await db.execute(
+            select(Member).join(
+                GroupDetail, Member.mt_idx == GroupDetail.mt_idx
+            ).where(
+                GroupDetail.sgt_idx == group_id,
+                GroupDetail.sgdt_exit == 'N',
+                GroupDetail.sgdt_discharge == 'N', 
+                GroupDetail.sgdt_show == 'Y'
+            )
+        )).scalars().all()
         
         if not group_members:
             return {"message": f"그룹 {group_id}에 멤버가 없습니다."}
         
         member_ids = [member.mt_idx for member in group_members]
         
-        # 일별 위치 기록 카운트 조회
-        query = text("""
-            SELECT 
-                mt_idx as member_idx,
-                DATE(mlt_gps_time) as log_date,
-                COUNT(DISTINCT mlt_idx) as count
-            FROM member_location_log_t 
-            WHERE mt_idx IN :member_ids
-            AND DATE(mlt_gps_time) BETWEEN :start_date AND :end_date
-            GROUP BY mt_idx, DATE(mlt_gps_time)
-            HAVING COUNT(DISTINCT mlt_idx) > 0
-            ORDER BY mt_idx, log_date DESC
-        """)
-        
-        result = db.execute(query, {
-            "member_ids": tuple(member_ids),
-            "start_date": start_date,
-            "end_date": end_date
-        }).fetchall()
-        
-        # 간단한 텍스트 형태로 변환
-        simple_data = []
-        for row in result:
-            simple_data.append(f"{row.member_idx} {row.log_date} {row.count}")
+        # 일별 위치 기록 카운트 조회 (일일 요약 테이블 사용, 회원 오름차순/날짜 내림차순)
+        counts = await daily_summary_crud.get_daily_point_counts_async(db, member_ids, start_date, end_date)
+        simple_data = [
+            f"{member_idx} {log_date} {counts[(member_idx, log_date)]}"
+            for member_idx, log_date in sorted(counts, key=lambda key: (key[0], -key[1].toordinal()))
+        ]
         
         logger.info(f"간단 형태 데이터: {len(simple_data)}건")
         
@@ -971,14 +1046,14 @@ async def get_daily_location_counts_simple(
 async def get_member_activity_by_date(
     group_id: int = Query(..., description="그룹 ID"),
     date: str = Query(..., description="조회할 날짜 (YYYY-MM-DD)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 날짜의 그룹 멤버별 위치 기록 활동을 반환합니다.
     """
     try:
-        from datetime import datetime
-        from sqlalchemy import func, and_, text
+        from datetime import datetime, time, timedelta
+        from sqlalchemy import func, and_, text, select
         from ....models.member import Member
         from ....models.group import Group
         from ....models.member_location_log import MemberLocationLog
@@ -990,14 +1065,16 @@ async def get_member_activity_by_date(
         logger.info(f"멤버 활동 조회: {target_date}, 그룹 ID: {group_id}")
         
         # 그룹 멤버 조회
-        group_members = db.query(Member).join(
-            GroupDetail, Member.mt_idx == GroupDetail.mt_idx
-        ).filter(
-            GroupDetail.sgt_idx == group_id,
-            GroupDetail.sgdt_exit == 'N',
-            GroupDetail.sgdt_discharge == 'N', 
-            GroupDetail.sgdt_show == 'Y'
-        ).all()
+        group_members = (await db.execute(
+            select(Member).join(
+                GroupDetail, Member.mt_idx == GroupDetail.mt_idx
+            ).where(
+                GroupDetail.sgt_idx == group_id,
+                GroupDetail.sgdt_exit == 'N',
+                GroupDetail.sgdt_discharge == 'N', 
+                GroupDetail.sgdt_show == 'Y'
+            )
+        )).scalars().all()
         
         if not group_members:
             return {"member_activities": [], "date": date}
@@ -1005,40 +1082,31 @@ async def get_member_activity_by_date(
         # 모든 멤버의 데이터를 한 번의 쿼리로 조회 (성능 최적화)
         member_ids = [member.mt_idx for member in group_members]
         
-        # 카운트 데이터를 한 번에 조회
-        count_query = text("""
-            SELECT mt_idx, COUNT(*) as log_count
-            FROM member_location_log_t 
-            WHERE mt_idx IN :member_ids
-            AND DATE(mlt_gps_time) = :target_date
-            GROUP BY mt_idx
-        """)
-        
-        count_results = db.execute(count_query, {
-            "member_ids": tuple(member_ids),
-            "target_date": target_date
-        }).fetchall()
-        
-        # 첫 번째와 마지막 로그 시간을 한 번에 조회
-        time_query = text("""
+        # 카운트와 첫 번째/마지막 로그 시간을 한 번에 조회
+        # ((mt_idx, mlt_gps_time) 인덱스만으로 처리되도록 DATE() 대신 반열린 시간 범위 사용, 파티션 pruning으로 해당 월만 조회)
+        start_time = datetime.combine(target_date, time.min)
+        end_time = start_time + timedelta(days=1)
+        activity_query = text("""
             SELECT 
                 mt_idx,
+                COUNT(*) as log_count,
                 MIN(mlt_gps_time) as first_log_time,
                 MAX(mlt_gps_time) as last_log_time
             FROM member_location_log_t 
             WHERE mt_idx IN :member_ids
-            AND DATE(mlt_gps_time) = :target_date
+            AND mlt_gps_time >= :start_time AND mlt_gps_time < :end_time
             GROUP BY mt_idx
         """)
         
-        time_results = db.execute(time_query, {
+        activity_results = (await db.execute(activity_query, {
             "member_ids": tuple(member_ids),
-            "target_date": target_date
-        }).fetchall()
+            "start_time": start_time,
+            "end_time": end_time
+        })).fetchall()
         
         # 결과를 딕셔너리로 변환
-        count_dict = {row.mt_idx: row.log_count for row in count_results}
-        time_dict = {row.mt_idx: {"first": row.first_log_time, "last": row.last_log_time} for row in time_results}
+        count_dict = {row.mt_idx: row.log_count for row in activity_results}
+        time_dict = {row.mt_idx: {"first": row.first_log_time, "last": row.last_log_time} for row in activity_results}
         
         member_activities = []
         for member in group_members:
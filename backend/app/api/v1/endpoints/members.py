@@ -1,6 +1,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Header, UploadFile, File
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_
 from jose import JWTError, jwt
 from app.api import deps
@@ -341,7 +342,7 @@ def get_members(
 @router.get("/me")
 async def get_user_profile(
     authorization: str = Header(None),
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     현재 로그인한 사용자의 프로필 정보를 조회합니다.
@@ -363,7 +364,7 @@ async def get_user_profile(
         logger.info(f"[GET_PROFILE] 토큰에서 추출한 user_id: {user_id}")
         
         # 데이터베이스에서 최신 사용자 정보 조회
-        user = crud_auth.get_user_by_idx(db, user_id)
+        user = await crud_auth.get_user_by_idx_async(db, user_id)
         if not user:
             logger.warning(f"[GET_PROFILE] 사용자를 찾을 수 없음 - user_id: {user_id}")
             return {
@@ -881,7 +882,7 @@ async def withdraw_member(
 async def get_consent_info(
     member_id: int,
     authorization: str = Header(None),
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     사용자의 동의 정보를 조회합니다.
@@ -901,7 +902,7 @@ async def get_consent_info(
             raise HTTPException(status_code=403, detail="본인의 동의 정보만 조회할 수 있습니다.")
         
         # 동의 정보 조회
-        consent_info = crud_member.get_consent_info(db, user_id=member_id)
+        consent_info = await crud_member.get_consent_info_async(db, user_id=member_id)
         if not consent_info:
             logger.warning(f"[CONSENT] 사용자를 찾을 수 없음 - member_id: {member_id}")
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
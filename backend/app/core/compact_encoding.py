@@ -0,0 +1,112 @@
+"""
+위치 경로/지도 마커 응답용 압축 인코딩
+
+하루치 경로처럼 포인트가 많은 응답을 포인트별 dict 대신 컬럼 배열로 보냅니다.
+
+- columnar: 위경도는 1e-6도 단위 정수, 시간은 초 단위 정수로 바꾼 뒤 앞 값과의 차이(delta)만 전송
+    {"format": "columnar", "count": 3, "t0": "2025-01-01 08:00:00",
+     "t": [0, 30, 30], "lat": [37566535, 12, -4], "lng": [126977969, 8, 3], ...}
+  복원: t0 + 누적합(t)초, 누적합(lat) / 1e6
+- polyline: 위경도를 Google Encoded Polyline(정밀도 1e-5)으로, 시간은 columnar와 같은 t 배열로 전송
+
+형식은 ?format=columnar|polyline (POST act 요청은 body의 "format") 또는
+Accept: application/vnd.smap.columnar+json / application/vnd.smap.polyline+json 헤더로 선택합니다.
+클라이언트가 Accept-Encoding: gzip을 보내면 gzip으로 압축해 응답합니다.
+"""
+import gzip
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from fastapi import Request
+from fastapi.responses import Response
+
+COMPACT_FORMATS = ("columnar", "polyline")
+COORD_SCALE = 1_000_000
+POLYLINE_SCALE = 100_000
+GZIP_MIN_SIZE = 1024
+
+_ACCEPT_TYPES = {
+    "application/vnd.smap.columnar+json": "columnar",
+    "application/vnd.smap.polyline+json": "polyline"
+}
+
+
+def negotiate_format(request: Request, requested: Optional[str] = None) -> Optional[str]:
+    """요청한 압축 형식 (쿼리/body 값 우선, 없으면 Accept 헤더). 기존 JSON 형식이면 None"""
+    if requested:
+        requested = requested.lower()
+        return requested if requested in COMPACT_FORMATS else None
+    accept = request.headers.get("accept", "")
+    for media_type, compact_format in _ACCEPT_TYPES.items():
+        if media_type in accept:
+            return compact_format
+    return None
+
+
+def delta_encode(values: Sequence[float], scale: int) -> List[int]:
+    """값을 scale배 정수로 반올림한 뒤 첫 값은 그대로, 이후는 앞 값과의 차이"""
+    if not len(values):
+        return []
+    scaled = np.round(np.asarray(values, dtype=float) * scale).astype(np.int64)
+    return np.diff(scaled, prepend=0).tolist()
+
+
+def time_deltas(times: Sequence[datetime]) -> List[int]:
+    """첫 시간 기준 초 단위 delta (첫 값은 0)"""
+    if not times:
+        return []
+    seconds = np.array([(t - times[0]).total_seconds() for t in times], dtype=float)
+    return np.diff(np.round(seconds).astype(np.int64), prepend=0).tolist()
+
+
+def encode_polyline(lats: Sequence[float], lngs: Sequence[float]) -> str:
+    """Google Encoded Polyline Algorithm Format (정밀도 1e-5)"""
+    chunks = []
+    for value in np.column_stack((delta_encode(lats, POLYLINE_SCALE), delta_encode(lngs, POLYLINE_SCALE))).ravel().tolist():
+        value = ~(value << 1) if value < 0 else value << 1
+        while value >= 0x20:
+            chunks.append(chr((0x20 | (value & 0x1f)) + 63))
+            value >>= 5
+        chunks.append(chr(value + 63))
+    return "".join(chunks)
+
+
+def encode_track(
+    compact_format: str,
+    times: Sequence[datetime],
+    lats: Sequence[float],
+    lngs: Sequence[float],
+    columns: Optional[Dict[str, list]] = None
+) -> Dict:
+    """
+    시간순 포인트 목록을 압축 형식으로 인코딩
+
+    Args:
+        columns: 그대로 전송할 부가 컬럼 (예: {"speed": [...], "battery": [...]}), 포인트 수와 같은 길이
+    """
+    encoded = {
+        "format": compact_format,
+        "count": len(times),
+        "t0": times[0].strftime("%Y-%m-%d %H:%M:%S") if times else None,
+        "t": time_deltas(times)
+    }
+    if compact_format == "polyline":
+        encoded["polyline"] = encode_polyline(lats, lngs)
+    else:
+        encoded["lat"] = delta_encode(lats, COORD_SCALE)
+        encoded["lng"] = delta_encode(lngs, COORD_SCALE)
+    if columns:
+        encoded.update(columns)
+    return encoded
+
+
+def compact_response(request: Request, content: Dict) -> Response:
+    """JSON 응답 (클라이언트가 gzip을 받을 수 있고 GZIP_MIN_SIZE 이상이면 gzip 압축)"""
+    body = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if len(body) >= GZIP_MIN_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
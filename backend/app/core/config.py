@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl
 
@@ -38,11 +38,53 @@ class Settings(BaseSettings):
         f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}?charset={MYSQL_CHARSET}"
     )
     
+    # 비동기 SQLAlchemy 데이터베이스 URI (aiomysql)
+    ASYNC_SQLALCHEMY_DATABASE_URI: str = (
+        f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}?charset={MYSQL_CHARSET}"
+    )
+    
     # 데이터베이스 연결 풀 설정
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 30
     DB_POOL_TIMEOUT: int = 60
     DB_POOL_RECYCLE: int = 3600
+    ASYNC_DB_POOL_SIZE: int = 10
+    ASYNC_DB_MAX_OVERFLOW: int = 20
+    
+    # 위치 로그 비동기 수집(write-behind) 설정
+    LOCATION_INGEST_ASYNC: bool = True
+    LOCATION_INGEST_QUEUE_SIZE: int = 20000      # 메모리 버퍼 최대 건수 (초과 시 503 응답)
+    LOCATION_INGEST_BATCH_SIZE: int = 500        # 한 번에 INSERT할 최대 건수
+    LOCATION_INGEST_FLUSH_INTERVAL: float = 1.0  # 버퍼 flush 주기(초)
+    LOCATION_INGEST_RETRY_INTERVAL: int = 30     # DB 장애 시 재시도 간격(초)
+    LOCATION_INGEST_SPILL_DIR: str = "spool/location_logs"
+    
+    # 위치 로그 월별 파티션/보관 설정 (add_member_location_log_partitions.sql 적용 후 사용)
+    LOCATION_LOG_PARTITION_MONTHS_AHEAD: int = 3        # 미리 만들어 둘 미래 월 파티션 수
+    LOCATION_LOG_RETENTION_MONTHS: int = 0              # 이 개월 수보다 오래된 파티션은 보관 후 삭제 (0이면 삭제 안 함)
+    LOCATION_LOG_ARCHIVE_DIR: str = "archive/location_logs"  # 삭제 전 gzip JSONL 보관 위치
+    
+    # 위치 로그 수집 시 GPS 품질 판정 (add_member_location_log_quality.sql 적용 후 사용)
+    LOCATION_FILTER_MAX_ACCURACY: float = 100.0   # 수평 정확도가 이 값(m)보다 크면 저정확도로 표시
+    LOCATION_FILTER_MAX_SPEED_KMH: float = 250.0  # 직전 정상 위치에서 이보다 빠르게 이동해야 닿는 위치는 튐으로 표시
+    LOCATION_FILTER_MAX_REJECTS: int = 5          # 튐 판정이 연속 이 횟수에 이르면 새 위치를 기준으로 다시 시작
+    LOCATION_FILTER_SMOOTHING: bool = False       # 칼만 필터 보정 좌표를 최신 위치/실시간 스트림에 사용
+    LOCATION_FILTER_PROCESS_NOISE: float = 3.0    # 칼만 필터 프로세스 잡음(m/s)
+    LOCATION_FILTER_DROP_REJECTED: bool = False   # 튐/좌표 없음으로 판정된 로그는 저장하지 않음
+
+    # 그룹 실시간 위치 스트림(SSE) 설정
+    LOCATION_STREAM_MAX_CONNECTIONS: int = 1000  # 워커당 최대 동시 연결 수 (초과 시 503)
+    LOCATION_STREAM_HEARTBEAT: float = 15.0      # 새 위치가 없을 때 keep-alive 주석 전송 주기(초)
+    LOCATION_STREAM_MEMBER_REFRESH: int = 60     # 그룹 멤버 목록 재조회 주기(초)
+    
+    # 요청 단위 SQL 프로파일러 (쿼리 수, DB 시간, 느린 쿼리, N+1 의심 패턴)
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_PROFILER_SAMPLE_RATE: float = 0.01       # 측정할 요청 비율 (0~1)
+    SQL_PROFILER_HEADERS: bool = True            # X-SQL-Query-Count / X-SQL-Query-Time-Ms 응답 헤더 추가
+    SQL_PROFILER_SLOW_QUERY_MS: float = 100.0    # 느린 쿼리 기준(ms)
+    SQL_PROFILER_N_PLUS_ONE_THRESHOLD: int = 10  # 같은 형태의 쿼리가 이 횟수 이상 반복되면 N+1 의심
+    SQL_PROFILER_LOG_MIN_QUERIES: int = 30       # 쿼리 수가 이 이상이면 로그 기록
+    SQL_PROFILER_LOG_MIN_DB_MS: float = 500.0    # DB 시간 합계가 이 이상(ms)이면 로그 기록
     
     # JWT 설정
     JWT_SECRET_KEY: str = "smap!@super-secret"
@@ -53,6 +95,36 @@ class Settings(BaseSettings):
     FIREBASE_CREDENTIALS_PATH: str = "backend/com-dmonster-smap-firebase-adminsdk-2zx5p-2610556cf5.json"
     FIREBASE_PROJECT_ID: str = "com-dmonster-smap"
     
+    # 스케줄러 설정 (여러 워커 중 리더 1개만 작업 실행)
+    SCHEDULER_ENABLED: bool = True               # False면 이 워커에서는 스케줄러를 시작하지 않음
+    SCHEDULER_LEADER_ELECTION: bool = True       # False면 단일 워커 배포용 (메모리 작업 저장소, 선출 없음)
+    SCHEDULER_JOBSTORE_TABLE: str = "apscheduler_jobs"
+    SCHEDULER_LEASE_TTL: int = 30                # 리더 임대 유효 시간(초)
+    SCHEDULER_LEASE_RENEW_INTERVAL: int = 10     # 리더 임대 갱신 주기(초)
+    SCHEDULER_JOB_MAX_INSTANCES: int = 1         # 작업별 동시 실행 수 (이전 실행 중이면 건너뜀)
+    SCHEDULER_JOB_COALESCE: bool = True          # 밀린 실행은 1회로 합침
+    SCHEDULER_JOB_MISFIRE_GRACE_TIME: int = 30   # 예정 시각보다 이 시간(초) 이상 늦으면 실행 생략
+    SCHEDULER_JOB_OVERRIDES: Dict[str, Dict[str, Any]] = {}  # 작업별 정책 (예: {"send_silent_push_to_all_users": {"misfire_grace_time": 300}})
+    
+    # 그룹 통계(GET /groups/{group_id}/stats) 캐시 유효 시간(초)
+    GROUP_STATS_CACHE_TTL: int = 30
+    
+    # 스케줄러 회원 정보 스냅샷 캐시 유효 시간(초). 다른 워커에서 바뀐 토큰/언어는 최대 이 시간 뒤 반영
+    MEMBER_SNAPSHOT_TTL: int = 60
+    
+    # Silent 푸시 일괄 전송(fan-out) 설정
+    SILENT_PUSH_CONCURRENCY: int = 16            # 동시 전송 워커 수
+    SILENT_PUSH_RATE_LIMIT: float = 200.0        # 초당 최대 전송 건수 (0 이하면 제한 없음)
+    SILENT_PUSH_MAX_DURATION: int = 780          # 1회 실행 최대 시간(초, 15분 주기와 겹치지 않도록)
+    
+    # 푸시 outbox 전송 워커 설정
+    PUSH_OUTBOX_WORKER: bool = True
+    PUSH_OUTBOX_BATCH_SIZE: int = 500            # 한 번에 가져와 전송할 건수 (send_each 최대 500)
+    PUSH_OUTBOX_POLL_INTERVAL: float = 2.0       # 대기열 확인 주기(초)
+    PUSH_OUTBOX_MAX_ATTEMPTS: int = 6            # 최대 전송 시도 횟수 (초과 시 dead)
+    PUSH_OUTBOX_RETRY_BASE: int = 30             # 재시도 간격 기준(초), 시도마다 2배
+    PUSH_OUTBOX_RETRY_MAX: int = 3600            # 최대 재시도 간격(초)
+    
     # 하위 호환성을 위한 별칭
     @property
     def SECRET_KEY(self) -> str:
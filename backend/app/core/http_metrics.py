@@ -0,0 +1,63 @@
+import time
+
+from app.core.metrics import registry
+
+# API 응답 시간 구간(초)
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HTTP_REQUESTS = registry.counter(
+    "smap_http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"]
+)
+HTTP_DURATION = registry.histogram(
+    "smap_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=HTTP_BUCKETS
+)
+HTTP_IN_FLIGHT = registry.gauge(
+    "smap_http_requests_in_flight",
+    "HTTP requests currently being processed"
+)
+
+# 라우트에 매칭되지 않은 요청(404 등)은 경로 대신 이 값으로 집계 (레이블 수 폭증 방지)
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class MetricsMiddleware:
+    """
+    요청 수, 응답 시간, 처리 중인 요청 수를 기록하는 ASGI 미들웨어
+
+    - 경로는 실제 URL이 아니라 라우트 템플릿(/api/v1/members/{mt_idx})으로 집계
+    - BaseHTTPMiddleware를 거치지 않는 순수 ASGI 미들웨어로, 요청당 시간 측정과 카운터 갱신만 수행
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # 라우터가 매칭한 라우트를 scope에 기록하므로 응답 후에 템플릿 경로를 읽을 수 있음
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_DURATION.observe(time.perf_counter() - started, method=method, route=route_path)
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=status_code)
@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from sqlalchemy import event
+
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+JOB_DURATION = registry.histogram(
+    "smap_scheduler_job_duration_seconds",
+    "Scheduler job run time",
+    ["job"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+)
+JOB_RUNS = registry.counter(
+    "smap_scheduler_job_runs_total",
+    "Scheduler job runs by result (success, failure)",
+    ["job", "result"]
+)
+JOB_SKIPPED = registry.counter(
+    "smap_scheduler_job_skipped_total",
+    "Scheduler job runs skipped by reason (overlap, missed, not_leader)",
+    ["job", "reason"]
+)
+JOB_ITEMS = registry.counter(
+    "smap_scheduler_job_items_total",
+    "Items handled by scheduler jobs (processed, pushes)",
+    ["job", "kind"]
+)
+JOB_RUNNING = registry.gauge(
+    "smap_scheduler_job_running",
+    "Scheduler job runs in progress",
+    ["job"]
+)
+JOB_LAST_SUCCESS = registry.gauge(
+    "smap_scheduler_job_last_success_timestamp_seconds",
+    "Unix time of the last successful scheduler job run",
+    ["job"]
+)
+JOB_DB_QUERIES = registry.counter(
+    "smap_scheduler_job_db_queries_total",
+    "SQL statements executed by scheduler jobs",
+    ["job"]
+)
+JOB_DB_SECONDS = registry.counter(
+    "smap_scheduler_job_db_seconds_total",
+    "Time spent in SQL statements by scheduler jobs",
+    ["job"]
+)
+
+_current = threading.local()
+
+
+class JobRun:
+    def __init__(self, job: str):
+        self.job = job
+        self.error: Optional[str] = None
+
+
+def current_job() -> Optional[JobRun]:
+    return getattr(_current, "run", None)
+
+
+@contextmanager
+def track_job(job: str):
+    """
+    작업 1회 실행을 측정합니다. (실행 시간, 결과, 마지막 성공 시각, 실행 중 SQL 수/시간)
+
+    작업 메서드는 대부분 예외를 직접 잡아 로그만 남기므로, 실패는 mark_failed()로 표시합니다.
+    """
+    run = JobRun(job)
+    _current.run = run
+    JOB_RUNNING.inc(job=job)
+    started = time.perf_counter()
+    try:
+        yield run
+    except Exception as e:
+        run.error = str(e)
+        raise
+    finally:
+        JOB_DURATION.observe(time.perf_counter() - started, job=job)
+        JOB_RUNNING.dec(job=job)
+        if run.error is None:
+            JOB_RUNS.inc(job=job, result="success")
+            JOB_LAST_SUCCESS.set(time.time(), job=job)
+        else:
+            JOB_RUNS.inc(job=job, result="failure")
+        _current.run = None
+
+
+def mark_failed(error) -> None:
+    """현재 작업 실행을 실패로 집계 (작업 밖에서 호출되면 무시)"""
+    run = current_job()
+    if run is not None:
+        run.error = str(error)
+
+
+def record_items(count: int, kind: str = "processed") -> None:
+    """현재 작업이 처리한 건수 기록 (작업 밖에서 호출되면 무시)"""
+    run = current_job()
+    if run is not None and count:
+        JOB_ITEMS.inc(count, job=run.job, kind=kind)
+
+
+def record_skipped(job: str, reason: str) -> None:
+    JOB_SKIPPED.inc(job=job, reason=reason)
+
+
+def _on_scheduler_event(scheduler_event) -> None:
+    if scheduler_event.code == EVENT_JOB_MAX_INSTANCES:
+        # 이전 실행이 끝나지 않아 이번 실행을 건너뜀 (max_instances 초과)
+        record_skipped(scheduler_event.job_id, "overlap")
+    elif scheduler_event.code == EVENT_JOB_MISSED:
+        record_skipped(scheduler_event.job_id, "missed")
+
+
+def install(scheduler, engine) -> None:
+    """스케줄러 건너뜀 이벤트와 작업별 SQL 수/시간 측정을 등록합니다."""
+    scheduler.add_listener(_on_scheduler_event, EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_job() is not None:
+            conn.info.setdefault("job_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        run = current_job()
+        started = conn.info.get("job_query_started")
+        if run is None or not started:
+            return
+        JOB_DB_QUERIES.inc(job=run.job)
+        JOB_DB_SECONDS.inc(time.perf_counter() - started.pop(), job=run.job)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 제거
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("job_query_started"):
+            conn.info["job_query_started"].pop()
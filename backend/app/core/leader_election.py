@@ -0,0 +1,130 @@
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from app.db.session import SessionLocal
+from app.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """
+    DB 임대(scheduler_lease_t) 기반 리더 선출
+
+    - 모든 워커가 renew_interval마다 임대 획득/갱신을 시도하고, 1개 워커만 리더가 됨
+    - 리더가 중단되면 ttl 경과 후 다른 워커가 임대를 가져감
+    - is_leader()는 마지막 갱신 시도 시점 + ttl - safety_margin까지만 True를 반환하므로,
+      DB 연결이 끊겨 갱신하지 못한 리더는 다른 워커가 임대를 가져가기 전에 스스로 리더에서 물러남
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: int = 30,
+        renew_interval: int = 10,
+        safety_margin: int = 5,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_revoked: Optional[Callable[[], None]] = None
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.renew_interval = renew_interval
+        self.safety_margin = safety_margin
+        self.on_elected = on_elected
+        self.on_revoked = on_revoked
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._leader = False
+        self._valid_until = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "elected": 0,
+            "revoked": 0,
+            "renew_errors": 0,
+            "last_renewed_at": None,
+        }
+
+    def start(self) -> None:
+        """임대 갱신 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="scheduler-leader-election", daemon=True)
+        self._thread.start()
+        logger.info(f"스케줄러 리더 선출 시작 (owner: {self.owner}, ttl: {self.ttl}s, renew: {self.renew_interval}s)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """갱신 스레드를 종료하고, 리더였다면 임대를 반납하여 다른 워커가 바로 이어받도록 함"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._leader:
+            self._set_leader(False)
+            db = SessionLocal()
+            try:
+                SchedulerLease.release(db, self.name, self.owner)
+            except Exception as e:
+                logger.warning(f"스케줄러 임대 반납 실패: {e}")
+            finally:
+                db.close()
+
+    def is_leader(self) -> bool:
+        """현재 유효한 임대를 보유하고 있는지 여부"""
+        return self._leader and time.monotonic() < self._valid_until
+
+    def get_stats(self) -> Dict:
+        stats = dict(self._stats)
+        stats["owner"] = self.owner
+        stats["is_leader"] = self.is_leader()
+        return stats
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._renew()
+            self._stop_event.wait(self.renew_interval)
+
+    def _renew(self) -> None:
+        # DB 만료 시각은 갱신 쿼리 실행 이후 기준이므로, 쿼리 전 시각으로 계산하면 항상 더 보수적임
+        attempted_at = time.monotonic()
+        db = SessionLocal()
+        try:
+            acquired = SchedulerLease.try_acquire(db, self.name, self.owner, self.ttl)
+            if acquired:
+                self._valid_until = attempted_at + self.ttl - self.safety_margin
+                self._stats["last_renewed_at"] = time.time()
+            self._set_leader(acquired)
+        except Exception as e:
+            db.rollback()
+            self._stats["renew_errors"] += 1
+            logger.error(f"스케줄러 임대 갱신 실패: {e}")
+            # 갱신하지 못해도 로컬 유효 시간 안에서는 리더 유지 (일시적 DB 오류로 리더가 바뀌지 않도록)
+            if self._leader and time.monotonic() >= self._valid_until:
+                self._set_leader(False)
+        finally:
+            db.close()
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader == self._leader:
+            return
+        self._leader = leader
+        if leader:
+            self._stats["elected"] += 1
+            logger.info(f"스케줄러 리더로 선출됨 (owner: {self.owner})")
+            callback = self.on_elected
+        else:
+            self._valid_until = 0.0
+            self._stats["revoked"] += 1
+            logger.warning(f"스케줄러 리더 자격 상실 (owner: {self.owner})")
+            callback = self.on_revoked
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"스케줄러 리더 전환 처리 실패: {e}")
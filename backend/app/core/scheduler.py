@@ -1,29 +1,152 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.jobstores.memory import MemoryJobStore
 from datetime import datetime, timedelta
 import logging
+import threading
 from typing import Dict, List
 import random
 from apscheduler.triggers.interval import IntervalTrigger
-from app.db.session import SessionLocal
+from apscheduler.triggers.cron import CronTrigger
+from app.core import job_metrics
+from app.core.config import settings
+from app.core.leader_election import LeaderElection
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal, engine
 
 logger = logging.getLogger(__name__)
 
 class BackgroundTasks:
+    """
+    백그라운드 스케줄 작업
+
+    SCHEDULER_LEADER_ELECTION이 켜져 있으면 여러 API 워커 중 DB 임대를 가진 1개 워커만 작업을 실행하고,
+    작업 목록과 다음 실행 시각은 공유 작업 저장소(apscheduler_jobs 테이블)에 보관하여
+    리더가 바뀌어도 일정이 이어지도록 합니다. 꺼져 있으면 단일 워커 배포용으로 메모리 저장소를 사용합니다.
+    (어느 쪽이든 등록되는 작업 목록은 같습니다.)
+
+    작업 메서드의 self.db는 run_job이 실행마다 열고 닫는 세션입니다. 작업은 스레드풀에서 동시에 실행되므로
+    세션은 실행 스레드별로 보관합니다.
+    """
+
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
-        self.scheduler.add_job(
-            self._run_background_task,
-            trigger=IntervalTrigger(seconds=60),
-            id='background_task',
-            replace_existing=True
+        self._local = threading.local()
+        if settings.SCHEDULER_LEADER_ELECTION:
+            jobstore = SQLAlchemyJobStore(engine=engine, tablename=settings.SCHEDULER_JOBSTORE_TABLE)
+        else:
+            jobstore = MemoryJobStore()
+        self.scheduler = BackgroundScheduler(
+            jobstores={'default': jobstore},
+            job_defaults=self._job_policy()
+        )
+        job_metrics.install(self.scheduler, engine)
+        self.leader_election = LeaderElection(
+            name='background_tasks',
+            ttl=settings.SCHEDULER_LEASE_TTL,
+            renew_interval=settings.SCHEDULER_LEASE_RENEW_INTERVAL,
+            on_elected=self._on_elected,
+            on_revoked=self._on_revoked
         )
 
+    @property
+    def db(self) -> Session:
+        """현재 스레드에서 실행 중인 작업의 DB 세션"""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            raise RuntimeError("작업 DB 세션이 없습니다. 작업은 run_job으로 실행해야 합니다.")
+        return db
+
     def start(self):
-        self.scheduler.start()
+        if not settings.SCHEDULER_ENABLED:
+            logger.info("스케줄러 비활성화 (SCHEDULER_ENABLED=False)")
+            return
+        if not settings.SCHEDULER_LEADER_ELECTION:
+            self.scheduler.start()
+            self._schedule_all_jobs()
+            return
+        # 모든 워커는 일시정지 상태로 시작하고, 리더로 선출된 워커만 작업 처리를 재개
+        self.scheduler.start(paused=True)
+        self.leader_election.start()
 
     def shutdown(self):
-        self.scheduler.shutdown()
+        if not self.scheduler.running:
+            return
+        if settings.SCHEDULER_LEADER_ELECTION:
+            self.leader_election.stop()
+        self.scheduler.shutdown(wait=False)
+
+    def is_active(self) -> bool:
+        """이 워커가 스케줄 작업을 실행하는지 여부"""
+        if not settings.SCHEDULER_LEADER_ELECTION:
+            return self.scheduler.running
+        return self.leader_election.is_leader()
+
+    def get_status(self) -> Dict:
+        """스케줄러 상태 조회"""
+        status = {
+            "enabled": settings.SCHEDULER_ENABLED,
+            "leader_election": settings.SCHEDULER_LEADER_ELECTION,
+            "running": self.scheduler.running,
+            "active": self.is_active()
+        }
+        if settings.SCHEDULER_LEADER_ELECTION:
+            status["leader"] = self.leader_election.get_stats()
+        if status["active"]:
+            status["jobs"] = [
+                {"id": job.id, "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None}
+                for job in self.scheduler.get_jobs()
+            ]
+        return status
+
+    def _on_elected(self):
+        self._schedule_all_jobs()
+        self.scheduler.resume()
+
+    def _on_revoked(self):
+        self.scheduler.pause()
+
+    @staticmethod
+    def _job_policy(job_id: str = None) -> Dict:
+        """
+        작업 실행 정책 (중복 실행 방지)
+
+        - max_instances: 이전 실행이 끝나지 않았으면 이번 실행은 건너뜀 (건너뛴 횟수는 메트릭으로 집계)
+        - coalesce: 리더 교체 등으로 밀린 실행은 1회로 합침
+        - misfire_grace_time: 예정 시각에서 이 시간(초) 이상 늦어진 실행은 생략
+        SCHEDULER_JOB_OVERRIDES로 작업별 값을 바꿀 수 있습니다.
+        """
+        policy = {
+            'max_instances': settings.SCHEDULER_JOB_MAX_INSTANCES,
+            'coalesce': settings.SCHEDULER_JOB_COALESCE,
+            'misfire_grace_time': settings.SCHEDULER_JOB_MISFIRE_GRACE_TIME
+        }
+        if job_id:
+            policy.update(settings.SCHEDULER_JOB_OVERRIDES.get(job_id, {}))
+        return policy
+
+    def _add_job(self, func, trigger, job_id: str):
+        """
+        작업을 등록합니다. 작업 저장소에 같은 트리거와 정책으로 이미 등록되어 있으면 그대로 두어
+        리더가 바뀌어도 다음 실행 시각이 유지되도록 합니다.
+
+        공유 저장소에 저장할 수 있도록 바운드 메서드 대신 모듈 함수 run_job(메서드 이름)으로 등록합니다.
+        """
+        args = [func.__name__, job_id]
+        policy = self._job_policy(job_id)
+        job = self.scheduler.get_job(job_id)
+        if (
+            job and str(job.trigger) == str(trigger) and list(job.args) == args
+            and all(getattr(job, key) == value for key, value in policy.items())
+        ):
+            return
+        self.scheduler.add_job(
+            run_job,
+            trigger,
+            args=args,
+            id=job_id,
+            replace_existing=True,
+            **policy
+        )
 
     def _run_background_task(self):
         db = SessionLocal()
@@ -32,252 +155,162 @@ class BackgroundTasks:
             logger.info("Background task running...")
         except Exception as e:
             logger.error(f"Error in background task: {e}")
+            job_metrics.mark_failed(e)
         finally:
             db.close()
 
     def _schedule_all_jobs(self):
-        """모든 백그라운드 작업을 스케줄링합니다."""
-        # 30초마다 실행되는 작업들
-        self.scheduler.add_job(
-            self.location_entry_alert_schedule,
-            'interval',
-            seconds=30,
-            id='location_entry_alert_schedule'
-        )
-        self.scheduler.add_job(
-            self.location_exit_alert_schedule,
-            'interval',
-            seconds=30,
-            id='location_exit_alert_schedule'
-        )
-        self.scheduler.add_job(
-            self.my_location_entry_alert_schedule,
-            'interval',
-            seconds=30,
-            id='my_location_entry_alert_schedule'
-        )
-        self.scheduler.add_job(
-            self.my_location_exit_alert_schedule,
-            'interval',
-            seconds=30,
-            id='my_location_exit_alert_schedule'
-        )
-        self.scheduler.add_job(
-            self.sync_member_locations_recently,
-            'interval',
-            seconds=30,
-            id='sync_member_locations_recently'
-        )
-
-        # 1분마다 실행되는 작업들
-        self.scheduler.add_job(
-            self.schedule_notification,
-            'interval',
-            minutes=1,
-            id='schedule_notification'
-        )
-
-        # 5분마다 실행되는 작업들
-        self.scheduler.add_job(
-            self.schedule_movement_alert,
-            'cron',
-            minute='*/5',
-            id='schedule_movement_alert'
-        )
-
-        # 20분마다 실행되는 작업들 (8AM-7PM)
-        self.scheduler.add_job(
-            self.update_user_locations_every_20_minutes,
-            'cron',
-            minute='*/20',
-            hour='8-19',
-            id='update_user_locations_every_20_minutes'
-        )
-
-        # 매시간 실행되는 작업들
-        self.scheduler.add_job(
-            self.send_reserved_push_notifications,
-            'cron',
-            hour='*/1',
-            id='send_reserved_push_notifications'
-        )
-        self.scheduler.add_job(
-            self.send_silent_push_to_all_users,
-            'cron',
-            minute='*/15',  # 30분에서 15분으로 더 자주 silent push 전송
-            id='send_silent_push_to_all_users'
-        )
+        """
+        모든 백그라운드 작업을 스케줄링합니다.
+
+        아래 작업은 필요한 모델 조회 함수나 컬럼이 없어 실행되지 않으므로 등록하지 않습니다.
+        (구현을 마치면 목록에 추가)
+        - sync_member_locations_recently, update_user_locations_every_20_minutes,
+          force_update_internal_locations_midnight: member_t에 없는 mt_location_* 컬럼을 갱신
+        - schedule_notification, schedule_movement_alert: get_upcoming_schedules 인자 불일치,
+          sst_movement_alert_sent 컬럼 없음
+        - send_reserved_push_notifications: PushLog.get_reserved_pushes 없음
+        - send_my_location_push_notifications: 내 장소 행에 없는 ml_* 필드 사용
+        - send_daily_weather_notifications: weather_service 없음, member_t에 없는 mt_location_* 컬럼 사용
+        """
+        jobs = [
+            (self._run_background_task, IntervalTrigger(seconds=60), 'background_task'),
+
+            # 30초마다 실행되는 작업들
+            (self.location_entry_alert_schedule, IntervalTrigger(seconds=30), 'location_entry_alert_schedule'),
+            (self.location_exit_alert_schedule, IntervalTrigger(seconds=30), 'location_exit_alert_schedule'),
+            (self.my_location_geofence_alert_schedule, IntervalTrigger(seconds=30), 'my_location_geofence_alert_schedule'),
+
+            # 10분마다 실행되는 작업들
+            (self.rebuild_location_daily_summaries, CronTrigger(minute='*/10'), 'rebuild_location_daily_summaries'),
+
+            # 15분마다 실행되는 작업들
+            (self.send_silent_push_to_all_users, CronTrigger(minute='*/15'), 'send_silent_push_to_all_users'),
+
+            # 매일 특정 시간에 실행되는 작업들
+            (self.send_daily_log_notifications, CronTrigger(hour='18', minute='0'), 'send_daily_log_notifications'),
+            (self.trigger_app_execution_at_7_30pm, CronTrigger(hour='19', minute='30'), 'trigger_app_execution_at_7_30pm'),
+            (self.notify_low_battery_at_9pm, CronTrigger(hour='21', minute='0'), 'notify_low_battery_at_9pm'),
+
+            # 위치 로그 파티션 관리 (사용량이 적은 새벽)
+            (self.maintain_location_log_partitions, CronTrigger(hour='3', minute='30'), 'maintain_location_log_partitions'),
+        ]
+        for func, trigger, job_id in jobs:
+            self._add_job(func, trigger, job_id)
+
+        # 이전 버전에서 공유 작업 저장소에 등록된 작업 중 더 이상 등록하지 않는 작업은 제거
+        job_ids = {job_id for _, _, job_id in jobs}
+        for job in self.scheduler.get_jobs():
+            if job.id not in job_ids:
+                self.scheduler.remove_job(job.id)
+                logger.info(f"등록하지 않는 작업 제거: {job.id}")
+
+    def _sync_last_positions(self) -> None:
+        """다른 워커에서 저장된 위치 로그를 마지막 위치 인덱스에 반영 (작업 주기당 1회 조회)"""
+        from app.services.last_position_index import last_position_index
 
-        # 매일 특정 시간에 실행되는 작업들
-        self.scheduler.add_job(
-            self.force_update_internal_locations_midnight,
-            'cron',
-            hour='0',
-            minute='0',
-            id='force_update_internal_locations_midnight'
-        )
-        self.scheduler.add_job(
-            self.send_daily_log_notifications,
-            'cron',
-            hour='18',
-            minute='00',
-            id='send_daily_log_notifications'
-        )
-        self.scheduler.add_job(
-            self.send_my_location_push_notifications,
-            'cron', 
-            hour='14',
-            minute='00',
-            id='send_my_location_push_notifications'
-        )
-        self.scheduler.add_job(
-            self.trigger_app_execution_at_7_30pm,
-            'cron',
-            hour='19',
-            minute='30',
-            id='trigger_app_execution_at_7_30pm'
-        )
-        self.scheduler.add_job(
-            self.notify_low_battery_at_9pm,
-            'cron',
-            hour='21',
-            minute='00',
-            id='notify_low_battery_at_9pm'
-        )
-
-        # 평일/주말 날씨 알림
-        self.scheduler.add_job(
-            self.send_daily_weather_notifications,
-            'cron',
-            day_of_week='mon-fri',
-            hour=8,
-            minute=10,
-            id='send_daily_weather_notifications_weekdays'
-        )
-        self.scheduler.add_job(
-            self.send_daily_weather_notifications,
-            'cron',
-            day_of_week='sat,sun',
-            hour=9,
-            minute=0,
-            id='send_daily_weather_notifications_weekends'
-        )
+        try:
+            last_position_index.sync(self.db)
+        except Exception as e:
+            logger.error(f"Error syncing last position index: {e}")
 
     # 여기에 각각의 작업 메서드들을 구현
     def location_entry_alert_schedule(self):
         """일정 장소 진입 알림"""
         from app.models.schedule import Schedule
-        from app.models.member import Member
-        from app.models.group_detail import GroupDetail
-        from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
-        from app.core.utils import kmTom
-        
+        from app.services.geofence_service import geofence_service
+        from app.services.push_service import enqueue_pushes
+
         try:
+            self._sync_last_positions()
             plt_condition = "30초 - 장소알림"
             plt_memo = "일정에 입력한 장소의 100미터 반경에 들어왔을때"
-            
-            # 일정이 있는 100M 진입 전인 스케쥴 리스트
-            schedules = Schedule.get_now_schedule_in_members(self.db)
-            
-            for schedule in schedules:
-                mt_idx = None
-                sst_idx = schedule.sst_idx
 
-                if schedule.sgt_idx is not None and schedule.sgdt_idx != 0:
-                    sgt_idx = str(schedule.sgt_idx)
-                    
-                    # 그룹에서 해당 회원의 mt_idx 가져오기
-                    group_member = GroupDetail.get_one_member(self.db, str(schedule.sgdt_idx))
-                    if group_member:
-                        mt_idx = str(group_member.mt_idx)
-
-                if mt_idx and int(schedule.mt_idx) != int(mt_idx):
-                    # 해당 회원의 마지막 위치값과 장소의 위치값 비교
-                    member_location = MemberLocationLog.getDistance(
-                        self.db,
-                        str(schedule.sst_location_lat),
-                        str(schedule.sst_location_long),
-                        mt_idx
-                    )
-
-                    if member_location:
-                        distance = kmTom(member_location.distance)
-                        formatted_distance = "{:,.1f}".format(distance)
-                        push_json = {
-                            "lat": "{:.7f}".format(float(schedule.sst_location_lat)),
-                            "lng": "{:.7f}".format(float(schedule.sst_location_long)),
-                            "distance": formatted_distance
-                        }
+            # 일정이 있는 100M 진입 전인 스케쥴(지오펜스) 리스트와 대상 회원 위치를 일괄 조회 후 판정
+            fences = Schedule.get_location_alert_fences(self.db)
+            hits = geofence_service.evaluate(self.db, fences, radius_m=100.0)
+            job_metrics.record_items(len(fences))
+            group_data_map = self._get_group_members_data(hits)
+
+            pushes = []
+            for hit in hits:
+                schedule = hit.fence
+                push_json = self._geofence_push_json(hit)
 
-                        if distance <= 100.0 and int(schedule.sst_entry_cnt) == 0:
-                            group_data = self._get_group_member_data(sgt_idx, mt_idx)
-                            
-                            # 푸시 알림 메시지 생성 및 전송
-                            self._send_entry_notifications(
-                                group_data,
-                                schedule,
-                                plt_condition,
-                                plt_memo,
-                                push_json
-                            )
-
-                            # 진입 상태 업데이트
-                            self._update_entry_status(schedule.sst_idx)
-
-            logger.info("Location entry alert executed successfully")
+                # 푸시 알림 메시지 생성 및 전송
+                self._send_entry_notifications(
+                    group_data_map[schedule["sst_idx"]],
+                    schedule,
+                    plt_condition,
+                    plt_memo,
+                    push_json,
+                    pushes
+                )
+
+                # 진입 상태 업데이트
+                self._update_entry_status(schedule["sst_idx"])
+
+            # 알림은 outbox에 한 번에 등록 (INSERT/커밋 1회)
+            enqueue_pushes(self.db, pushes)
+
+            logger.info(f"Location entry alert executed successfully (fences: {len(fences)}, entered: {len(hits)})")
             
         except Exception as e:
             logger.error(f"Error in location entry alert: {e}")
-
-    def _get_group_member_data(self, sgt_idx: str, mt_idx: str) -> Dict:
-        """그룹 멤버 데이터를 가져옵니다."""
+            job_metrics.mark_failed(e)
+
+    def _geofence_push_json(self, hit) -> Dict:
+        """지오펜스 판정 결과로 푸시 로그 데이터를 만듭니다."""
+        return {
+            "lat": "{:.7f}".format(float(hit.fence["sst_location_lat"])),
+            "lng": "{:.7f}".format(float(hit.fence["sst_location_long"])),
+            "distance": "{:,.1f}".format(hit.distance_m)
+        }
+
+    def _get_group_members_data(self, hits: List) -> Dict[int, Dict]:
+        """지오펜스 판정 결과별 그룹 소유자/리더/대상 회원 정보를 일괄 조회합니다."""
         from app.models.group_detail import GroupDetail
-        from app.models.member import Member
-        
+        from app.services.member_snapshot_cache import member_snapshot_cache
+
+        if not hits:
+            return {}
+
+        empty = {"owner": {}, "leader": {}, "member": {}}
         try:
-            group_data = {
-                "owner": {},
-                "leader": {},
-                "member": {}
+            managers = GroupDetail.find_managers_by_groups(
+                self.db, [hit.fence["sgt_idx"] for hit in hits]
+            )
+            target_idxs = {int(hit.fence["target_mt_idx"]) for hit in hits}
+            members = {
+                mt_idx: member._asdict()
+                for mt_idx, member in member_snapshot_cache.prefetch(self.db, target_idxs).items()
             }
-            
-            # 그룹 소유자 정보
-            owner = GroupDetail.find_owner(self.db, sgt_idx)
-            if owner:
-                group_data["owner"] = owner
-            
-            # 그룹 리더 정보
-            leader = GroupDetail.find_leader(self.db, sgt_idx)
-            if leader:
-                group_data["leader"] = leader
-            
-            # 멤버 정보
-            member = Member.find_by_idx(self.db, mt_idx)
-            if member:
-                group_data["member"] = {
-                    "mt_idx": member.mt_idx,
-                    "mt_name": member.mt_nickname or member.mt_name,
-                    "mt_lang": member.mt_lang,
-                    "mt_token_id": member.mt_token_id
+
+            group_data_map = {}
+            for hit in hits:
+                group = managers.get(hit.fence["sgt_idx"], {})
+                group_data_map[hit.fence["sst_idx"]] = {
+                    "owner": group.get("owner", {}),
+                    "leader": group.get("leader", {}),
+                    "member": members.get(int(hit.fence["target_mt_idx"]), {})
                 }
-            
-            return group_data
-            
+            return group_data_map
+
         except Exception as e:
             logger.error(f"Error getting group member data: {e}")
-            return {"owner": {}, "leader": {}, "member": {}}
+            return {hit.fence["sst_idx"]: empty for hit in hits}
 
     def _send_entry_notifications(
         self,
         group_data: Dict,
-        schedule: 'Schedule',
+        schedule: Dict,
         plt_condition: str,
         plt_memo: str,
-        push_json: Dict
+        push_json: Dict,
+        pushes: List[Dict]
     ) -> None:
-        """진입 알림을 전송합니다."""
-        from app.services.push_service import send_push, push_log_add
+        """진입 알림을 pushes에 추가합니다. (outbox 등록은 호출한 작업에서 한 번에 수행)"""
+        from app.services.push_service import outbox_push
         
         try:
             messages = {
@@ -294,57 +327,43 @@ class BackgroundTasks:
 
             # 소유자에게 알림
             if group_data["owner"] and group_data["owner"]["mt_idx"] != group_data["member"]["mt_idx"]:
-                lang = group_data["owner"]["mt_lang"]
+                lang = group_data["owner"]["mt_lang"] if group_data["owner"]["mt_lang"] in messages else "ko"
                 push_title = messages[lang]["title"]
                 push_content = messages[lang]["content"].format(
                     name_prefix=group_data["member"]["mt_name"],
-                    title=schedule.sst_title
+                    title=schedule["sst_title"]
                 )
                 
-                push_result = send_push(
-                    group_data["owner"]["mt_token_id"],
-                    push_title,
-                    push_content
-                )
-                
-                push_log_add(
-                    self.db,
+                pushes.append(outbox_push(
                     group_data["owner"]["mt_idx"],
-                    schedule.sst_idx,
+                    schedule["sst_idx"],
                     plt_condition,
                     plt_memo,
                     push_title,
                     push_content,
-                    push_result,
+                    group_data["owner"]["mt_token_id"],
                     push_json
-                )
+                ))
 
             # 리더에게 알림
             if group_data["leader"] and group_data["leader"]["mt_idx"] != group_data["member"]["mt_idx"]:
-                lang = group_data["leader"]["mt_lang"]
+                lang = group_data["leader"]["mt_lang"] if group_data["leader"]["mt_lang"] in messages else "ko"
                 push_title = messages[lang]["title"]
                 push_content = messages[lang]["content"].format(
                     name_prefix=group_data["member"]["mt_name"],
-                    title=schedule.sst_title
+                    title=schedule["sst_title"]
                 )
                 
-                push_result = send_push(
-                    group_data["leader"]["mt_token_id"],
-                    push_title,
-                    push_content
-                )
-                
-                push_log_add(
-                    self.db,
+                pushes.append(outbox_push(
                     group_data["leader"]["mt_idx"],
-                    schedule.sst_idx,
+                    schedule["sst_idx"],
                     plt_condition,
                     plt_memo,
                     push_title,
                     push_content,
-                    push_result,
+                    group_data["leader"]["mt_token_id"],
                     push_json
-                )
+                ))
 
         except Exception as e:
             logger.error(f"Error sending entry notifications: {e}")
@@ -367,79 +386,58 @@ class BackgroundTasks:
     def location_exit_alert_schedule(self):
         """일정 장소 이탈 알림"""
         from app.models.schedule import Schedule
-        from app.models.member import Member
-        from app.models.group_detail import GroupDetail
-        from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
-        from app.core.utils import kmTom
+        from app.services.geofence_service import geofence_service
+        from app.services.push_service import enqueue_pushes
 
         try:
+            self._sync_last_positions()
             plt_condition = "30초 - 장소알림"
             plt_memo = "일정에 입력한 장소의 100미터 반경에서 이탈했을때"
 
-            # 일정이 있는 100M 진입 후인 스케쥴 리스트
-            schedules = Schedule.get_now_schedule_out_members(self.db)
+            # 일정이 있는 100M 진입 후인 스케쥴(지오펜스) 리스트와 대상 회원 위치를 일괄 조회 후 판정
+            fences = Schedule.get_location_alert_fences(self.db, exit_alert=True)
+            hits = geofence_service.evaluate(self.db, fences, exit_alert=True, radius_m=100.0)
+            job_metrics.record_items(len(fences))
+            group_data_map = self._get_group_members_data(hits)
 
-            for schedule in schedules:
-                mt_idx = None
-                sst_idx = schedule.sst_idx
+            pushes = []
+            for hit in hits:
+                schedule = hit.fence
+                push_json = self._geofence_push_json(hit)
 
-                if schedule.sgt_idx is not None and schedule.sgdt_idx != 0:
-                    sgt_idx = str(schedule.sgt_idx)
-
-                    # 그룹에서 해당 회원의 mt_idx 가져오기
-                    group_member = GroupDetail.get_one_member(self.db, str(schedule.sgdt_idx))
-                    if group_member:
-                        mt_idx = str(group_member.mt_idx)
-
-                if mt_idx and int(schedule.mt_idx) != int(mt_idx):
-                    # 해당 회원의 마지막 위치값과 장소의 위치값 비교
-                    member_location = MemberLocationLog.getDistance(
-                        self.db,
-                        str(schedule.sst_location_lat),
-                        str(schedule.sst_location_long),
-                        mt_idx
-                    )
-
-                    if member_location:
-                        distance = kmTom(member_location.distance)
-                        formatted_distance = "{:,.1f}".format(distance)
-                        push_json = {
-                            "lat": "{:.7f}".format(float(schedule.sst_location_lat)),
-                            "lng": "{:.7f}".format(float(schedule.sst_location_long)),
-                            "distance": formatted_distance
-                        }
+                # 푸시 알림 메시지 생성 및 전송
+                self._send_exit_notifications(
+                    group_data_map[schedule["sst_idx"]],
+                    schedule,
+                    plt_condition,
+                    plt_memo,
+                    push_json,
+                    pushes
+                )
 
-                        if distance >= 100.0 and int(schedule.sst_exit_cnt) == 0:
-                            group_data = self._get_group_member_data(sgt_idx, mt_idx)
-                            
-                            # 푸시 알림 메시지 생성 및 전송
-                            self._send_exit_notifications(
-                                group_data,
-                                schedule,
-                                plt_condition,
-                                plt_memo,
-                                push_json
-                            )
+                # 이탈 상태 업데이트
+                self._update_exit_status(schedule["sst_idx"])
 
-                            # 이탈 상태 업데이트
-                            self._update_exit_status(schedule.sst_idx)
+            # 알림은 outbox에 한 번에 등록 (INSERT/커밋 1회)
+            enqueue_pushes(self.db, pushes)
 
-            logger.info("Location exit alert executed successfully")
+            logger.info(f"Location exit alert executed successfully (fences: {len(fences)}, exited: {len(hits)})")
 
         except Exception as e:
             logger.error(f"Error in location exit alert: {e}")
+            job_metrics.mark_failed(e)
 
     def _send_exit_notifications(
         self,
         group_data: Dict,
-        schedule: 'Schedule',
+        schedule: Dict,
         plt_condition: str,
         plt_memo: str,
-        push_json: Dict
+        push_json: Dict,
+        pushes: List[Dict]
     ) -> None:
-        """이탈 알림을 전송합니다."""
-        from app.services.push_service import send_push, push_log_add
+        """이탈 알림을 pushes에 추가합니다. (outbox 등록은 호출한 작업에서 한 번에 수행)"""
+        from app.services.push_service import outbox_push
         
         try:
             messages = {
@@ -456,57 +454,43 @@ class BackgroundTasks:
 
             # 소유자에게 알림
             if group_data["owner"] and group_data["owner"]["mt_idx"] != group_data["member"]["mt_idx"]:
-                lang = group_data["owner"]["mt_lang"]
+                lang = group_data["owner"]["mt_lang"] if group_data["owner"]["mt_lang"] in messages else "ko"
                 push_title = messages[lang]["title"]
                 push_content = messages[lang]["content"].format(
                     name_prefix=group_data["member"]["mt_name"],
-                    title=schedule.sst_title
-                )
-                
-                push_result = send_push(
-                    group_data["owner"]["mt_token_id"],
-                    push_title,
-                    push_content
+                    title=schedule["sst_title"]
                 )
                 
-                push_log_add(
-                    self.db,
+                pushes.append(outbox_push(
                     group_data["owner"]["mt_idx"],
-                    schedule.sst_idx,
+                    schedule["sst_idx"],
                     plt_condition,
                     plt_memo,
                     push_title,
                     push_content,
-                    push_result,
+                    group_data["owner"]["mt_token_id"],
                     push_json
-                )
+                ))
 
             # 리더에게 알림
             if group_data["leader"] and group_data["leader"]["mt_idx"] != group_data["member"]["mt_idx"]:
-                lang = group_data["leader"]["mt_lang"]
+                lang = group_data["leader"]["mt_lang"] if group_data["leader"]["mt_lang"] in messages else "ko"
                 push_title = messages[lang]["title"]
                 push_content = messages[lang]["content"].format(
                     name_prefix=group_data["member"]["mt_name"],
-                    title=schedule.sst_title
+                    title=schedule["sst_title"]
                 )
                 
-                push_result = send_push(
-                    group_data["leader"]["mt_token_id"],
-                    push_title,
-                    push_content
-                )
-                
-                push_log_add(
-                    self.db,
+                pushes.append(outbox_push(
                     group_data["leader"]["mt_idx"],
-                    schedule.sst_idx,
+                    schedule["sst_idx"],
                     plt_condition,
                     plt_memo,
                     push_title,
                     push_content,
-                    push_result,
+                    group_data["leader"]["mt_token_id"],
                     push_json
-                )
+                ))
 
         except Exception as e:
             logger.error(f"Error sending exit notifications: {e}")
@@ -526,178 +510,87 @@ class BackgroundTasks:
             logger.error(f"Error updating exit status: {e}")
             self.db.rollback()
 
-    def my_location_entry_alert_schedule(self):
-        """내 장소 진입 알림"""
-        from app.models.my_location import MyLocation
-        from app.models.member import Member
-        from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
-        from app.core.utils import kmTom
+    def my_location_geofence_alert_schedule(self):
+        """내 장소 진입/이탈 알림 (지오펜스 상태 머신)"""
+        from app.services.geofence_service import my_location_geofence
+        from app.services.member_snapshot_cache import member_snapshot_cache
+        from app.services.push_service import enqueue_pushes, outbox_push
 
         try:
+            self._sync_last_positions()
             plt_condition = "30초 - 내장소알림"
-            plt_memo = "내가 등록한 장소의 100미터 반경에 들어왔을때"
-
-            # 내 장소 목록 가져오기
-            my_locations = MyLocation.get_all_active(self.db)
-
-            for my_location in my_locations:
-                mt_idx = str(my_location.mt_idx)
-                ml_idx = my_location.ml_idx
-
-                # 해당 회원의 마지막 위치값과 장소의 위치값 비교
-                member_location = MemberLocationLog.getDistance(
-                    self.db,
-                    str(my_location.ml_location_lat),
-                    str(my_location.ml_location_long),
-                    mt_idx
-                )
-
-                if member_location:
-                    distance = kmTom(member_location.distance)
-                    formatted_distance = "{:,.1f}".format(distance)
-                    push_json = {
-                        "lat": "{:.7f}".format(float(my_location.ml_location_lat)),
-                        "lng": "{:.7f}".format(float(my_location.ml_location_long)),
-                        "distance": formatted_distance
+            plt_memos = {
+                "enter": "내가 등록한 장소의 100미터 반경에 들어왔을때",
+                "exit": "내가 등록한 장소의 150미터 반경에서 이탈했을때"
+            }
+            messages = {
+                "enter": {
+                    "ko": {
+                        "title": "내 장소 도착알림 📍",
+                        "content": "'{title}' 장소에 도착했어요! 🎉"
+                    },
+                    "en": {
+                        "title": "Arrival at my location 📍",
+                        "content": "You have arrived at '{title}'! 🎉"
                     }
+                },
+                "exit": {
+                    "ko": {
+                        "title": "내 장소 출발알림 👋",
+                        "content": "'{title}' 장소에서 출발했어요!"
+                    },
+                    "en": {
+                        "title": "Departure from my location 👋",
+                        "content": "You have departed from '{title}'!"
+                    }
+                }
+            }
 
-                    if distance <= 100.0 and int(my_location.ml_entry_cnt) == 0:
-                        # 회원 정보 가져오기
-                        member = Member.find_by_idx(self.db, mt_idx)
-                        if member:
-                            # 푸시 알림 메시지 생성 및 전송
-                            messages = {
-                                "ko": {
-                                    "title": "내 장소 도착알림 📍",
-                                    "content": "'{title}' 장소에 도착했어요! 🎉"
-                                },
-                                "en": {
-                                    "title": "Arrival at my location 📍",
-                                    "content": "You have arrived at '{title}'! 🎉"
-                                }
-                            }
-
-                            lang = member.mt_lang
-                            push_title = messages[lang]["title"]
-                            push_content = messages[lang]["content"].format(
-                                title=my_location.ml_title
-                            )
-
-                            push_result = send_push(
-                                member.mt_token_id,
-                                push_title,
-                                push_content
-                            )
-
-                            push_log_add(
-                                self.db,
-                                mt_idx,
-                                ml_idx,
-                                plt_condition,
-                                plt_memo,
-                                push_title,
-                                push_content,
-                                push_result,
-                                push_json
-                            )
-
-                            # 진입 상태 업데이트
-                            my_location.ml_in_chk = "Y"
-                            my_location.ml_entry_cnt = (my_location.ml_entry_cnt or 0) + 1
-                            self.db.commit()
-
-            logger.info("My location entry alert executed successfully")
-
-        except Exception as e:
-            logger.error(f"Error in my location entry alert: {e}")
-            self.db.rollback()
-
-    def my_location_exit_alert_schedule(self):
-        """내 장소 이탈 알림"""
-        from app.models.my_location import MyLocation
-        from app.models.member import Member
-        from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
-        from app.core.utils import kmTom
-
-        try:
-            plt_condition = "30초 - 내장소알림"
-            plt_memo = "내가 등록한 장소의 100미터 반경에서 이탈했을때"
+            # 위치가 바뀐 회원의 장소만 판정하여 진입/이탈 전이 이벤트 생성
+            result = my_location_geofence.tick(self.db)
+            events = result.events
+            job_metrics.record_items(len(events))
 
-            # 내 장소 목록 가져오기 (진입 상태인 것만)
-            my_locations = MyLocation.get_all_active_in(self.db)
+            members = member_snapshot_cache.prefetch(self.db, [event.fence["mt_idx"] for event in events])
 
-            for my_location in my_locations:
-                mt_idx = str(my_location.mt_idx)
-                ml_idx = my_location.ml_idx
+            pushes = []
+            for event in events:
+                fence = event.fence
+                member = members.get(fence["mt_idx"])
+                if not member or not member.mt_token_id:
+                    continue
 
-                # 해당 회원의 마지막 위치값과 장소의 위치값 비교
-                member_location = MemberLocationLog.getDistance(
-                    self.db,
-                    str(my_location.ml_location_lat),
-                    str(my_location.ml_location_long),
-                    mt_idx
+                lang = member.mt_lang if member.mt_lang in messages[event.event] else "ko"
+                push_title = messages[event.event][lang]["title"]
+                push_content = messages[event.event][lang]["content"].format(
+                    title=fence["slt_title"]
                 )
+                push_json = {
+                    "lat": "{:.7f}".format(fence["slt_lat"]),
+                    "lng": "{:.7f}".format(fence["slt_long"]),
+                    "distance": "{:,.1f}".format(event.distance_m)
+                }
 
-                if member_location:
-                    distance = kmTom(member_location.distance)
-                    formatted_distance = "{:,.1f}".format(distance)
-                    push_json = {
-                        "lat": "{:.7f}".format(float(my_location.ml_location_lat)),
-                        "lng": "{:.7f}".format(float(my_location.ml_location_long)),
-                        "distance": formatted_distance
-                    }
+                pushes.append(outbox_push(
+                    member.mt_idx,
+                    fence["slt_idx"],
+                    plt_condition,
+                    plt_memos[event.event],
+                    push_title,
+                    push_content,
+                    member.mt_token_id,
+                    push_json
+                ))
 
-                    if distance >= 100.0 and int(my_location.ml_exit_cnt) == 0:
-                        # 회원 정보 가져오기
-                        member = Member.find_by_idx(self.db, mt_idx)
-                        if member:
-                            # 푸시 알림 메시지 생성 및 전송
-                            messages = {
-                                "ko": {
-                                    "title": "내 장소 출발알림 👋",
-                                    "content": "'{title}' 장소에서 출발했어요!"
-                                },
-                                "en": {
-                                    "title": "Departure from my location 👋",
-                                    "content": "You have departed from '{title}'!"
-                                }
-                            }
+            # 진입 상태와 알림 outbox를 한 트랜잭션으로 커밋 (실패하면 다음 주기에 다시 판정)
+            enqueue_pushes(self.db, pushes, commit=False)
+            my_location_geofence.commit(self.db, result)
 
-                            lang = member.mt_lang
-                            push_title = messages[lang]["title"]
-                            push_content = messages[lang]["content"].format(
-                                title=my_location.ml_title
-                            )
-
-                            push_result = send_push(
-                                member.mt_token_id,
-                                push_title,
-                                push_content
-                            )
-
-                            push_log_add(
-                                self.db,
-                                mt_idx,
-                                ml_idx,
-                                plt_condition,
-                                plt_memo,
-                                push_title,
-                                push_content,
-                                push_result,
-                                push_json
-                            )
-
-                            # 이탈 상태 업데이트
-                            my_location.ml_in_chk = "N"
-                            my_location.ml_exit_cnt = (my_location.ml_exit_cnt or 0) + 1
-                            self.db.commit()
-
-            logger.info("My location exit alert executed successfully")
+            logger.info(f"My location geofence alert executed successfully (events: {len(events)})")
 
         except Exception as e:
-            logger.error(f"Error in my location exit alert: {e}")
+            logger.error(f"Error in my location geofence alert: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def sync_member_locations_recently(self):
@@ -714,6 +607,7 @@ class BackgroundTasks:
 
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
             for member in members:
                 mt_idx = str(member.mt_idx)
@@ -736,14 +630,15 @@ class BackgroundTasks:
 
         except Exception as e:
             logger.error(f"Error in member locations sync: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def schedule_notification(self):
         """일정 알림"""
         from app.models.schedule import Schedule
-        from app.models.member import Member
         from app.models.group_detail import GroupDetail
-        from app.services.push_service import send_push, push_log_add
+        from app.services.member_snapshot_cache import member_snapshot_cache
+        from app.services.push_service import enqueue_pushes, outbox_push
         from datetime import datetime, timedelta
 
         try:
@@ -761,12 +656,25 @@ class BackgroundTasks:
                 thirty_minutes_later
             )
 
+            # 그룹 멤버와 회원 정보(언어, 토큰)를 일괄 조회
+            job_metrics.record_items(len(schedules))
+            group_members = GroupDetail.get_member_idxs_by_groups(
+                self.db,
+                [schedule.sgt_idx for schedule in schedules]
+            )
+            members = member_snapshot_cache.prefetch(
+                self.db,
+                [schedule.mt_idx for schedule in schedules] +
+                [member_idx for member_idxs in group_members.values() for member_idx in member_idxs]
+            )
+
+            pushes = []
             for schedule in schedules:
                 sst_idx = schedule.sst_idx
                 mt_idx = str(schedule.mt_idx)
 
                 # 일정 소유자 정보 가져오기
-                owner = Member.find_by_idx(self.db, mt_idx)
+                owner = members.get(schedule.mt_idx)
                 if not owner:
                     continue
 
@@ -788,73 +696,54 @@ class BackgroundTasks:
                     title=schedule.sst_title
                 )
 
-                push_result = send_push(
-                    owner.mt_token_id,
-                    push_title,
-                    push_content
-                )
-
-                push_log_add(
-                    self.db,
+                pushes.append(outbox_push(
                     mt_idx,
                     sst_idx,
                     plt_condition,
                     plt_memo,
                     push_title,
                     push_content,
-                    push_result,
+                    owner.mt_token_id,
                     {}
-                )
+                ))
 
                 # 그룹 일정인 경우 그룹 멤버들에게도 알림
                 if schedule.sgt_idx is not None:
-                    group_members = GroupDetail.get_all_members(
-                        self.db,
-                        str(schedule.sgt_idx)
-                    )
-
-                    for group_member in group_members:
-                        if str(group_member.mt_idx) != mt_idx:  # 소유자 제외
-                            member = Member.find_by_idx(
-                                self.db,
-                                str(group_member.mt_idx)
-                            )
+                    for member_idx in group_members.get(schedule.sgt_idx, []):
+                        if str(member_idx) != mt_idx:  # 소유자 제외
+                            member = members.get(member_idx)
                             if member:
-                                push_result = send_push(
-                                    member.mt_token_id,
-                                    push_title,
-                                    push_content
-                                )
-
-                                push_log_add(
-                                    self.db,
+                                pushes.append(outbox_push(
                                     str(member.mt_idx),
                                     sst_idx,
                                     plt_condition,
                                     plt_memo,
                                     push_title,
                                     push_content,
-                                    push_result,
+                                    member.mt_token_id,
                                     {}
-                                )
+                                ))
+
+            enqueue_pushes(self.db, pushes)
 
             logger.info("Schedule notifications executed successfully")
 
         except Exception as e:
             logger.error(f"Error in schedule notifications: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def schedule_movement_alert(self):
         """일정 이동 알림"""
         from app.models.schedule import Schedule
-        from app.models.member import Member
-        from app.models.group_detail import GroupDetail
         from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
+        from app.services.member_snapshot_cache import member_snapshot_cache
+        from app.services.push_service import enqueue_pushes, outbox_push
         from app.core.utils import kmTom
         from datetime import datetime, timedelta
 
         try:
+            self._sync_last_positions()
             plt_condition = "5분 - 이동알림"
             plt_memo = "일정 장소로 이동 중인지 확인"
 
@@ -868,13 +757,16 @@ class BackgroundTasks:
                 self.db,
                 one_hour_later
             )
+            members = member_snapshot_cache.prefetch(self.db, [schedule.mt_idx for schedule in schedules])
+            job_metrics.record_items(len(schedules))
 
+            pushes = []
             for schedule in schedules:
                 sst_idx = schedule.sst_idx
                 mt_idx = str(schedule.mt_idx)
 
                 # 일정 소유자 정보 가져오기
-                owner = Member.find_by_idx(self.db, mt_idx)
+                owner = members.get(schedule.mt_idx)
                 if not owner:
                     continue
 
@@ -916,34 +808,65 @@ class BackgroundTasks:
                             distance=formatted_distance
                         )
 
-                        push_result = send_push(
-                            owner.mt_token_id,
-                            push_title,
-                            push_content
-                        )
-
-                        push_log_add(
-                            self.db,
+                        pushes.append(outbox_push(
                             mt_idx,
                             sst_idx,
                             plt_condition,
                             plt_memo,
                             push_title,
                             push_content,
-                            push_result,
+                            owner.mt_token_id,
                             push_json
-                        )
+                        ))
 
-                        # 이동 중 알림 상태 업데이트
+                        # 이동 중 알림 상태 업데이트 (알림과 같은 트랜잭션에서 함께 커밋)
                         schedule.sst_movement_alert_sent = True
-                        self.db.commit()
+
+            enqueue_pushes(self.db, pushes, commit=False)
+            self.db.commit()
 
             logger.info("Schedule movement alerts executed successfully")
 
         except Exception as e:
             logger.error(f"Error in schedule movement alerts: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
+    def rebuild_location_daily_summaries(self):
+        """재계산 대상으로 표시된 일일 위치 요약 재계산"""
+        from app.crud import location_daily_summary
+
+        db = SessionLocal()
+        try:
+            count = location_daily_summary.rebuild_pending_summaries(db)
+            job_metrics.record_items(count)
+            if count:
+                logger.info(f"일일 위치 요약 재계산 완료: {count}건")
+        except Exception as e:
+            logger.error(f"Error rebuilding location daily summaries: {e}")
+            job_metrics.mark_failed(e)
+            db.rollback()
+        finally:
+            db.close()
+
+    def maintain_location_log_partitions(self):
+        """위치 로그 다음 달 파티션 생성, 보관 기간이 지난 파티션 보관 후 삭제"""
+        from app.services.location_partition_service import location_partition_service
+
+        db = SessionLocal()
+        try:
+            result = location_partition_service.run_maintenance(db)
+            job_metrics.record_items(len(result["created"]), "partitions_created")
+            job_metrics.record_items(len(result["dropped"]), "partitions_dropped")
+            if result["created"] or result["dropped"]:
+                logger.info(f"위치 로그 파티션 관리 완료: {result}")
+        except Exception as e:
+            logger.error(f"Error maintaining location log partitions: {e}")
+            job_metrics.mark_failed(e)
+            db.rollback()
+        finally:
+            db.close()
+
     def update_user_locations_every_20_minutes(self):
         """사용자 위치 업데이트"""
         from app.models.member import Member
@@ -958,6 +881,7 @@ class BackgroundTasks:
 
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
             for member in members:
                 mt_idx = str(member.mt_idx)
@@ -980,12 +904,13 @@ class BackgroundTasks:
 
         except Exception as e:
             logger.error(f"Error in user locations update: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def send_reserved_push_notifications(self):
         """예약된 푸시 알림 발송"""
         from app.models.push_log import PushLog
-        from app.models.member import Member
+        from app.services.member_snapshot_cache import member_snapshot_cache
         from app.services.push_service import send_push
         from datetime import datetime
 
@@ -998,10 +923,12 @@ class BackgroundTasks:
                 self.db,
                 now
             )
+            members = member_snapshot_cache.prefetch(self.db, [push.mt_idx for push in reserved_pushes])
+            job_metrics.record_items(len(reserved_pushes))
 
             for push in reserved_pushes:
                 # 회원 정보 가져오기
-                member = Member.find_by_idx(self.db, str(push.mt_idx))
+                member = members.get(push.mt_idx)
                 if not member:
                     continue
 
@@ -1011,6 +938,8 @@ class BackgroundTasks:
                     push.plt_title,
                     push.plt_content
                 )
+                if push_result["result"]:
+                    job_metrics.record_items(1, "pushes")
 
                 # 푸시 로그 상태 업데이트
                 push.plt_status = "SENT" if push_result else "FAILED"
@@ -1021,12 +950,15 @@ class BackgroundTasks:
 
         except Exception as e:
             logger.error(f"Error in reserved push notifications: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def send_silent_push_to_all_users(self):
         """모든 FCM 토큰 보유 사용자에게 Silent 푸시 전송 (백그라운드 토큰 유지용)"""
         from app.models.member import Member
         from app.services.firebase_service import firebase_service
+        from app.services.push_fanout import PushFanout
+        from app.core.config import settings
         from datetime import datetime, timedelta
 
         try:
@@ -1036,58 +968,54 @@ class BackgroundTasks:
             current_time = datetime.now()
             expired_threshold = current_time + timedelta(days=30)  # 30일 이내 만료 예정인 토큰 우선
 
-            # 우선순위 1: 토큰 만료 임박 사용자
-            priority_members = Member.get_token_expiring_soon(self.db, expired_threshold)
-            # 우선순위 2: 나머지 모든 토큰 보유 사용자
-            all_members = Member.get_token_list(self.db)
-
-            # 중복 제거를 위해 우선순위 멤버들을 제외한 나머지 멤버들
-            priority_mt_idxs = {member.mt_idx for member in priority_members}
-            remaining_members = [member for member in all_members if member.mt_idx not in priority_mt_idxs]
-
-            # 우선순위 멤버 먼저, 나머지 멤버들 뒤에 추가
-            target_members = priority_members + remaining_members
-
-            logger.info(f"FCM 토큰 보유 사용자 수: {len(target_members)} (우선순위: {len(priority_members)}, 일반: {len(remaining_members)})")
-
-            success_count = 0
-            fail_count = 0
-            priority_success_count = 0
-            priority_fail_count = 0
-
-            for i, member in enumerate(target_members):
-                try:
-                    is_priority = i < len(priority_members)
-                    reason = "priority_token_refresh" if is_priority else "scheduled_token_refresh"
-                    priority = "high" if is_priority else "high"  # 모두 high로 설정하여 푸시 수신 보장
+            # 우선순위 1: 토큰 만료 임박 사용자, 우선순위 2: 나머지 모든 토큰 보유 사용자 (한 번의 쿼리로 정렬 조회)
+            # 같은 토큰이 여러 계정에 있으면 한 번만 전송
+            priority_members = []
+            remaining_members = []
+            seen_tokens = set()
+            for member in Member.get_silent_push_targets(self.db, expired_threshold):
+                if member.mt_token_id in seen_tokens:
+                    continue
+                seen_tokens.add(member.mt_token_id)
+                (priority_members if member.is_priority else remaining_members).append(member)
 
-                    # 각 사용자에게 silent push 전송 (priority를 높게 설정하여 iOS 무시 방지)
-                    response = firebase_service.send_silent_push_notification(
-                        member.mt_token_id,
-                        reason,
-                        priority  # 무조건 high로 설정하여 푸시 수신 보장
-                    )
+            logger.info(f"FCM 토큰 보유 사용자 수: {len(seen_tokens)} (우선순위: {len(priority_members)}, 일반: {len(remaining_members)})")
 
-                    if is_priority:
-                        priority_success_count += 1
-                    success_count += 1
+            def send(member):
+                reason = "priority_token_refresh" if member.is_priority else "scheduled_token_refresh"
+                # 각 사용자에게 silent push 전송 (priority를 높게 설정하여 iOS 무시 방지)
+                firebase_service.send_silent_push_notification(
+                    member.mt_token_id,
+                    reason,
+                    "high"  # 무조건 high로 설정하여 푸시 수신 보장
+                )
 
-                    logger.debug(f"Silent 푸시 전송 성공 - mt_idx: {member.mt_idx}, 우선순위: {is_priority}, 토큰 만료일: {member.mt_token_expiry_date}")
+            # 우선순위 멤버 먼저, 나머지 멤버들 뒤에 (동시 전송 수/초당 전송 건수 제한)
+            fanout = PushFanout(
+                concurrency=settings.SILENT_PUSH_CONCURRENCY,
+                rate_limit=settings.SILENT_PUSH_RATE_LIMIT,
+                max_duration=settings.SILENT_PUSH_MAX_DURATION
+            )
+            stats = fanout.run([("priority", priority_members), ("normal", remaining_members)], send)
+            priority_stats, remaining_stats = stats["priority"], stats["normal"]
 
-                except Exception as e:
-                    if i < len(priority_members):
-                        priority_fail_count += 1
-                    fail_count += 1
-                    logger.error(f"Silent 푸시 전송 실패 - mt_idx: {member.mt_idx}, error: {str(e)}")
+            success_count = priority_stats["success"] + remaining_stats["success"]
+            fail_count = priority_stats["fail"] + remaining_stats["fail"]
+            skipped_count = priority_stats["skipped"] + remaining_stats["skipped"]
+            job_metrics.record_items(priority_stats["total"] + remaining_stats["total"])
+            job_metrics.record_items(success_count, "pushes")
 
-            logger.info(f"Silent 푸시 배치 전송 완료 - 전체: {success_count}/{len(target_members)} 성공")
-            logger.info(f"우선순위 토큰: {priority_success_count}/{len(priority_members)} 성공, 일반 토큰: {success_count - priority_success_count}/{len(remaining_members)} 성공")
+            logger.info(f"Silent 푸시 배치 전송 완료 - 전체: {success_count}/{len(seen_tokens)} 성공")
+            logger.info(f"우선순위 토큰: {priority_stats['success']}/{priority_stats['total']} 성공, 일반 토큰: {remaining_stats['success']}/{remaining_stats['total']} 성공")
 
             if fail_count > 0:
-                logger.warning(f"Silent 푸시 전송 실패: {fail_count}개 (우선순위 실패: {priority_fail_count})")
+                logger.warning(f"Silent 푸시 전송 실패: {fail_count}개 (우선순위 실패: {priority_stats['fail']})")
+            if skipped_count > 0:
+                logger.warning(f"Silent 푸시 전송 생략: {skipped_count}개 (최대 실행 시간 초과, 우선순위 생략: {priority_stats['skipped']})")
 
         except Exception as e:
             logger.error(f"Silent 푸시 배치 전송 중 오류 발생: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def force_update_internal_locations_midnight(self):
@@ -1104,6 +1032,7 @@ class BackgroundTasks:
 
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
             for member in members:
                 mt_idx = str(member.mt_idx)
@@ -1127,105 +1056,91 @@ class BackgroundTasks:
 
         except Exception as e:
             logger.error(f"Error in internal locations force update: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def send_daily_log_notifications(self):
         """일일 로그 알림"""
+        from app.crud.location_daily_summary import get_daily_moving_meters
         from app.models.member import Member
-        from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
-        from datetime import datetime, timedelta
+        from app.services.push_service import enqueue_pushes, outbox_push
+        from datetime import date
 
         try:
             plt_condition = "일일 - 로그알림"
             plt_memo = "오늘의 위치 이동 기록 요약"
 
-            # 현재 시간
-            now = datetime.now()
-            # 오늘 자정
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            # 푸시 알림 메시지
+            messages = {
+                "ko": {
+                    "title": "오늘의 이동 기록 📊",
+                    "content": "오늘 총 {distance}m를 이동했어요!"
+                },
+                "en": {
+                    "title": "Today's Movement Record 📊",
+                    "content": "You moved {distance}m today!"
+                }
+            }
 
-            # 활성화된 모든 회원 가져오기
+            # 활성화된 모든 회원과 오늘 이동 거리(일일 요약)를 각각 한 번에 조회
             members = Member.get_all_active(self.db)
+            moving_meters = get_daily_moving_meters(self.db, date.today())
+            job_metrics.record_items(len(members))
 
+            pushes = []
             for member in members:
-                mt_idx = str(member.mt_idx)
-                
-                # 오늘의 위치 로그 가져오기
-                today_logs = MemberLocationLog.get_daily_logs(
-                    self.db,
-                    mt_idx,
-                    today_start
-                )
+                total_distance = moving_meters.get(member.mt_idx)
+                if not total_distance:
+                    continue
+                formatted_distance = "{:,.1f}".format(total_distance)
 
-                if today_logs:
-                    # 이동 거리 계산
-                    total_distance = sum(log.mll_distance for log in today_logs)
-                    formatted_distance = "{:,.1f}".format(total_distance)
-
-                    # 푸시 알림 메시지 생성 및 전송
-                    messages = {
-                        "ko": {
-                            "title": "오늘의 이동 기록 📊",
-                            "content": "오늘 총 {distance}m를 이동했어요!"
-                        },
-                        "en": {
-                            "title": "Today's Movement Record 📊",
-                            "content": "You moved {distance}m today!"
-                        }
-                    }
+                lang = member.mt_lang if member.mt_lang in messages else "ko"
+                pushes.append(outbox_push(
+                    member.mt_idx,
+                    None,  # 일일 로그는 특정 일정과 연관 없음
+                    plt_condition,
+                    plt_memo,
+                    messages[lang]["title"],
+                    messages[lang]["content"].format(distance=formatted_distance),
+                    member.mt_token_id,
+                    {"distance": formatted_distance}
+                ))
 
-                    lang = member.mt_lang
-                    push_title = messages[lang]["title"]
-                    push_content = messages[lang]["content"].format(
-                        distance=formatted_distance
-                    )
-
-                    push_result = send_push(
-                        member.mt_token_id,
-                        push_title,
-                        push_content
-                    )
-
-                    push_log_add(
-                        self.db,
-                        mt_idx,
-                        None,  # 일일 로그는 특정 일정과 연관 없음
-                        plt_condition,
-                        plt_memo,
-                        push_title,
-                        push_content,
-                        push_result,
-                        {"distance": formatted_distance}
-                    )
+            # outbox에 일괄 등록 (전송은 push_outbox_service 워커가 500건 단위로 수행)
+            enqueue_pushes(self.db, pushes)
 
             logger.info("Daily log notifications executed successfully")
 
         except Exception as e:
             logger.error(f"Error in daily log notifications: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def send_my_location_push_notifications(self):
         """내 위치 푸시 알림"""
         from app.models.my_location import MyLocation
-        from app.models.member import Member
         from app.models.member_location_log import MemberLocationLog
-        from app.services.push_service import send_push, push_log_add
+        from app.services.member_snapshot_cache import member_snapshot_cache
+        from app.services.push_service import enqueue_pushes, outbox_push
         from app.core.utils import kmTom
 
         try:
+            self._sync_last_positions()
             plt_condition = "일일 - 내위치알림"
             plt_memo = "내가 등록한 장소 근처에 있는지 확인"
 
             # 활성화된 모든 내 장소 가져오기
             my_locations = MyLocation.get_all_active(self.db)
+            job_metrics.record_items(len(my_locations))
+            members = member_snapshot_cache.prefetch(self.db, [my_location.mt_idx for my_location in my_locations])
 
+            pushes = []
             for my_location in my_locations:
                 mt_idx = str(my_location.mt_idx)
                 ml_idx = my_location.ml_idx
 
                 # 회원 정보 가져오기
-                member = Member.find_by_idx(self.db, mt_idx)
+                member = members.get(my_location.mt_idx)
                 if not member:
                     continue
 
@@ -1267,156 +1182,152 @@ class BackgroundTasks:
                             distance=formatted_distance
                         )
 
-                        push_result = send_push(
-                            member.mt_token_id,
-                            push_title,
-                            push_content
-                        )
-
-                        push_log_add(
-                            self.db,
+                        pushes.append(outbox_push(
                             mt_idx,
                             ml_idx,
                             plt_condition,
                             plt_memo,
                             push_title,
                             push_content,
-                            push_result,
+                            member.mt_token_id,
                             push_json
-                        )
+                        ))
+
+            enqueue_pushes(self.db, pushes)
 
             logger.info("My location push notifications executed successfully")
 
         except Exception as e:
             logger.error(f"Error in my location push notifications: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def trigger_app_execution_at_7_30pm(self):
         """앱 실행 트리거"""
         from app.models.member import Member
-        from app.services.push_service import send_push, push_log_add
+        from app.services.push_service import enqueue_pushes
 
         try:
             plt_condition = "일일 - 앱실행알림"
             plt_memo = "저녁 7시 30분 앱 실행 알림"
 
+            # 푸시 알림 메시지
+            messages = {
+                "ko": {
+                    "title": "오늘 하루는 어떠셨나요? 🌙",
+                    "content": "오늘의 일정과 위치 기록을 확인해보세요!"
+                },
+                "en": {
+                    "title": "How was your day? 🌙",
+                    "content": "Check your today's schedule and location records!"
+                }
+            }
+
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
+            pushes = []
             for member in members:
-                mt_idx = str(member.mt_idx)
-
-                # 푸시 알림 메시지 생성 및 전송
-                messages = {
-                    "ko": {
-                        "title": "오늘 하루는 어떠셨나요? 🌙",
-                        "content": "오늘의 일정과 위치 기록을 확인해보세요!"
-                    },
-                    "en": {
-                        "title": "How was your day? 🌙",
-                        "content": "Check your today's schedule and location records!"
-                    }
-                }
-
-                lang = member.mt_lang
-                push_title = messages[lang]["title"]
-                push_content = messages[lang]["content"]
-
-                push_result = send_push(
-                    member.mt_token_id,
-                    push_title,
-                    push_content
-                )
-
-                push_log_add(
-                    self.db,
-                    mt_idx,
-                    None,  # 앱 실행 알림은 특정 일정과 연관 없음
-                    plt_condition,
-                    plt_memo,
-                    push_title,
-                    push_content,
-                    push_result,
-                    {}
-                )
+                lang = member.mt_lang if member.mt_lang in messages else "ko"
+                pushes.append({
+                    "mt_idx": member.mt_idx,
+                    "sst_idx": None,  # 앱 실행 알림은 특정 일정과 연관 없음
+                    "plt_condition": plt_condition,
+                    "plt_memo": plt_memo,
+                    "plt_title": messages[lang]["title"],
+                    "plt_content": messages[lang]["content"],
+                    "token_id": member.mt_token_id,
+                    "push_json": {}
+                })
+
+            # outbox에 일괄 등록 (전송은 push_outbox_service 워커가 500건 단위로 수행)
+            enqueue_pushes(self.db, pushes)
 
             logger.info("App execution trigger executed successfully")
 
         except Exception as e:
             logger.error(f"Error in app execution trigger: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def notify_low_battery_at_9pm(self):
         """배터리 부족 알림"""
         from app.models.member import Member
-        from app.services.push_service import send_push, push_log_add
+        from app.services.push_service import enqueue_pushes
 
         try:
             plt_condition = "일일 - 배터리알림"
             plt_memo = "저녁 9시 배터리 부족 알림"
 
+            # 푸시 알림 메시지
+            messages = {
+                "ko": {
+                    "title": "배터리 부족 알림 🔋",
+                    "content": "배터리가 부족해요! 충전해주세요."
+                },
+                "en": {
+                    "title": "Low Battery Alert 🔋",
+                    "content": "Your battery is low! Please charge your device."
+                }
+            }
+
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
+            pushes = []
             for member in members:
-                mt_idx = str(member.mt_idx)
-
-                # 푸시 알림 메시지 생성 및 전송
-                messages = {
-                    "ko": {
-                        "title": "배터리 부족 알림 🔋",
-                        "content": "배터리가 부족해요! 충전해주세요."
-                    },
-                    "en": {
-                        "title": "Low Battery Alert 🔋",
-                        "content": "Your battery is low! Please charge your device."
-                    }
-                }
-
-                lang = member.mt_lang
-                push_title = messages[lang]["title"]
-                push_content = messages[lang]["content"]
-
-                push_result = send_push(
-                    member.mt_token_id,
-                    push_title,
-                    push_content
-                )
-
-                push_log_add(
-                    self.db,
-                    mt_idx,
-                    None,  # 배터리 알림은 특정 일정과 연관 없음
-                    plt_condition,
-                    plt_memo,
-                    push_title,
-                    push_content,
-                    push_result,
-                    {}
-                )
+                lang = member.mt_lang if member.mt_lang in messages else "ko"
+                pushes.append({
+                    "mt_idx": member.mt_idx,
+                    "sst_idx": None,  # 배터리 알림은 특정 일정과 연관 없음
+                    "plt_condition": plt_condition,
+                    "plt_memo": plt_memo,
+                    "plt_title": messages[lang]["title"],
+                    "plt_content": messages[lang]["content"],
+                    "token_id": member.mt_token_id,
+                    "push_json": {}
+                })
+
+            # outbox에 일괄 등록 (전송은 push_outbox_service 워커가 500건 단위로 수행)
+            enqueue_pushes(self.db, pushes)
 
             logger.info("Low battery notifications executed successfully")
 
         except Exception as e:
             logger.error(f"Error in low battery notifications: {e}")
+            job_metrics.mark_failed(e)
             self.db.rollback()
 
     def send_daily_weather_notifications(self):
         """일일 날씨 알림"""
         from app.models.member import Member
-        from app.services.push_service import send_push, push_log_add
+        from app.services.push_service import enqueue_pushes
         from app.services.weather_service import get_weather_info
 
         try:
             plt_condition = "일일 - 날씨알림"
             plt_memo = "오늘의 날씨 정보 알림"
 
+            # 푸시 알림 메시지
+            messages = {
+                "ko": {
+                    "title": "오늘의 날씨 ☀️",
+                    "content": "현재 기온: {temp}°C\n날씨: {weather}\n습도: {humidity}%"
+                },
+                "en": {
+                    "title": "Today's Weather ☀️",
+                    "content": "Current Temperature: {temp}°C\nWeather: {weather}\nHumidity: {humidity}%"
+                }
+            }
+
             # 활성화된 모든 회원 가져오기
             members = Member.get_all_active(self.db)
+            job_metrics.record_items(len(members))
 
+            pushes = []
             for member in members:
-                mt_idx = str(member.mt_idx)
-
                 # 회원의 위치 기반으로 날씨 정보 가져오기
                 weather_info = get_weather_info(
                     self.db,
@@ -1425,50 +1336,54 @@ class BackgroundTasks:
                 )
 
                 if weather_info:
-                    # 푸시 알림 메시지 생성 및 전송
-                    messages = {
-                        "ko": {
-                            "title": "오늘의 날씨 ☀️",
-                            "content": "현재 기온: {temp}°C\n날씨: {weather}\n습도: {humidity}%"
-                        },
-                        "en": {
-                            "title": "Today's Weather ☀️",
-                            "content": "Current Temperature: {temp}°C\nWeather: {weather}\nHumidity: {humidity}%"
-                        }
-                    }
-
                     lang = member.mt_lang
-                    push_title = messages[lang]["title"]
-                    push_content = messages[lang]["content"].format(
-                        temp=weather_info["temperature"],
-                        weather=weather_info["weather"],
-                        humidity=weather_info["humidity"]
-                    )
-
-                    push_result = send_push(
-                        member.mt_token_id,
-                        push_title,
-                        push_content
-                    )
-
-                    push_log_add(
-                        self.db,
-                        mt_idx,
-                        None,  # 날씨 알림은 특정 일정과 연관 없음
-                        plt_condition,
-                        plt_memo,
-                        push_title,
-                        push_content,
-                        push_result,
-                        weather_info
-                    )
+                    pushes.append({
+                        "mt_idx": member.mt_idx,
+                        "sst_idx": None,  # 날씨 알림은 특정 일정과 연관 없음
+                        "plt_condition": plt_condition,
+                        "plt_memo": plt_memo,
+                        "plt_title": messages[lang]["title"],
+                        "plt_content": messages[lang]["content"].format(
+                            temp=weather_info["temperature"],
+                            weather=weather_info["weather"],
+                            humidity=weather_info["humidity"]
+                        ),
+                        "token_id": member.mt_token_id,
+                        "push_json": weather_info
+                    })
+
+            # outbox에 일괄 등록 (전송은 push_outbox_service 워커가 500건 단위로 수행)
+            enqueue_pushes(self.db, pushes)
 
             logger.info("Daily weather notifications executed successfully")
 
         except Exception as e:
             logger.error(f"Error sending daily weather notification: {e}")
-        finally:
-            db.close()
+            job_metrics.mark_failed(e)
+            self.db.rollback()
 
 # scheduler 인스턴스 생성
-scheduler = BackgroundTasks() 
\ No newline at end of file
+scheduler = BackgroundTasks()
+
+
+def run_job(task_name: str, job_id: str = None):
+    """
+    작업 저장소에 등록되는 작업 진입점 (task_name: BackgroundTasks 메서드 이름)
+
+    리더 임대가 만료된 직후 실행 예정이던 작업이 다른 워커와 중복 실행되지 않도록, 실행 직전에 리더 여부를 다시 확인합니다.
+    작업마다 DB 세션을 새로 열어 self.db로 제공하고, 끝나면 닫습니다.
+    실행 시간, 결과, 처리 건수는 job_id별 메트릭으로 기록합니다.
+    """
+    job_id = job_id or task_name
+    if not scheduler.is_active():
+        logger.info(f"리더가 아니므로 작업 실행 생략: {task_name}")
+        job_metrics.record_skipped(job_id, "not_leader")
+        return
+    db = SessionLocal()
+    scheduler._local.db = db
+    try:
+        with job_metrics.track_job(job_id):
+            getattr(scheduler, task_name)()
+    finally:
+        scheduler._local.db = None
+        db.close() 
\ No newline at end of file
@@ -0,0 +1,153 @@
+import contextvars
+import json
+import logging
+import random
+import re
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 요청별 프로파일 (sync 엔드포인트는 스레드풀에서 실행되지만 contextvars가 복사되어 같은 객체를 공유)
+_current_profile: contextvars.ContextVar[Optional["SQLProfile"]] = contextvars.ContextVar("sql_profile", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|:\w+|%\(\w+\)s)\s*,?)+\)", re.IGNORECASE)
+
+
+def normalize_statement(statement: str) -> str:
+    """같은 형태의 쿼리를 묶기 위해 리터럴과 IN 목록 길이를 지운 문장"""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _IN_LIST.sub("IN (...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class SQLProfile:
+    """요청 1건에서 실행된 SQL 수, 총 실행 시간, 느린 쿼리, 반복 쿼리(N+1 의심)"""
+
+    def __init__(self, slow_query_ms: float, max_slow_queries: int = 5):
+        self.slow_query_ms = slow_query_ms
+        self.max_slow_queries = max_slow_queries
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Dict[str, List[float]] = {}  # 정규화 문장 -> [실행 수, 총 시간(ms)]
+        self.slowest: List[Dict] = []
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        normalized = normalize_statement(statement)
+        stat = self.statements.get(normalized)
+        if stat is None:
+            stat = self.statements[normalized] = [0, 0.0]
+        stat[0] += 1
+        stat[1] += elapsed_ms
+
+        if elapsed_ms >= self.slow_query_ms:
+            self.slowest.append({"ms": round(elapsed_ms, 2), "sql": normalized[:500]})
+            self.slowest.sort(key=lambda query: query["ms"], reverse=True)
+            del self.slowest[self.max_slow_queries:]
+
+    def repeated(self, threshold: int) -> List[Dict]:
+        """threshold번 이상 반복된 같은 형태의 쿼리 (루프 안에서 1건씩 조회하는 N+1 패턴)"""
+        return sorted(
+            (
+                {"count": count, "ms": round(total_ms, 2), "sql": statement[:500]}
+                for statement, (count, total_ms) in self.statements.items()
+                if count >= threshold
+            ),
+            key=lambda query: query["count"],
+            reverse=True
+        )
+
+
+def install_sql_profiler(engine) -> None:
+    """엔진에 쿼리 시간 측정 이벤트를 등록합니다. (프로파일 중인 요청에서만 측정)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_profile.get() is not None:
+            conn.info.setdefault("sql_profile_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = _current_profile.get()
+        started = conn.info.get("sql_profile_started")
+        if profile is None or not started:
+            return
+        profile.record(statement, (time.perf_counter() - started.pop()) * 1000)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("sql_profile_started"):
+            conn.info["sql_profile_started"].pop()
+
+
+class SQLProfilerMiddleware:
+    """
+    요청 단위 SQL 프로파일러 (SQL_PROFILER_ENABLED로 켬)
+
+    - SQL_PROFILER_SAMPLE_RATE 비율의 요청만 측정하므로 운영 환경에서도 사용 가능
+    - 측정한 요청은 X-SQL-Query-Count / X-SQL-Query-Time-Ms 응답 헤더를 추가하고,
+      쿼리 수나 DB 시간이 기준을 넘거나 반복 쿼리(N+1 의심)가 있으면 JSON 한 줄로 로그를 남김
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= settings.SQL_PROFILER_SAMPLE_RATE:
+            await self.app(scope, receive, send)
+            return
+
+        profile = SQLProfile(settings.SQL_PROFILER_SLOW_QUERY_MS)
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SQL_PROFILER_HEADERS:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-sql-query-count", str(profile.count).encode()))
+                    headers.append((b"x-sql-query-time-ms", f"{profile.total_ms:.1f}".encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._log(scope, profile, status_code, (time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def _log(scope, profile: SQLProfile, status_code: int, elapsed_ms: float) -> None:
+        repeated = profile.repeated(settings.SQL_PROFILER_N_PLUS_ONE_THRESHOLD)
+        if (
+            profile.count < settings.SQL_PROFILER_LOG_MIN_QUERIES
+            and profile.total_ms < settings.SQL_PROFILER_LOG_MIN_DB_MS
+            and not repeated
+        ):
+            return
+        route = scope.get("route")
+        logger.warning("[SQL PROFILE] " + json.dumps({
+            "method": scope["method"],
+            "route": getattr(route, "path", None) or scope["path"],
+            "status": status_code,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "query_count": profile.count,
+            "db_ms": round(profile.total_ms, 1),
+            "distinct_queries": len(profile.statements),
+            "n_plus_one": repeated[:5],
+            "slowest": profile.slowest
+        }, ensure_ascii=False))
@@ -0,0 +1,173 @@
+"""
+위치 로그(GPS 궤적) 분석 유틸리티
+
+DB에서 하루치 위치 로그를 한 번만 읽어 NumPy 배열로 변환한 뒤,
+체류/이동 구간 분할, 거리 계산, 경로 단순화를 벡터 연산으로 수행합니다.
+"""
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# 경로 단순화 기본 허용 오차(m). 단순화된 경로에서 원래 포인트까지의 거리가 이 값 이하
+DEFAULT_SIMPLIFY_TOLERANCE_M = 5.0
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    두 좌표(배열) 간의 Haversine 거리를 계산합니다.
+
+    Args:
+        lat1, lon1, lat2, lon2: 위경도(도 단위). 스칼라 또는 같은 길이의 배열
+
+    Returns:
+        거리(km). 입력이 배열이면 배열, 좌표가 NaN이면 NaN
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _to_float_array(values: Iterable) -> np.ndarray:
+    """None이 섞인 숫자(Decimal 포함) 목록을 float 배열로 변환 (None → NaN)"""
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+
+
+def segment_stays(
+    gps_times: Sequence[datetime],
+    speeds: Sequence[Optional[float]],
+    lats: Sequence[Optional[float]],
+    longs: Sequence[Optional[float]],
+    min_speed: float = 1.0,
+    min_duration: float = 5
+) -> List[Dict]:
+    """
+    시간순으로 정렬된 위치 로그를 체류/이동 구간으로 나누고 체류 구간을 반환합니다.
+
+    기존 get_member_stay_times CTE와 동일한 규칙을 따릅니다.
+    - 속도 < min_speed 이면 'stay', 그 외(속도 없음 포함)는 'move'
+    - label이 바뀔 때마다 grp 번호가 1씩 증가 (첫 구간은 0)
+    - 로그가 2건 이상인 구간만 대상 (시작/종료 지점이 모두 있어야 함)
+    - 거리는 직전 로그(이전 구간 포함)와의 거리 합
+    - 지속 시간이 min_duration(분) 이상인 체류 구간만 반환
+
+    Returns:
+        List[dict]: label, grp, start_time, end_time, duration(분), distance(km), start_lat, start_long
+    """
+    count = len(gps_times)
+    if count < 2:
+        return []
+
+    times = np.array(gps_times, dtype="datetime64[s]")
+    speed_arr = _to_float_array(speeds)
+    lat_arr = _to_float_array(lats)
+    long_arr = _to_float_array(longs)
+
+    # NaN 비교는 False이므로 속도가 없는 로그는 'move'로 분류됨
+    with np.errstate(invalid="ignore"):
+        is_stay = speed_arr < min_speed
+
+    changed = is_stay[1:] != is_stay[:-1]
+    grp = np.concatenate(([0], np.cumsum(changed)))
+    starts = np.flatnonzero(np.concatenate(([True], changed)))
+    ends = np.concatenate((starts[1:], [count])) - 1
+
+    step_km = np.zeros(count)
+    step_km[1:] = haversine_km(lat_arr[:-1], long_arr[:-1], lat_arr[1:], long_arr[1:])
+    step_km = np.nan_to_num(step_km, nan=0.0)
+    distances = np.add.reduceat(step_km, starts)
+    durations = (times[ends] - times[starts]).astype(np.int64) / 60.0
+
+    selected = np.flatnonzero(
+        is_stay[starts] & (ends > starts) & (np.round(durations, 4) >= min_duration)
+    )
+
+    results = []
+    for i in selected:
+        s, e = starts[i], ends[i]
+        start_lat = lat_arr[s]
+        start_long = long_arr[s]
+        results.append({
+            'label': 'stay',
+            'grp': int(grp[s]),
+            'start_time': gps_times[s].strftime('%Y-%m-%d %H:%M:%S'),
+            'end_time': gps_times[e].strftime('%Y-%m-%d %H:%M:%S'),
+            'duration': round(float(durations[i]), 4),
+            'distance': float(distances[i]),
+            'start_lat': float(start_lat) if start_lat and not np.isnan(start_lat) else None,
+            'start_long': float(start_long) if start_long and not np.isnan(start_long) else None
+        })
+    return results
+
+
+def simplify_track(
+    lats: Sequence[Optional[float]],
+    longs: Sequence[Optional[float]],
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_points: Optional[int] = None
+) -> np.ndarray:
+    """
+    시간순 경로를 Douglas–Peucker 방식으로 단순화하고 남길 포인트의 인덱스를 반환합니다.
+
+    - 첫/마지막 포인트는 항상 남기고, 남긴 포인트 사이 구간에서 선분과 가장 먼 포인트를
+      오차가 큰 구간부터 하나씩 추가합니다. (모든 구간의 오차가 tolerance_m 이하가 되면 종료)
+    - max_points를 주면 그 수에 도달했을 때도 종료하므로, 포인트 수 제한 안에서
+      오차가 가장 큰 모서리(방향 전환 지점)부터 남습니다.
+    - 거리는 경로 평균 위도 기준 평면 좌표(m)에서 포인트와 선분 사이 거리로 계산합니다.
+
+    Returns:
+        np.ndarray: 남길 포인트 인덱스 (오름차순)
+    """
+    lat_arr = _to_float_array(lats)
+    long_arr = _to_float_array(longs)
+    count = len(lat_arr)
+    if count <= 2:
+        return np.arange(count)
+    if max_points is not None:
+        max_points = max(int(max_points), 2)
+
+    earth_radius_m = EARTH_RADIUS_KM * 1000
+    lat0 = np.radians(np.nanmean(lat_arr)) if not np.all(np.isnan(lat_arr)) else 0.0
+    x = np.radians(long_arr) * np.cos(lat0) * earth_radius_m
+    y = np.radians(lat_arr) * earth_radius_m
+
+    def farthest(start: int, end: int):
+        """start~end 사이 포인트 중 선분(start, end)에서 가장 먼 포인트 (거리, 인덱스)"""
+        px = x[start + 1:end]
+        py = y[start + 1:end]
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            t = np.clip(((px - x[start]) * dx + (py - y[start]) * dy) / length_sq, 0.0, 1.0)
+        else:
+            t = 0.0
+        distances = np.nan_to_num(np.hypot(px - (x[start] + t * dx), py - (y[start] + t * dy)), nan=0.0)
+        index = int(np.argmax(distances))
+        return float(distances[index]), start + 1 + index
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    kept = 2
+    heap = []
+
+    def push(start: int, end: int) -> None:
+        if end - start >= 2:
+            distance, index = farthest(start, end)
+            heapq.heappush(heap, (-distance, index, start, end))
+
+    push(0, count - 1)
+    while heap:
+        negative_distance, index, start, end = heapq.heappop(heap)
+        if -negative_distance <= tolerance_m or (max_points is not None and kept >= max_points):
+            break
+        keep[index] = True
+        kept += 1
+        push(start, index)
+        push(index, end)
+    return np.flatnonzero(keep)
@@ -1,6 +1,8 @@
 """
 유틸리티 함수들을 포함하는 모듈
 """
+from datetime import datetime
+
 
 def kmTom(distance_km: float) -> float:
     """
@@ -43,3 +45,16 @@ def format_distance(distance_m: float) -> str:
     else:
         km = distance_m / 1000
         return f"{km:.1f}km"
+
+
+def naive_datetime(value: datetime) -> datetime:
+    """
+    DB에는 timezone 없이 저장되므로 비교 전에 tzinfo를 제거합니다.
+    
+    Args:
+        value (datetime): timezone이 있을 수 있는 시각
+        
+    Returns:
+        datetime: tzinfo가 없는 시각
+    """
+    return value.replace(tzinfo=None) if value.tzinfo else value
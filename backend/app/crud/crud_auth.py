@@ -1,4 +1,6 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import bcrypt
 from datetime import datetime # mt_wdate 등 날짜 필드용
 from app.models.member import Member  # member_t 테이블에 매핑된 모델
@@ -38,6 +40,18 @@ def get_user_by_idx(db: Session, mt_idx: int) -> Optional[Member]:
         Member.mt_show == 'Y' # 노출여부
     ).first()
 
+async def get_user_by_idx_async(db: AsyncSession, mt_idx: int) -> Optional[Member]:
+    """사용자 인덱스로 사용자를 조회합니다. (비동기)"""
+    result = await db.execute(
+        select(Member).where(
+            Member.mt_idx == mt_idx,
+            Member.mt_level >= 2,
+            Member.mt_status == 1,
+            Member.mt_show == 'Y'
+        ).limit(1)
+    )
+    return result.scalars().first()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """입력된 비밀번호와 해시된 비밀번호를 비교합니다."""
     import logging
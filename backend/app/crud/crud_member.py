@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.member import Member
 from app.schemas.member import MemberCreate, MemberUpdate, RegisterRequest
 from typing import Optional, List
@@ -20,6 +21,11 @@ class CRUDMember:
         """ID로 회원 조회"""
         return db.query(self.model).filter(self.model.mt_idx == id).first()
 
+    async def get_async(self, db: AsyncSession, id: int) -> Optional[Member]:
+        """ID로 회원 조회 (비동기)"""
+        result = await db.execute(select(self.model).where(self.model.mt_idx == id).limit(1))
+        return result.scalars().first()
+
     def get_by_phone(self, db: Session, phone: str) -> Optional[Member]:
         """전화번호로 회원 조회"""
         clean_phone = phone.replace('-', '')
@@ -292,6 +298,20 @@ class CRUDMember:
             "mt_agree5": user.mt_agree5
         }
 
+    async def get_consent_info_async(self, db: AsyncSession, *, user_id: int) -> Optional[dict]:
+        """사용자의 동의 정보 조회 (비동기)"""
+        user = await self.get_async(db, user_id)
+        if not user:
+            return None
+
+        return {
+            "mt_agree1": user.mt_agree1,
+            "mt_agree2": user.mt_agree2,
+            "mt_agree3": user.mt_agree3,
+            "mt_agree4": user.mt_agree4,
+            "mt_agree5": user.mt_agree5
+        }
+
     def update_consent(self, db: Session, *, user_id: int, field: str, value: str) -> Optional[Member]:
         """개별 약관 동의 상태 변경"""
         user = self.get(db, user_id)
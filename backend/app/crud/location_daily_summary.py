@@ -0,0 +1,400 @@
+"""
+회원별 일일 위치 로그 요약(member_location_daily_summary_t) CRUD
+
+위치 로그가 수집될 때 apply_location_logs()로 증분 갱신되며,
+순서가 어긋난 로그가 들어오거나 갱신에 실패한 날은 mlds_rebuild='Y'로 표시되어
+조회 시점 또는 스케줄러(rebuild_pending_summaries)에서 원본 로그로 재계산됩니다.
+
+과거 데이터 backfill:
+    python -m app.crud.location_daily_summary --start 2025-01-01 --end 2025-12-31
+"""
+import argparse
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..core.trajectory import haversine_km
+from ..core.utils import naive_datetime
+from ..models.member_location_daily_summary import MemberLocationDailySummary
+from ..models.member_location_log import MemberLocationLog
+from ..services.location_partition_service import location_partition_service
+
+logger = logging.getLogger(__name__)
+
+# get_gps_distance_and_time 기본 필터 (이동거리/이동시간)
+MOVE_MAX_ACCURACY = 100.0
+MOVE_MIN_SPEED_KMH = 2.0
+MOVE_MAX_SPEED_KMH = 55.0
+
+# get_member_stay_times 기본 필터 (체류 횟수)
+STAY_MIN_SPEED = 1.0
+STAY_MAX_ACCURACY = 50.0
+STAY_MIN_DURATION = 5
+
+SummaryKey = Tuple[int, date]
+
+
+def _new_summary(mt_idx: int, summary_date: date) -> MemberLocationDailySummary:
+    summary = MemberLocationDailySummary(mt_idx=mt_idx, mlds_date=summary_date)
+    _reset_summary(summary)
+    return summary
+
+
+def _reset_summary(summary: MemberLocationDailySummary) -> None:
+    summary.mlds_point_count = 0
+    summary.mlds_first_time = None
+    summary.mlds_last_time = None
+    summary.mlds_path_km = 0.0
+    summary.mlds_moving_meters = 0.0
+    summary.mlds_moving_seconds = 0
+    summary.mlds_stay_count = 0
+    summary.mlds_step_count = 0
+    summary.mlds_min_steps = None
+    summary.mlds_max_steps = None
+    summary.mlds_last_steps = None
+    summary.mlds_battery_count = 0
+    summary.mlds_first_battery = None
+    summary.mlds_last_battery = None
+    summary.mlds_last_lat = None
+    summary.mlds_last_long = None
+    summary.mlds_move_time = None
+    summary.mlds_move_lat = None
+    summary.mlds_move_long = None
+    summary.mlds_stay_label = None
+    summary.mlds_stay_start = None
+    summary.mlds_stay_counted = 'N'
+    summary.mlds_rebuild = 'N'
+
+
+def _apply_fix(summary: MemberLocationDailySummary, log) -> bool:
+    """
+    위치 로그 한 건을 요약에 반영합니다.
+
+    Returns:
+        bool: 반영 여부. 마지막으로 반영한 로그보다 이전 시간이면 False (재계산 필요)
+    """
+    gps_time = naive_datetime(log.mlt_gps_time)
+    if summary.mlds_last_time and gps_time < summary.mlds_last_time:
+        return False
+
+    lat = float(log.mlt_lat) if log.mlt_lat is not None else None
+    lng = float(log.mlt_long) if log.mlt_long is not None else None
+    speed = log.mlt_speed
+    accuracy = log.mlt_accuacy
+    # 수집 시 GPS 품질 판정에서 제외된 로그(튐/저정확도/좌표 없음)는 거리/이동/체류 계산에 사용하지 않음
+    clean = not log.mlt_quality
+
+    # 전체 경로 거리: 연속한 두 로그 모두 좌표가 있을 때만 (get_member_daily_location_summary 기준)
+    prev_lat = float(summary.mlds_last_lat) if summary.mlds_last_lat is not None else None
+    prev_lng = float(summary.mlds_last_long) if summary.mlds_last_long is not None else None
+    if clean and summary.mlds_point_count and all([prev_lat, prev_lng, lat, lng]):
+        summary.mlds_path_km += float(haversine_km(prev_lat, prev_lng, lat, lng))
+
+    # 이동 거리/시간: 속도 > 0, 정확도 필터를 통과한 로그끼리 구간 속도가 범위 안일 때만 (get_gps_distance_and_time 기준)
+    if clean and speed is not None and speed > 0 and accuracy is not None and accuracy < MOVE_MAX_ACCURACY:
+        if summary.mlds_move_time is not None and None not in (summary.mlds_move_lat, summary.mlds_move_long, lat, lng):
+            time_diff = int((gps_time - summary.mlds_move_time).total_seconds())
+            move_lat, move_lng = float(summary.mlds_move_lat), float(summary.mlds_move_long)
+            distance_m = round(float(haversine_km(move_lat, move_lng, lat, lng)) * 1000, 1)
+            if time_diff > 0:
+                speed_kmh = round(distance_m / time_diff * 3600 / 1000, 1)
+                if MOVE_MIN_SPEED_KMH <= speed_kmh <= MOVE_MAX_SPEED_KMH:
+                    summary.mlds_moving_meters += distance_m
+                    summary.mlds_moving_seconds += time_diff
+        summary.mlds_move_time = gps_time
+        summary.mlds_move_lat = lat
+        summary.mlds_move_long = lng
+
+    # 체류 횟수: 체류 구간이 STAY_MIN_DURATION분에 도달하는 순간 1회 집계 (get_member_stay_times 기준)
+    if clean and accuracy is not None and accuracy < STAY_MAX_ACCURACY:
+        label = 'stay' if speed is not None and speed < STAY_MIN_SPEED else 'move'
+        if label != summary.mlds_stay_label:
+            summary.mlds_stay_label = label
+            summary.mlds_stay_start = gps_time if label == 'stay' else None
+            summary.mlds_stay_counted = 'N'
+        if label == 'stay' and summary.mlds_stay_counted != 'Y':
+            stay_minutes = (gps_time - summary.mlds_stay_start).total_seconds() / 60
+            if round(stay_minutes, 4) >= STAY_MIN_DURATION:
+                summary.mlds_stay_count += 1
+                summary.mlds_stay_counted = 'Y'
+
+    if log.mt_health_work is not None:
+        steps = log.mt_health_work
+        summary.mlds_step_count += 1
+        summary.mlds_min_steps = steps if summary.mlds_min_steps is None else min(summary.mlds_min_steps, steps)
+        summary.mlds_max_steps = steps if summary.mlds_max_steps is None else max(summary.mlds_max_steps, steps)
+    summary.mlds_last_steps = log.mt_health_work
+
+    if log.mlt_battery is not None:
+        summary.mlds_battery_count += 1
+        if summary.mlds_first_battery is None:
+            summary.mlds_first_battery = log.mlt_battery
+        summary.mlds_last_battery = log.mlt_battery
+
+    if summary.mlds_first_time is None:
+        summary.mlds_first_time = gps_time
+    summary.mlds_last_time = gps_time
+    if clean:
+        summary.mlds_last_lat = lat
+        summary.mlds_last_long = lng
+    summary.mlds_point_count += 1
+    return True
+
+
+def mark_for_rebuild(db: Session, keys: Iterable[SummaryKey]) -> None:
+    """요약을 재계산 대상으로 표시 (commit은 호출자가 수행)"""
+    keys = list(keys)
+    if not keys:
+        return
+    db.query(MemberLocationDailySummary).filter(
+        tuple_(MemberLocationDailySummary.mt_idx, MemberLocationDailySummary.mlds_date).in_(keys)
+    ).update({MemberLocationDailySummary.mlds_rebuild: 'Y'}, synchronize_session=False)
+
+
+def apply_location_logs(db: Session, logs: List) -> None:
+    """
+    새로 저장되는 위치 로그를 일일 요약에 증분 반영합니다. (commit은 호출자가 수행)
+
+    위치 로그 저장과 같은 트랜잭션에서 호출되며, 요약 갱신에 실패해도
+    위치 로그 저장은 계속되도록 SAVEPOINT 안에서 처리합니다.
+    """
+    logs_by_day: Dict[SummaryKey, List] = defaultdict(list)
+    for log in logs:
+        if log.mlt_gps_time is None:
+            continue
+        logs_by_day[(log.mt_idx, naive_datetime(log.mlt_gps_time).date())].append(log)
+    if not logs_by_day:
+        return
+
+    try:
+        with db.begin_nested():
+            summaries = {
+                (summary.mt_idx, summary.mlds_date): summary
+                for summary in db.query(MemberLocationDailySummary).filter(
+                    tuple_(MemberLocationDailySummary.mt_idx, MemberLocationDailySummary.mlds_date).in_(list(logs_by_day))
+                ).with_for_update().all()
+            }
+            for key, day_logs in logs_by_day.items():
+                summary = summaries.get(key)
+                if summary is None:
+                    summary = _new_summary(*key)
+                    db.add(summary)
+                if summary.mlds_rebuild == 'Y':
+                    continue
+                for log in sorted(day_logs, key=lambda item: naive_datetime(item.mlt_gps_time)):
+                    if not _apply_fix(summary, log):
+                        summary.mlds_rebuild = 'Y'
+                        break
+    except Exception as e:
+        logger.error(f"일일 위치 요약 증분 갱신 실패, 재계산 대상으로 표시: {e}")
+        mark_for_rebuild(db, logs_by_day.keys())
+
+
+def rebuild_daily_summary(db: Session, mt_idx: int, summary_date: date) -> Optional[MemberLocationDailySummary]:
+    """
+    원본 위치 로그로 특정 회원/날짜의 요약을 다시 계산합니다. (commit은 호출자가 수행)
+
+    보관 기간이 지난 날짜는 원본 로그가 없어도 요약을 삭제하지 않고 재계산 표시만 해제합니다.
+    """
+    start_datetime = datetime.combine(summary_date, time.min)
+    end_datetime = start_datetime + timedelta(days=1)
+
+    logs = db.query(
+        MemberLocationLog.mt_idx,
+        MemberLocationLog.mlt_gps_time,
+        MemberLocationLog.mlt_lat,
+        MemberLocationLog.mlt_long,
+        MemberLocationLog.mlt_speed,
+        MemberLocationLog.mlt_accuacy,
+        MemberLocationLog.mt_health_work,
+        MemberLocationLog.mlt_battery,
+        MemberLocationLog.mlt_quality
+    ).filter(
+        MemberLocationLog.mt_idx == mt_idx,
+        MemberLocationLog.mlt_gps_time >= start_datetime,
+        MemberLocationLog.mlt_gps_time < end_datetime
+    ).order_by(MemberLocationLog.mlt_gps_time.asc(), MemberLocationLog.mlt_idx.asc()).all()
+
+    summary = db.query(MemberLocationDailySummary).filter(
+        MemberLocationDailySummary.mt_idx == mt_idx,
+        MemberLocationDailySummary.mlds_date == summary_date
+    ).with_for_update().first()
+
+    if not logs:
+        if summary is None:
+            return None
+        cutoff = location_partition_service.retention_cutoff()
+        if cutoff is not None and summary_date < cutoff:
+            # 보관 기간이 지나 원본 로그 파티션이 삭제된 날은 요약이 유일한 기록이므로 유지
+            summary.mlds_rebuild = 'N'
+            return summary
+        db.delete(summary)
+        return None
+
+    if summary is None:
+        summary = _new_summary(mt_idx, summary_date)
+        db.add(summary)
+    else:
+        _reset_summary(summary)
+
+    for log in logs:
+        _apply_fix(summary, log)
+    return summary
+
+
+def get_daily_summary(db: Session, mt_idx: int, summary_date: date) -> Optional[MemberLocationDailySummary]:
+    """
+    일일 요약 조회. 요약이 없거나 재계산 대상이면 원본 로그로 다시 계산해 저장합니다.
+
+    Returns:
+        MemberLocationDailySummary 또는 해당 날짜에 위치 로그가 없으면 None
+    """
+    summary = db.query(MemberLocationDailySummary).filter(
+        MemberLocationDailySummary.mt_idx == mt_idx,
+        MemberLocationDailySummary.mlds_date == summary_date
+    ).first()
+    if summary is not None and summary.mlds_rebuild != 'Y':
+        return summary
+
+    try:
+        summary = rebuild_daily_summary(db, mt_idx, summary_date)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return summary
+
+
+async def get_daily_point_counts_async(
+    db: AsyncSession,
+    mt_idxs: List[int],
+    start_date: date,
+    end_date: date
+) -> Dict[SummaryKey, int]:
+    """
+    회원/날짜별 위치 로그 수 (활동 달력용)
+
+    요약 테이블의 mlds_point_count를 한 번에 읽고, 재계산 대상(mlds_rebuild='Y')인 날만
+    원본 로그를 (mt_idx, mlt_gps_time) 범위로 다시 셉니다. 로그가 없는 회원/날짜는 결과에 없습니다.
+    """
+    if not mt_idxs:
+        return {}
+
+    rows = (await db.execute(
+        select(
+            MemberLocationDailySummary.mt_idx,
+            MemberLocationDailySummary.mlds_date,
+            MemberLocationDailySummary.mlds_point_count,
+            MemberLocationDailySummary.mlds_rebuild
+        ).where(
+            MemberLocationDailySummary.mt_idx.in_(mt_idxs),
+            MemberLocationDailySummary.mlds_date >= start_date,
+            MemberLocationDailySummary.mlds_date <= end_date
+        )
+    )).all()
+
+    counts: Dict[SummaryKey, int] = {}
+    stale_keys: List[SummaryKey] = []
+    for row in rows:
+        if row.mlds_rebuild == 'Y':
+            stale_keys.append((row.mt_idx, row.mlds_date))
+        elif row.mlds_point_count:
+            counts[(row.mt_idx, row.mlds_date)] = row.mlds_point_count
+
+    if stale_keys:
+        log_date = func.date(MemberLocationLog.mlt_gps_time)
+        stale_rows = (await db.execute(
+            select(MemberLocationLog.mt_idx, log_date, func.count()).where(or_(*[
+                and_(
+                    MemberLocationLog.mt_idx == mt_idx,
+                    MemberLocationLog.mlt_gps_time >= datetime.combine(summary_date, time.min),
+                    MemberLocationLog.mlt_gps_time < datetime.combine(summary_date + timedelta(days=1), time.min)
+                )
+                for mt_idx, summary_date in stale_keys
+            ])).group_by(MemberLocationLog.mt_idx, log_date)
+        )).all()
+        for mt_idx, summary_date, count in stale_rows:
+            counts[(mt_idx, summary_date)] = count
+    return counts
+
+
+def get_daily_moving_meters(db: Session, summary_date: date) -> Dict[int, float]:
+    """
+    해당 날짜에 이동한 회원별 이동 거리(m, 속도 필터 적용) - 일일 로그 알림용
+
+    재계산 대상인 요약도 그대로 읽습니다. (rebuild_pending_summaries 작업이 10분마다 갱신)
+    """
+    rows = db.query(
+        MemberLocationDailySummary.mt_idx,
+        MemberLocationDailySummary.mlds_moving_meters
+    ).filter(
+        MemberLocationDailySummary.mlds_date == summary_date,
+        MemberLocationDailySummary.mlds_moving_meters > 0
+    ).all()
+    return {row.mt_idx: row.mlds_moving_meters for row in rows}
+
+
+def rebuild_pending_summaries(db: Session, limit: int = 500) -> int:
+    """재계산 대상(mlds_rebuild='Y')으로 표시된 요약을 다시 계산합니다."""
+    keys = db.query(
+        MemberLocationDailySummary.mt_idx,
+        MemberLocationDailySummary.mlds_date
+    ).filter(
+        MemberLocationDailySummary.mlds_rebuild == 'Y'
+    ).order_by(MemberLocationDailySummary.mlds_date.desc()).limit(limit).all()
+
+    for mt_idx, summary_date in keys:
+        rebuild_daily_summary(db, mt_idx, summary_date)
+        db.commit()
+    return len(keys)
+
+
+def backfill_daily_summaries(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    mt_idx: Optional[int] = None
+) -> int:
+    """기간 내 위치 로그가 있는 모든 회원/날짜의 요약을 원본 로그로 계산합니다."""
+    log_date = func.date(MemberLocationLog.mlt_gps_time)
+    query = db.query(MemberLocationLog.mt_idx, log_date).filter(
+        MemberLocationLog.mlt_gps_time >= datetime.combine(start_date, time.min),
+        MemberLocationLog.mlt_gps_time < datetime.combine(end_date + timedelta(days=1), time.min)
+    )
+    if mt_idx is not None:
+        query = query.filter(MemberLocationLog.mt_idx == mt_idx)
+    keys = query.group_by(MemberLocationLog.mt_idx, log_date).all()
+
+    for index, (key_mt_idx, summary_date) in enumerate(keys, start=1):
+        rebuild_daily_summary(db, key_mt_idx, summary_date)
+        db.commit()
+        if index % 1000 == 0:
+            logger.info(f"일일 위치 요약 backfill 진행: {index}/{len(keys)}")
+    return len(keys)
+
+
+if __name__ == "__main__":
+    from ..db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="회원별 일일 위치 로그 요약 backfill")
+    parser.add_argument("--start", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--mt-idx", type=int, default=None, help="특정 회원만 처리")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        count = backfill_daily_summaries(
+            session,
+            datetime.strptime(args.start, "%Y-%m-%d").date(),
+            datetime.strptime(args.end, "%Y-%m-%d").date(),
+            args.mt_idx
+        )
+        print(f"일일 위치 요약 backfill 완료: {count}건")
+    finally:
+        session.close()
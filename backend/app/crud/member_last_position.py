@@ -0,0 +1,67 @@
+"""
+회원별 최신 위치(member_last_position_t) CRUD
+
+위치 로그가 저장될 때 apply_location_logs()로 같은 트랜잭션에서 갱신되며,
+이미 저장된 위치보다 GPS 시간이 늦은(같은 경우 포함) 로그만 반영합니다.
+GPS 품질 판정(app.services.location_quality)이 정상인 로그만 전달되므로 튄 위치는 최신 위치가 되지 않습니다.
+"""
+import logging
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..core.utils import naive_datetime
+
+logger = logging.getLogger(__name__)
+
+# 대입은 왼쪽부터 적용되므로 mlp_gps_time은 마지막에 갱신 (앞의 비교는 기존 GPS 시간 기준)
+_UPSERT_SQL = text("""
+    INSERT INTO member_last_position_t
+        (mt_idx, mlp_lat, mlp_long, mlp_accuacy, mlp_speed, mlp_battery, mlp_gps_time)
+    VALUES
+        (:mt_idx, :mlp_lat, :mlp_long, :mlp_accuacy, :mlp_speed, :mlp_battery, :mlp_gps_time)
+    ON DUPLICATE KEY UPDATE
+        mlp_lat = IF(VALUES(mlp_gps_time) >= mlp_gps_time, VALUES(mlp_lat), mlp_lat),
+        mlp_long = IF(VALUES(mlp_gps_time) >= mlp_gps_time, VALUES(mlp_long), mlp_long),
+        mlp_accuacy = IF(VALUES(mlp_gps_time) >= mlp_gps_time, VALUES(mlp_accuacy), mlp_accuacy),
+        mlp_speed = IF(VALUES(mlp_gps_time) >= mlp_gps_time, VALUES(mlp_speed), mlp_speed),
+        mlp_battery = IF(VALUES(mlp_gps_time) >= mlp_gps_time, VALUES(mlp_battery), mlp_battery),
+        mlp_gps_time = GREATEST(mlp_gps_time, VALUES(mlp_gps_time))
+""")
+
+
+def apply_location_logs(db: Session, logs: List) -> None:
+    """
+    새로 저장되는 위치 로그 중 회원별 가장 늦은 로그로 최신 위치를 갱신합니다. (commit은 호출자가 수행)
+
+    갱신에 실패해도 위치 로그 저장은 계속되도록 SAVEPOINT 안에서 처리합니다.
+    """
+    latest: Dict[int, object] = {}
+    for log in logs:
+        if log.mlt_gps_time is None:
+            continue
+        current = latest.get(log.mt_idx)
+        if current is None or naive_datetime(log.mlt_gps_time) >= naive_datetime(current.mlt_gps_time):
+            latest[log.mt_idx] = log
+    if not latest:
+        return
+
+    # 여러 워커가 동시에 갱신할 때 잠금 순서를 맞추도록 mt_idx 순으로 실행
+    rows = [
+        {
+            "mt_idx": mt_idx,
+            "mlp_lat": log.mlt_lat,
+            "mlp_long": log.mlt_long,
+            "mlp_accuacy": log.mlt_accuacy,
+            "mlp_speed": log.mlt_speed,
+            "mlp_battery": log.mlt_battery,
+            "mlp_gps_time": naive_datetime(log.mlt_gps_time)
+        }
+        for mt_idx, log in sorted(latest.items())
+    ]
+    try:
+        with db.begin_nested():
+            db.execute(_UPSERT_SQL, rows)
+    except Exception as e:
+        logger.error(f"회원 최신 위치 갱신 실패 ({len(rows)}명): {e}")
@@ -1,8 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc, asc, text, or_
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, desc, asc, text, or_, insert, select
+from typing import Optional, List, Dict
 from datetime import datetime, timedelta, date
+from itertools import groupby
+import logging
 import math
+from ..core.compact_encoding import delta_encode, encode_track
+from ..core.trajectory import DEFAULT_SIMPLIFY_TOLERANCE_M, segment_stays, simplify_track
+from . import location_daily_summary, member_last_position
 from ..models.member_location_log import MemberLocationLog
 from ..schemas.member_location_log import (
     MemberLocationLogCreate, 
@@ -17,6 +23,8 @@ from ..schemas.member_location_log import (
     LocationLogSummary
 )
 
+logger = logging.getLogger(__name__)
+
 def get_member_location_logs(
     db: Session, 
     mt_idx: int,
@@ -40,18 +48,105 @@ def get_member_location_logs(
     # 시간순 정렬 및 페이징
     return query.order_by(asc(MemberLocationLog.mlt_gps_time)).offset(offset).limit(limit).all()
 
+async def get_member_location_logs_async(
+    db: AsyncSession,
+    mt_idx: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0
+) -> List[MemberLocationLog]:
+    """회원의 위치 로그 목록 조회 (비동기)"""
+    stmt = select(MemberLocationLog).where(MemberLocationLog.mt_idx == mt_idx)
+
+    if start_date:
+        stmt = stmt.where(MemberLocationLog.mlt_gps_time >= datetime.strptime(start_date, "%Y-%m-%d"))
+
+    if end_date:
+        stmt = stmt.where(MemberLocationLog.mlt_gps_time < datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1))
+
+    stmt = stmt.order_by(asc(MemberLocationLog.mlt_gps_time)).offset(offset).limit(limit)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
 def get_location_log_by_id(db: Session, log_id: int) -> Optional[MemberLocationLog]:
     """특정 위치 로그 조회"""
     return db.query(MemberLocationLog).filter(MemberLocationLog.mlt_idx == log_id).first()
 
+def _judge_quality(db: Session, logs_data: List[MemberLocationLogCreate]) -> tuple:
+    """
+    수집 로그의 GPS 품질을 판정하여 mlt_quality를 채움
+
+    Returns:
+        (저장할 로그, 최신 위치/실시간 스트림에 반영할 정상 로그, 필터 상태)
+        LOCATION_FILTER_SMOOTHING 사용 시 정상 로그는 보정 좌표로 바꾼 사본
+    """
+    from ..services.location_quality import QUALITY_CLEAN, QUALITY_REJECTED, location_quality_filter
+    results, states = location_quality_filter.classify(db, logs_data)
+    location_quality_filter.record(results)
+
+    stored, positions = [], []
+    for log_data, result in zip(logs_data, results):
+        log_data.mlt_quality = result.quality
+        if location_quality_filter.drop_rejected and result.quality & QUALITY_REJECTED:
+            continue
+        stored.append(log_data)
+        if result.quality != QUALITY_CLEAN:
+            continue
+        if location_quality_filter.smoothing:
+            log_data = log_data.model_copy(update={"mlt_lat": result.lat, "mlt_long": result.lng})
+        positions.append(log_data)
+    return stored, positions, states
+
+def _after_logs_saved(logs_data: List[MemberLocationLogCreate], states: Dict) -> None:
+    """위치 로그 저장(commit) 후 품질 필터 상태/인메모리 인덱스 갱신, 실시간 위치 스트림 구독자에게 전달"""
+    from ..services.last_position_index import last_position_index
+    from ..services.location_quality import location_quality_filter
+    from ..services.location_stream import location_stream_hub
+    location_quality_filter.commit(states)
+    last_position_index.update_from_logs(logs_data)
+    location_stream_hub.publish_logs(logs_data)
+
 def create_location_log(db: Session, log_data: MemberLocationLogCreate) -> MemberLocationLog:
-    """위치 로그 생성"""
+    """위치 로그 생성 (LOCATION_FILTER_DROP_REJECTED 사용 시 튐/좌표 없음 로그는 저장하지 않고 그대로 반환)"""
+    stored, positions, states = _judge_quality(db, [log_data])
     db_log = MemberLocationLog(**log_data.model_dump())
+    if not stored:
+        return db_log
     db.add(db_log)
+    location_daily_summary.apply_location_logs(db, stored)
+    member_last_position.apply_location_logs(db, positions)
     db.commit()
     db.refresh(db_log)
+    _after_logs_saved(positions, states)
     return db_log
 
+def create_location_logs_bulk(db: Session, logs_data: List[MemberLocationLogCreate]) -> int:
+    """
+    위치 로그 일괄 생성 (배치 업로드용)
+    검증이 끝난 로그들의 GPS 품질을 판정한 뒤 하나의 트랜잭션에서 multi-row INSERT로 저장
+
+    Returns:
+        int: 저장된 로그 수
+    """
+    if not logs_data:
+        return 0
+
+    stored, positions, states = _judge_quality(db, logs_data)
+    if not stored:
+        return 0
+    rows = [log_data.model_dump() for log_data in stored]
+    try:
+        db.execute(insert(MemberLocationLog), rows)
+        location_daily_summary.apply_location_logs(db, stored)
+        member_last_position.apply_location_logs(db, positions)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    _after_logs_saved(positions, states)
+    return len(rows)
+
 def update_location_log(db: Session, log_id: int, log_data: MemberLocationLogUpdate) -> Optional[MemberLocationLog]:
     """위치 로그 업데이트"""
     db_log = get_location_log_by_id(db, log_id)
@@ -189,28 +284,40 @@ def get_location_summary(
         battery_consumption=battery_usage
     )
 
+def _simplify_logs(logs: list, tolerance_m: float, max_points: Optional[int]) -> list:
+    """좌표가 있는 로그만 남기고 경로 단순화(simplify_track) 적용"""
+    logs = [log for log in logs if log.mlt_lat and log.mlt_long]
+    indices = simplify_track(
+        [log.mlt_lat for log in logs],
+        [log.mlt_long for log in logs],
+        tolerance_m,
+        max_points
+    )
+    return [logs[index] for index in indices]
+
 def get_location_path(
     db: Session, 
     mt_idx: int, 
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_points: Optional[int] = None
 ) -> LocationPathResponse:
-    """위치 경로 및 요약 정보 조회"""
+    """위치 경로 및 요약 정보 조회 (경로는 tolerance_m 오차 안에서 단순화, 요약은 전체 로그 기준)"""
     logs = get_member_location_logs(db, mt_idx, start_date, end_date, limit=10000)
     
     # 포인트 데이터 생성
     points = []
-    for log in logs:
-        if log.mlt_lat and log.mlt_long:
-            points.append({
-                'lat': float(log.mlt_lat),
-                'lng': float(log.mlt_long),
-                'timestamp': log.mlt_gps_time.isoformat(),
-                'accuracy': log.mlt_accuacy,
-                'speed': log.mlt_speed,
-                'battery': log.mlt_battery,
-                'steps': log.mt_health_work
-            })
+    for log in _simplify_logs(logs, tolerance_m, max_points):
+        points.append({
+            'lat': float(log.mlt_lat),
+            'lng': float(log.mlt_long),
+            'timestamp': log.mlt_gps_time.isoformat(),
+            'accuracy': log.mlt_accuacy,
+            'speed': log.mlt_speed,
+            'battery': log.mlt_battery,
+            'steps': log.mt_health_work
+        })
     
     # 요약 정보
     summary = get_location_summary(db, mt_idx, start_date, end_date)
@@ -257,15 +364,36 @@ def get_member_location_logs_by_exact_date(
     # 시간순 정렬 및 페이징
     return query.order_by(asc(MemberLocationLog.mlt_gps_time)).offset(offset).limit(limit).all()
 
+async def get_member_location_logs_by_exact_date_async(
+    db: AsyncSession,
+    mt_idx: int,
+    date: str,
+    limit: int = 1000,
+    offset: int = 0
+) -> List[MemberLocationLog]:
+    """특정 회원의 특정 날짜 위치 로그 조회 (비동기)"""
+    start_datetime = datetime.strptime(date, "%Y-%m-%d")
+    end_datetime = start_datetime + timedelta(days=1)
+
+    stmt = select(MemberLocationLog).where(
+        MemberLocationLog.mt_idx == mt_idx,
+        MemberLocationLog.mlt_gps_time >= start_datetime,
+        MemberLocationLog.mlt_gps_time < end_datetime
+    ).order_by(asc(MemberLocationLog.mlt_gps_time)).offset(offset).limit(limit)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
 def get_member_daily_location_summary(
     db: Session, 
     mt_idx: int, 
     date: str
 ) -> LocationSummaryResponse:
-    """특정 회원의 특정 날짜 위치 로그 요약 정보"""
-    logs = get_member_location_logs_by_exact_date(db, mt_idx, date, limit=10000)
+    """특정 회원의 특정 날짜 위치 로그 요약 정보 (일일 요약 테이블 기반)"""
+    summary = location_daily_summary.get_daily_summary(
+        db, mt_idx, datetime.strptime(date, "%Y-%m-%d").date()
+    )
     
-    if not logs:
+    if not summary:
         return LocationSummaryResponse(
             total_distance=0.0,
             total_time='0분',
@@ -274,32 +402,20 @@ def get_member_daily_location_summary(
             battery_consumption=0
         )
     
-    # 총 이동거리 계산
-    total_distance = 0.0
-    for i in range(1, len(logs)):
-        prev_log = logs[i-1]
-        curr_log = logs[i]
-        if prev_log.mlt_lat and prev_log.mlt_long and curr_log.mlt_lat and curr_log.mlt_long:
-            distance = calculate_distance(
-                float(prev_log.mlt_lat), float(prev_log.mlt_long),
-                float(curr_log.mlt_lat), float(curr_log.mlt_long)
-            )
-            total_distance += distance
+    # 총 이동거리 (연속한 로그 간 거리 합, km)
+    total_distance = summary.mlds_path_km or 0.0
     
     # 총 시간 계산 (분) - 첫 번째 로그부터 마지막 로그까지의 시간
-    if len(logs) > 1:
-        start_time = logs[0].mlt_gps_time
-        end_time = logs[-1].mlt_gps_time
-        total_time = int((end_time - start_time).total_seconds() / 60)
+    if summary.mlds_point_count > 1:
+        total_time = int((summary.mlds_last_time - summary.mlds_first_time).total_seconds() / 60)
     else:
         total_time = 0
     
     # 총 걸음수 (가장 마지막 걸음수 - 첫 번째 걸음수로 실제 증가량 계산)
-    step_logs = [log.mt_health_work for log in logs if log.mt_health_work is not None]
-    if len(step_logs) > 1:
-        total_steps = max(step_logs) - min(step_logs)
-    elif len(step_logs) == 1:
-        total_steps = step_logs[0]
+    if summary.mlds_step_count > 1:
+        total_steps = summary.mlds_max_steps - summary.mlds_min_steps
+    elif summary.mlds_step_count == 1:
+        total_steps = summary.mlds_max_steps
     else:
         total_steps = 0
     
@@ -310,11 +426,8 @@ def get_member_daily_location_summary(
         average_speed = 0.0
     
     # 배터리 사용량 (시작 - 끝)
-    battery_logs = [log.mlt_battery for log in logs if log.mlt_battery is not None]
-    if len(battery_logs) > 1:
-        start_battery = battery_logs[0]
-        end_battery = battery_logs[-1]
-        battery_usage = max(0, start_battery - end_battery)
+    if summary.mlds_battery_count > 1:
+        battery_usage = max(0, summary.mlds_first_battery - summary.mlds_last_battery)
     else:
         battery_usage = 0
     
@@ -342,25 +455,26 @@ def get_member_daily_location_summary(
 def get_member_daily_location_path(
     db: Session, 
     mt_idx: int, 
-    date: str
+    date: str,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_points: Optional[int] = None
 ) -> LocationPathResponse:
-    """특정 회원의 특정 날짜 위치 경로 및 요약 정보"""
+    """특정 회원의 특정 날짜 위치 경로 및 요약 정보 (경로는 tolerance_m 오차 안에서 단순화)"""
     logs = get_member_location_logs_by_exact_date(db, mt_idx, date, limit=10000)
     
     # 포인트 데이터 생성
     points = []
-    for log in logs:
-        if log.mlt_lat and log.mlt_long:
-            points.append({
-                'lat': float(log.mlt_lat),
-                'lng': float(log.mlt_long),
-                'timestamp': log.mlt_gps_time.isoformat(),
-                'accuracy': log.mlt_accuacy,
-                'speed': log.mlt_speed,
-                'battery': log.mlt_battery,
-                'steps': log.mt_health_work,
-                'gps_time': log.mlt_gps_time.strftime('%H:%M:%S')  # 시간만 표시
-            })
+    for log in _simplify_logs(logs, tolerance_m, max_points):
+        points.append({
+            'lat': float(log.mlt_lat),
+            'lng': float(log.mlt_long),
+            'timestamp': log.mlt_gps_time.isoformat(),
+            'accuracy': log.mlt_accuacy,
+            'speed': log.mlt_speed,
+            'battery': log.mlt_battery,
+            'steps': log.mt_health_work,
+            'gps_time': log.mlt_gps_time.strftime('%H:%M:%S')  # 시간만 표시
+        })
     
     # 요약 정보
     summary = get_member_daily_location_summary(db, mt_idx, date)
@@ -370,6 +484,52 @@ def get_member_daily_location_path(
         summary=summary
     )
 
+def get_member_daily_location_path_compact(
+    db: Session,
+    mt_idx: int,
+    date: str,
+    compact_format: str,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_points: Optional[int] = None
+) -> dict:
+    """
+    get_member_daily_location_path와 같은 경로를 압축 형식(app.core.compact_encoding)으로 반환
+
+    ORM 객체 대신 필요한 컬럼만 조회하고, points는 포인트별 dict 대신 컬럼 배열로 인코딩합니다.
+    """
+    start_datetime = datetime.strptime(date, "%Y-%m-%d")
+    end_datetime = start_datetime + timedelta(days=1)
+
+    rows = db.query(
+        MemberLocationLog.mlt_gps_time,
+        MemberLocationLog.mlt_lat,
+        MemberLocationLog.mlt_long,
+        MemberLocationLog.mlt_accuacy,
+        MemberLocationLog.mlt_speed,
+        MemberLocationLog.mlt_battery,
+        MemberLocationLog.mt_health_work
+    ).filter(
+        MemberLocationLog.mt_idx == mt_idx,
+        MemberLocationLog.mlt_gps_time >= start_datetime,
+        MemberLocationLog.mlt_gps_time < end_datetime
+    ).order_by(asc(MemberLocationLog.mlt_gps_time)).limit(10000).all()
+    rows = _simplify_logs(rows, tolerance_m, max_points)
+
+    points = encode_track(
+        compact_format,
+        [row.mlt_gps_time for row in rows],
+        [row.mlt_lat for row in rows],
+        [row.mlt_long for row in rows],
+        {
+            "accuracy": [row.mlt_accuacy for row in rows],
+            "speed": [row.mlt_speed for row in rows],
+            "battery": [row.mlt_battery for row in rows],
+            "steps": [row.mt_health_work for row in rows]
+        }
+    )
+    summary = get_member_daily_location_summary(db, mt_idx, date)
+    return {"points": points, "summary": summary.model_dump()}
+
 def get_member_location_logs_daily_summary(
     db: Session, 
     mt_idx: int,
@@ -436,6 +596,60 @@ def get_member_location_logs_daily_summary(
     
     return results
 
+def _fetch_stay_fixes(db: Session, mt_idxs: List[int], date: str, max_accuracy: float):
+    """체류 분석용 위치 로그(정상 판정만)를 회원/시간순으로 한 번에 조회 (필요한 컬럼만)"""
+    start_datetime = datetime.strptime(date, "%Y-%m-%d")
+    end_datetime = start_datetime + timedelta(days=1)
+
+    return db.query(
+        MemberLocationLog.mt_idx,
+        MemberLocationLog.mlt_gps_time,
+        MemberLocationLog.mlt_speed,
+        MemberLocationLog.mlt_lat,
+        MemberLocationLog.mlt_long
+    ).filter(
+        MemberLocationLog.mt_idx.in_(mt_idxs),
+        MemberLocationLog.mlt_quality == 0,
+        # 수집 판정(LOCATION_FILTER_MAX_ACCURACY=100m)보다 엄격한 조회 기준(기본 50m)이라 함께 유지
+        MemberLocationLog.mlt_accuacy < max_accuracy,
+        MemberLocationLog.mlt_gps_time >= start_datetime,
+        MemberLocationLog.mlt_gps_time < end_datetime
+    ).order_by(
+        MemberLocationLog.mt_idx.asc(),
+        MemberLocationLog.mlt_gps_time.asc()
+    ).all()
+
+def get_members_stay_times(
+    db: Session,
+    mt_idxs: List[int],
+    date: str,
+    min_speed: float = 1.0,
+    max_accuracy: float = 50.0,
+    min_duration: int = 5
+) -> Dict[int, List[dict]]:
+    """
+    여러 회원의 특정 날짜 체류시간 분석 (한 번의 쿼리 + 회원별 벡터 연산)
+
+    Returns:
+        Dict[int, List[dict]]: 회원 인덱스별 체류시간 분석 결과 (get_member_stay_times 형식)
+    """
+    results = {mt_idx: [] for mt_idx in mt_idxs}
+    if not mt_idxs:
+        return results
+
+    rows = _fetch_stay_fixes(db, mt_idxs, date, max_accuracy)
+    for mt_idx, member_rows in groupby(rows, key=lambda row: row.mt_idx):
+        member_rows = list(member_rows)
+        results[mt_idx] = segment_stays(
+            [row.mlt_gps_time for row in member_rows],
+            [row.mlt_speed for row in member_rows],
+            [row.mlt_lat for row in member_rows],
+            [row.mlt_long for row in member_rows],
+            min_speed=min_speed,
+            min_duration=min_duration
+        )
+    return results
+
 def get_member_stay_times(
     db: Session, 
     mt_idx: int,
@@ -446,7 +660,8 @@ def get_member_stay_times(
 ) -> List[dict]:
     """
     특정 회원의 특정 날짜 체류시간 분석
-    제공된 복잡한 CTE 쿼리를 원시 SQL로 구현
+    하루치 로그를 한 번 조회한 뒤 app.core.trajectory.segment_stays로 구간 분할
+    (기존 윈도우 함수 CTE 쿼리와 동일한 결과)
     
     Args:
         mt_idx: 회원 인덱스 (sgdt_mt_idx)
@@ -457,7 +672,7 @@ def get_member_stay_times(
     
     Returns:
         List[dict]: 체류시간 분석 결과
-            - label: 'stay' 또는 'move'
+            - label: 'stay'
             - grp: 그룹 번호
             - start_time: 시작 시간
             - end_time: 종료 시간
@@ -466,170 +681,77 @@ def get_member_stay_times(
             - start_lat: 시작 위도
             - start_long: 시작 경도
     """
-    from sqlalchemy import text
-    
-    # 복잡한 CTE 쿼리를 원시 SQL로 구현
+    return get_members_stay_times(
+        db, [mt_idx], date, min_speed, max_accuracy, min_duration
+    )[mt_idx]
+
+def _fetch_map_marker_rows(
+    db: Session,
+    mt_idx: int,
+    date: str,
+    min_speed: float,
+    max_accuracy: float,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_markers: Optional[int] = 200
+) -> list:
+    """
+    지도 마커용 이동로그 행 조회
+
+    수집 시 정상(mlt_quality = 0)으로 판정되고 속도/정확도 조건을 통과한 하루치 로그를 시간순으로 읽은 뒤 경로 단순화(simplify_track)로
+    방향이 바뀌는 지점을 남기고 직선 구간의 중복 포인트를 제거합니다. (최대 max_markers건)
+    수집 판정은 튐/저정확도(100m 초과)만 거르므로, 요청별 정확도 기준과 보고된 속도 조건은 조회에서 따로 적용합니다.
+    """
     sql_query = text("""
-        WITH labeled_data AS (
-            SELECT
-                mlt_idx,
-                mt_idx,
-                mlt_gps_time,
-                mlt_speed,
-                mlt_lat,
-                mlt_long,
-                CASE
-                    WHEN mlt_speed < :min_speed THEN 'stay'
-                    ELSE 'move'
-                END AS label
-            FROM
-                member_location_log_t
-            WHERE 
-                mt_idx = :mt_idx
-                AND mlt_accuacy < :max_accuracy
-                AND mlt_gps_time BETWEEN :start_datetime AND :end_datetime
-            ORDER BY
-                mlt_gps_time
-        ),
-        labeled_data_with_lag AS (
-            SELECT
-                *,
-                LAG(label) OVER (ORDER BY mlt_gps_time) AS prev_label,
-                LAG(mlt_lat) OVER (ORDER BY mlt_gps_time) AS prev_lat,
-                LAG(mlt_long) OVER (ORDER BY mlt_gps_time) AS prev_long
-            FROM
-                labeled_data
-        ),
-        labeled_data_with_grp AS (
-            SELECT
-                *,
-                SUM(CASE WHEN label <> COALESCE(prev_label, label) THEN 1 ELSE 0 END) OVER (ORDER BY mlt_gps_time) AS grp
-            FROM
-                labeled_data_with_lag
-        ),
-        labeled_data_with_grp_status AS (
-            SELECT
-                *,
-                CASE
-                    WHEN ROW_NUMBER() OVER (PARTITION BY grp ORDER BY mlt_gps_time) = 1 THEN 'S' 
-                    WHEN ROW_NUMBER() OVER (PARTITION BY grp ORDER BY mlt_gps_time DESC) = 1 THEN 'E' 
-                    WHEN mlt_gps_time = (SELECT MAX(mlt_gps_time) FROM labeled_data_with_grp) THEN 'E'
-                    ELSE NULL
-                END AS grp_status
-            FROM
-                labeled_data_with_grp
-        ),
-        filtered_data AS (
-            SELECT
-                *
-            FROM
-                labeled_data_with_grp_status
-            WHERE
-                grp IN (
-                    SELECT
-                        grp
-                    FROM
-                        labeled_data_with_grp_status
-                    GROUP BY
-                        grp
-                    HAVING
-                        COUNT(CASE WHEN grp_status = 'S' THEN 1 END) = 1
-                        AND COUNT(CASE WHEN grp_status = 'E' THEN 1 END) >= 1
-                )
-        ),
-        result_data AS (
-            SELECT
-                label,
-                grp,
-                MIN(CASE WHEN grp_status = 'S' THEN mlt_gps_time END) AS start_time,
-                MAX(CASE WHEN grp_status = 'E' THEN mlt_gps_time END) AS end_time,
-                TIMESTAMPDIFF(SECOND, 
-                    MIN(CASE WHEN grp_status = 'S' THEN mlt_gps_time END), 
-                    MAX(CASE WHEN grp_status = 'E' THEN mlt_gps_time END)
-                ) / 60 AS duration,
-                SUM(
-                    CASE WHEN prev_lat IS NOT NULL AND prev_long IS NOT NULL 
-                    THEN 
-                        (6371 * ACOS(
-                            GREATEST(-1, LEAST(1,
-                                COS(RADIANS(mlt_lat)) * COS(RADIANS(prev_lat)) * 
-                                COS(RADIANS(prev_long) - RADIANS(mlt_long)) + 
-                                SIN(RADIANS(mlt_lat)) * SIN(RADIANS(prev_lat))
-                            ))
-                        ))
-                    ELSE 0 
-                    END
-                ) AS distance,
-                MAX(CASE WHEN grp_status = 'S' THEN mlt_lat END) AS start_lat,
-                MAX(CASE WHEN grp_status = 'S' THEN mlt_long END) AS start_long
-            FROM
-                filtered_data
-            GROUP BY
-                label, grp
-        )
-        SELECT
-            label,
-            grp,
-            start_time,
-            end_time,
-            duration,
-            distance,
-            start_lat,
-            start_long
-        FROM
-            result_data
-        WHERE 
-            duration >= :min_duration
-            AND label = 'stay'
-        ORDER BY
-            start_time
+        SELECT *
+        FROM member_location_log_t
+        WHERE mt_idx = :mt_idx
+            AND mlt_quality = 0
+            AND mlt_accuacy < :max_accuracy
+            AND mlt_speed >= :min_speed
+            AND (mlt_lat > 0 AND mlt_long > 0)
+            AND mlt_gps_time >= :start_datetime AND mlt_gps_time < :end_datetime
+        ORDER BY mlt_gps_time ASC, mlt_idx ASC
     """)
     
-    # 파라미터 바인딩
+    start_datetime = datetime.strptime(date, "%Y-%m-%d")
     params = {
         'mt_idx': mt_idx,
         'min_speed': min_speed,
         'max_accuracy': max_accuracy,
-        'start_datetime': f"{date} 00:00:00",
-        'end_datetime': f"{date} 23:59:59",
-        'min_duration': min_duration
+        'start_datetime': start_datetime,
+        'end_datetime': start_datetime + timedelta(days=1)
     }
     
-    # 쿼리 실행
-    result = db.execute(sql_query, params)
-    
-    # 결과를 딕셔너리 리스트로 변환
-    results = []
-    for row in result:
-        results.append({
-            'label': row.label,
-            'grp': row.grp,
-            'start_time': row.start_time.strftime('%Y-%m-%d %H:%M:%S') if row.start_time else None,
-            'end_time': row.end_time.strftime('%Y-%m-%d %H:%M:%S') if row.end_time else None,
-            'duration': float(row.duration) if row.duration else 0.0,
-            'distance': float(row.distance) if row.distance else 0.0,
-            'start_lat': float(row.start_lat) if row.start_lat else None,
-            'start_long': float(row.start_long) if row.start_long else None
-        })
-    
-    return results
+    rows = db.execute(sql_query, params).fetchall()
+    indices = simplify_track(
+        [row.mlt_lat for row in rows],
+        [row.mlt_long for row in rows],
+        tolerance_m,
+        max_markers
+    )
+    logger.debug(f"[get_member_map_markers] 데이터 건수: {len(rows)}건 -> 경로 단순화 후 {len(indices)}건")
+    return [rows[index] for index in indices]
 
 def get_member_map_markers(
     db: Session, 
     mt_idx: int,
     date: str,
     min_speed: float = 1.0,
-    max_accuracy: float = 50.0
+    max_accuracy: float = 50.0,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_markers: Optional[int] = 200
 ) -> List[dict]:
     """
     특정 회원의 특정 날짜 지도 마커용 이동로그 데이터 조회
-    제공된 SQL 쿼리를 원시 SQL로 구현 (데이터 샘플링 포함)
+    원시 SQL로 조회 후 경로 단순화로 마커 수를 줄임
     
     Args:
         mt_idx: 회원 인덱스 (sgdt_mt_idx)
         date: 조회할 날짜 (YYYY-MM-DD)
         min_speed: 최소 속도 값 (기본값: 1.0)
         max_accuracy: 최대 정확도 값 (기본값: 50.0)
+        tolerance_m: 경로 단순화 허용 오차(m)
+        max_markers: 최대 마커 수 (None이면 제한 없음)
     
     Returns:
         List[dict]: 지도 마커용 위치 로그 데이터
@@ -643,41 +765,11 @@ def get_member_map_markers(
             - mt_health_work: 걸음수
             - mlt_battery: 배터리
     """
-    from sqlalchemy import text
-    
-    # 제공된 SQL 쿼리를 원시 SQL로 구현
-    sql_query = text("""
-        SELECT *
-        FROM member_location_log_t
-        WHERE mt_idx = :mt_idx
-            AND mlt_accuacy < :max_accuracy
-            AND mlt_speed >= :min_speed
-            AND (mlt_lat > 0 AND mlt_long > 0)
-            AND mlt_gps_time BETWEEN :start_datetime AND :end_datetime
-        GROUP BY 
-            CASE 
-                WHEN (mlt_speed >= :min_speed AND mlt_accuacy < :max_accuracy) THEN mlt_gps_time
-                ELSE mt_health_work
-            END
-        HAVING COUNT(*) % 10 = 1
-        ORDER BY mlt_gps_time ASC
-    """)
-    
-    # 파라미터 바인딩
-    params = {
-        'mt_idx': mt_idx,
-        'min_speed': min_speed,
-        'max_accuracy': max_accuracy,
-        'start_datetime': f"{date} 00:00:00",
-        'end_datetime': f"{date} 23:59:59"
-    }
-    
-    # 쿼리 실행
-    result = db.execute(sql_query, params)
+    rows = _fetch_map_marker_rows(db, mt_idx, date, min_speed, max_accuracy, tolerance_m, max_markers)
     
     # 결과를 딕셔너리 리스트로 변환
     results = []
-    for row in result:
+    for row in rows:
         results.append({
             'mlt_idx': row.mlt_idx,
             'mt_idx': row.mt_idx,
@@ -695,28 +787,38 @@ def get_member_map_markers(
             'stay_long': float(row.stay_long) if row.stay_long else None
         })
     
-    # 데이터가 200건을 넘으면 균일하게 샘플링하여 200건으로 제한
-    max_markers = 200
-    if len(results) > max_markers:
-        print(f"[get_member_map_marker] 데이터 건수: {len(results)}건 -> {max_markers}건으로 샘플링")
-        
-        # 균일한 간격으로 샘플링
-        total_count = len(results)
-        step = total_count / max_markers
-        
-        sampled_results = []
-        for i in range(max_markers):
-            index = int(i * step)
-            if index < total_count:
-                sampled_results.append(results[index])
-        
-        print(f"[get_member_map_markers] 샘플링 완료: {len(sampled_results)}건")
-        return sampled_results
-    else:
-        print(f"[get_member_map_markers] 데이터 건수: {len(results)}건 (샘플링 불필요)")
-    
     return results
 
+def get_member_map_markers_compact(
+    db: Session,
+    mt_idx: int,
+    date: str,
+    compact_format: str,
+    min_speed: float = 1.0,
+    max_accuracy: float = 50.0,
+    tolerance_m: float = DEFAULT_SIMPLIFY_TOLERANCE_M,
+    max_markers: Optional[int] = 200
+) -> dict:
+    """
+    get_member_map_markers와 같은 마커를 압축 형식(app.core.compact_encoding)으로 반환
+
+    행별 dict를 만들지 않고 컬럼 배열로 인코딩합니다. (mlt_idx는 delta, 나머지는 값 그대로)
+    """
+    rows = _fetch_map_marker_rows(db, mt_idx, date, min_speed, max_accuracy, tolerance_m, max_markers)
+    return encode_track(
+        compact_format,
+        [row.mlt_gps_time for row in rows],
+        [row.mlt_lat for row in rows],
+        [row.mlt_long for row in rows],
+        {
+            "mlt_idx": delta_encode([row.mlt_idx for row in rows], 1),
+            "speed": [row.mlt_speed for row in rows],
+            "accuracy": [row.mlt_accuacy for row in rows],
+            "steps": [row.mt_health_work for row in rows],
+            "battery": [row.mlt_battery for row in rows]
+        }
+    )
+
 def get_schedule_count(db: Session, mt_idx: int, date_str: str) -> int:
     """특정 날짜의 일정 개수 조회 (PHP get_schedule_array 함수 기반)"""
     
@@ -782,6 +884,22 @@ def get_schedule_count(db: Session, mt_idx: int, date_str: str) -> int:
 def get_gps_distance_and_time(db: Session, mt_idx: int, date_str: str, max_accuracy: float = 100.0, min_speed: float = 2.0, max_speed: float = 55.0) -> tuple:
     """GPS 거리 및 시간 계산 (PHP get_gps_distance 함수 기반)"""
     
+    # 기본 필터 값이면 수집 시 미리 계산된 일일 요약 테이블 사용
+    if (max_accuracy, min_speed, max_speed) == (
+        location_daily_summary.MOVE_MAX_ACCURACY,
+        location_daily_summary.MOVE_MIN_SPEED_KMH,
+        location_daily_summary.MOVE_MAX_SPEED_KMH
+    ):
+        try:
+            summary = location_daily_summary.get_daily_summary(
+                db, mt_idx, datetime.strptime(date_str, "%Y-%m-%d").date()
+            )
+            if not summary:
+                return 0, 0, 0
+            return summary.mlds_moving_meters, summary.mlds_moving_seconds / 60, summary.mlds_last_steps or 0
+        except Exception as e:
+            print(f"일일 위치 요약 조회 오류, 원본 로그로 계산: {e}")
+    
     # PHP 복잡한 SQL 쿼리를 Python으로 변환
     distance_query = text("""
         WITH RankedLogs AS (
@@ -798,8 +916,9 @@ def get_gps_distance_and_time(db: Session, mt_idx: int, date_str: str, max_accur
             WHERE 1=1
                 AND mt_idx = :mt_idx
                 AND mlt_gps_time BETWEEN :date_start AND :date_end
-                AND mlt_speed > 0
-                AND mlt_accuacy < :max_accuracy
+                AND mlt_quality = 0  -- 수집 시 튐/저정확도 판정
+                AND mlt_speed > 0  -- 수집 판정은 보고된 속도를 보지 않음
+                AND mlt_accuacy < :max_accuracy  -- 요청별 기준 (수집 판정은 100m 초과만 제외)
         ),
         Diffs AS (
             SELECT
@@ -862,11 +981,12 @@ def get_gps_distance_and_time(db: Session, mt_idx: int, date_str: str, max_accur
         moving_minutes = result.moving_minute if result and result.moving_minute else 0
         
         # 걸음수 조회 (해당 날짜의 마지막 기록)
+        # 등록일시(mlt_wdate)가 아닌 파티션 기준 컬럼(mlt_gps_time)으로 조회해 해당 월 파티션만 읽도록 함
         steps_query = text("""
             SELECT mt_health_work 
             FROM member_location_log_t 
             WHERE mt_idx = :mt_idx 
-            AND mlt_wdate BETWEEN :date_start AND :date_end
+            AND mlt_gps_time BETWEEN :date_start AND :date_end
             ORDER BY mlt_gps_time DESC 
             LIMIT 1
         """)
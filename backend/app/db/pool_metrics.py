@@ -0,0 +1,58 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import registry
+
+POOL_CHECKOUT_WAIT = registry.histogram(
+    "smap_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a DB pool connection",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+)
+POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    "smap_db_pool_checkout_timeouts_total",
+    "DB pool checkouts that hit pool_timeout",
+    ["pool"]
+)
+POOL_SIZE = registry.gauge("smap_db_pool_size", "Configured DB pool size", ["pool"])
+POOL_CHECKED_OUT = registry.gauge("smap_db_pool_checked_out", "DB connections in use", ["pool"])
+POOL_CHECKED_IN = registry.gauge("smap_db_pool_checked_in", "Idle DB connections in the pool", ["pool"])
+POOL_OVERFLOW = registry.gauge("smap_db_pool_overflow", "DB connections opened beyond pool_size", ["pool"])
+
+
+class _CheckoutTimingMixin:
+    """연결 대기 시간(풀이 가득 차 반납을 기다린 시간 포함)과 pool_timeout 초과 횟수 기록"""
+    metrics_name = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.metrics_name)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, pool=self.metrics_name)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+def register_pool_collector(engine, name: str) -> None:
+    """메트릭 수집 시점에 연결 풀 사용 현황(사용 중, 유휴, overflow)을 갱신하도록 등록"""
+    def collect():
+        pool = engine.pool
+        POOL_SIZE.set(pool.size(), pool=name)
+        POOL_CHECKED_OUT.set(pool.checkedout(), pool=name)
+        POOL_CHECKED_IN.set(pool.checkedin(), pool=name)
+        # overflow()는 pool_size를 넘어 연 연결 수 (미사용 시 음수로 표시되므로 0으로 보정)
+        POOL_OVERFLOW.set(max(pool.overflow(), 0), pool=name)
+
+    registry.add_collector(collect)
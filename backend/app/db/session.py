@@ -1,6 +1,8 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, register_pool_collector
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -15,7 +17,9 @@ engine = create_engine(
     max_overflow=settings.DB_MAX_OVERFLOW,    # 오버플로우 연결 수
     pool_timeout=settings.DB_POOL_TIMEOUT,    # 연결 대기 시간
     pool_reset_on_return='commit',  # 연결 반환 시 자동 커밋
+    poolclass=InstrumentedQueuePool,  # 연결 대기 시간 메트릭 기록
 )
+register_pool_collector(engine, "sync")
 logger.info(f"Engine URL in session.py: {engine.url}")
 logger.info(f"Database pool settings - Size: {settings.DB_POOL_SIZE}, Max Overflow: {settings.DB_MAX_OVERFLOW}, Timeout: {settings.DB_POOL_TIMEOUT}s")
 
@@ -27,4 +31,24 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# 비동기 엔진 (aiomysql) - async def 엔드포인트에서 이벤트 루프를 막지 않도록 사용
+async_engine = create_async_engine(
+    settings.ASYNC_SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_size=settings.ASYNC_DB_POOL_SIZE,
+    max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    poolclass=InstrumentedAsyncQueuePool,
+)
+register_pool_collector(async_engine, "async")
+logger.info(f"Async database pool settings - Size: {settings.ASYNC_DB_POOL_SIZE}, Max Overflow: {settings.ASYNC_DB_MAX_OVERFLOW}")
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# 비동기 데이터베이스 세션 의존성
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -5,12 +5,19 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.scheduler import scheduler
 from app.core.log_manager import get_log_manager
-from app.db.session import engine
+from app.core.metrics import registry as metrics_registry
+from app.core.http_metrics import MetricsMiddleware
+from app.core.sql_profiler import SQLProfilerMiddleware, install_sql_profiler
+from app.db.session import engine, async_engine
+from app.services.location_ingest_service import location_ingest_service
+from app.services.push_outbox_service import push_outbox_service
+# 회원 스냅샷 캐시 무효화 리스너(Member after_update)를 API 워커에도 등록
+import app.services.member_snapshot_cache  # noqa: F401
 import traceback
 from app.api.v1.endpoints import locations as locations_router
 
@@ -76,6 +83,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 수/응답 시간/처리 중 요청 수 메트릭 (라우트 템플릿 기준, /metrics로 노출)
+app.add_middleware(MetricsMiddleware)
+
+# 요청 단위 SQL 프로파일러 (샘플링, 기본 비활성화)
+if settings.SQL_PROFILER_ENABLED:
+    install_sql_profiler(engine)
+    install_sql_profiler(async_engine.sync_engine)
+    app.add_middleware(SQLProfilerMiddleware)
+
 # API 라우터 포함
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -108,7 +124,11 @@ async def root():
         "redoc": "/redoc",
         "openapi": "/openapi.json",
         "health": "/health",
-        "db_pool_health": "/health/db-pool"
+        "db_pool_health": "/health/db-pool",
+        "location_ingest_health": "/health/location-ingest",
+        "push_outbox_health": "/health/push-outbox",
+        "scheduler_health": "/health/scheduler",
+        "metrics": "/metrics"
     }
 
 # 정적 파일 서빙
@@ -157,6 +177,67 @@ async def check_db_pool_health():
             "timestamp": time.time()
         }
 
+# 위치 로그 수집기 상태 확인
+@app.get("/health/location-ingest", tags=["healthcheck"])
+async def check_location_ingest_health():
+    """위치 로그 write-behind 수집기 상태를 확인합니다."""
+    stats = location_ingest_service.get_stats()
+    if not stats["running"]:
+        status = "disabled" if not settings.LOCATION_INGEST_ASYNC else "stopped"
+    elif not stats["db_available"] or stats["spill_files"] > 0:
+        status = "degraded"
+    elif stats["queued"] > stats["max_queue_size"] * 0.8:
+        status = "warning"
+    else:
+        status = "healthy"
+    return {
+        "status": status,
+        "timestamp": time.time(),
+        "ingest_status": stats
+    }
+
+# 푸시 outbox 워커 상태 확인
+@app.get("/health/push-outbox", tags=["healthcheck"])
+def check_push_outbox_health():
+    """푸시 outbox 전송 워커와 대기열 상태를 확인합니다."""
+    stats = push_outbox_service.get_stats()
+    if not stats["running"]:
+        status = "disabled" if not settings.PUSH_OUTBOX_WORKER else "stopped"
+    elif "error" in stats["outbox"]:
+        status = "degraded"
+    elif stats["outbox"].get("pending", 0) > settings.PUSH_OUTBOX_BATCH_SIZE * 20:
+        status = "warning"
+    else:
+        status = "healthy"
+    return {
+        "status": status,
+        "timestamp": time.time(),
+        "outbox_status": stats
+    }
+
+# Prometheus 메트릭 (API 응답 시간, DB 연결 풀, FCM 전송, 스케줄러 작업 등)
+@app.get("/metrics", tags=["healthcheck"], include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 형식으로 메트릭을 반환합니다."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+# 스케줄러 리더 상태 확인
+@app.get("/health/scheduler", tags=["healthcheck"])
+def check_scheduler_health():
+    """스케줄러 실행 여부와 리더 선출 상태를 확인합니다."""
+    stats = scheduler.get_status()
+    if not settings.SCHEDULER_ENABLED:
+        status = "disabled"
+    elif not stats["running"]:
+        status = "stopped"
+    else:
+        status = "leader" if stats["active"] else "standby"
+    return {
+        "status": status,
+        "timestamp": time.time(),
+        "scheduler_status": stats
+    }
+
 # 일반 헬스체크
 @app.get("/health", tags=["healthcheck"])
 async def health_check():
@@ -187,6 +268,10 @@ async def startup_event():
     애플리케이션 시작 시 실행되는 이벤트
     """
     scheduler.start()
+    if settings.LOCATION_INGEST_ASYNC:
+        location_ingest_service.start()
+    if settings.PUSH_OUTBOX_WORKER:
+        push_outbox_service.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -194,6 +279,9 @@ async def shutdown_event():
     애플리케이션 종료 시 실행되는 이벤트
     """
     scheduler.shutdown()
+    location_ingest_service.stop()
+    push_outbox_service.stop()
+    await async_engine.dispose()
 
 # 동적 OpenAPI 스키마: 요청 호스트 기반으로 servers 설정
 @app.get(f"{settings.API_V1_STR}/openapi.json", include_in_schema=False)
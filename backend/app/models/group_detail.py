@@ -171,4 +171,72 @@ class GroupDetail(BaseModel):
             cls.sgdt_discharge == DischargeEnum.N,
             cls.sgdt_exit == ExitEnum.N,
             cls.sgdt_show == ShowEnum.Y
-        ).count() 
\ No newline at end of file
+        ).count() 
+
+    @classmethod
+    def find_managers_by_groups(cls, db: Session, sgt_idxs: List[int]) -> Dict[int, Dict[str, Dict]]:
+        """
+        여러 그룹의 소유자/리더 정보를 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Dict[sgt_idx, {"owner": {...}, "leader": {...}}]: 회원 정보(mt_idx, mt_name, mt_lang, mt_token_id) 포함
+        """
+        if not sgt_idxs:
+            return {}
+        try:
+            from app.models.member import Member
+            rows = (
+                db.query(cls, Member)
+                .join(Member, cls.mt_idx == Member.mt_idx)
+                .filter(
+                    cls.sgt_idx.in_(set(sgt_idxs)),
+                    (cls.sgdt_owner_chk == OwnerCheckEnum.Y) | (cls.sgdt_leader_chk == LeaderCheckEnum.Y),
+                    cls.sgdt_discharge == DischargeEnum.N,
+                    cls.sgdt_exit == ExitEnum.N,
+                    cls.sgdt_show == ShowEnum.Y
+                )
+                .all()
+            )
+
+            managers: Dict[int, Dict[str, Dict]] = {}
+            for row in rows:
+                info = {
+                    "sgdt_idx": row.GroupDetail.sgdt_idx,
+                    "sgt_idx": row.GroupDetail.sgt_idx,
+                    "mt_idx": row.GroupDetail.mt_idx,
+                    "mt_name": row.Member.mt_nickname or row.Member.mt_name,
+                    "mt_lang": row.Member.mt_lang,
+                    "mt_token_id": row.Member.mt_token_id
+                }
+                group = managers.setdefault(row.GroupDetail.sgt_idx, {"owner": {}, "leader": {}})
+                if row.GroupDetail.sgdt_owner_chk == OwnerCheckEnum.Y and not group["owner"]:
+                    group["owner"] = info
+                if row.GroupDetail.sgdt_leader_chk == LeaderCheckEnum.Y and not group["leader"]:
+                    group["leader"] = info
+            return managers
+        except Exception as e:
+            logger.error(f"Error in find_managers_by_groups: {e}")
+            return {}
+
+    @classmethod
+    def get_member_idxs_by_groups(cls, db: Session, sgt_idxs: List[int]) -> Dict[int, List[int]]:
+        """
+        여러 그룹의 활성 멤버 회원 번호를 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Dict[sgt_idx, List[mt_idx]]
+        """
+        sgt_idxs = {sgt_idx for sgt_idx in sgt_idxs if sgt_idx is not None}
+        if not sgt_idxs:
+            return {}
+        rows = db.query(cls.sgt_idx, cls.mt_idx).filter(
+            cls.sgt_idx.in_(sgt_idxs),
+            cls.sgdt_discharge == DischargeEnum.N,
+            cls.sgdt_exit == ExitEnum.N,
+            cls.sgdt_show == ShowEnum.Y
+        ).all()
+
+        members: Dict[int, List[int]] = {}
+        for row in rows:
+            members.setdefault(row.sgt_idx, []).append(row.mt_idx)
+        return members
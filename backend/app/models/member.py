@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, Enum, text, Date
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Enum, text, Date, and_, case
 from sqlalchemy.dialects.mysql import DECIMAL, TINYINT
 from app.models.base import BaseModel
 from datetime import datetime, date, timedelta
@@ -116,6 +116,25 @@ class Member(BaseModel):
             cls.mt_status == 1
         ).all()
 
+    @classmethod
+    def get_all_active(cls, db: Session) -> List:
+        """
+        전체 발송 알림 대상 (토큰 보유 정상 회원) 조회 - 발송에 필요한 컬럼만 읽음
+
+        Returns:
+            List[Row]: mt_idx, mt_lang, mt_token_id
+        """
+        return db.query(
+            cls.mt_idx,
+            cls.mt_lang,
+            cls.mt_token_id
+        ).filter(
+            cls.mt_level > 1,
+            cls.mt_token_id.isnot(None),
+            cls.mt_token_id != "",
+            cls.mt_status == 1
+        ).order_by(cls.mt_idx).all()
+
     @classmethod
     def get_token_expiring_soon(cls, db: Session, expiry_threshold: datetime) -> List['Member']:
         """만료 임박한 FCM 토큰을 가진 사용자 목록 조회"""
@@ -128,6 +147,36 @@ class Member(BaseModel):
             cls.mt_token_expiry_date <= expiry_threshold
         ).order_by(cls.mt_token_expiry_date.asc()).all()
 
+    @classmethod
+    def get_silent_push_targets(cls, db: Session, expiry_threshold: datetime) -> List:
+        """
+        Silent 푸시 대상 (토큰 보유 사용자) 조회 - 토큰 만료 임박 사용자 우선 정렬
+
+        get_token_list / get_token_expiring_soon 두 번 조회하던 것을 한 번의 쿼리로 처리하며,
+        전송에 필요한 컬럼만 읽습니다.
+
+        Returns:
+            List[Row]: mt_idx, mt_token_id, mt_token_expiry_date, is_priority
+        """
+        is_priority = and_(
+            cls.mt_token_expiry_date.isnot(None),
+            cls.mt_token_expiry_date <= expiry_threshold
+        )
+        return db.query(
+            cls.mt_idx,
+            cls.mt_token_id,
+            cls.mt_token_expiry_date,
+            case((is_priority, 1), else_=0).label("is_priority")
+        ).filter(
+            cls.mt_level > 1,
+            cls.mt_token_id.isnot(None),
+            cls.mt_token_id != "",
+            cls.mt_status == 1
+        ).order_by(
+            case((is_priority, 0), else_=1),
+            cls.mt_token_expiry_date.asc()
+        ).all()
+
     @classmethod
     def get_sign_in_3(cls, db: Session) -> List['Member']:
         before3h_start = datetime.now() - timedelta(hours=3)
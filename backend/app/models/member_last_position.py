@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, DateTime, DECIMAL, Float, SmallInteger
+from sqlalchemy.sql import func
+from .base import Base
+
+class MemberLastPosition(Base):
+    """회원별 최신 위치 (member_location_log_t에서 GPS 시간이 가장 늦은 로그, 수집 시 갱신)"""
+    __tablename__ = "member_last_position_t"
+
+    mt_idx = Column(Integer, primary_key=True, comment='회원 인덱스')
+    mlp_lat = Column(DECIMAL(16, 14), comment='위도')
+    mlp_long = Column(DECIMAL(17, 14), comment='경도')
+    mlp_accuacy = Column(Float, comment='위치값(수평 정확도)')
+    mlp_speed = Column(Float, comment='속도(m/s)')
+    mlp_battery = Column(SmallInteger, comment='배터리')
+    mlp_gps_time = Column(DateTime, nullable=False, comment='GPS 시간')
+    mlp_udate = Column(DateTime, default=func.now(), onupdate=func.now(), comment='수정일시')
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, Date, DateTime, DECIMAL, Float, Enum, SmallInteger
+from sqlalchemy.sql import func
+from .base import Base
+
+class MemberLocationDailySummary(Base):
+    """회원별 일일 위치 로그 요약 (member_location_log_t 롤업, 수집 시 증분 갱신)"""
+    __tablename__ = "member_location_daily_summary_t"
+
+    mt_idx = Column(Integer, primary_key=True, comment='회원 인덱스')
+    mlds_date = Column(Date, primary_key=True, comment='요약 날짜 (GPS 시간 기준)')
+
+    # 일일 요약 값
+    mlds_point_count = Column(Integer, nullable=False, default=0, comment='위치 로그 수')
+    mlds_first_time = Column(DateTime, comment='첫 GPS 시간')
+    mlds_last_time = Column(DateTime, comment='마지막 GPS 시간')
+    mlds_path_km = Column(Float, nullable=False, default=0.0, comment='전체 경로 거리(km)')
+    mlds_moving_meters = Column(Float, nullable=False, default=0.0, comment='이동 거리(m, 속도 필터 적용)')
+    mlds_moving_seconds = Column(Integer, nullable=False, default=0, comment='이동 시간(초, 속도 필터 적용)')
+    mlds_stay_count = Column(Integer, nullable=False, default=0, comment='체류 횟수')
+    mlds_step_count = Column(Integer, nullable=False, default=0, comment='걸음수 기록 수')
+    mlds_min_steps = Column(Integer, comment='최소 걸음수')
+    mlds_max_steps = Column(Integer, comment='최대 걸음수')
+    mlds_last_steps = Column(Integer, comment='마지막 걸음수')
+    mlds_battery_count = Column(Integer, nullable=False, default=0, comment='배터리 기록 수')
+    mlds_first_battery = Column(SmallInteger, comment='첫 배터리')
+    mlds_last_battery = Column(SmallInteger, comment='마지막 배터리')
+
+    # 증분 계산용 상태 (마지막으로 반영한 로그 기준)
+    mlds_last_lat = Column(DECIMAL(16, 14), comment='마지막 로그 위도')
+    mlds_last_long = Column(DECIMAL(17, 14), comment='마지막 로그 경도')
+    mlds_move_time = Column(DateTime, comment='이동거리 계산 대상 마지막 로그 시간')
+    mlds_move_lat = Column(DECIMAL(16, 14), comment='이동거리 계산 대상 마지막 로그 위도')
+    mlds_move_long = Column(DECIMAL(17, 14), comment='이동거리 계산 대상 마지막 로그 경도')
+    mlds_stay_label = Column(Enum('stay', 'move'), comment='체류 계산 대상 마지막 로그 구분')
+    mlds_stay_start = Column(DateTime, comment='현재 체류 구간 시작 시간')
+    mlds_stay_counted = Column(Enum('Y', 'N'), default='N', comment='현재 체류 구간 집계 여부')
+
+    mlds_rebuild = Column(Enum('Y', 'N'), nullable=False, default='N', comment='재계산 필요 여부 (순서가 어긋난 로그 수신 시)')
+    mlds_udate = Column(DateTime, default=func.now(), onupdate=func.now(), comment='수정일시')
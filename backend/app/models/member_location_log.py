@@ -24,6 +24,7 @@ class MemberLocationLog(Base):
     mlt_wdate = Column(DateTime, default=func.now(), comment='등록일시')
     stay_lat = Column(DECIMAL(16, 14), comment='체류 중심위도')
     stay_long = Column(DECIMAL(17, 14), comment='체류 중심경도')
+    mlt_quality = Column(SmallInteger, nullable=False, default=0, comment='GPS 품질 플래그 (0: 정상, 1: 저정확도, 2: 튐, 4: 좌표 없음)')
     
     def to_dict(self):
         """모델을 딕셔너리로 변환"""
@@ -41,7 +42,8 @@ class MemberLocationLog(Base):
             'mlt_gps_time': self.mlt_gps_time.isoformat() if self.mlt_gps_time else None,
             'mlt_wdate': self.mlt_wdate.isoformat() if self.mlt_wdate else None,
             'stay_lat': float(self.stay_lat) if self.stay_lat else None,
-            'stay_long': float(self.stay_long) if self.stay_long else None
+            'stay_long': float(self.stay_long) if self.stay_long else None,
+            'mlt_quality': self.mlt_quality
         }
     
     @classmethod
@@ -55,15 +57,16 @@ class MemberLocationLog(Base):
     def getDistance(cls, db: Session, lat: str, long: str, mt_idx: str) -> Optional[Dict]:
         """회원의 위치와 특정 좌표 사이의 거리를 계산합니다."""
         try:
-            # 회원의 최근 위치 로그 가져오기
-            recent_location = cls.get_recent_location(db, int(mt_idx))
+            # 회원의 최근 위치 (인메모리 인덱스, 없으면 DB 조회 후 캐시)
+            from app.services.last_position_index import last_position_index
+            recent_location = last_position_index.get_or_load(db, int(mt_idx))
             if not recent_location:
                 return None
             
             # 거리 계산 (간단한 유클리드 거리)
             from math import sqrt
-            member_lat = float(recent_location.mlt_lat) if recent_location.mlt_lat else 0
-            member_long = float(recent_location.mlt_long) if recent_location.mlt_long else 0
+            member_lat = recent_location.lat
+            member_long = recent_location.lng
             target_lat = float(lat) if lat else 0
             target_long = float(long) if long else 0
             
@@ -76,6 +76,36 @@ class MyLocation(BaseModel):
             logger.error(f"Error in get_all_active_in: {e}")
             return []
 
+    @classmethod
+    def get_geofences(cls, db: Session) -> List[Dict]:
+        """알림이 켜진 내 장소(지오펜스)와 현재 진입 상태를 가져옵니다."""
+        try:
+            sql = text("""
+                SELECT slt_idx, mt_idx, slt_title, slt_lat, slt_long, slt_enter_chk
+                FROM smap_location_t
+                WHERE slt_ddate IS NULL
+                  AND slt_enter_alarm = 'Y'
+                  AND slt_show = 'Y'
+                  AND mt_idx IS NOT NULL
+                  AND slt_lat IS NOT NULL
+                  AND slt_long IS NOT NULL
+            """)
+            result = db.execute(sql)
+            return [dict(row._mapping) for row in result]
+        except Exception as e:
+            logger.error(f"Error in get_geofences: {e}")
+            return []
+
+    @classmethod
+    def set_enter_state(cls, db: Session, slt_idxs: List[int], enter_chk: str) -> None:
+        """여러 내 장소의 진입 상태(slt_enter_chk)를 한 번에 갱신합니다. (커밋은 호출자가 수행)"""
+        if not slt_idxs:
+            return
+        db.query(cls).filter(cls.slt_idx.in_(slt_idxs)).update(
+            {cls.slt_enter_chk: enter_chk},
+            synchronize_session=False
+        )
+
     @classmethod
     def create(cls, db: Session, **kwargs) -> 'MyLocation':
         """새로운 내 장소를 생성합니다."""
@@ -0,0 +1,63 @@
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, SmallInteger, func
+from app.models.base import BaseModel
+from sqlalchemy.orm import Session
+from typing import List, Tuple
+from datetime import datetime, timedelta
+
+class PushOutbox(BaseModel):
+    """푸시 전송 대기열 (outbox). 요청/작업은 행만 추가하고 전송은 push_outbox_service 워커가 수행"""
+    __tablename__ = "push_outbox_t"
+
+    pot_idx = Column(Integer, primary_key=True, autoincrement=True)
+    mt_idx = Column(Integer, nullable=True, comment='수신 회원 인덱스')
+    sst_idx = Column(Integer, nullable=True, comment='관련 일정/장소 인덱스')
+    pot_token = Column(String(255), nullable=True, comment='FCM 토큰')
+    pot_title = Column(String(100), nullable=True, comment='푸시 제목')
+    pot_content = Column(String(500), nullable=True, comment='푸시 내용')
+    pot_condition = Column(String(50), nullable=True, comment='push_log_t.plt_condition')
+    pot_memo = Column(String(50), nullable=True, comment='push_log_t.plt_memo')
+    pot_json = Column(Text, nullable=True, comment='push_log_t.push_json')
+    pot_status = Column(Enum('pending', 'sending', 'sent', 'dead'), nullable=False, default='pending', comment='전송 상태')
+    pot_attempts = Column(SmallInteger, nullable=False, default=0, comment='전송 시도 횟수')
+    pot_next_attempt_at = Column(DateTime, nullable=False, comment='다음 전송 시도 시각')
+    pot_claimed_at = Column(DateTime, nullable=True, comment='워커가 가져간 시각')
+    pot_last_error = Column(String(255), nullable=True, comment='마지막 전송 오류')
+    pot_wdate = Column(DateTime, nullable=True, comment='등록일시')
+    pot_sdate = Column(DateTime, nullable=True, comment='전송 완료(또는 dead 처리) 일시')
+
+    @classmethod
+    def claim_batch(cls, db: Session, limit: int, claim_timeout: int, max_attempts: int) -> Tuple[List['PushOutbox'], List['PushOutbox']]:
+        """
+        전송할 행을 가져와 sending 상태로 표시하고 시도 횟수를 올립니다. (커밋은 호출자가 수행)
+
+        - 전송 시각이 된 pending 행과, claim_timeout(초)이 지나도록 sending인 행(워커 중단)을 대상으로 함
+        - FOR UPDATE SKIP LOCKED로 여러 워커가 같은 행을 가져가지 않음
+        - 시도 횟수는 가져갈 때 올리므로, 전송 중 워커를 중단시키는 행도 max_attempts번 뒤에는 dead로 처리됨
+
+        Returns:
+            (전송할 행, 시도 횟수를 모두 써서 dead로 표시한 행)
+        """
+        now = datetime.now()
+        rows = db.query(cls).filter(
+            ((cls.pot_status == 'pending') & (cls.pot_next_attempt_at <= now)) |
+            ((cls.pot_status == 'sending') & (cls.pot_claimed_at < now - timedelta(seconds=claim_timeout)))
+        ).order_by(cls.pot_idx).limit(limit).with_for_update(skip_locked=True).all()
+        claimed, dead = [], []
+        for row in rows:
+            if (row.pot_attempts or 0) >= max_attempts:
+                row.pot_status = 'dead'
+                row.pot_claimed_at = None
+                row.pot_sdate = now
+                row.pot_last_error = f"전송 중 중단 {row.pot_attempts}회 (claim_timeout 초과)"
+                dead.append(row)
+                continue
+            row.pot_status = 'sending'
+            row.pot_attempts = (row.pot_attempts or 0) + 1
+            row.pot_claimed_at = now
+            claimed.append(row)
+        return claimed, dead
+
+    @classmethod
+    def count_by_status(cls, db: Session) -> dict:
+        """상태별 행 수"""
+        return dict(db.query(cls.pot_status, func.count(cls.pot_idx)).group_by(cls.pot_status).all())
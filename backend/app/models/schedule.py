@@ -105,6 +105,55 @@ class Schedule(BaseModel):
             logger.error(f"Error in get_now_schedule_out_members: {e}")
             return []
 
+    @classmethod
+    def get_location_alert_fences(cls, db: Session, exit_alert: bool = False) -> List[Dict]:
+        """
+        장소 진입/이탈 알림 대상 일정(지오펜스)을 한 번에 조회합니다.
+
+        get_now_schedule_in_members / get_now_schedule_out_members와 같은 조건에
+        일정 대상 회원(sgdt_idx → mt_idx)을 함께 조인하여 반환합니다.
+
+        Returns:
+            List[dict]: sst_idx, sst_title, sgt_idx, mt_idx(일정 작성자), target_mt_idx(대상 회원), 장소 좌표
+        """
+        try:
+            if exit_alert:
+                condition = """
+                    NOW() BETWEEN sst.sst_sdate AND sst.sst_edate
+                    AND (sst.sst_location_alarm = 2 OR sst.sst_location_alarm = 4)
+                    AND sst.sst_in_chk = 'Y'
+                    AND sst.sst_exit_cnt = 0
+                """
+            else:
+                condition = """
+                    NOW() BETWEEN
+                        LEAST(
+                            DATE_SUB(sst.sst_sdate, INTERVAL 30 MINUTE),
+                            IFNULL(sst.sst_adate, sst.sst_sdate)
+                        ) AND sst.sst_edate
+                    AND (sst.sst_location_alarm = 1 OR sst.sst_location_alarm = 4)
+                    AND sst.sst_in_chk = 'N'
+                    AND sst.sst_entry_cnt = 0
+                """
+            sql = text(f"""
+                SELECT sst.sst_idx, sst.sst_title, sst.sgt_idx, sst.mt_idx,
+                       sst.sst_location_lat, sst.sst_location_long,
+                       sgdt.mt_idx AS target_mt_idx
+                FROM smap_schedule_t sst
+                JOIN smap_group_detail_t sgdt ON sgdt.sgdt_idx = sst.sgdt_idx
+                WHERE {condition}
+                AND sst.sst_show = 'Y'
+                AND sst.sgt_idx IS NOT NULL
+                AND sst.sst_location_lat IS NOT NULL
+                AND sst.sst_location_long IS NOT NULL
+                AND sgdt.mt_idx <> sst.mt_idx
+            """)
+            result = db.execute(sql)
+            return [dict(row._mapping) for row in result]
+        except Exception as e:
+            logger.error(f"Error in get_location_alert_fences: {e}")
+            return []
+
     @classmethod
     def get_now_schedule_push(cls, db: Session) -> List['Schedule']:
         now = datetime.now()
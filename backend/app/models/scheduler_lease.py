@@ -0,0 +1,58 @@
+from sqlalchemy import Column, String, DateTime, text
+from app.models.base import BaseModel
+from sqlalchemy.orm import Session
+
+class SchedulerLease(BaseModel):
+    """스케줄러 리더 임대. 임대를 가진 워커만 스케줄 작업을 실행"""
+    __tablename__ = "scheduler_lease_t"
+
+    sls_name = Column(String(50), primary_key=True, comment='임대 이름')
+    sls_owner = Column(String(100), nullable=False, comment='임대 보유 워커 (호스트:PID:ID)')
+    sls_expires_at = Column(DateTime, nullable=False, comment='임대 만료 시각 (DB 시각 기준)')
+    sls_udate = Column(DateTime, nullable=True, comment='마지막 갱신일시')
+
+    @classmethod
+    def try_acquire(cls, db: Session, name: str, owner: str, ttl: int) -> bool:
+        """
+        임대를 획득하거나 갱신합니다.
+
+        - 임대가 없거나, 이미 owner가 보유 중이거나, 만료된 경우에만 owner로 설정하고 ttl(초)만큼 연장
+        - 한 문장(INSERT ... ON DUPLICATE KEY UPDATE)으로 처리하므로 여러 워커가 동시에 시도해도 1개만 성공
+        - 만료 판정은 DB 시각(NOW())을 기준으로 하여 서버 간 시계 차이의 영향을 받지 않음
+
+        Returns:
+            bool: owner가 임대를 보유하고 있으면 True
+        """
+        # 대입은 왼쪽부터 적용되므로 sls_owner가 먼저 바뀐 뒤의 값으로 만료 시각 갱신 여부를 판단
+        db.execute(text("""
+            INSERT INTO scheduler_lease_t (sls_name, sls_owner, sls_expires_at, sls_udate)
+            VALUES (:name, :owner, NOW() + INTERVAL :ttl SECOND, NOW())
+            ON DUPLICATE KEY UPDATE
+                sls_owner = IF(sls_owner = VALUES(sls_owner) OR sls_expires_at < NOW(), VALUES(sls_owner), sls_owner),
+                sls_expires_at = IF(sls_owner = VALUES(sls_owner), VALUES(sls_expires_at), sls_expires_at),
+                sls_udate = IF(sls_owner = VALUES(sls_owner), VALUES(sls_udate), sls_udate)
+        """), {"name": name, "owner": owner, "ttl": ttl})
+        current_owner = db.execute(
+            text("SELECT sls_owner FROM scheduler_lease_t WHERE sls_name = :name"),
+            {"name": name}
+        ).scalar()
+        db.commit()
+        return current_owner == owner
+
+    @classmethod
+    def release(cls, db: Session, name: str, owner: str) -> None:
+        """owner가 보유한 임대를 즉시 만료시켜 다른 워커가 바로 가져갈 수 있도록 합니다."""
+        db.execute(text("""
+            UPDATE scheduler_lease_t
+            SET sls_expires_at = NOW(), sls_udate = NOW()
+            WHERE sls_name = :name AND sls_owner = :owner
+        """), {"name": name, "owner": owner})
+        db.commit()
+
+    @classmethod
+    def get_owner(cls, db: Session, name: str) -> dict:
+        """현재 임대 보유 워커와 만료 시각"""
+        lease = db.query(cls).filter(cls.sls_name == name).first()
+        if not lease:
+            return {}
+        return {"owner": lease.sls_owner, "expires_at": lease.sls_expires_at}
@@ -19,7 +19,8 @@ class MemberLocationLogBase(BaseModel):
 
 class MemberLocationLogCreate(MemberLocationLogBase):
     """위치 로그 생성 스키마"""
-    pass
+    # 저장 시 서버에서 판정 (app.services.location_quality, 클라이언트 값은 무시)
+    mlt_quality: int = 0
 
 class MemberLocationLogUpdate(BaseModel):
     """위치 로그 업데이트 스키마"""
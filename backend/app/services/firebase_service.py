@@ -1,6 +1,6 @@
 import firebase_admin
-from firebase_admin import credentials, messaging
-from typing import Optional, Dict, Any
+from firebase_admin import credentials, messaging, exceptions as firebase_exceptions
+from typing import Optional, Dict, Any, List
 import logging
 import os
 import json
@@ -8,9 +8,39 @@ import time
 import ssl
 from datetime import datetime
 from app.config import Config
+from app.core.metrics import registry as metrics_registry
 
 logger = logging.getLogger(__name__)
 
+# send_each() 1회 호출당 최대 메시지 수 (FCM 제한)
+FCM_BATCH_SIZE = 500
+
+# 재시도해도 성공할 수 없는 FCM 오류 (토큰 무효, 잘못된 요청)
+FCM_PERMANENT_ERRORS = (
+    messaging.UnregisteredError,
+    messaging.ThirdPartyAuthError,
+    messaging.SenderIdMismatchError,
+    firebase_exceptions.InvalidArgumentError
+)
+
+FCM_SEND_SECONDS = metrics_registry.histogram(
+    "smap_fcm_send_duration_seconds",
+    "FCM API call latency (send: one message, send_each: one batch call)",
+    ["method"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+FCM_MESSAGES = metrics_registry.counter(
+    "smap_fcm_messages_total",
+    "FCM messages by result (success or error type)",
+    ["method", "result"]
+)
+
+
+def _fcm_error_code(error: Exception) -> str:
+    """메트릭 레이블용 FCM 오류 종류 (UnregisteredError, QuotaExceededError 등)"""
+    return type(error).__name__
+
+
 class FirebaseService:
     _instance = None
     _initialized = False
@@ -184,7 +214,7 @@ class FirebaseService:
                     )
                     
                 # FCM 전송 실행
-                response = messaging.send(message)
+                response = self._send_message(message, "ios_optimized")
                 logger.info(f"✅ [FCM iOS] iOS 최적화 푸시 전송 성공: {response}")
                 
                 return response
@@ -223,6 +253,87 @@ class FirebaseService:
             logger.error(f"❌ [FCM iOS] iOS 최적화 푸시 전송 실패: {e}")
             return f"ios_push_failed: {e}"
 
+    def _send_message(self, message: messaging.Message, method: str) -> str:
+        """messaging.send() 호출 (응답 시간과 결과/오류 종류를 메트릭으로 기록)"""
+        started = time.perf_counter()
+        try:
+            response = messaging.send(message)
+        except Exception as e:
+            FCM_MESSAGES.inc(method=method, result=_fcm_error_code(e))
+            raise
+        finally:
+            FCM_SEND_SECONDS.observe(time.perf_counter() - started, method=method)
+        FCM_MESSAGES.inc(method=method, result="success")
+        return response
+
+    def _build_push_message(self, token: str, title: str, content: str) -> messaging.Message:
+        """FCM 표준 푸시 메시지 구성 (iOS 토큰이면 APNs 설정 포함)"""
+        # Firebase Admin SDK의 send() 메소드에 맞게 Message 객체 생성
+        # iOS 최적화: 토큰에 콜론(:)이 있으면 iOS로 판단하여 APNs 설정 추가
+        is_ios_token = ':' in token
+
+        if is_ios_token:
+            # iOS 토큰인 경우 APNs 설정 포함
+            logger.info(f"📱 [FCM iOS] iOS 토큰 감지됨 - APNs 설정 적용: {token[:30]}...")
+            message = messaging.Message(
+                token=token,
+                notification=messaging.Notification(
+                    title=title,
+                    body=content
+                ),
+                data={
+                    "title": title,
+                    "body": content,
+                    "click_action": "FLUTTER_NOTIFICATION_CLICK",
+                    "notification_type": "standard_push",
+                    "timestamp": str(int(time.time())),
+                    "ios_delivery_mode": "reliable"
+                },
+                android=messaging.AndroidConfig(
+                    priority='high',
+                    notification=messaging.AndroidNotification(
+                        sound='default'
+                    )
+                ),
+                apns=messaging.APNSConfig(
+                    headers={
+                        "apns-push-type": "alert",
+                        "apns-priority": "5",  # 10에서 5로 변경 (일반 우선순위)
+                        "apns-topic": Config.IOS_BUNDLE_ID,
+                        # expiration과 thread-id 제거로 단순화
+                    },
+                    payload=messaging.APNSPayload(
+                        aps=messaging.Aps(
+                            sound='default',
+                            badge=1,
+                            alert=messaging.ApsAlert(
+                                title=title,
+                                body=content
+                            )
+                            # mutable_content, content_available, category 제거로 단순화
+                        )
+                    )
+                )
+            )
+        else:
+            # Android 토큰인 경우 Android 전용 설정만
+            logger.info(f"🤖 [FCM Android] Android 토큰 감지됨 - Android 설정만 적용: {token[:30]}...")
+            message = messaging.Message(
+                token=token,
+                notification=messaging.Notification(
+                    title=title,
+                    body=content
+                ),
+                android=messaging.AndroidConfig(
+                    priority='high',
+                    notification=messaging.AndroidNotification(
+                        sound='default'
+                    )
+                )
+            )
+
+        return message
+
     def send_push_notification(self, token: str, title: str, content: str, max_retries: int = 0, member_id: int = None, enable_fallback: bool = True, is_test: bool = False) -> str:
         """FCM 푸시 알림 전송 (iOS 최적화 포함) - 토큰 검증 및 자동 정리 기능 포함
 
@@ -271,69 +382,7 @@ class FirebaseService:
                 # FCM 메시지 구성 (FCM v1 API 형식 준수)
                 logger.info(f"📤 [FCM] 메시지 구성 시작")
 
-                # Firebase Admin SDK의 send() 메소드에 맞게 Message 객체 생성
-                # iOS 최적화: 토큰에 콜론(:)이 있으면 iOS로 판단하여 APNs 설정 추가
-                is_ios_token = ':' in token
-
-                if is_ios_token:
-                    # iOS 토큰인 경우 APNs 설정 포함
-                    logger.info(f"📱 [FCM iOS] iOS 토큰 감지됨 - APNs 설정 적용: {token[:30]}...")
-                    message = messaging.Message(
-                        token=token,
-                        notification=messaging.Notification(
-                            title=title,
-                            body=content
-                        ),
-                        data={
-                            "title": title,
-                            "body": content,
-                            "click_action": "FLUTTER_NOTIFICATION_CLICK",
-                            "notification_type": "standard_push",
-                            "timestamp": str(int(time.time())),
-                            "ios_delivery_mode": "reliable"
-                        },
-                        android=messaging.AndroidConfig(
-                            priority='high',
-                            notification=messaging.AndroidNotification(
-                                sound='default'
-                            )
-                        ),
-                        apns=messaging.APNSConfig(
-                            headers={
-                                "apns-push-type": "alert",
-                                "apns-priority": "5",  # 10에서 5로 변경 (일반 우선순위)
-                                "apns-topic": Config.IOS_BUNDLE_ID,
-                                # expiration과 thread-id 제거로 단순화
-                            },
-                            payload=messaging.APNSPayload(
-                                aps=messaging.Aps(
-                                    sound='default',
-                                    badge=1,
-                                    alert=messaging.ApsAlert(
-                                        title=title,
-                                        body=content
-                                    )
-                                    # mutable_content, content_available, category 제거로 단순화
-                                )
-                            )
-                        )
-                    )
-                else:
-                    # Android 토큰인 경우 Android 전용 설정만
-                    logger.info(f"🤖 [FCM Android] Android 토큰 감지됨 - Android 설정만 적용: {token[:30]}...")
-                    message = messaging.Message(
-                        token=token,
-                        notification=messaging.Notification(
-                            title=title,
-                            body=content
-                        ),
-                        android=messaging.AndroidConfig(
-                            priority='high',
-                            notification=messaging.AndroidNotification(
-                                sound='default'
-                            )
-                        )
-                    )
+                message = self._build_push_message(token, title, content)
 
                 logger.info(f"📤 [FCM] 메시지 구성 완료 - 토큰: {token[:30]}..., 제목: {title}")
 
@@ -366,7 +415,7 @@ class FirebaseService:
                         logger.warning(f"🔍 [FCM DEBUG] 메시지 구조 로깅 실패: {debug_error}")
 
                     # FCM 전송 시도
-                    response = messaging.send(message)
+                    response = self._send_message(message, "push")
                     logger.info(f"✅ [FCM] FCM 전송 성공: {response}")
                 except Exception as send_error:
                     logger.error(f"🚨 [FCM] messaging.send() 호출 실패: {send_error}")
@@ -439,6 +488,89 @@ class FirebaseService:
         logger.error(f"❌ [FCM POLICY 4] 모든 재시도 실패 - 최종 에러: {last_error}")
         raise last_error
 
+    def send_push_notifications_batch(self, pushes: List[Dict[str, Any]], batch_size: int = FCM_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """FCM 푸시 알림 일괄 전송 (send_each, batch_size개씩)
+
+        토큰별로 제목/내용이 다른 메시지를 묶어 전송하고, 결과를 토큰별로 수집합니다.
+        무효 토큰 오류는 send_push_notification과 동일하게 토큰 무효화 처리로 넘깁니다.
+
+        Args:
+            pushes: [{"token": str, "title": str, "content": str, "member_id": Optional[int]}, ...]
+            batch_size: send_each 1회 호출당 메시지 수 (최대 500)
+
+        Returns:
+            List[dict]: pushes와 같은 순서의 결과 {"token", "result", "msg", "fcm_response", "retryable"}
+                        retryable은 실패 시 재시도로 성공할 수 있는 오류인지 여부
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pushes)
+
+        if not self._firebase_available:
+            logger.warning("Firebase가 초기화되지 않아 푸시 알림을 건너뜁니다.")
+            return [
+                {"token": push.get("token"), "result": False, "msg": "firebase_disabled", "retryable": True}
+                for push in pushes
+            ]
+
+        # 전송 가능한 메시지만 구성 (토큰/제목/내용 누락은 전송하지 않고 실패 처리)
+        pending = []
+        for i, push in enumerate(pushes):
+            token, title, content = push.get("token"), push.get("title"), push.get("content")
+            if not token or not title or not content:
+                results[i] = {"token": token, "result": False, "msg": "필수 FCM 데이터가 누락됨", "retryable": False}
+                continue
+            pending.append((i, self._build_push_message(token, title, content)))
+
+        batch_size = max(1, min(batch_size, FCM_BATCH_SIZE))
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            started = time.perf_counter()
+            try:
+                batch_response = messaging.send_each([message for _, message in chunk])
+                responses = batch_response.responses
+            except Exception as e:
+                FCM_MESSAGES.inc(len(chunk), method="send_each", result=_fcm_error_code(e))
+                logger.error(f"❌ [FCM BATCH] send_each 호출 실패 ({len(chunk)}건): {e}")
+                for i, _ in chunk:
+                    results[i] = {"token": pushes[i]["token"], "result": False, "msg": str(e), "retryable": True}
+                continue
+            finally:
+                FCM_SEND_SECONDS.observe(time.perf_counter() - started, method="send_each")
+
+            for (i, _), response in zip(chunk, responses):
+                push = pushes[i]
+                FCM_MESSAGES.inc(
+                    method="send_each",
+                    result="success" if response.success else _fcm_error_code(response.exception)
+                )
+                if response.success:
+                    results[i] = {
+                        "token": push["token"],
+                        "result": True,
+                        "msg": "Success",
+                        "fcm_response": response.message_id
+                    }
+                    continue
+
+                error = response.exception
+                results[i] = {
+                    "token": push["token"],
+                    "result": False,
+                    "msg": str(error),
+                    "retryable": not isinstance(error, FCM_PERMANENT_ERRORS)
+                }
+                if isinstance(error, messaging.UnregisteredError):
+                    if self._should_invalidate_token(push["token"], "unregistered"):
+                        self._handle_token_invalidation(push["token"], "unregistered", push["title"], push["content"])
+                elif isinstance(error, messaging.ThirdPartyAuthError):
+                    self._handle_token_invalidation(push["token"], "invalid_registration", push["title"], push["content"])
+
+            logger.info(
+                f"📊 [FCM BATCH] {start // batch_size + 1}번째 묶음 전송 완료 - "
+                f"성공: {batch_response.success_count}, 실패: {batch_response.failure_count}"
+            )
+
+        return results
+
     def _handle_inactive_token(self, token: str, reason: str):
         """
         ✅ 4단계: 비활성 토큰 처리 함수
@@ -551,7 +683,7 @@ class FirebaseService:
                 token=token,
             )
 
-            response = messaging.send(message)
+            response = self._send_message(message, "background")
             logger.info(f"✅ [FCM POLICY 4] 백그라운드 FCM 메시지 전송 성공: {response}")
             return response
 
@@ -643,7 +775,7 @@ class FirebaseService:
                 token=token,
             )
 
-            response = messaging.send(message)
+            response = self._send_message(message, "silent")
             logger.info(f"✅ [FCM SILENT] Silent FCM 메시지 전송 성공 - 백그라운드 앱 깨우기 완료: {response}")
             return response
 
@@ -1490,7 +1622,7 @@ SMAP 팀 드림 - 언제나 최고의 서비스를 제공하기 위해 노력하
             )
             
             # Silent Push 전송
-            response = messaging.send(message)
+            response = self._send_message(message, "token_refresh")
             logger.info(f"✅ [Silent Push] 토큰 갱신용 Silent Push 전송 성공 - 응답: {response}")
             
             # 성공 기록
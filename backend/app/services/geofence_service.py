@@ -0,0 +1,229 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.trajectory import haversine_km
+from app.services.last_position_index import LastPosition, last_position_index
+
+logger = logging.getLogger(__name__)
+
+# 장소 알림 반경(미터)
+DEFAULT_RADIUS_M = 100.0
+
+# 내 장소 진입/이탈 히스테리시스 (진입 반경 안으로 들어오면 진입, 이탈 반경 밖으로 나가면 이탈)
+MY_LOCATION_ENTER_RADIUS_M = 100.0
+MY_LOCATION_EXIT_RADIUS_M = 150.0
+
+# 내 장소 목록 재조회 주기(초)
+FENCE_REFRESH_SECONDS = 60
+
+
+class GeofenceHit(NamedTuple):
+    fence: Dict
+    position: LastPosition
+    distance_m: float
+
+
+class GeofenceService:
+    """
+    지오펜스(장소 반경) 진입/이탈 일괄 판정
+
+    - 지오펜스 목록과 대상 회원 마지막 위치(last_position_index.load_members)를 한 번에 읽고
+    - Haversine 거리를 벡터 연산으로 한 번에 계산하여 진입/이탈 대상만 반환
+    """
+
+    def evaluate(
+        self,
+        db: Session,
+        fences: Iterable[Dict],
+        exit_alert: bool = False,
+        radius_m: float = DEFAULT_RADIUS_M,
+        lat_key: str = "sst_location_lat",
+        lng_key: str = "sst_location_long",
+        member_key: str = "target_mt_idx"
+    ) -> List[GeofenceHit]:
+        """
+        지오펜스별 대상 회원의 마지막 위치와 거리를 계산하여 진입(거리 <= 반경) 또는
+        이탈(거리 >= 반경) 조건을 만족하는 지오펜스를 반환합니다.
+
+        Args:
+            fences: 지오펜스 dict 목록 (위경도와 대상 회원 번호 포함)
+            exit_alert: True면 이탈, False면 진입 판정
+            radius_m: 반경(미터)
+            lat_key, lng_key, member_key: 지오펜스 dict의 위도/경도/회원 키
+
+        Returns:
+            List[GeofenceHit]: 조건을 만족하는 지오펜스, 위치, 거리(m)
+        """
+        fences = [fence for fence in fences if fence.get(member_key)]
+        if not fences:
+            return []
+
+        positions = last_position_index.load_members(db, (int(fence[member_key]) for fence in fences))
+        targets = [
+            (fence, positions[int(fence[member_key])])
+            for fence in fences
+            if int(fence[member_key]) in positions
+        ]
+        if not targets:
+            return []
+
+        distances = haversine_km(
+            [float(fence[lat_key]) for fence, _ in targets],
+            [float(fence[lng_key]) for fence, _ in targets],
+            [position.lat for _, position in targets],
+            [position.lng for _, position in targets]
+        ) * 1000
+        matched = distances >= radius_m if exit_alert else distances <= radius_m
+
+        return [
+            GeofenceHit(targets[i][0], targets[i][1], float(distances[i]))
+            for i in np.flatnonzero(matched)
+        ]
+
+
+class GeofenceEvent(NamedTuple):
+    event: str  # 'enter' | 'exit'
+    fence: Dict
+    position: LastPosition
+    distance_m: float
+
+
+class GeofenceTick(NamedTuple):
+    events: List[GeofenceEvent]
+    seq: int  # 판정에 반영한 위치 갱신 순번 (commit 성공 후 저장)
+    members: Set[int]  # 판정한 회원
+
+
+class MyLocationGeofenceEngine:
+    """
+    내 장소(smap_location_t) 진입/이탈 상태 머신
+
+    - (회원, 장소)별 진입 상태는 slt_enter_chk 컬럼에 영속화되며, 메모리에는 그 사본을 유지
+    - 매 주기마다 last_position_index.changed_since()로 위치가 바뀐 회원만 판정
+    - 판정 순번과 진입 상태는 commit()에서 DB 커밋이 성공한 뒤에만 반영하므로, 저장에 실패하면 다음 주기에 다시 판정
+    - 진입 반경(100m)과 이탈 반경(150m)을 달리 두어 경계 부근 GPS 흔들림으로 알림이 반복되지 않도록 함
+    - 장소 목록은 FENCE_REFRESH_SECONDS마다 다시 읽고, 추가/이동된 장소의 회원은 위치 변화가 없어도 판정
+    """
+
+    def __init__(
+        self,
+        enter_radius_m: float = MY_LOCATION_ENTER_RADIUS_M,
+        exit_radius_m: float = MY_LOCATION_EXIT_RADIUS_M,
+        refresh_seconds: float = FENCE_REFRESH_SECONDS
+    ):
+        self.enter_radius_m = enter_radius_m
+        self.exit_radius_m = exit_radius_m
+        self.refresh_seconds = refresh_seconds
+        self._fences: Dict[int, List[Dict]] = {}
+        self._inside: Dict[int, bool] = {}
+        self._seq = 0
+        self._dirty: Set[int] = set()
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _refresh_fences(self, db: Session) -> Set[int]:
+        """
+        장소 목록을 다시 읽고, 새로 추가되었거나 좌표가 바뀐 장소의 회원 번호를 반환
+        """
+        from app.models.my_location import MyLocation
+
+        fences: Dict[int, List[Dict]] = {}
+        inside: Dict[int, bool] = {}
+        dirty: Set[int] = set()
+        for row in MyLocation.get_geofences(db):
+            mt_idx = int(row["mt_idx"])
+            fence = {
+                "slt_idx": row["slt_idx"],
+                "mt_idx": mt_idx,
+                "slt_title": row["slt_title"],
+                "slt_lat": float(row["slt_lat"]),
+                "slt_long": float(row["slt_long"])
+            }
+            fences.setdefault(mt_idx, []).append(fence)
+            inside[fence["slt_idx"]] = row["slt_enter_chk"] == "Y"
+
+            previous = next(
+                (f for f in self._fences.get(mt_idx, ()) if f["slt_idx"] == fence["slt_idx"]),
+                None
+            )
+            if previous is None or (previous["slt_lat"], previous["slt_long"]) != (fence["slt_lat"], fence["slt_long"]):
+                dirty.add(mt_idx)
+
+        self._fences = fences
+        self._inside = inside
+        self._refreshed_at = time.monotonic()
+        return dirty
+
+    def tick(self, db: Session) -> GeofenceTick:
+        """
+        위치가 바뀐 회원의 장소만 판정하여 진입/이탈 전이 이벤트를 반환합니다.
+        반환값은 commit()으로 넘겨야 상태와 판정 순번이 저장됩니다.
+        """
+        with self._lock:
+            if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_seconds:
+                self._dirty |= self._refresh_fences(db)
+
+            changed, seq = last_position_index.changed_since(self._seq)
+            candidates = self._dirty.union(mt_idx for mt_idx in changed if mt_idx in self._fences)
+            if not candidates:
+                return GeofenceTick([], seq, candidates)
+
+            positions = last_position_index.load_members(db, candidates)
+            pairs: List[Tuple[Dict, LastPosition]] = [
+                (fence, positions[mt_idx])
+                for mt_idx in candidates if mt_idx in positions
+                for fence in self._fences.get(mt_idx, ())
+            ]
+            if not pairs:
+                return GeofenceTick([], seq, candidates)
+
+            distances = haversine_km(
+                [fence["slt_lat"] for fence, _ in pairs],
+                [fence["slt_long"] for fence, _ in pairs],
+                [position.lat for _, position in pairs],
+                [position.lng for _, position in pairs]
+            ) * 1000
+
+            events = []
+            for (fence, position), distance in zip(pairs, distances):
+                is_inside = self._inside.get(fence["slt_idx"], False)
+                if not is_inside and distance <= self.enter_radius_m:
+                    events.append(GeofenceEvent("enter", fence, position, float(distance)))
+                elif is_inside and distance >= self.exit_radius_m:
+                    events.append(GeofenceEvent("exit", fence, position, float(distance)))
+            return GeofenceTick(events, seq, candidates)
+
+    def commit(self, db: Session, result: GeofenceTick) -> None:
+        """
+        전이 이벤트의 진입 상태(slt_enter_chk)를 DB에 커밋한 뒤 메모리 상태와 판정 순번을 반영합니다.
+
+        같은 세션에 추가한 변경(예: 알림 outbox)도 함께 커밋됩니다. 커밋에 실패하면 아무것도 반영하지 않으므로
+        다음 tick()에서 같은 회원을 다시 판정합니다.
+        """
+        from app.models.my_location import MyLocation
+
+        entered = [e.fence["slt_idx"] for e in result.events if e.event == "enter"]
+        exited = [e.fence["slt_idx"] for e in result.events if e.event == "exit"]
+        if result.events:
+            try:
+                MyLocation.set_enter_state(db, entered, "Y")
+                MyLocation.set_enter_state(db, exited, "N")
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        with self._lock:
+            self._inside.update({slt_idx: True for slt_idx in entered})
+            self._inside.update({slt_idx: False for slt_idx in exited})
+            self._seq = max(self._seq, result.seq)
+            self._dirty -= result.members
+
+
+geofence_service = GeofenceService()
+my_location_geofence = MyLocationGeofenceEngine()
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import and_, case, event, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.group import Group
+from app.models.group_detail import GroupDetail
+from app.models.location import Location
+from app.models.member import Member
+from app.models.schedule import Schedule
+
+logger = logging.getLogger(__name__)
+
+# 통계 기간 (일)
+STATS_PERIOD_DAYS = 7
+
+
+class GroupStatsService:
+    """
+    그룹 멤버별 통계 (주간 일정 수, 전체/주간 장소 수)
+
+    - 멤버 목록과 일정/장소 집계를 GROUP BY 서브쿼리로 한 번에 조회 (멤버 수와 관계없이 쿼리 1회)
+    - 결과는 그룹별로 ttl 동안 캐시하며, 이 프로세스에서 ORM으로 일정/장소/그룹 멤버가 바뀌면 즉시 무효화
+      (다른 프로세스나 raw SQL 변경은 ttl 경과 후 반영)
+    """
+
+    def __init__(self, ttl: float = 30):
+        self.ttl = ttl
+        # group_id -> (만료 시각, 멤버 mt_idx 집합, 결과)
+        self._entries: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get_stats(self, db: Session, group: Group) -> Dict:
+        group_id = group.sgt_idx
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(group_id)
+            if entry and entry[0] > now:
+                return entry[2]
+
+        result = self._build_stats(db, group)
+        member_ids = frozenset(stat["mt_idx"] for stat in result["member_stats"])
+        with self._lock:
+            self._entries[group_id] = (time.monotonic() + self.ttl, member_ids, result)
+        return result
+
+    def _build_stats(self, db: Session, group: Group) -> Dict:
+        group_id = group.sgt_idx
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=STATS_PERIOD_DAYS)
+
+        group_member_ids = db.query(GroupDetail.mt_idx).filter(
+            GroupDetail.sgt_idx == group_id,
+            GroupDetail.sgdt_exit == 'N',
+            GroupDetail.sgdt_show == 'Y'
+        )
+
+        # 멤버별 주간 일정 수
+        schedule_counts = db.query(
+            Schedule.mt_idx.label("mt_idx"),
+            func.count(Schedule.sst_idx).label("weekly_schedules")
+        ).filter(
+            Schedule.mt_idx.in_(group_member_ids),
+            Schedule.sst_show == 'Y',
+            Schedule.sst_sdate >= start_date,
+            Schedule.sst_sdate <= end_date
+        ).group_by(Schedule.mt_idx).subquery()
+
+        # 멤버별 전체/주간 장소 수
+        location_counts = db.query(
+            Location.mt_idx.label("mt_idx"),
+            func.count(Location.slt_idx).label("total_locations"),
+            func.sum(case(
+                (and_(Location.slt_wdate >= start_date, Location.slt_wdate <= end_date), 1),
+                else_=0
+            )).label("weekly_locations")
+        ).filter(
+            Location.mt_idx.in_(group_member_ids),
+            Location.slt_show == 'Y'
+        ).group_by(Location.mt_idx).subquery()
+
+        rows = db.query(
+            GroupDetail.mt_idx,
+            GroupDetail.sgdt_owner_chk,
+            GroupDetail.sgdt_leader_chk,
+            Member.mt_name,
+            Member.mt_nickname,
+            func.coalesce(schedule_counts.c.weekly_schedules, 0).label("weekly_schedules"),
+            func.coalesce(location_counts.c.total_locations, 0).label("total_locations"),
+            func.coalesce(location_counts.c.weekly_locations, 0).label("weekly_locations")
+        ).join(
+            Member, Member.mt_idx == GroupDetail.mt_idx
+        ).outerjoin(
+            schedule_counts, schedule_counts.c.mt_idx == GroupDetail.mt_idx
+        ).outerjoin(
+            location_counts, location_counts.c.mt_idx == GroupDetail.mt_idx
+        ).filter(
+            GroupDetail.sgt_idx == group_id,
+            GroupDetail.sgdt_exit == 'N',
+            GroupDetail.sgdt_show == 'Y'
+        ).order_by(GroupDetail.sgdt_idx).all()
+
+        # 같은 회원의 그룹 상세 행이 여러 개일 수 있으므로 회원 기준으로 합침 (소유자/리더는 하나라도 Y면 True)
+        member_stats: Dict[int, Dict] = {}
+        for row in rows:
+            stat = member_stats.get(row.mt_idx)
+            if stat is None:
+                member_stats[row.mt_idx] = {
+                    "mt_idx": row.mt_idx,
+                    "mt_name": row.mt_name or f"멤버 {row.mt_idx}",
+                    "mt_nickname": row.mt_nickname or row.mt_name or f"멤버 {row.mt_idx}",
+                    "weekly_schedules": int(row.weekly_schedules),
+                    "total_locations": int(row.total_locations),
+                    "weekly_locations": int(row.weekly_locations),
+                    "is_owner": row.sgdt_owner_chk == 'Y',
+                    "is_leader": row.sgdt_leader_chk == 'Y'
+                }
+            else:
+                stat["is_owner"] = stat["is_owner"] or row.sgdt_owner_chk == 'Y'
+                stat["is_leader"] = stat["is_leader"] or row.sgdt_leader_chk == 'Y'
+
+        stats = list(member_stats.values())
+        result = {
+            "group_id": group_id,
+            "group_title": group.sgt_title,
+            "member_count": len(stats),
+            "weekly_schedules": sum(stat["weekly_schedules"] for stat in stats),
+            "total_locations": sum(stat["total_locations"] for stat in stats)
+        }
+        if stats:
+            result["stats_period"] = {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "days": STATS_PERIOD_DAYS
+            }
+        result["member_stats"] = stats
+        return result
+
+    def invalidate_group(self, group_id: Optional[int]) -> None:
+        if group_id is None:
+            return
+        with self._lock:
+            self._entries.pop(int(group_id), None)
+
+    def invalidate_member(self, mt_idx: Optional[int]) -> None:
+        """회원이 속한 그룹의 캐시된 통계를 모두 무효화"""
+        if mt_idx is None:
+            return
+        mt_idx = int(mt_idx)
+        with self._lock:
+            for group_id in [group_id for group_id, entry in self._entries.items() if mt_idx in entry[1]]:
+                del self._entries[group_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+group_stats_service = GroupStatsService(ttl=settings.GROUP_STATS_CACHE_TTL)
+
+
+def _invalidate_member_stats(mapper, connection, target) -> None:
+    group_stats_service.invalidate_member(target.mt_idx)
+
+
+def _invalidate_group_stats(mapper, connection, target) -> None:
+    group_stats_service.invalidate_group(target.sgt_idx)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Schedule, _event_name, _invalidate_member_stats)
+    event.listen(Location, _event_name, _invalidate_member_stats)
+    event.listen(GroupDetail, _event_name, _invalidate_group_stats)
@@ -0,0 +1,224 @@
+import logging
+import math
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.trajectory import haversine_km
+from app.models.member_location_log import MemberLocationLog
+
+logger = logging.getLogger(__name__)
+
+# 격자 크기(도). 위도 0.01도 ≈ 1.1km
+GRID_CELL_DEG = 0.01
+
+# sync()에서 워터마크 아래로 다시 읽는 mlt_idx 범위
+# (먼저 발급된 mlt_idx의 트랜잭션이 나중에 커밋되면 워터마크 이후 조회에서 빠지므로)
+SYNC_OVERLAP_ROWS = 2000
+
+
+class LastPosition(NamedTuple):
+    mt_idx: int
+    lat: float
+    lng: float
+    gps_time: datetime
+
+
+class LastPositionIndex:
+    """
+    회원별 마지막 위치 인메모리 인덱스
+
+    - 위치 로그 수집 시 update_from_logs()로 즉시 갱신 (GPS 품질 판정이 정상인 로그만)
+    - 다른 워커에서 저장된 로그는 sync()가 mlt_idx 워터마크 부근 이후 로그만 읽어 반영 (PK 범위 조회)
+    - 인덱스에 없는 회원은 get_or_load()에서 DB 조회 후 캐시
+    - 격자(GRID_CELL_DEG) 기반으로 "특정 지점 반경 R미터 안의 회원" 조회 지원
+    - 갱신 순번(seq)을 기록하여 changed_since()로 "지난 확인 이후 위치가 바뀐 회원"만 조회 가능
+    """
+
+    def __init__(self, cell_deg: float = GRID_CELL_DEG):
+        self.cell_deg = cell_deg
+        self._positions: Dict[int, LastPosition] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._lock = threading.RLock()
+        self._watermark: Optional[int] = None
+        # 회원별 마지막 갱신 순번 (갱신 순서대로 정렬 유지)
+        self._versions: "OrderedDict[int, int]" = OrderedDict()
+        self._seq = 0
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def update(self, mt_idx: int, lat, lng, gps_time: datetime) -> bool:
+        """
+        회원 위치 갱신. 기존 위치와 같거나 오래된 GPS 시간이면 무시 (이미 반영한 로그를 다시 읽어도 순번이 바뀌지 않음)
+
+        Returns:
+            bool: 갱신 여부
+        """
+        if lat is None or lng is None or gps_time is None:
+            return False
+        lat, lng = float(lat), float(lng)
+        if not lat or not lng:
+            return False
+        gps_time = gps_time.replace(tzinfo=None) if gps_time.tzinfo else gps_time
+
+        with self._lock:
+            current = self._positions.get(mt_idx)
+            if current and current.gps_time >= gps_time:
+                return False
+            if current:
+                old_cell = self._cell(current.lat, current.lng)
+                members = self._cells.get(old_cell)
+                if members:
+                    members.discard(mt_idx)
+                    if not members:
+                        del self._cells[old_cell]
+            self._positions[mt_idx] = LastPosition(mt_idx, lat, lng, gps_time)
+            self._cells.setdefault(self._cell(lat, lng), set()).add(mt_idx)
+            self._seq += 1
+            self._versions[mt_idx] = self._seq
+            self._versions.move_to_end(mt_idx)
+        return True
+
+    def update_from_logs(self, logs: Iterable) -> None:
+        """수집된 위치 로그(스키마 또는 모델)로 인덱스 갱신"""
+        for log in logs:
+            self.update(log.mt_idx, log.mlt_lat, log.mlt_long, log.mlt_gps_time)
+
+    def changed_since(self, seq: int) -> Tuple[List[int], int]:
+        """
+        seq 이후 위치가 갱신된 회원 목록
+
+        Returns:
+            (mt_idx 목록, 현재 순번): 다음 호출 시 현재 순번을 seq로 전달
+        """
+        with self._lock:
+            changed = []
+            for mt_idx in reversed(self._versions):
+                if self._versions[mt_idx] <= seq:
+                    break
+                changed.append(mt_idx)
+            return changed, self._seq
+
+    def get(self, mt_idx: int) -> Optional[LastPosition]:
+        with self._lock:
+            return self._positions.get(mt_idx)
+
+    def get_many(self, mt_idxs: Iterable[int]) -> Dict[int, LastPosition]:
+        with self._lock:
+            return {mt_idx: self._positions[mt_idx] for mt_idx in mt_idxs if mt_idx in self._positions}
+
+    def get_or_load(self, db: Session, mt_idx: int) -> Optional[LastPosition]:
+        """인덱스에서 조회하고, 없으면 DB의 최근 위치 로그로 채움"""
+        position = self.get(mt_idx)
+        if position:
+            return position
+        recent = MemberLocationLog.get_recent_location(db, mt_idx)
+        if recent:
+            self.update(mt_idx, recent.mlt_lat, recent.mlt_long, recent.mlt_gps_time)
+        return self.get(mt_idx)
+
+    def load_members(self, db: Session, mt_idxs: Iterable[int]) -> Dict[int, LastPosition]:
+        """
+        여러 회원의 마지막 위치를 조회. 인덱스에 없는 회원만 한 번의 쿼리로 DB에서 채움
+        """
+        mt_idxs = set(mt_idxs)
+        missing = [mt_idx for mt_idx in mt_idxs if self.get(mt_idx) is None]
+        if missing:
+            latest = db.query(
+                MemberLocationLog.mt_idx,
+                func.max(MemberLocationLog.mlt_idx).label("mlt_idx")
+            ).filter(
+                MemberLocationLog.mt_idx.in_(missing),
+                MemberLocationLog.mlt_quality == 0
+            ).group_by(MemberLocationLog.mt_idx).subquery()
+            rows = db.query(
+                MemberLocationLog.mt_idx,
+                MemberLocationLog.mlt_lat,
+                MemberLocationLog.mlt_long,
+                MemberLocationLog.mlt_gps_time
+            ).join(latest, MemberLocationLog.mlt_idx == latest.c.mlt_idx).all()
+            for row in rows:
+                self.update(row.mt_idx, row.mlt_lat, row.mlt_long, row.mlt_gps_time)
+        return self.get_many(mt_idxs)
+
+    def within(self, lat: float, lng: float, radius_m: float) -> List[Tuple[int, float]]:
+        """
+        지점 반경 radius_m 안에 마지막 위치가 있는 회원 목록
+
+        Returns:
+            List[(mt_idx, 거리(m))]: 거리순 정렬
+        """
+        lat, lng = float(lat), float(lng)
+        lat_span = radius_m / 111320.0
+        lng_span = radius_m / (111320.0 * max(math.cos(math.radians(lat)), 1e-6))
+        min_cell = self._cell(lat - lat_span, lng - lng_span)
+        max_cell = self._cell(lat + lat_span, lng + lng_span)
+
+        with self._lock:
+            candidates = [
+                self._positions[mt_idx]
+                for x in range(min_cell[0], max_cell[0] + 1)
+                for y in range(min_cell[1], max_cell[1] + 1)
+                for mt_idx in self._cells.get((x, y), ())
+            ]
+        if not candidates:
+            return []
+
+        distances = haversine_km(
+            lat, lng,
+            [position.lat for position in candidates],
+            [position.lng for position in candidates]
+        ) * 1000
+        matches = [
+            (position.mt_idx, float(distance))
+            for position, distance in zip(candidates, distances)
+            if distance <= radius_m
+        ]
+        return sorted(matches, key=lambda item: item[1])
+
+    def sync(self, db: Session, batch_size: int = 5000, overlap: int = SYNC_OVERLAP_ROWS) -> int:
+        """
+        다른 워커에서 저장된 위치 로그 반영 (마지막 동기화 이후 mlt_idx만 조회)
+
+        첫 호출에서는 현재 최대 mlt_idx를 워터마크로 잡고, 이전 위치는 get_or_load/load_members로 채웁니다.
+        커밋 순서가 mlt_idx 순서와 다를 수 있으므로 워터마크 아래 overlap건도 다시 읽습니다.
+        이미 반영한 로그는 update()에서 GPS 시간으로 걸러집니다.
+        """
+        if self._watermark is None:
+            self._watermark = db.query(func.max(MemberLocationLog.mlt_idx)).scalar() or 0
+            return 0
+
+        applied = 0
+        cursor = max(0, self._watermark - overlap)
+        while True:
+            rows = db.query(
+                MemberLocationLog.mlt_idx,
+                MemberLocationLog.mt_idx,
+                MemberLocationLog.mlt_lat,
+                MemberLocationLog.mlt_long,
+                MemberLocationLog.mlt_gps_time
+            ).filter(
+                MemberLocationLog.mlt_idx > cursor,
+                MemberLocationLog.mlt_quality == 0
+            ).order_by(MemberLocationLog.mlt_idx.asc()).limit(batch_size).all()
+            for row in rows:
+                if self.update(row.mt_idx, row.mlt_lat, row.mlt_long, row.mlt_gps_time):
+                    applied += 1
+            if rows:
+                cursor = rows[-1].mlt_idx
+                self._watermark = max(self._watermark, cursor)
+            if len(rows) < batch_size:
+                break
+        return applied
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._positions)
+
+
+last_position_index = LastPositionIndex()
@@ -0,0 +1,226 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.crud import member_location_log as location_log_crud
+from app.db.session import SessionLocal
+from app.schemas.member_location_log import MemberLocationLogCreate
+
+logger = logging.getLogger(__name__)
+
+
+class LocationIngestService:
+    """
+    위치 로그 write-behind 수집기
+
+    API 요청은 검증된 위치 로그를 메모리 버퍼에 넣고 즉시 응답하며,
+    백그라운드 writer 스레드가 건수(batch_size) 또는 시간(flush_interval) 기준으로
+    multi-row INSERT로 DB에 저장합니다.
+    - 버퍼는 max_queue_size로 제한되며, 가득 차면 submit()이 False를 반환합니다 (백프레셔)
+    - DB 저장 실패 시 배치를 spill 디렉토리에 JSONL로 기록하고, DB 복구 후 재적재합니다
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 20000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        retry_interval: int = 30,
+        spill_dir: str = "spool/location_logs"
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.spill_dir = Path(spill_dir)
+
+        self._buffer: Deque[MemberLocationLogCreate] = deque()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # DB 장애 시 retry_interval 동안은 DB 접근 없이 바로 spill
+        self._db_unavailable_until = 0.0
+        self._stats = {
+            "accepted": 0,
+            "rejected": 0,
+            "written": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "write_errors": 0,
+            "last_flush_at": None,
+        }
+
+    def start(self) -> None:
+        """writer 스레드 시작"""
+        if self.is_running():
+            return
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._writer_loop, name="location-ingest-writer", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"위치 로그 수집기 시작 (queue: {self.max_queue_size}, batch: {self.batch_size}, "
+            f"flush: {self.flush_interval}s, spill: {self.spill_dir})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """writer 스레드 종료 (남은 버퍼는 저장 또는 spill 후 종료)"""
+        if not self.is_running():
+            return
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        # 제한 시간 내 처리하지 못한 로그는 유실되지 않도록 디스크에 기록
+        remaining = self._drain(len(self._buffer))
+        if remaining:
+            self._spill(remaining)
+        self._thread = None
+        logger.info("위치 로그 수집기 종료")
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, logs: List[MemberLocationLogCreate]) -> bool:
+        """
+        검증된 위치 로그를 버퍼에 추가 (전체 수락 또는 전체 거절)
+
+        Returns:
+            bool: 수락 여부. 버퍼 용량을 넘으면 False
+        """
+        if not logs:
+            return True
+        with self._condition:
+            if len(self._buffer) + len(logs) > self.max_queue_size:
+                self._stats["rejected"] += len(logs)
+                return False
+            self._buffer.extend(logs)
+            self._stats["accepted"] += len(logs)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+        return True
+
+    def get_stats(self) -> Dict:
+        """수집기 상태 조회"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats["queued"] = len(self._buffer)
+        stats["running"] = self.is_running()
+        stats["max_queue_size"] = self.max_queue_size
+        stats["spill_files"] = len(self._spill_files())
+        stats["db_available"] = time.monotonic() >= self._db_unavailable_until
+        return stats
+
+    def _drain(self, max_items: int) -> List[MemberLocationLogCreate]:
+        with self._condition:
+            count = min(max_items, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def _writer_loop(self) -> None:
+        last_replay_check = 0.0
+        while True:
+            with self._condition:
+                if len(self._buffer) < self.batch_size and not self._stop_event.is_set():
+                    self._condition.wait(self.flush_interval)
+            batch = self._drain(self.batch_size)
+            if batch:
+                self._write(batch)
+            elif self._stop_event.is_set():
+                break
+
+            now = time.monotonic()
+            if now - last_replay_check >= self.retry_interval and now >= self._db_unavailable_until:
+                last_replay_check = now
+                self._replay_spill()
+
+    def _write(self, batch: List[MemberLocationLogCreate]) -> bool:
+        if time.monotonic() < self._db_unavailable_until:
+            self._spill(batch)
+            return False
+
+        db = SessionLocal()
+        try:
+            location_log_crud.create_location_logs_bulk(db, batch)
+            self._stats["written"] += len(batch)
+            self._stats["last_flush_at"] = time.time()
+            return True
+        except Exception as e:
+            logger.error(f"위치 로그 배치 저장 실패 ({len(batch)}건), spill 처리: {e}")
+            self._stats["write_errors"] += 1
+            self._db_unavailable_until = time.monotonic() + self.retry_interval
+            self._spill(batch)
+            return False
+        finally:
+            db.close()
+
+    def _spill_files(self) -> List[Path]:
+        if not self.spill_dir.exists():
+            return []
+        return sorted(self.spill_dir.glob("location_logs_*.jsonl"))
+
+    def _spill(self, batch: List[MemberLocationLogCreate]) -> bool:
+        """DB에 저장하지 못한 배치를 JSONL 파일로 기록"""
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f"location_logs_{time.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}.jsonl"
+        tmp_path = self.spill_dir / f".{file_name}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for log in batch:
+                    f.write(json.dumps(log.model_dump(mode="json"), ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # rename으로 원자적 공개 (재적재 중 반쯤 쓰인 파일을 읽지 않도록)
+            tmp_path.rename(self.spill_dir / file_name)
+            self._stats["spilled"] += len(batch)
+            logger.warning(f"위치 로그 {len(batch)}건 spill: {file_name}")
+            return True
+        except Exception as e:
+            logger.error(f"위치 로그 spill 실패, {len(batch)}건 유실: {e}")
+            return False
+
+    def _replay_spill(self) -> None:
+        """spill 파일을 오래된 순서대로 DB에 재적재"""
+        for path in self._spill_files():
+            if self._stop_event.is_set():
+                return
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    logs = [MemberLocationLogCreate(**json.loads(line)) for line in f if line.strip()]
+            except Exception as e:
+                logger.error(f"spill 파일 읽기 실패, 건너뜀: {path.name} - {e}")
+                path.rename(path.with_suffix(".corrupt"))
+                continue
+
+            for start in range(0, len(logs), self.batch_size):
+                chunk = logs[start:start + self.batch_size]
+                db = SessionLocal()
+                try:
+                    location_log_crud.create_location_logs_bulk(db, chunk)
+                    self._stats["replayed"] += len(chunk)
+                except Exception as e:
+                    logger.error(f"spill 재적재 실패, 다음 주기에 재시도: {path.name} - {e}")
+                    self._db_unavailable_until = time.monotonic() + self.retry_interval
+                    # 이미 저장된 앞부분이 중복 저장되지 않도록 남은 로그만 다시 기록
+                    if start > 0 and self._spill(logs[start:]):
+                        path.unlink()
+                    return
+                finally:
+                    db.close()
+            path.unlink()
+            logger.info(f"spill 파일 재적재 완료: {path.name} ({len(logs)}건)")
+
+
+location_ingest_service = LocationIngestService(
+    max_queue_size=settings.LOCATION_INGEST_QUEUE_SIZE,
+    batch_size=settings.LOCATION_INGEST_BATCH_SIZE,
+    flush_interval=settings.LOCATION_INGEST_FLUSH_INTERVAL,
+    retry_interval=settings.LOCATION_INGEST_RETRY_INTERVAL,
+    spill_dir=settings.LOCATION_INGEST_SPILL_DIR
+)
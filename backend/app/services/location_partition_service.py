@@ -0,0 +1,241 @@
+"""
+위치 로그(member_location_log_t) 월별 파티션 관리 및 보관(retention)
+
+- 테이블은 RANGE (TO_DAYS(mlt_gps_time)) 월별 파티션(pYYYYMM) + pmax로 구성됩니다.
+  (add_member_location_log_partitions.sql 적용 후)
+- 스케줄러(maintain_location_log_partitions)가 매일 다음 달 파티션을 미리 만들고,
+  보관 기간이 지난 파티션은 gzip JSONL 파일로 보관한 뒤 DROP PARTITION으로 제거합니다.
+- 조회는 PARTITION (...)을 지정하지 않습니다. mlt_gps_time 범위 조건만으로 MySQL이 해당 월
+  파티션만 읽으며(partition pruning), 다른 프로세스가 파티션을 삭제해도 조회가 실패하지 않습니다.
+
+수동 실행 (backend 디렉토리에서):
+    python -m app.services.location_partition_service --dry-run
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "member_location_log_t"
+MAXVALUE_PARTITION = "pmax"
+
+# MySQL TO_DAYS('0001-01-01') = 366, date.toordinal(0001-01-01) = 1
+_TO_DAYS_OFFSET = 365
+
+
+class LogPartition(NamedTuple):
+    name: str
+    upper_bound: Optional[date]  # 이 날짜 00:00 미만의 로그가 저장됨 (pmax는 None)
+    row_estimate: int
+
+
+def to_days(value: date) -> int:
+    """MySQL TO_DAYS()와 같은 값"""
+    return value.toordinal() + _TO_DAYS_OFFSET
+
+
+def from_days(days: int) -> date:
+    return date.fromordinal(days - _TO_DAYS_OFFSET)
+
+
+def month_start(value: date, months: int = 0) -> date:
+    """value가 속한 달의 1일에서 months개월 이동한 날짜"""
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+class LocationLogPartitionService:
+    """위치 로그 월별 파티션 조회/생성/보관"""
+
+    def __init__(self, months_ahead: int = 3, retention_months: int = 0, archive_dir: str = "archive/location_logs"):
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_dir = Path(archive_dir)
+
+    def get_partitions(self, db: Session) -> List[LogPartition]:
+        """파티션 목록 (상한 오름차순). 파티션되지 않은 테이블이면 빈 목록"""
+        rows = db.execute(text("""
+            SELECT partition_name, partition_description, table_rows
+            FROM information_schema.partitions
+            WHERE table_schema = DATABASE() AND table_name = :table_name AND partition_name IS NOT NULL
+            ORDER BY partition_ordinal_position
+        """), {"table_name": TABLE_NAME}).fetchall()
+
+        return [
+            LogPartition(
+                name=row[0],
+                upper_bound=None if row[1] == "MAXVALUE" else from_days(int(row[1])),
+                row_estimate=int(row[2] or 0)
+            )
+            for row in rows
+        ]
+
+    def ensure_future_partitions(self, db: Session, today: Optional[date] = None, dry_run: bool = False) -> List[str]:
+        """
+        이번 달부터 months_ahead개월 뒤까지의 월 파티션을 pmax를 나눠 생성합니다.
+
+        pmax에는 미래 시간의 로그만 있으므로 REORGANIZE 비용이 거의 없습니다.
+        """
+        partitions = self.get_partitions(db)
+        if not partitions or partitions[-1].name != MAXVALUE_PARTITION:
+            logger.warning(f"{TABLE_NAME}이 월별 파티션 테이블이 아니므로 파티션 생성을 건너뜁니다.")
+            return []
+
+        today = today or datetime.now().date()
+        last_bound = max((p.upper_bound for p in partitions if p.upper_bound), default=month_start(today))
+        target_bound = month_start(today, self.months_ahead + 1)
+
+        new_partitions = []
+        bound = last_bound
+        while bound < target_bound:
+            new_partitions.append((partition_name(bound), month_start(bound, 1)))
+            bound = month_start(bound, 1)
+        if not new_partitions:
+            return []
+
+        definitions = ",\n".join(
+            f"PARTITION {name} VALUES LESS THAN ({to_days(upper)})" for name, upper in new_partitions
+        )
+        ddl = (
+            f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {MAXVALUE_PARTITION} INTO (\n"
+            f"{definitions},\nPARTITION {MAXVALUE_PARTITION} VALUES LESS THAN MAXVALUE)"
+        )
+        names = [name for name, _ in new_partitions]
+        if dry_run:
+            logger.info(f"[dry-run] {ddl}")
+            return names
+
+        db.execute(text(ddl))
+        db.commit()
+        logger.info(f"위치 로그 파티션 생성: {', '.join(names)}")
+        return names
+
+    def retention_cutoff(self, today: Optional[date] = None) -> Optional[date]:
+        """이 날짜 미만의 로그는 보관 후 삭제 대상. retention_months가 0 이하면 None"""
+        if self.retention_months <= 0:
+            return None
+        return month_start(today or datetime.now().date(), -self.retention_months)
+
+    def expired_partitions(self, partitions: List[LogPartition], today: date) -> List[LogPartition]:
+        """보관 기간(retention_months)이 지난 파티션. retention_months가 0 이하면 없음"""
+        cutoff = self.retention_cutoff(today)
+        if cutoff is None:
+            return []
+        return [p for p in partitions if p.upper_bound is not None and p.upper_bound <= cutoff]
+
+    def archive_partition(self, db: Session, partition: LogPartition) -> Path:
+        """
+        파티션의 로그를 gzip JSONL 파일로 내보냅니다.
+
+        임시 파일에 쓴 뒤 행 수를 파티션 COUNT(*)와 비교하고, 일치할 때만 rename으로 공개합니다.
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f"{TABLE_NAME}_{partition.name}.jsonl.gz"
+        tmp_path = self.archive_dir / f".{file_name}.tmp"
+
+        expected = db.execute(text(f"SELECT COUNT(*) FROM {TABLE_NAME} PARTITION ({partition.name})")).scalar()
+        result = db.connection().execution_options(stream_results=True).execute(
+            text(f"SELECT * FROM {TABLE_NAME} PARTITION ({partition.name}) ORDER BY mlt_idx")
+        )
+        written = 0
+        try:
+            with open(tmp_path, "wb") as raw:
+                with gzip.open(raw, "wt", encoding="utf-8") as f:
+                    for rows in result.mappings().partitions(5000):
+                        for row in rows:
+                            f.write(json.dumps(dict(row), default=_json_default, ensure_ascii=False) + "\n")
+                        written += len(rows)
+                raw.flush()
+                os.fsync(raw.fileno())
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            result.close()
+
+        if written != expected:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"파티션 {partition.name} 보관 행 수 불일치 (파일 {written}건, 테이블 {expected}건)")
+
+        archive_path = self.archive_dir / file_name
+        tmp_path.rename(archive_path)
+        logger.info(f"위치 로그 파티션 보관: {partition.name} {written}건 -> {archive_path}")
+        return archive_path
+
+    def drop_expired_partitions(self, db: Session, today: Optional[date] = None, dry_run: bool = False) -> List[str]:
+        """보관 기간이 지난 파티션을 파일로 보관한 뒤 삭제합니다. (보관에 실패한 파티션은 삭제하지 않음)"""
+        today = today or datetime.now().date()
+        expired = self.expired_partitions(self.get_partitions(db), today)
+        if dry_run:
+            for partition in expired:
+                logger.info(f"[dry-run] 보관 후 삭제 대상: {partition.name} (약 {partition.row_estimate}건)")
+            return [partition.name for partition in expired]
+
+        dropped = []
+        for partition in expired:
+            try:
+                self.archive_partition(db, partition)
+                db.commit()
+                db.execute(text(f"ALTER TABLE {TABLE_NAME} DROP PARTITION {partition.name}"))
+                db.commit()
+                dropped.append(partition.name)
+            except Exception as e:
+                logger.error(f"위치 로그 파티션 {partition.name} 보관/삭제 실패, 다음 실행에서 재시도: {e}")
+                db.rollback()
+        if dropped:
+            logger.info(f"위치 로그 파티션 삭제: {', '.join(dropped)}")
+        return dropped
+
+    def run_maintenance(self, db: Session, dry_run: bool = False) -> Dict[str, List[str]]:
+        """다음 달 파티션 생성 + 보관 기간이 지난 파티션 보관/삭제"""
+        created = self.ensure_future_partitions(db, dry_run=dry_run)
+        dropped = self.drop_expired_partitions(db, dry_run=dry_run)
+        return {"created": created, "dropped": dropped}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"JSON 변환 불가: {type(value)}")
+
+
+location_partition_service = LocationLogPartitionService(
+    months_ahead=settings.LOCATION_LOG_PARTITION_MONTHS_AHEAD,
+    retention_months=settings.LOCATION_LOG_RETENTION_MONTHS,
+    archive_dir=settings.LOCATION_LOG_ARCHIVE_DIR
+)
+
+
+if __name__ == "__main__":
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="위치 로그 월별 파티션 생성 및 보관 기간 경과 파티션 보관/삭제")
+    parser.add_argument("--dry-run", action="store_true", help="DDL을 실행하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        for partition in location_partition_service.get_partitions(session):
+            print(f"{partition.name}: < {partition.upper_bound or 'MAXVALUE'} (약 {partition.row_estimate}건)")
+        print(location_partition_service.run_maintenance(session, dry_run=args.dry_run))
+    finally:
+        session.close()
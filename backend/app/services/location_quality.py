@@ -0,0 +1,303 @@
+"""
+위치 로그 수집 시 GPS 품질 판정 (mlt_quality)
+
+조회 API마다 정확도/속도 조건으로 잡음을 다시 거르지 않도록, 수집 시 회원별 직전 정상 위치와 비교해
+한 번만 판정하고 결과를 mlt_quality 비트 플래그로 저장합니다. (add_member_location_log_quality.sql 적용 후)
+
+- QUALITY_NO_FIX: 좌표 없음(또는 0)
+- QUALITY_LOW_ACCURACY: 수평 정확도 없음 또는 LOCATION_FILTER_MAX_ACCURACY 초과
+- QUALITY_SPEED_JUMP: 직전 정상 위치에서 LOCATION_FILTER_MAX_SPEED_KMH보다 빠르게 이동해야 닿는 위치 (튐)
+- 0(QUALITY_CLEAN)인 로그만 정상 위치로 보고 다음 판정의 기준이 됩니다.
+
+직전 정상 위치는 회원별로 메모리에 두고, 없으면 member_last_position_t에서 한 번에 채웁니다.
+LOCATION_FILTER_SMOOTHING을 켜면 정상 위치를 1차원 칼만 필터(정확도를 측정 잡음으로 사용)로 보정하여
+최신 위치/실시간 스트림에 보정 좌표를 사용합니다. 위치 로그 원본 좌표는 바꾸지 않습니다.
+
+기존 로그 재판정 (backend 디렉토리에서):
+    python -m app.services.location_quality --start 2025-01-01 --end 2025-01-31
+"""
+import argparse
+import logging
+import math
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.trajectory import haversine_km
+from app.core.utils import naive_datetime
+from app.models.member_last_position import MemberLastPosition
+
+logger = logging.getLogger(__name__)
+
+QUALITY_CLEAN = 0
+QUALITY_LOW_ACCURACY = 1
+QUALITY_SPEED_JUMP = 2
+QUALITY_NO_FIX = 4
+
+# 저장하지 않을 수 있는 판정 (LOCATION_FILTER_DROP_REJECTED)
+QUALITY_REJECTED = QUALITY_SPEED_JUMP | QUALITY_NO_FIX
+
+_QUALITY_NAMES = {
+    QUALITY_LOW_ACCURACY: "low_accuracy",
+    QUALITY_SPEED_JUMP: "speed_jump",
+    QUALITY_NO_FIX: "no_fix"
+}
+
+QUALITY_FIXES = registry.counter(
+    "smap_location_quality_total",
+    "Ingested location fixes by quality verdict (clean, low_accuracy, speed_jump, no_fix)",
+    ["quality"]
+)
+
+
+class FixState(NamedTuple):
+    """회원별 직전 정상 위치 (칼만 필터 상태)"""
+    gps_time: datetime
+    lat: float
+    lng: float
+    variance: float  # 위치 추정 분산(m²)
+    rejects: int = 0  # 이후 연속 튐 판정 수
+
+
+class QualityResult(NamedTuple):
+    quality: int
+    lat: Optional[float]  # 최신 위치/스트림에 사용할 좌표 (보정 사용 시 보정 좌표)
+    lng: Optional[float]
+
+
+def quality_label(quality: int) -> str:
+    if not quality:
+        return "clean"
+    return ",".join(name for flag, name in _QUALITY_NAMES.items() if quality & flag)
+
+
+class LocationQualityFilter:
+    """
+    회원별 직전 정상 위치와 비교하는 스트리밍 GPS 필터
+
+    classify()는 상태를 바꾸지 않고 판정과 새 상태를 돌려주며, 위치 로그 저장(commit)에 성공한 뒤
+    commit()으로 상태를 반영합니다. (저장에 실패해 spill 후 재적재되어도 같은 판정이 나오도록)
+    """
+
+    def __init__(
+        self,
+        max_accuracy: float = 100.0,
+        max_speed_kmh: float = 250.0,
+        max_rejects: int = 5,
+        smoothing: bool = False,
+        process_noise: float = 3.0,
+        drop_rejected: bool = False,
+        max_members: int = 100000
+    ):
+        self.max_accuracy = max_accuracy
+        self.max_speed_kmh = max_speed_kmh
+        self.max_rejects = max_rejects
+        self.smoothing = smoothing
+        self.process_noise = process_noise
+        self.drop_rejected = drop_rejected
+        self.max_members = max_members
+        self._states: "OrderedDict[int, FixState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _seed(self, db: Session, mt_idxs: List[int]) -> Dict[int, FixState]:
+        """메모리에 없는 회원의 직전 정상 위치를 member_last_position_t에서 한 번에 조회"""
+        with self._lock:
+            states = {mt_idx: self._states[mt_idx] for mt_idx in mt_idxs if mt_idx in self._states}
+        missing = [mt_idx for mt_idx in mt_idxs if mt_idx not in states]
+        if missing and db is not None:
+            try:
+                rows = db.query(MemberLastPosition).filter(MemberLastPosition.mt_idx.in_(missing)).all()
+            except Exception as e:
+                logger.error(f"직전 정상 위치 조회 실패, 기준 위치 없이 판정: {e}")
+                rows = []
+            for row in rows:
+                if row.mlp_lat and row.mlp_long and row.mlp_gps_time:
+                    accuracy = row.mlp_accuacy if row.mlp_accuacy else self.max_accuracy
+                    states[row.mt_idx] = FixState(
+                        naive_datetime(row.mlp_gps_time), float(row.mlp_lat), float(row.mlp_long), accuracy ** 2
+                    )
+        return states
+
+    def _judge(self, state: Optional[FixState], log) -> Tuple[QualityResult, Optional[FixState]]:
+        """로그 1건 판정. (판정 결과, 새 상태)"""
+        lat = float(log.mlt_lat) if log.mlt_lat is not None else None
+        lng = float(log.mlt_long) if log.mlt_long is not None else None
+        if not lat or not lng:
+            return QualityResult(QUALITY_NO_FIX, None, None), state
+
+        accuracy = log.mlt_accuacy
+        if accuracy is None or accuracy > self.max_accuracy:
+            return QualityResult(QUALITY_LOW_ACCURACY, lat, lng), state
+
+        gps_time = naive_datetime(log.mlt_gps_time)
+        fresh = FixState(gps_time, lat, lng, max(accuracy, 1.0) ** 2)
+        if state is None:
+            return QualityResult(QUALITY_CLEAN, lat, lng), fresh
+
+        # 두 위치의 오차 반경만큼은 이동하지 않은 것으로 보고 속도 계산 (짧은 간격의 흔들림 허용)
+        elapsed = max(abs((gps_time - state.gps_time).total_seconds()), 1.0)
+        distance_m = float(haversine_km(state.lat, state.lng, lat, lng)) * 1000
+        moved_m = max(distance_m - accuracy - math.sqrt(state.variance), 0.0)
+        if moved_m / elapsed * 3.6 > self.max_speed_kmh:
+            # 기준 위치가 잘못된 경우(오래된 최신 위치, 실제 장거리 이동) 계속 거부하지 않도록 새 위치로 다시 시작
+            if state.rejects + 1 >= self.max_rejects:
+                return QualityResult(QUALITY_SPEED_JUMP, lat, lng), fresh
+            return QualityResult(QUALITY_SPEED_JUMP, lat, lng), state._replace(rejects=state.rejects + 1)
+
+        # 늦게 도착한 과거 위치는 판정만 하고 기준 위치는 유지
+        if gps_time < state.gps_time:
+            return QualityResult(QUALITY_CLEAN, lat, lng), state
+        if not self.smoothing:
+            return QualityResult(QUALITY_CLEAN, lat, lng), fresh
+
+        # 칼만 필터: 예측(경과 시간만큼 분산 증가) 후 정확도를 측정 잡음으로 보정
+        variance = state.variance + (self.process_noise ** 2) * elapsed
+        gain = variance / (variance + fresh.variance)
+        smoothed_lat = state.lat + gain * (lat - state.lat)
+        smoothed_lng = state.lng + gain * (lng - state.lng)
+        return (
+            QualityResult(QUALITY_CLEAN, smoothed_lat, smoothed_lng),
+            FixState(gps_time, smoothed_lat, smoothed_lng, (1 - gain) * variance)
+        )
+
+    def classify(self, db: Optional[Session], logs: List) -> Tuple[List[QualityResult], Dict[int, FixState]]:
+        """
+        로그 목록 판정 (회원별 GPS 시간순으로 처리, 결과는 입력 순서)
+
+        Returns:
+            (판정 결과 목록, 회원별 새 상태): 저장 성공 후 새 상태를 commit()에 전달
+        """
+        by_member: Dict[int, List[int]] = defaultdict(list)
+        for position, log in enumerate(logs):
+            if log.mlt_gps_time is not None:
+                by_member[log.mt_idx].append(position)
+
+        states = self._seed(db, list(by_member))
+        results: List[QualityResult] = [QualityResult(QUALITY_NO_FIX, None, None)] * len(logs)
+        for mt_idx, positions in by_member.items():
+            state = states.get(mt_idx)
+            for position in sorted(positions, key=lambda index: naive_datetime(logs[index].mlt_gps_time)):
+                results[position], state = self._judge(state, logs[position])
+            if state is not None:
+                states[mt_idx] = state
+        return results, states
+
+    def commit(self, states: Dict[int, FixState]) -> None:
+        """저장된 로그의 판정 상태 반영 (오래된 회원부터 max_members를 넘는 만큼 제거)"""
+        with self._lock:
+            for mt_idx, state in states.items():
+                current = self._states.get(mt_idx)
+                if current is None or state.gps_time >= current.gps_time:
+                    self._states[mt_idx] = state
+                self._states.move_to_end(mt_idx)
+            while len(self._states) > self.max_members:
+                self._states.popitem(last=False)
+
+    def record(self, results: List[QualityResult]) -> None:
+        for result in results:
+            QUALITY_FIXES.inc(quality=quality_label(result.quality))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+location_quality_filter = LocationQualityFilter(
+    max_accuracy=settings.LOCATION_FILTER_MAX_ACCURACY,
+    max_speed_kmh=settings.LOCATION_FILTER_MAX_SPEED_KMH,
+    max_rejects=settings.LOCATION_FILTER_MAX_REJECTS,
+    smoothing=settings.LOCATION_FILTER_SMOOTHING,
+    process_noise=settings.LOCATION_FILTER_PROCESS_NOISE,
+    drop_rejected=settings.LOCATION_FILTER_DROP_REJECTED
+)
+
+
+_RECLASSIFY_SELECT = text("""
+    SELECT mlt_idx, mt_idx, mlt_lat, mlt_long, mlt_accuacy, mlt_gps_time, mlt_quality
+    FROM member_location_log_t
+    WHERE mt_idx = :mt_idx AND mlt_gps_time >= :start_time AND mlt_gps_time < :end_time
+    ORDER BY mlt_gps_time ASC, mlt_idx ASC
+""")
+
+_RECLASSIFY_UPDATE = text("""
+    UPDATE member_location_log_t SET mlt_quality = :quality
+    WHERE mlt_idx = :mlt_idx AND mlt_gps_time = :mlt_gps_time
+""")
+
+
+def reclassify_logs(db: Session, start_date: date, end_date: date, mt_idx: Optional[int] = None) -> int:
+    """
+    기간 내 기존 위치 로그를 회원별로 다시 판정하여 mlt_quality 갱신 (컬럼 추가 전 로그용)
+
+    판정이 바뀐 날의 일일 요약은 재계산 대상으로 표시합니다.
+
+    Returns:
+        int: mlt_quality가 바뀐 로그 수
+    """
+    from app.crud import location_daily_summary
+
+    start_time = datetime.combine(start_date, time.min)
+    end_time = datetime.combine(end_date + timedelta(days=1), time.min)
+    if mt_idx is not None:
+        member_ids = [mt_idx]
+    else:
+        member_ids = [row.mt_idx for row in db.execute(text("""
+            SELECT DISTINCT mt_idx FROM member_location_log_t
+            WHERE mlt_gps_time >= :start_time AND mlt_gps_time < :end_time
+        """), {"start_time": start_time, "end_time": end_time})]
+
+    quality_filter = LocationQualityFilter(
+        max_accuracy=location_quality_filter.max_accuracy,
+        max_speed_kmh=location_quality_filter.max_speed_kmh,
+        max_rejects=location_quality_filter.max_rejects
+    )
+    changed_total = 0
+    for index, member_id in enumerate(member_ids, start=1):
+        rows = db.execute(_RECLASSIFY_SELECT, {
+            "mt_idx": member_id, "start_time": start_time, "end_time": end_time
+        }).fetchall()
+        results, _ = quality_filter.classify(None, rows)
+        changed = [
+            {"quality": result.quality, "mlt_idx": row.mlt_idx, "mlt_gps_time": row.mlt_gps_time}
+            for row, result in zip(rows, results)
+            if result.quality != row.mlt_quality
+        ]
+        if changed:
+            db.execute(_RECLASSIFY_UPDATE, changed)
+            location_daily_summary.mark_for_rebuild(
+                db, {(member_id, item["mlt_gps_time"].date()) for item in changed}
+            )
+            db.commit()
+            changed_total += len(changed)
+        if index % 1000 == 0:
+            logger.info(f"위치 로그 품질 재판정 진행: {index}/{len(member_ids)}명, 변경 {changed_total}건")
+    return changed_total
+
+
+if __name__ == "__main__":
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="기존 위치 로그 GPS 품질(mlt_quality) 재판정")
+    parser.add_argument("--start", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--mt-idx", type=int, default=None, help="특정 회원만 처리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        count = reclassify_logs(
+            session,
+            datetime.strptime(args.start, "%Y-%m-%d").date(),
+            datetime.strptime(args.end, "%Y-%m-%d").date(),
+            args.mt_idx
+        )
+        print(f"위치 로그 품질 재판정 완료: {count}건 변경")
+    finally:
+        session.close()
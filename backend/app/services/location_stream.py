@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.utils import naive_datetime
+
+logger = logging.getLogger(__name__)
+
+STREAM_CONNECTIONS = registry.gauge(
+    "smap_location_stream_connections",
+    "Open live location stream connections"
+)
+STREAM_EVENTS = registry.counter(
+    "smap_location_stream_events_total",
+    "Live location deltas by outcome (queued, coalesced into a newer pending delta, stale)",
+    ["outcome"]
+)
+
+
+def position_delta(log) -> Optional[Dict]:
+    """
+    위치 로그(스키마 또는 모델)를 스트림 이벤트 데이터로 변환
+
+    키와 값 형식은 GET /group-members/member/{group_id}의 최신 위치 필드와 같습니다.
+    """
+    if log.mlt_gps_time is None or log.mlt_lat is None or log.mlt_long is None:
+        return None
+    return {
+        "mt_idx": log.mt_idx,
+        "mlt_lat": float(log.mlt_lat) if log.mlt_lat else None,
+        "mlt_long": float(log.mlt_long) if log.mlt_long else None,
+        "mlt_speed": float(log.mlt_speed) if log.mlt_speed else None,
+        "mlt_battery": int(log.mlt_battery) if log.mlt_battery else None,
+        "mlt_gps_time": naive_datetime(log.mlt_gps_time).strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+class LocationSubscription:
+    """
+    그룹 1개를 구독하는 연결
+
+    전송 대기 중인 위치는 회원별 최신 1건만 보관합니다. 클라이언트가 느려도 대기열은
+    그룹 멤버 수를 넘지 않고, 밀린 위치는 가장 최신 위치로 합쳐져 전송됩니다.
+    """
+
+    def __init__(self, group_id: int, member_ids: Iterable[int]):
+        self.group_id = group_id
+        self.member_ids: Set[int] = set(member_ids)
+        self._pending: Dict[int, Dict] = {}
+        self._last_time: Dict[int, str] = {}
+        self._event = asyncio.Event()
+
+    def _push(self, delta: Dict) -> None:
+        """이벤트 루프 스레드에서만 호출"""
+        mt_idx = delta["mt_idx"]
+        # 순서가 어긋나 도착한 과거 위치는 전송하지 않음 (GPS 시간 문자열은 사전순 = 시간순)
+        if delta["mlt_gps_time"] < self._last_time.get(mt_idx, ""):
+            STREAM_EVENTS.inc(outcome="stale")
+            return
+        self._last_time[mt_idx] = delta["mlt_gps_time"]
+        STREAM_EVENTS.inc(outcome="coalesced" if mt_idx in self._pending else "queued")
+        self._pending[mt_idx] = delta
+        self._event.set()
+
+    def seed(self, positions: Iterable[Dict]) -> None:
+        """
+        스냅샷으로 보낸 최신 위치 시각을 기준으로 설정 (이벤트 루프 스레드에서만 호출)
+
+        구독 후 스냅샷 조회 전에 들어온 위치 중 스냅샷보다 새롭지 않은 것은 전송하지 않고,
+        이후 도착하는 그보다 과거 위치도 stale로 처리됩니다.
+        """
+        for position in positions:
+            mt_idx, gps_time = position["mt_idx"], position.get("mlt_gps_time")
+            if not gps_time:
+                continue
+            if gps_time > self._last_time.get(mt_idx, ""):
+                self._last_time[mt_idx] = gps_time
+            pending = self._pending.get(mt_idx)
+            if pending is not None and pending["mlt_gps_time"] <= gps_time:
+                del self._pending[mt_idx]
+        if not self._pending:
+            self._event.clear()
+
+    async def next_batch(self, timeout: float) -> List[Dict]:
+        """전송할 위치 목록. timeout 동안 새 위치가 없으면 빈 목록"""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        self._event.clear()
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+
+class LocationStreamHub:
+    """
+    위치 로그 수집 경로에서 그룹 실시간 위치 스트림으로 전달하는 프로세스 내 pub/sub
+
+    - publish_logs()는 위치 로그 저장 후(스레드풀/수집 스레드) 호출되며, 해당 회원을 구독 중인
+      연결에만 call_soon_threadsafe로 이벤트 루프에 전달합니다.
+    - 구독자가 없으면 회원 색인 조회 1회로 끝나므로 수집 경로에 부담이 없습니다.
+    - 이 프로세스에서 저장된 위치만 전달합니다. (다른 워커에 저장된 위치는 해당 워커의 구독자에게 전달)
+    """
+
+    def __init__(self, max_connections: int = 1000):
+        self.max_connections = max_connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscriptions: Set[LocationSubscription] = set()
+        self._by_member: Dict[int, Set[LocationSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, group_id: int, member_ids: Iterable[int]) -> Optional[LocationSubscription]:
+        """구독 등록 (이벤트 루프에서 호출). 최대 연결 수를 넘으면 None"""
+        subscription = LocationSubscription(group_id, member_ids)
+        with self._lock:
+            if len(self._subscriptions) >= self.max_connections:
+                return None
+            self._loop = asyncio.get_running_loop()
+            self._subscriptions.add(subscription)
+            for mt_idx in subscription.member_ids:
+                self._by_member.setdefault(mt_idx, set()).add(subscription)
+            STREAM_CONNECTIONS.set(len(self._subscriptions))
+        return subscription
+
+    def update_members(self, subscription: LocationSubscription, member_ids: Iterable[int]) -> None:
+        """그룹 멤버 변경 반영"""
+        member_ids = set(member_ids)
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            for mt_idx in subscription.member_ids - member_ids:
+                self._discard(mt_idx, subscription)
+            for mt_idx in member_ids - subscription.member_ids:
+                self._by_member.setdefault(mt_idx, set()).add(subscription)
+            subscription.member_ids = member_ids
+
+    def unsubscribe(self, subscription: LocationSubscription) -> None:
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.discard(subscription)
+            for mt_idx in subscription.member_ids:
+                self._discard(mt_idx, subscription)
+            STREAM_CONNECTIONS.set(len(self._subscriptions))
+
+    def _discard(self, mt_idx: int, subscription: LocationSubscription) -> None:
+        subscriptions = self._by_member.get(mt_idx)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._by_member[mt_idx]
+
+    def publish_logs(self, logs: Iterable) -> None:
+        """저장된 위치 로그를 구독 중인 연결에 전달 (어느 스레드에서나 호출 가능)"""
+        if not self._by_member:
+            return
+
+        # 같은 배치 안에서는 회원별 가장 늦은 로그만 전달
+        latest: Dict[int, Dict] = {}
+        for log in logs:
+            if log.mt_idx not in self._by_member:
+                continue
+            delta = position_delta(log)
+            if delta and delta["mlt_gps_time"] >= latest.get(log.mt_idx, {}).get("mlt_gps_time", ""):
+                latest[log.mt_idx] = delta
+        if not latest:
+            return
+
+        with self._lock:
+            loop = self._loop
+            targets = [
+                (subscription, delta)
+                for mt_idx, delta in latest.items()
+                for subscription in self._by_member.get(mt_idx, ())
+            ]
+        if loop is None or loop.is_closed():
+            return
+        for subscription, delta in targets:
+            try:
+                loop.call_soon_threadsafe(subscription._push, delta)
+            except RuntimeError:
+                # 종료 중인 이벤트 루프
+                return
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "connections": len(self._subscriptions),
+                "members": len(self._by_member),
+                "max_connections": self.max_connections
+            }
+
+
+location_stream_hub = LocationStreamHub(max_connections=settings.LOCATION_STREAM_MAX_CONNECTIONS)
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.member import Member
+
+logger = logging.getLogger(__name__)
+
+# IN 쿼리 1회당 최대 회원 수
+PREFETCH_CHUNK_SIZE = 1000
+
+# 변경 시 캐시를 무효화하는 컬럼
+SNAPSHOT_COLUMNS = ("mt_lang", "mt_token_id", "mt_name", "mt_nickname")
+
+
+class MemberSnapshot(NamedTuple):
+    mt_idx: int
+    mt_lang: Optional[str]
+    mt_token_id: Optional[str]
+    mt_name: Optional[str]
+
+
+class MemberSnapshotCache:
+    """
+    스케줄러 작업용 회원 정보(언어, FCM 토큰, 이름) 스냅샷 캐시
+
+    - 작업 시작 시 prefetch()로 대상 회원 전체를 IN 쿼리로 한 번에 읽고, 루프에서는 get()으로 조회
+    - 같은 주기에 실행되는 다른 작업도 ttl 동안 같은 스냅샷을 재사용
+    - 이 프로세스에서 ORM으로 토큰/언어/이름이 바뀌면 after_update 이벤트로 즉시 무효화
+      (리스너는 이 모듈을 import할 때 등록되므로 app.main에서 시작 시 import)
+    - 캐시는 프로세스별이므로 다른 프로세스(다른 API 워커, 스케줄러 리더)나 raw SQL 변경은
+      ttl(MEMBER_SNAPSHOT_TTL) 경과 후 반영됨
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._entries: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, mt_idx: int, now: float) -> Optional[MemberSnapshot]:
+        entry = self._entries.get(mt_idx)
+        if entry and now - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    def prefetch(self, db: Session, mt_idxs: Iterable) -> Dict[int, MemberSnapshot]:
+        """
+        회원 스냅샷을 일괄 조회합니다. 캐시에 없거나 만료된 회원만 IN 쿼리로 읽습니다.
+
+        Returns:
+            Dict[mt_idx, MemberSnapshot]: 존재하는 회원만 포함
+        """
+        mt_idxs = {int(mt_idx) for mt_idx in mt_idxs if mt_idx is not None}
+        now = time.monotonic()
+        with self._lock:
+            result = {}
+            missing = []
+            for mt_idx in mt_idxs:
+                snapshot = self._fresh(mt_idx, now)
+                if snapshot:
+                    result[mt_idx] = snapshot
+                else:
+                    missing.append(mt_idx)
+
+        for start in range(0, len(missing), PREFETCH_CHUNK_SIZE):
+            rows = db.query(
+                Member.mt_idx,
+                Member.mt_lang,
+                Member.mt_token_id,
+                Member.mt_nickname,
+                Member.mt_name
+            ).filter(Member.mt_idx.in_(missing[start:start + PREFETCH_CHUNK_SIZE])).all()
+            loaded_at = time.monotonic()
+            with self._lock:
+                for row in rows:
+                    snapshot = MemberSnapshot(row.mt_idx, row.mt_lang, row.mt_token_id, row.mt_nickname or row.mt_name)
+                    self._entries[row.mt_idx] = (snapshot, loaded_at)
+                    result[row.mt_idx] = snapshot
+        return result
+
+    def get(self, db: Session, mt_idx) -> Optional[MemberSnapshot]:
+        """회원 스냅샷 1건 조회 (캐시에 없으면 DB 조회)"""
+        if mt_idx is None:
+            return None
+        return self.prefetch(db, [mt_idx]).get(int(mt_idx))
+
+    def invalidate(self, mt_idx) -> None:
+        with self._lock:
+            self._entries.pop(int(mt_idx), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+member_snapshot_cache = MemberSnapshotCache(ttl=settings.MEMBER_SNAPSHOT_TTL)
+
+
+@event.listens_for(Member, "after_update")
+def _invalidate_member_snapshot(mapper, connection, target: Member) -> None:
+    """토큰/언어/이름이 바뀐 회원의 스냅샷 무효화"""
+    state = inspect(target)
+    if any(state.attrs[column].history.has_changes() for column in SNAPSHOT_COLUMNS):
+        member_snapshot_cache.invalidate(target.mt_idx)
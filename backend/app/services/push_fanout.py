@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """초당 rate건으로 호출을 제한하는 토큰 버킷 (스레드 안전). rate가 0 이하면 제한 없음"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class PushFanout:
+    """
+    푸시 일괄 전송기 (동시 전송 수 제한 + 초당 전송 건수 제한)
+
+    - 단계(tier) 순서대로 작업을 제출하므로 앞 단계(우선순위) 대상이 먼저 전송됨
+    - 진행 중인 작업 수를 concurrency * 2로 제한하여 대상이 많아도 메모리 사용량이 일정함
+    - max_duration을 넘기면 남은 대상은 전송하지 않고 skipped로 집계 (다음 주기 실행과 겹치지 않도록)
+    """
+
+    def __init__(self, concurrency: int = 16, rate_limit: float = 0, max_duration: Optional[float] = None):
+        self.concurrency = max(1, concurrency)
+        self.rate_limit = rate_limit
+        self.max_duration = max_duration
+
+    def run(
+        self,
+        tiers: Sequence[Tuple[str, Sequence[Any]]],
+        send: Callable[[Any], Any]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        단계별 대상에게 send(item)을 실행합니다. send가 예외 없이 끝나면 성공으로 집계합니다.
+
+        Args:
+            tiers: [(단계 이름, 대상 목록), ...] 우선순위 순
+            send: 대상 1건 전송 함수
+
+        Returns:
+            Dict[단계 이름, {"total", "success", "fail", "skipped"}]
+        """
+        stats = {name: {"total": len(items), "success": 0, "fail": 0, "skipped": 0} for name, items in tiers}
+        stats_lock = threading.Lock()
+        in_flight = threading.BoundedSemaphore(self.concurrency * 2)
+        limiter = RateLimiter(self.rate_limit)
+        deadline = time.monotonic() + self.max_duration if self.max_duration else None
+
+        def task(name: str, item: Any) -> None:
+            try:
+                send(item)
+                result = "success"
+            except Exception as e:
+                logger.warning(f"푸시 전송 실패 ({name}): {e}")
+                result = "fail"
+            finally:
+                in_flight.release()
+            with stats_lock:
+                stats[name][result] += 1
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="push-fanout") as executor:
+            for name, items in tiers:
+                for i, item in enumerate(items):
+                    if deadline and time.monotonic() >= deadline:
+                        # 최대 시간 초과 시 이 단계의 남은 대상과 이후 단계 대상은 모두 건너뜀
+                        with stats_lock:
+                            stats[name]["skipped"] += len(items) - i
+                        break
+                    limiter.acquire()
+                    in_flight.acquire()
+                    executor.submit(task, name, item)
+
+        if any(tier["skipped"] for tier in stats.values()):
+            logger.warning(f"푸시 일괄 전송 최대 시간({self.max_duration}초) 초과 - 남은 대상 전송 생략")
+        return stats
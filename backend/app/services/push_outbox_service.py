@@ -0,0 +1,220 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.push_outbox import PushOutbox
+from app.services.firebase_service import firebase_service
+from app.services.push_service import push_logs_add
+
+logger = logging.getLogger(__name__)
+
+
+class PushOutboxService:
+    """
+    푸시 outbox 전송 워커
+
+    - push_outbox_t에서 전송할 행을 batch_size건씩 가져와(FOR UPDATE SKIP LOCKED) send_each로 일괄 전송
+    - 일시적 오류는 지수 백오프(retry_base * 2^(시도-1), 최대 retry_max)로 재시도
+    - 토큰 무효 등 재시도해도 성공할 수 없는 오류 또는 max_attempts 초과 시 dead 상태로 보관
+      (시도 횟수는 가져갈 때 올리므로, 전송 중 워커를 중단시키는 행도 max_attempts번 뒤에는 dead)
+    - 전송 완료/dead 처리된 건은 push_log_t에 한 번의 INSERT로 기록
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        poll_interval: float = 2.0,
+        max_attempts: int = 6,
+        retry_base: int = 30,
+        retry_max: int = 3600,
+        claim_timeout: int = 300
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.claim_timeout = claim_timeout
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "sent": 0,
+            "retried": 0,
+            "dead": 0,
+            "errors": 0,
+            "last_batch_at": None,
+        }
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._worker_loop, name="push-outbox-worker", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"푸시 outbox 워커 시작 (batch: {self.batch_size}, poll: {self.poll_interval}s, "
+            f"max_attempts: {self.max_attempts})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """워커 스레드 종료 (전송 중인 배치는 claim_timeout 이후 다른 워커가 다시 가져감)"""
+        if not self.is_running():
+            return
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("푸시 outbox 워커 종료")
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self) -> Dict:
+        """워커 상태 조회 (outbox 상태별 건수 포함)"""
+        stats = dict(self._stats)
+        stats["running"] = self.is_running()
+        db = SessionLocal()
+        try:
+            stats["outbox"] = PushOutbox.count_by_status(db)
+        except Exception as e:
+            stats["outbox"] = {"error": str(e)}
+        finally:
+            db.close()
+        return stats
+
+    def _worker_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed = self.process_batch()
+            except Exception as e:
+                logger.error(f"푸시 outbox 처리 실패: {e}")
+                self._stats["errors"] += 1
+                processed = 0
+            # 가져온 행이 batch_size만큼이면 밀린 건이 있으므로 바로 다음 배치 처리
+            if processed < self.batch_size:
+                self._stop_event.wait(self.poll_interval)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.retry_max, self.retry_base * 2 ** (attempts - 1)))
+
+    @staticmethod
+    def _dead_log(row: PushOutbox) -> Dict:
+        return {
+            "mt_idx": row.mt_idx,
+            "sst_idx": row.sst_idx,
+            "plt_condition": row.pot_condition,
+            "plt_memo": row.pot_memo,
+            "plt_title": row.pot_title,
+            "plt_content": row.pot_content,
+            "plt_status": 4,
+            "push_json": row.pot_json,
+            "plt_sdate": row.pot_sdate
+        }
+
+    def process_batch(self) -> int:
+        """
+        outbox에서 한 배치를 가져와 전송하고 결과를 반영합니다.
+
+        Returns:
+            int: 처리한 행 수
+        """
+        db = SessionLocal()
+        try:
+            claimed, dead = PushOutbox.claim_batch(db, self.batch_size, self.claim_timeout, self.max_attempts)
+            dead_logs = [self._dead_log(row) for row in dead]
+            pushes = [
+                {
+                    "pot_idx": row.pot_idx,
+                    "mt_idx": row.mt_idx,
+                    "sst_idx": row.sst_idx,
+                    "token": row.pot_token,
+                    "title": row.pot_title,
+                    "content": row.pot_content,
+                    "member_id": row.mt_idx,
+                    "condition": row.pot_condition,
+                    "memo": row.pot_memo,
+                    "push_json": row.pot_json,
+                    "attempts": row.pot_attempts
+                }
+                for row in claimed
+            ]
+            # 시도 횟수를 모두 쓴 채 중단된 행은 전송하지 않고 dead 로그만 기록
+            push_logs_add(db, dead_logs)
+            # 행 잠금은 claim 직후 해제 (전송 중에는 sending 상태와 pot_claimed_at으로 보호)
+            db.commit()
+            for log, row in zip(dead_logs, dead):
+                self._stats["dead"] += 1
+                logger.warning(f"푸시 dead 처리 - pot_idx: {row.pot_idx}, mt_idx: {log['mt_idx']}, 오류: {row.pot_last_error}")
+            if not pushes:
+                return len(dead)
+
+            results = firebase_service.send_push_notifications_batch(pushes, batch_size=self.batch_size)
+
+            now = datetime.now()
+            updates: List[Dict] = []
+            logs: List[Dict] = []
+            for push, result in zip(pushes, results):
+                attempts = push["attempts"]
+                error = (result.get("msg") or "")[:255]
+                if result["result"]:
+                    status, next_attempt_at, error = "sent", None, None
+                elif result.get("retryable", True) and attempts < self.max_attempts:
+                    status, next_attempt_at = "pending", now + self._backoff(attempts)
+                else:
+                    status, next_attempt_at = "dead", None
+
+                updates.append({
+                    "pot_idx": push["pot_idx"],
+                    "pot_status": status,
+                    "pot_attempts": attempts,
+                    "pot_next_attempt_at": next_attempt_at or now,
+                    "pot_last_error": error,
+                    "pot_sdate": now if status != "pending" else None,
+                    "pot_claimed_at": None
+                })
+                if status == "pending":
+                    self._stats["retried"] += 1
+                    continue
+
+                self._stats[status] += 1
+                if status == "dead":
+                    logger.warning(f"푸시 dead 처리 - pot_idx: {push['pot_idx']}, mt_idx: {push['mt_idx']}, 시도: {attempts}, 오류: {error}")
+                logs.append({
+                    "mt_idx": push["mt_idx"],
+                    "sst_idx": push["sst_idx"],
+                    "plt_condition": push["condition"],
+                    "plt_memo": push["memo"],
+                    "plt_title": push["title"],
+                    "plt_content": push["content"],
+                    "plt_status": 2 if status == "sent" else 4,
+                    "push_json": push["push_json"],
+                    "plt_sdate": now
+                })
+
+            # 기본 키 기준 ORM bulk UPDATE (executemany)
+            db.execute(update(PushOutbox), updates)
+            push_logs_add(db, logs)
+            db.commit()
+            self._stats["last_batch_at"] = time.time()
+            return len(pushes) + len(dead)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+push_outbox_service = PushOutboxService(
+    batch_size=settings.PUSH_OUTBOX_BATCH_SIZE,
+    poll_interval=settings.PUSH_OUTBOX_POLL_INTERVAL,
+    max_attempts=settings.PUSH_OUTBOX_MAX_ATTEMPTS,
+    retry_base=settings.PUSH_OUTBOX_RETRY_BASE,
+    retry_max=settings.PUSH_OUTBOX_RETRY_MAX
+)
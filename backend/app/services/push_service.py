@@ -1,7 +1,11 @@
+import json
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import insert
+from app.core import job_metrics
 from app.models.push_log import PushLog
+from app.models.push_outbox import PushOutbox
 from app.models.push_fcm import PushFCM
 from app.models.enums import ReadCheckEnum, ShowEnum
 from app.services.firebase_service import firebase_service
@@ -44,6 +48,27 @@ def send_push(token_id: str, title: str, content: str, url: Optional[str] = None
             "msg": str(e)
         }
 
+def send_push_batch(pushes: List[Dict]) -> List[Dict]:
+    """
+    여러 회원에게 FCM 푸시 알림을 일괄 전송합니다. (send_each, 500건 단위)
+
+    Args:
+        pushes: [{"token": str, "title": str, "content": str, "member_id": Optional[int]}, ...]
+
+    Returns:
+        List[dict]: pushes와 같은 순서의 send_push 형식 결과 (push_log_add에 그대로 전달 가능)
+    """
+    try:
+        logger.info(f"📤 푸시 알림 일괄 전송 시작 - {len(pushes)}건")
+        results = firebase_service.send_push_notifications_batch(pushes)
+        success = sum(1 for result in results if result["result"])
+        logger.info(f"✅ 푸시 알림 일괄 전송 완료 - 성공: {success}, 실패: {len(results) - success}")
+        return results
+
+    except Exception as e:
+        logger.error(f"❌ 푸시 알림 일괄 전송 실패: {e}")
+        return [{"result": False, "msg": str(e), "retryable": True} for _ in pushes]
+
 def push_log_add(
     db,
     mt_idx: int,
@@ -86,4 +111,130 @@ def push_log_add(
 
     except Exception as e:
         logger.error(f"Error adding push log: {e}")
-        db.rollback() 
\ No newline at end of file
+        db.rollback() 
+
+def _push_json_text(push_json: Any) -> str:
+    """push_json(dict 또는 문자열)을 저장용 문자열로 변환"""
+    if push_json is None:
+        return ""
+    if isinstance(push_json, str):
+        return push_json
+    return json.dumps(push_json, ensure_ascii=False, default=str)
+
+def enqueue_pushes(db, pushes: List[Dict], commit: bool = True) -> int:
+    """
+    푸시 알림 여러 건을 outbox(push_outbox_t)에 한 번에 등록합니다.
+    실제 전송과 push_log_t 기록은 push_outbox_service 워커가 수행합니다.
+
+    Args:
+        pushes: [{"mt_idx", "sst_idx", "plt_condition", "plt_memo", "plt_title", "plt_content", "token_id", "push_json"}, ...]
+        commit: True면 등록 후 커밋 (호출자 트랜잭션에 포함하려면 False)
+
+    Returns:
+        int: 등록 건수
+    """
+    if not pushes:
+        return 0
+    now = datetime.now()
+    rows = [
+        {
+            "mt_idx": push.get("mt_idx"),
+            "sst_idx": push.get("sst_idx"),
+            "pot_token": push.get("token_id"),
+            "pot_title": push.get("plt_title"),
+            "pot_content": push.get("plt_content"),
+            "pot_condition": push.get("plt_condition"),
+            "pot_memo": push.get("plt_memo"),
+            "pot_json": _push_json_text(push.get("push_json")),
+            "pot_status": "pending",
+            "pot_attempts": 0,
+            "pot_next_attempt_at": now,
+            "pot_wdate": now
+        }
+        for push in pushes
+    ]
+    try:
+        db.execute(insert(PushOutbox), rows)
+        if commit:
+            db.commit()
+        # 스케줄러 작업에서 호출된 경우 작업별 푸시 건수로 집계
+        job_metrics.record_items(len(rows), "pushes")
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error enqueueing push notifications ({len(rows)}건): {e}")
+        db.rollback()
+        raise
+
+def outbox_push(
+    mt_idx: int,
+    sst_idx: Optional[int],
+    plt_condition: str,
+    plt_memo: str,
+    plt_title: str,
+    plt_content: str,
+    token_id: str,
+    push_json: Any = ""
+) -> Dict:
+    """enqueue_pushes()에 전달할 푸시 1건"""
+    return {
+        "mt_idx": mt_idx,
+        "sst_idx": sst_idx,
+        "plt_condition": plt_condition,
+        "plt_memo": plt_memo,
+        "plt_title": plt_title,
+        "plt_content": plt_content,
+        "token_id": token_id,
+        "push_json": push_json
+    }
+
+def enqueue_push(
+    db,
+    mt_idx: int,
+    sst_idx: Optional[int],
+    plt_condition: str,
+    plt_memo: str,
+    plt_title: str,
+    plt_content: str,
+    token_id: str,
+    push_json: Any = ""
+) -> None:
+    """
+    푸시 알림 1건을 outbox에 등록합니다. (send_push + push_log_add 대체)
+    여러 건을 보내는 작업은 outbox_push()로 모아 enqueue_pushes()를 한 번 호출하세요.
+    """
+    try:
+        enqueue_pushes(db, [outbox_push(
+            mt_idx, sst_idx, plt_condition, plt_memo, plt_title, plt_content, token_id, push_json
+        )])
+    except Exception:
+        # 등록 실패가 호출한 작업(알림 판정, 상태 갱신)을 중단시키지 않도록 로그만 남김
+        pass
+
+def push_logs_add(db, logs: List[Dict]) -> None:
+    """
+    푸시 알림 로그 여러 건을 한 번의 INSERT로 저장합니다. (커밋은 호출자가 수행)
+
+    Args:
+        logs: [{"mt_idx", "sst_idx", "plt_condition", "plt_memo", "plt_title", "plt_content", "plt_status", "push_json", "plt_sdate"}, ...]
+    """
+    if not logs:
+        return
+    now = datetime.now()
+    db.execute(insert(PushLog), [
+        {
+            "plt_type": 2,
+            "mt_idx": log["mt_idx"],
+            "sst_idx": log["sst_idx"],
+            "plt_condition": log["plt_condition"],
+            "plt_memo": log["plt_memo"],
+            "plt_title": log["plt_title"],
+            "plt_content": log["plt_content"],
+            "plt_sdate": log.get("plt_sdate", now),
+            "plt_status": log["plt_status"],
+            "plt_read_chk": ReadCheckEnum.N,
+            "plt_show": ShowEnum.Y,
+            "push_json": log.get("push_json", ""),
+            "plt_wdate": now
+        }
+        for log in logs
+    ])
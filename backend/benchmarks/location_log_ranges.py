@@ -0,0 +1,143 @@
+"""
+위치 로그 기간 조회 벤치마크 (DATE(mlt_gps_time) 필터 vs 반열린 시간 범위)
+
+그룹 멤버의 위치 로그를 기존 방식(DATE() 비교, COUNT(DISTINCT mlt_idx))과
+변경된 방식(mlt_gps_time >= 시작 AND < 끝, COUNT(*))으로 조회하여 실행 계획과 응답 시간을 비교합니다.
+idx_mlt_mt_idx_gps_time 인덱스가 있으면 인덱스를 사용하지 않은 경우(IGNORE INDEX)도 함께 측정합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.location_log_ranges --group-id 123 --days 14 --repeat 5
+"""
+import argparse
+import statistics
+import time as timer
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+
+INDEX_NAME = "idx_mlt_mt_idx_gps_time"
+
+DAILY_COUNTS_BEFORE = """
+    SELECT mt_idx, DATE(mlt_gps_time) AS log_date, COUNT(DISTINCT mlt_idx) AS count
+    FROM member_location_log_t
+    WHERE mt_idx IN :member_ids
+    AND DATE(mlt_gps_time) BETWEEN :start_date AND :end_date
+    GROUP BY mt_idx, DATE(mlt_gps_time)
+"""
+
+DAILY_COUNTS_AFTER = """
+    SELECT mt_idx, DATE(mlt_gps_time) AS log_date, COUNT(*) AS count
+    FROM member_location_log_t {hint}
+    WHERE mt_idx IN :member_ids
+    AND mlt_gps_time >= :start_time AND mlt_gps_time < :end_time
+    GROUP BY mt_idx, DATE(mlt_gps_time)
+"""
+
+MEMBER_ACTIVITY_BEFORE = """
+    SELECT mt_idx, COUNT(*) AS log_count, MIN(mlt_gps_time), MAX(mlt_gps_time)
+    FROM member_location_log_t
+    WHERE mt_idx IN :member_ids
+    AND DATE(mlt_gps_time) = :end_date
+    GROUP BY mt_idx
+"""
+
+MEMBER_ACTIVITY_AFTER = """
+    SELECT mt_idx, COUNT(*) AS log_count, MIN(mlt_gps_time), MAX(mlt_gps_time)
+    FROM member_location_log_t {hint}
+    WHERE mt_idx IN :member_ids
+    AND mlt_gps_time >= :day_start AND mlt_gps_time < :end_time
+    GROUP BY mt_idx
+"""
+
+
+def get_group_member_ids(db: Session, group_id: int) -> List[int]:
+    rows = db.execute(text("""
+        SELECT mt_idx FROM smap_group_detail_t
+        WHERE sgt_idx = :group_id AND sgdt_exit = 'N' AND sgdt_discharge = 'N' AND sgdt_show = 'Y'
+    """), {"group_id": group_id}).fetchall()
+    return [row.mt_idx for row in rows]
+
+
+def has_index(db: Session) -> bool:
+    return db.execute(text("""
+        SELECT COUNT(*) FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = 'member_location_log_t' AND index_name = :index_name
+    """), {"index_name": INDEX_NAME}).scalar() > 0
+
+
+def explain(db: Session, sql: str, params: Dict) -> List[Dict]:
+    rows = db.execute(text("EXPLAIN " + sql), params).mappings().all()
+    return [
+        {key: row.get(key) for key in ("table", "type", "key", "key_len", "rows", "filtered", "Extra")}
+        for row in rows
+    ]
+
+
+def measure(db: Session, sql: str, params: Dict, repeat: int) -> Tuple[float, float, int]:
+    """(중앙값 ms, 최소 ms, 결과 행 수)"""
+    elapsed = []
+    row_count = 0
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        row_count = len(db.execute(text(sql), params).fetchall())
+        elapsed.append((timer.perf_counter() - started) * 1000)
+    return statistics.median(elapsed), min(elapsed), row_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="위치 로그 기간 조회 실행 계획/응답 시간 비교")
+    parser.add_argument("--group-id", type=int, required=True, help="대상 그룹 ID")
+    parser.add_argument("--days", type=int, default=14, help="조회 일수 (기본 14일)")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None, help="마지막 날짜 (YYYY-MM-DD, 기본 오늘)")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수")
+    args = parser.parse_args()
+
+    end_date = args.end_date or datetime.now().date()
+    start_date = end_date - timedelta(days=args.days - 1)
+
+    db = SessionLocal()
+    try:
+        member_ids = get_group_member_ids(db, args.group_id)
+        if not member_ids:
+            print(f"그룹 {args.group_id}에 멤버가 없습니다.")
+            return
+
+        params = {
+            "member_ids": tuple(member_ids),
+            "start_date": start_date,
+            "end_date": end_date,
+            "start_time": datetime.combine(start_date, time.min),
+            "day_start": datetime.combine(end_date, time.min),
+            "end_time": datetime.combine(end_date + timedelta(days=1), time.min)
+        }
+        index_exists = has_index(db)
+
+        cases = [
+            ("daily-counts / before (DATE BETWEEN)", DAILY_COUNTS_BEFORE),
+            ("daily-counts / after (half-open range)", DAILY_COUNTS_AFTER.format(hint="")),
+            ("member-activity / before (DATE =)", MEMBER_ACTIVITY_BEFORE),
+            ("member-activity / after (half-open range)", MEMBER_ACTIVITY_AFTER.format(hint="")),
+        ]
+        if index_exists:
+            ignore = f"IGNORE INDEX ({INDEX_NAME})"
+            cases.insert(2, ("daily-counts / after, without index", DAILY_COUNTS_AFTER.format(hint=ignore)))
+            cases.append(("member-activity / after, without index", MEMBER_ACTIVITY_AFTER.format(hint=ignore)))
+
+        print(f"그룹 {args.group_id}: 멤버 {len(member_ids)}명, 기간 {start_date} ~ {end_date}, 반복 {args.repeat}회")
+        print(f"{INDEX_NAME}: {'있음' if index_exists else '없음 (add_member_location_log_gps_time_index.sql 적용 전)'}")
+        for name, sql in cases:
+            print(f"\n[{name}]")
+            for plan in explain(db, sql, params):
+                print(f"  plan: {plan}")
+            median_ms, min_ms, row_count = measure(db, sql, params, args.repeat)
+            print(f"  time: median {median_ms:.1f}ms, min {min_ms:.1f}ms, rows {row_count}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.core.compact_encoding import delta_encode, encode_polyline, encode_track, time_deltas
+
+
+class TestCompactEncoding:
+    """지도 경로 압축 인코딩"""
+
+    def test_polyline_google_example(self):
+        """Google Encoded Polyline 문서의 예시"""
+        lats = [38.5, 40.7, 43.252]
+        lngs = [-120.2, -120.95, -126.453]
+        assert encode_polyline(lats, lngs) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+    def test_delta_encode_round_trip(self):
+        values = [37.566535, 37.566547, 37.566543, 37.5701]
+        encoded = delta_encode(values, 1_000_000)
+        assert encoded[0] == 37566535
+        assert np.allclose(np.cumsum(encoded) / 1_000_000, values)
+
+    def test_empty(self):
+        assert delta_encode([], 1_000_000) == []
+        assert time_deltas([]) == []
+        assert encode_polyline([], []) == ""
+
+    def test_time_deltas(self):
+        t0 = datetime(2025, 1, 1, 8, 0, 0)
+        times = [t0, t0 + timedelta(seconds=30), t0 + timedelta(seconds=90)]
+        assert time_deltas(times) == [0, 30, 60]
+
+    def test_encode_track_columnar(self):
+        t0 = datetime(2025, 1, 1, 8, 0, 0)
+        encoded = encode_track(
+            "columnar",
+            [t0, t0 + timedelta(seconds=30)],
+            [37.5, 37.5001],
+            [127.0, 127.0002],
+            {"speed": [1.0, 2.0]}
+        )
+        assert encoded["count"] == 2
+        assert encoded["t0"] == "2025-01-01 08:00:00"
+        assert encoded["t"] == [0, 30]
+        assert encoded["lat"] == [37500000, 100]
+        assert encoded["lng"] == [127000000, 200]
+        assert encoded["speed"] == [1.0, 2.0]
+        assert "polyline" not in encoded
@@ -0,0 +1,174 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.services import geofence_service as geofence_module
+from app.services.geofence_service import GeofenceService
+from app.services.last_position_index import LastPositionIndex
+from app.models.member_location_log import MemberLocationLog
+
+FENCE_LAT, FENCE_LNG = 37.5, 127.0
+# 위도 1도 = 6371km * π / 180 ≈ 111,195m
+METERS_PER_DEG_LAT = 6371000 * 3.141592653589793 / 180
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+def _fence(sst_idx, target_mt_idx):
+    return {
+        "sst_idx": sst_idx, "target_mt_idx": target_mt_idx,
+        "sst_location_lat": FENCE_LAT, "sst_location_long": FENCE_LNG
+    }
+
+
+def _north(meters):
+    return FENCE_LAT + meters / METERS_PER_DEG_LAT
+
+
+class TestGeofenceEvaluate:
+    """일정 장소 진입/이탈 일괄 판정"""
+
+    @pytest.fixture
+    def index(self, monkeypatch):
+        index = LastPositionIndex()
+        monkeypatch.setattr(geofence_module, "last_position_index", index)
+        # 장소에서 정북 방향으로 50m, 99m, 101m, 300m
+        for mt_idx, meters in ((1, 50), (2, 99), (3, 101), (4, 300)):
+            index.update(mt_idx, _north(meters), FENCE_LNG, T0)
+        return index
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        MemberLocationLog.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def _fences(self):
+        return [_fence(10 + mt_idx, mt_idx) for mt_idx in (1, 2, 3, 4)]
+
+    def test_entry_hits(self, index, db):
+        hits = GeofenceService().evaluate(db, self._fences(), radius_m=100.0)
+        assert [hit.fence["target_mt_idx"] for hit in hits] == [1, 2]
+        assert [hit.distance_m for hit in hits] == [pytest.approx(50, abs=0.01), pytest.approx(99, abs=0.01)]
+
+    def test_exit_hits(self, index, db):
+        hits = GeofenceService().evaluate(db, self._fences(), exit_alert=True, radius_m=100.0)
+        assert [hit.fence["target_mt_idx"] for hit in hits] == [3, 4]
+        assert [hit.distance_m for hit in hits] == [pytest.approx(101, abs=0.01), pytest.approx(300, abs=0.01)]
+
+    def test_missing_member_loaded_from_latest_clean_log(self, index, db):
+        """인덱스에 없는 회원은 정상 판정된 최신 로그로 채우고, 위치가 없는 회원과 대상 없는 지오펜스는 제외"""
+        db.add_all([
+            MemberLocationLog(mt_idx=5, mlt_gps_time=T0, mlt_lat=_north(500), mlt_long=FENCE_LNG, mlt_quality=0),
+            MemberLocationLog(mt_idx=5, mlt_gps_time=T0, mlt_lat=_north(80), mlt_long=FENCE_LNG, mlt_quality=0),
+            MemberLocationLog(mt_idx=5, mlt_gps_time=T0, mlt_lat=_north(10), mlt_long=FENCE_LNG, mlt_quality=2),
+        ])
+        db.commit()
+
+        fences = [_fence(15, 5), _fence(16, 6), _fence(17, None)]
+        hits = GeofenceService().evaluate(db, fences, radius_m=100.0)
+        assert [(hit.fence["sst_idx"], round(hit.distance_m)) for hit in hits] == [(15, 80)]
+        assert index.get(5).lat == pytest.approx(_north(80))
+
+
+class TestMyLocationGeofence:
+    """내 장소 진입(100m)/이탈(150m) 히스테리시스 상태 머신"""
+
+    @pytest.fixture
+    def index(self, monkeypatch):
+        index = LastPositionIndex()
+        monkeypatch.setattr(geofence_module, "last_position_index", index)
+        return index
+
+    @pytest.fixture
+    def db(self):
+        from app.models.my_location import MyLocation
+
+        engine = create_engine("sqlite://")
+        MyLocation.__table__.create(engine)
+        MemberLocationLog.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        session.add(MyLocation(
+            slt_idx=1, mt_idx=7, slt_title="집", slt_lat=FENCE_LAT, slt_long=FENCE_LNG,
+            slt_show='Y', slt_enter_alarm='Y', slt_enter_chk='N'
+        ))
+        session.commit()
+        yield session
+        session.close()
+
+    def _move(self, index, meters, minute):
+        index.update(7, _north(meters), FENCE_LNG, T0.replace(minute=minute))
+
+    def _step(self, engine, db):
+        result = engine.tick(db)
+        engine.commit(db, result)
+        return [event.event for event in result.events]
+
+    def _enter_chk(self, db):
+        from app.models.my_location import MyLocation
+        db.expire_all()
+        return db.query(MyLocation.slt_enter_chk).filter(MyLocation.slt_idx == 1).scalar()
+
+    def test_hysteresis(self, index, db):
+        engine = geofence_module.MyLocationGeofenceEngine()
+        self._move(index, 200, 0)
+        assert self._step(engine, db) == []
+
+        self._move(index, 90, 1)
+        assert self._step(engine, db) == ["enter"]
+        assert self._enter_chk(db) == 'Y'
+
+        # 진입 반경과 이탈 반경 사이에서는 상태 유지
+        for minute, meters in ((2, 120), (3, 140), (4, 95)):
+            self._move(index, meters, minute)
+            assert self._step(engine, db) == []
+
+        self._move(index, 160, 5)
+        assert self._step(engine, db) == ["exit"]
+        assert self._enter_chk(db) == 'N'
+
+        self._move(index, 120, 6)
+        assert self._step(engine, db) == []
+
+    def test_unchanged_member_not_evaluated(self, index, db):
+        engine = geofence_module.MyLocationGeofenceEngine()
+        self._move(index, 90, 0)
+        assert self._step(engine, db) == ["enter"]
+        result = engine.tick(db)
+        assert result.events == [] and result.members == set()
+
+    def test_failed_commit_is_retried(self, index, db, monkeypatch):
+        """상태 저장에 실패하면 순번을 올리지 않아 위치 변화가 없어도 다음 주기에 다시 판정"""
+        from app.models.my_location import MyLocation
+
+        engine = geofence_module.MyLocationGeofenceEngine()
+        self._move(index, 50, 0)
+        result = engine.tick(db)
+        assert [event.event for event in result.events] == ["enter"]
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("db down")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(MyLocation, "set_enter_state", fail)
+            with pytest.raises(RuntimeError):
+                engine.commit(db, result)
+
+        assert self._step(engine, db) == ["enter"]
+        assert self._enter_chk(db) == 'Y'
+        assert self._step(engine, db) == []
+
+    def test_state_loaded_from_db(self, index, db):
+        """이미 진입 상태로 저장된 장소는 진입 알림 없이 이탈만 판정"""
+        from app.models.my_location import MyLocation
+
+        db.query(MyLocation).filter(MyLocation.slt_idx == 1).update({MyLocation.slt_enter_chk: 'Y'})
+        db.commit()
+        engine = geofence_module.MyLocationGeofenceEngine()
+        self._move(index, 50, 0)
+        assert self._step(engine, db) == []
+        self._move(index, 151, 1)
+        assert self._step(engine, db) == ["exit"]
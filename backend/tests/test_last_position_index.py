@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.member_location_log import MemberLocationLog
+from app.services.last_position_index import LastPositionIndex
+
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+class TestLastPositionSync:
+    """다른 워커에서 저장된 위치 로그 동기화"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        MemberLocationLog.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def _log(self, db, mlt_idx, mt_idx, minute, quality=0):
+        db.add(MemberLocationLog(
+            mlt_idx=mlt_idx, mt_idx=mt_idx, mlt_gps_time=T0 + timedelta(minutes=minute),
+            mlt_lat=37.5 + mlt_idx / 1000, mlt_long=127.0, mlt_quality=quality
+        ))
+        db.commit()
+
+    def test_late_commit_below_watermark_applied(self, db):
+        index = LastPositionIndex()
+        assert index.sync(db) == 0
+
+        # 12번 트랜잭션이 13번보다 늦게 커밋된 경우
+        self._log(db, 11, 1, 1)
+        self._log(db, 13, 2, 1)
+        assert index.sync(db) == 2
+        _, seq = index.changed_since(0)
+
+        self._log(db, 12, 3, 1)
+        assert index.sync(db) == 1
+        assert index.changed_since(seq)[0] == [3]
+        assert index.get(3).lat == pytest.approx(37.512)
+
+    def test_resync_does_not_bump_seq(self, db):
+        index = LastPositionIndex()
+        index.sync(db)
+        self._log(db, 1, 1, 0)
+        self._log(db, 2, 1, 1)
+        self._log(db, 3, 2, 0, quality=2)
+        assert index.sync(db) == 2
+        _, seq = index.changed_since(0)
+
+        # 다시 읽은 로그(같은 GPS 시간)와 품질 불량 로그는 반영하지 않음
+        assert index.sync(db) == 0
+        assert index.changed_since(seq) == ([], seq)
+        assert index.get(2) is None
+
+    def test_overlap_window(self, db):
+        index = LastPositionIndex()
+        self._log(db, 20, 1, 0)
+        index.sync(db)
+        self._log(db, 21, 1, 1)
+        index.sync(db)
+
+        # 워터마크(21) - overlap(3) = 18 이하로 늦게 커밋된 로그는 읽지 않음
+        self._log(db, 18, 2, 0)
+        self._log(db, 19, 3, 0)
+        assert index.sync(db, overlap=3) == 1
+        assert index.get(2) is None and index.get(3) is not None
@@ -0,0 +1,127 @@
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.trajectory import haversine_km
+from app.crud.location_daily_summary import _apply_fix, _new_summary, rebuild_daily_summary
+from app.models.member_location_daily_summary import MemberLocationDailySummary
+from app.models.member_location_log import MemberLocationLog
+from app.services.location_partition_service import location_partition_service
+
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+def _fix(second, lat, lng, speed=None, accuracy=10.0, steps=None, battery=None, quality=0):
+    return SimpleNamespace(
+        mlt_gps_time=T0 + timedelta(seconds=second), mlt_lat=lat, mlt_long=lng, mlt_speed=speed,
+        mlt_accuacy=accuracy, mt_health_work=steps, mlt_battery=battery, mlt_quality=quality
+    )
+
+
+def _summarize(fixes):
+    summary = _new_summary(1, date(2025, 3, 10))
+    for fix in fixes:
+        assert _apply_fix(summary, fix)
+    return summary
+
+
+class TestApplyFix:
+    """일일 위치 요약 증분 갱신"""
+
+    def test_path_distance_and_times(self):
+        fixes = [_fix(0, 37.5, 127.0), _fix(60, 37.501, 127.0), _fix(120, 37.502, 127.0)]
+        summary = _summarize(fixes)
+        assert summary.mlds_point_count == 3
+        assert summary.mlds_first_time == T0
+        assert summary.mlds_last_time == T0 + timedelta(seconds=120)
+        assert summary.mlds_path_km == pytest.approx(float(haversine_km(37.5, 127.0, 37.502, 127.0)), rel=1e-6)
+
+    def test_moving_distance_speed_window(self):
+        """구간 속도가 2~55km/h인 구간만 이동거리/시간에 포함"""
+        fixes = [
+            _fix(0, 37.5, 127.0, speed=3.0),
+            _fix(60, 37.501, 127.0, speed=3.0),     # 약 111m/60s ≈ 6.7km/h → 포함
+            _fix(120, 37.521, 127.0, speed=30.0),   # 약 2.2km/60s ≈ 133km/h → 제외
+            _fix(180, 37.5211, 127.0, speed=0.0),   # 속도 0 → 이동 계산 대상 아님
+        ]
+        summary = _summarize(fixes)
+        assert summary.mlds_moving_seconds == 60
+        assert summary.mlds_moving_meters == pytest.approx(111.2, abs=0.1)
+
+    def test_low_accuracy_skipped_for_moving(self):
+        fixes = [_fix(0, 37.5, 127.0, speed=3.0), _fix(60, 37.501, 127.0, speed=3.0, accuracy=150.0)]
+        summary = _summarize(fixes)
+        assert summary.mlds_moving_seconds == 0
+
+    def test_stay_counted_once(self):
+        fixes = [_fix(minute * 60, 37.5, 127.0, speed=0.2) for minute in range(12)]
+        fixes += [_fix(12 * 60, 37.51, 127.0, speed=5.0)]
+        fixes += [_fix((13 + minute) * 60, 37.51, 127.0, speed=0.2) for minute in range(4)]
+        summary = _summarize(fixes)
+        # 12분 체류 1회, 마지막 3분 체류는 최소 체류시간(5분) 미달
+        assert summary.mlds_stay_count == 1
+
+    def test_out_of_order_fix_rejected(self):
+        summary = _summarize([_fix(60, 37.5, 127.0)])
+        assert not _apply_fix(summary, _fix(0, 37.5, 127.0))
+        assert summary.mlds_point_count == 1
+
+    def test_flagged_fix_skipped_for_geometry(self):
+        """GPS 품질 판정에서 제외된 로그는 건수/걸음수에만 반영"""
+        fixes = [
+            _fix(0, 37.5, 127.0, speed=3.0, steps=100),
+            _fix(30, 37.6, 127.0, speed=3.0, steps=120, quality=2),
+            _fix(60, 37.501, 127.0, speed=3.0, steps=150),
+        ]
+        summary = _summarize(fixes)
+        assert summary.mlds_point_count == 3
+        assert summary.mlds_path_km == pytest.approx(float(haversine_km(37.5, 127.0, 37.501, 127.0)), rel=1e-6)
+        assert summary.mlds_moving_seconds == 60
+        assert (summary.mlds_min_steps, summary.mlds_max_steps, summary.mlds_last_steps) == (100, 150, 150)
+
+    def test_battery(self):
+        summary = _summarize([_fix(0, 37.5, 127.0, battery=90), _fix(60, 37.5, 127.0), _fix(120, 37.5, 127.0, battery=85)])
+        assert (summary.mlds_battery_count, summary.mlds_first_battery, summary.mlds_last_battery) == (2, 90, 85)
+
+
+class TestRebuildDailySummary:
+    """원본 로그가 없는 날의 재계산"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        MemberLocationLog.__table__.create(engine)
+        MemberLocationDailySummary.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def _stale_summary(self, db, summary_date):
+        summary = _new_summary(1, summary_date)
+        summary.mlds_point_count = 42
+        summary.mlds_rebuild = 'Y'
+        db.add(summary)
+        db.commit()
+
+    def test_archived_date_kept(self, db, monkeypatch):
+        """보관 기간이 지나 파티션이 삭제된 날은 요약을 유지하고 재계산 표시만 해제"""
+        monkeypatch.setattr(location_partition_service, "retention_months", 1)
+        summary_date = date.today().replace(day=1) - timedelta(days=40)
+        self._stale_summary(db, summary_date)
+
+        summary = rebuild_daily_summary(db, 1, summary_date)
+        db.commit()
+        assert summary is not None
+        assert (summary.mlds_point_count, summary.mlds_rebuild) == (42, 'N')
+
+    def test_retained_date_deleted(self, db, monkeypatch):
+        monkeypatch.setattr(location_partition_service, "retention_months", 1)
+        summary_date = date.today()
+        self._stale_summary(db, summary_date)
+
+        assert rebuild_daily_summary(db, 1, summary_date) is None
+        db.commit()
+        assert db.query(MemberLocationDailySummary).count() == 0
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.schemas.member_location_log import MemberLocationLogCreate
+from app.services import location_ingest_service as ingest_module
+from app.services.location_ingest_service import LocationIngestService
+
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+class FakeSession:
+    def close(self):
+        pass
+
+
+def _logs(count, start=0):
+    return [
+        MemberLocationLogCreate(mt_idx=1, mlt_lat=37.5, mlt_long=127.0, mlt_speed=1.5, mlt_gps_time=T0 + timedelta(seconds=i))
+        for i in range(start, start + count)
+    ]
+
+
+class TestSpillAndReplay:
+    """DB 저장 실패 시 spill 파일 기록 및 재적재"""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        state = {"saved": [], "fail_after": None}
+
+        def create_location_logs_bulk(db, batch):
+            if state["fail_after"] is not None and len(state["saved"]) >= state["fail_after"]:
+                raise RuntimeError("db down")
+            state["saved"].extend(batch)
+
+        monkeypatch.setattr(ingest_module, "SessionLocal", FakeSession)
+        monkeypatch.setattr(ingest_module.location_log_crud, "create_location_logs_bulk", create_location_logs_bulk)
+        return state
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        return LocationIngestService(batch_size=2, retry_interval=30, spill_dir=str(tmp_path / "spool"))
+
+    def _spilled(self, service):
+        return [path.read_text(encoding="utf-8").count("\n") for path in service._spill_files()]
+
+    def test_write_failure_spills_and_skips_db_until_retry(self, service, store):
+        store["fail_after"] = 0
+        assert not service._write(_logs(2))
+        assert self._spilled(service) == [2]
+
+        # retry_interval 동안은 DB 접근 없이 바로 spill
+        store["fail_after"] = None
+        assert not service._write(_logs(1, start=2))
+        assert store["saved"] == []
+        assert sorted(self._spilled(service)) == [1, 2]
+        assert service.get_stats()["spilled"] == 3
+        assert not service.get_stats()["db_available"]
+
+    def test_replay_round_trip(self, service, store):
+        logs = _logs(3)
+        service._spill(logs)
+        service._replay_spill()
+
+        assert store["saved"] == logs
+        assert service._spill_files() == []
+        assert service.get_stats()["replayed"] == 3
+
+    def test_partial_replay_respills_only_remaining(self, service, store):
+        logs = _logs(5)
+        service._spill(logs)
+
+        # 첫 번째 청크(2건)만 저장되고 실패
+        store["fail_after"] = 2
+        service._replay_spill()
+        assert store["saved"] == logs[:2]
+        assert self._spilled(service) == [3]
+
+        store["fail_after"] = None
+        service._db_unavailable_until = 0.0
+        service._replay_spill()
+        # 중복 없이 전체 저장
+        assert store["saved"] == logs
+        assert service._spill_files() == []
+
+    def test_first_chunk_failure_keeps_file(self, service, store):
+        service._spill(_logs(3))
+        store["fail_after"] = 0
+        service._replay_spill()
+        assert self._spilled(service) == [3]
+
+    def test_corrupt_file_set_aside(self, service, store):
+        service.spill_dir.mkdir(parents=True)
+        (service.spill_dir / "location_logs_20250310000000_bad.jsonl").write_text("{not json\n", encoding="utf-8")
+        service._spill(_logs(1))
+
+        service._replay_spill()
+        assert len(store["saved"]) == 1
+        assert service._spill_files() == []
+        assert [path.name for path in service.spill_dir.glob("*.corrupt")] == ["location_logs_20250310000000_bad.corrupt"]
+
+
+class TestSubmit:
+    """버퍼 용량 백프레셔"""
+
+    def test_rejects_whole_request_when_full(self, tmp_path):
+        service = LocationIngestService(max_queue_size=3, batch_size=10, spill_dir=str(tmp_path))
+        assert service.submit(_logs(2))
+        assert not service.submit(_logs(2))
+        assert service.submit(_logs(1))
+        stats = service.get_stats()
+        assert (stats["queued"], stats["accepted"], stats["rejected"]) == (3, 3, 2)
@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+
+from app.services.location_partition_service import (
+    LocationLogPartitionService,
+    LogPartition,
+    from_days,
+    month_start,
+    partition_name,
+    to_days,
+)
+
+
+def _monthly(*months):
+    """월 파티션 목록 + pmax (months는 각 파티션의 상한 날짜)"""
+    return [LogPartition(partition_name(month_start(upper, -1)), upper, 0) for upper in months] + [
+        LogPartition("pmax", None, 0)
+    ]
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+
+    def commit(self):
+        self.commits += 1
+
+
+class TestBoundMath:
+    """MySQL TO_DAYS 호환 날짜 계산"""
+
+    def test_to_days_matches_mysql(self):
+        # MySQL 문서 예: TO_DAYS('2007-10-07') = 733321, TO_DAYS('1995-05-01') = 728779
+        assert to_days(date(2007, 10, 7)) == 733321
+        assert to_days(date(1995, 5, 1)) == 728779
+        assert from_days(733321) == date(2007, 10, 7)
+
+    def test_month_start(self):
+        assert month_start(date(2025, 1, 31)) == date(2025, 1, 1)
+        assert month_start(date(2025, 11, 15), 2) == date(2026, 1, 1)
+        assert month_start(date(2025, 1, 15), -1) == date(2024, 12, 1)
+        assert month_start(date(2025, 3, 1), -14) == date(2024, 1, 1)
+
+
+class TestEnsureFuturePartitions:
+    """pmax를 나눠 월 파티션 미리 생성"""
+
+    def _service(self, monkeypatch, partitions, months_ahead=2):
+        service = LocationLogPartitionService(months_ahead=months_ahead)
+        monkeypatch.setattr(service, "get_partitions", lambda db: partitions)
+        return service
+
+    def test_creates_missing_months(self, monkeypatch):
+        service = self._service(monkeypatch, _monthly(date(2025, 10, 1), date(2025, 11, 1)))
+        db = FakeSession()
+
+        names = service.ensure_future_partitions(db, today=date(2025, 10, 20))
+
+        # 이번 달(10월) + 2개월 뒤(12월)까지
+        assert names == ["p202511", "p202512"]
+        assert db.commits == 1
+        ddl = db.statements[0]
+        assert "REORGANIZE PARTITION pmax INTO" in ddl
+        assert f"PARTITION p202511 VALUES LESS THAN ({to_days(date(2025, 12, 1))})" in ddl
+        assert f"PARTITION p202512 VALUES LESS THAN ({to_days(date(2026, 1, 1))})" in ddl
+        assert ddl.rstrip().endswith("PARTITION pmax VALUES LESS THAN MAXVALUE)")
+
+    def test_nothing_to_create(self, monkeypatch):
+        service = self._service(monkeypatch, _monthly(date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1)))
+        db = FakeSession()
+        assert service.ensure_future_partitions(db, today=date(2025, 10, 20)) == []
+        assert db.statements == []
+
+    def test_dry_run_and_unpartitioned(self, monkeypatch):
+        db = FakeSession()
+        service = self._service(monkeypatch, _monthly(date(2025, 10, 1)))
+        assert service.ensure_future_partitions(db, today=date(2025, 10, 20), dry_run=True) == [
+            "p202510", "p202511", "p202512"
+        ]
+        assert db.statements == []
+
+        # 파티션되지 않은 테이블(pmax 없음)은 건너뜀
+        service = self._service(monkeypatch, [])
+        assert service.ensure_future_partitions(db, today=date(2025, 10, 20)) == []
+
+
+class TestExpiredPartitions:
+    """보관 기간이 지난 파티션 선택"""
+
+    @pytest.fixture
+    def partitions(self):
+        return _monthly(date(2025, 1, 1), date(2025, 2, 1), date(2025, 3, 1), date(2025, 4, 1))
+
+    def test_retention_months(self, partitions):
+        service = LocationLogPartitionService(retention_months=12)
+        # 2026-02-15 기준 12개월 보관 -> 2025-02-01 미만 로그만 있는 파티션
+        expired = service.expired_partitions(partitions, date(2026, 2, 15))
+        assert [partition.name for partition in expired] == ["p202412", "p202501"]
+        assert service.retention_cutoff(date(2026, 2, 15)) == date(2025, 2, 1)
+
+    def test_disabled_retention_and_pmax_kept(self, partitions):
+        assert LocationLogPartitionService(retention_months=0).expired_partitions(partitions, date(2030, 1, 1)) == []
+        expired = LocationLogPartitionService(retention_months=1).expired_partitions(partitions, date(2030, 1, 1))
+        assert "pmax" not in [partition.name for partition in expired]
+        assert len(expired) == 4
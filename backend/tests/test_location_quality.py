@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.location_quality import (
+    QUALITY_CLEAN,
+    QUALITY_LOW_ACCURACY,
+    QUALITY_NO_FIX,
+    QUALITY_SPEED_JUMP,
+    FixState,
+    LocationQualityFilter
+)
+
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+def _fix(second, lat, lng, accuracy=10.0, mt_idx=1):
+    return SimpleNamespace(
+        mt_idx=mt_idx, mlt_lat=lat, mlt_long=lng, mlt_accuacy=accuracy,
+        mlt_gps_time=T0 + timedelta(seconds=second)
+    )
+
+
+class TestLocationQualityFilter:
+    """수집 시 GPS 품질 판정"""
+
+    @pytest.fixture
+    def quality_filter(self):
+        return LocationQualityFilter(max_accuracy=100.0, max_speed_kmh=250.0, max_rejects=3)
+
+    def test_first_fix_is_clean(self, quality_filter):
+        result, state = quality_filter._judge(None, _fix(0, 37.5, 127.0))
+        assert result.quality == QUALITY_CLEAN
+        assert state == FixState(T0, 37.5, 127.0, 100.0)
+
+    def test_no_fix(self, quality_filter):
+        for lat, lng in ((None, 127.0), (37.5, None), (0, 0)):
+            result, state = quality_filter._judge(None, _fix(0, lat, lng))
+            assert result.quality == QUALITY_NO_FIX
+            assert state is None
+
+    def test_low_accuracy_keeps_state(self, quality_filter):
+        previous = FixState(T0, 37.5, 127.0, 100.0)
+        for accuracy in (None, 150.0):
+            result, state = quality_filter._judge(previous, _fix(30, 37.5, 127.0, accuracy))
+            assert result.quality == QUALITY_LOW_ACCURACY
+            assert state is previous
+
+    def test_speed_gate(self, quality_filter):
+        previous = FixState(T0, 37.5, 127.0, 100.0)
+        # 30초에 약 11km (1300km/h) → 튐, 기준 위치 유지
+        result, state = quality_filter._judge(previous, _fix(30, 37.6, 127.0))
+        assert result.quality == QUALITY_SPEED_JUMP
+        assert (state.lat, state.lng, state.rejects) == (37.5, 127.0, 1)
+        # 30초에 약 110m (13km/h) → 정상
+        result, state = quality_filter._judge(previous, _fix(30, 37.501, 127.0))
+        assert result.quality == QUALITY_CLEAN
+        assert state.lat == 37.501
+
+    def test_accuracy_radius_allows_jitter(self, quality_filter):
+        """1초 간격이라도 두 위치의 오차 반경 안의 흔들림은 튐이 아님"""
+        previous = FixState(T0, 37.5, 127.0, 50.0 ** 2)
+        result, _ = quality_filter._judge(previous, _fix(1, 37.5008, 127.0, 50.0))
+        assert result.quality == QUALITY_CLEAN
+
+    def test_restarts_after_max_rejects(self, quality_filter):
+        fixes = [_fix(0, 37.5, 127.0)] + [_fix(second, 35.1, 129.0) for second in (30, 60, 90, 120)]
+        results, states = quality_filter.classify(None, fixes)
+        assert [result.quality for result in results] == [
+            QUALITY_CLEAN, QUALITY_SPEED_JUMP, QUALITY_SPEED_JUMP, QUALITY_SPEED_JUMP, QUALITY_CLEAN
+        ]
+        assert states[1].lat == 35.1
+
+    def test_classify_orders_by_gps_time(self, quality_filter):
+        """배치 안에서 순서가 뒤섞여도 회원별 GPS 시간순으로 판정하고 결과는 입력 순서로 반환"""
+        fixes = [_fix(60, 37.502, 127.0), _fix(0, 37.5, 127.0), _fix(30, 37.501, 127.0), _fix(0, 37.3, 127.2, mt_idx=2)]
+        results, states = quality_filter.classify(None, fixes)
+        assert [result.quality for result in results] == [QUALITY_CLEAN] * 4
+        assert states[1].gps_time == T0 + timedelta(seconds=60)
+        assert states[2].lat == 37.3
+
+    def test_late_fix_keeps_state(self, quality_filter):
+        previous = FixState(T0 + timedelta(seconds=60), 37.5, 127.0, 100.0)
+        result, state = quality_filter._judge(previous, _fix(30, 37.5001, 127.0))
+        assert result.quality == QUALITY_CLEAN
+        assert state is previous
+
+    def test_commit_keeps_newer_state(self, quality_filter):
+        newer = FixState(T0 + timedelta(seconds=60), 37.5, 127.0, 100.0)
+        quality_filter.commit({1: newer})
+        quality_filter.commit({1: FixState(T0, 37.4, 127.0, 100.0)})
+        assert quality_filter._seed(None, [1]) == {1: newer}
+
+    def test_smoothing_moves_toward_fix(self):
+        quality_filter = LocationQualityFilter(smoothing=True, process_noise=1.0)
+        previous = FixState(T0, 37.5, 127.0, 10.0 ** 2)
+        result, state = quality_filter._judge(previous, _fix(10, 37.5002, 127.0, 10.0))
+        assert result.quality == QUALITY_CLEAN
+        assert 37.5 < result.lat < 37.5002
+        assert state.variance < 10.0 ** 2 + 10.0
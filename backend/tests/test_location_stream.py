@@ -0,0 +1,39 @@
+import asyncio
+
+from app.services.location_stream import LocationSubscription
+
+
+def _delta(mt_idx, gps_time):
+    return {"mt_idx": mt_idx, "mlt_lat": 37.5, "mlt_long": 127.0, "mlt_speed": None, "mlt_battery": None,
+            "mlt_gps_time": gps_time}
+
+
+class TestLocationSubscription:
+    """실시간 위치 구독의 스냅샷 기준 설정"""
+
+    def test_seed_drops_older_pending_and_later_stale(self):
+        async def scenario():
+            subscription = LocationSubscription(1, [10, 20])
+            # 구독 후 스냅샷 조회 전에 도착한 위치
+            subscription._push(_delta(10, "2025-03-10 08:00:00"))
+            subscription._push(_delta(20, "2025-03-10 08:05:00"))
+            subscription.seed([
+                {"mt_idx": 10, "mlt_gps_time": "2025-03-10 08:01:00"},
+                {"mt_idx": 20, "mlt_gps_time": "2025-03-10 08:02:00"},
+                {"mt_idx": 30, "mlt_gps_time": None},
+            ])
+            # 스냅샷보다 과거 위치는 전송하지 않음
+            subscription._push(_delta(10, "2025-03-10 08:00:30"))
+            return await subscription.next_batch(0.01)
+
+        batch = asyncio.run(scenario())
+        assert [(delta["mt_idx"], delta["mlt_gps_time"]) for delta in batch] == [(20, "2025-03-10 08:05:00")]
+
+    def test_seed_clears_event_when_nothing_pending(self):
+        async def scenario():
+            subscription = LocationSubscription(1, [10])
+            subscription._push(_delta(10, "2025-03-10 08:00:00"))
+            subscription.seed([{"mt_idx": 10, "mlt_gps_time": "2025-03-10 08:00:00"}])
+            return await subscription.next_batch(0.01)
+
+        assert asyncio.run(scenario()) == []
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from app.services import push_fanout as push_fanout_module
+from app.services.push_fanout import PushFanout, RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.sleep이 가짜 monotonic 시계를 진행시키는 시계 (rate는 대기 시간이 정확히 표현되는 2의 거듭제곱 사용)"""
+    now = {"value": 100.0, "slept": 0.0}
+
+    def sleep(seconds):
+        now["value"] += seconds
+        now["slept"] += seconds
+
+    monkeypatch.setattr(push_fanout_module.time, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(push_fanout_module.time, "sleep", sleep)
+    return now
+
+
+class TestRateLimiter:
+    """토큰 버킷 초당 호출 제한"""
+
+    def test_burst_then_rate(self, clock):
+        limiter = RateLimiter(rate=8)
+        # 버킷 용량(rate)만큼은 바로 통과
+        for _ in range(8):
+            limiter.acquire()
+        assert clock["slept"] == 0
+
+        # 이후에는 초당 8건
+        for _ in range(16):
+            limiter.acquire()
+        assert clock["slept"] == pytest.approx(2.0)
+
+    def test_refill_capped_at_capacity(self, clock):
+        limiter = RateLimiter(rate=4, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        # 오래 쉬어도 버킷 용량 이상 쌓이지 않음
+        clock["value"] += 60
+        for _ in range(3):
+            limiter.acquire()
+        assert clock["slept"] == pytest.approx(0.25)
+
+    def test_no_limit(self, clock):
+        limiter = RateLimiter(rate=0)
+        for _ in range(1000):
+            limiter.acquire()
+        assert clock["slept"] == 0
+
+
+class TestPushFanout:
+    """단계별 일괄 전송 집계"""
+
+    def test_success_and_fail(self):
+        sent = []
+        lock = threading.Lock()
+
+        def send(item):
+            if item % 3 == 0:
+                raise RuntimeError("fcm error")
+            with lock:
+                sent.append(item)
+
+        stats = PushFanout(concurrency=4).run([("priority", [1, 2, 3]), ("normal", list(range(4, 10)))], send)
+
+        assert stats == {
+            "priority": {"total": 3, "success": 2, "fail": 1, "skipped": 0},
+            "normal": {"total": 6, "success": 4, "fail": 2, "skipped": 0},
+        }
+        assert sorted(sent) == [1, 2, 4, 5, 7, 8]
+
+    def test_deadline_skips_remaining_items_and_tiers(self, clock, monkeypatch):
+        # 전송 1건을 제출할 때마다 1초가 지나는 것으로 가정
+        monkeypatch.setattr(RateLimiter, "acquire", lambda self: clock.__setitem__("value", clock["value"] + 1))
+        sent = []
+        lock = threading.Lock()
+
+        def send(item):
+            with lock:
+                sent.append(item)
+
+        stats = PushFanout(concurrency=1, max_duration=2.5).run(
+            [("priority", ["p1", "p2"]), ("normal", ["n1", "n2", "n3"]), ("last", ["l1"])], send
+        )
+
+        # 0초, 1초, 2초에 제출한 3건만 전송하고 2.5초 이후 대상은 skipped
+        assert sent == ["p1", "p2", "n1"]
+        assert stats == {
+            "priority": {"total": 2, "success": 2, "fail": 0, "skipped": 0},
+            "normal": {"total": 3, "success": 1, "fail": 0, "skipped": 2},
+            "last": {"total": 1, "success": 0, "fail": 0, "skipped": 1},
+        }
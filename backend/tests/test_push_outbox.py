@@ -0,0 +1,150 @@
+import importlib
+import sys
+import types
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.push_outbox import PushOutbox
+
+
+class TestProcessBatch:
+    """outbox 행 상태 전이 (pending → pending(백오프) / sent / dead)"""
+
+    @pytest.fixture
+    def env(self, monkeypatch):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        PushOutbox.__table__.create(engine)
+        Session = sessionmaker(bind=engine)
+        state = {"results": [], "logs": [], "sent": [], "Session": Session}
+
+        def send(pushes, batch_size):
+            state["sent"].append([push["pot_idx"] for push in pushes])
+            results = state["results"].pop(0)
+            if isinstance(results, Exception):
+                raise results
+            return results
+
+        # FCM 전송은 가짜 firebase_service로 대체
+        firebase = types.ModuleType("app.services.firebase_service")
+        firebase.firebase_service = types.SimpleNamespace(send_push_notifications_batch=send)
+        monkeypatch.setitem(sys.modules, "app.services.firebase_service", firebase)
+        for name in ("app.services.push_service", "app.services.push_outbox_service"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        outbox_module = importlib.import_module("app.services.push_outbox_service")
+
+        monkeypatch.setattr(outbox_module, "SessionLocal", Session)
+        monkeypatch.setattr(outbox_module, "push_logs_add", lambda db, logs: state["logs"].extend(logs))
+        state["service"] = lambda: outbox_module.PushOutboxService(
+            batch_size=10, max_attempts=3, retry_base=30, retry_max=3600, claim_timeout=300
+        )
+        yield state
+        engine.dispose()
+
+    def _add(self, env, **values):
+        db = env["Session"]()
+        row = PushOutbox(
+            mt_idx=1, pot_token="token", pot_title="제목", pot_content="내용",
+            pot_status="pending", pot_attempts=0, pot_next_attempt_at=datetime.now() - timedelta(seconds=1),
+            **values
+        )
+        db.add(row)
+        db.commit()
+        pot_idx = row.pot_idx
+        db.close()
+        return pot_idx
+
+    def _row(self, env, pot_idx):
+        db = env["Session"]()
+        row = db.get(PushOutbox, pot_idx)
+        db.close()
+        return row
+
+    def _make_due(self, env, pot_idx):
+        db = env["Session"]()
+        row = db.get(PushOutbox, pot_idx)
+        row.pot_next_attempt_at = datetime.now() - timedelta(seconds=1)
+        row.pot_claimed_at = row.pot_claimed_at and row.pot_claimed_at - timedelta(seconds=301)
+        db.commit()
+        db.close()
+
+    def test_sent(self, env):
+        pot_idx = self._add(env)
+        env["results"].append([{"result": True, "msg": "ok"}])
+
+        assert env["service"]().process_batch() == 1
+        row = self._row(env, pot_idx)
+        assert (row.pot_status, row.pot_attempts, row.pot_claimed_at) == ("sent", 1, None)
+        assert row.pot_sdate is not None
+        assert [log["plt_status"] for log in env["logs"]] == [2]
+
+    def test_retryable_error_backs_off_then_dead(self, env):
+        pot_idx = self._add(env)
+        service = env["service"]()
+
+        env["results"].append([{"result": False, "msg": "unavailable", "retryable": True}])
+        before = datetime.now()
+        service.process_batch()
+        row = self._row(env, pot_idx)
+        assert (row.pot_status, row.pot_attempts) == ("pending", 1)
+        assert row.pot_next_attempt_at >= before + timedelta(seconds=30)
+        assert env["logs"] == []
+
+        # 백오프 시각 전에는 가져가지 않음
+        assert service.process_batch() == 0
+
+        self._make_due(env, pot_idx)
+        env["results"].append([{"result": False, "msg": "unavailable", "retryable": True}])
+        before = datetime.now()
+        service.process_batch()
+        row = self._row(env, pot_idx)
+        assert (row.pot_status, row.pot_attempts) == ("pending", 2)
+        assert row.pot_next_attempt_at >= before + timedelta(seconds=60)
+
+        # max_attempts번째 실패는 dead
+        self._make_due(env, pot_idx)
+        env["results"].append([{"result": False, "msg": "unavailable", "retryable": True}])
+        service.process_batch()
+        row = self._row(env, pot_idx)
+        assert (row.pot_status, row.pot_attempts) == ("dead", 3)
+        assert [log["plt_status"] for log in env["logs"]] == [4]
+        assert service.get_stats()["retried"] == 2
+
+    def test_non_retryable_error_is_dead(self, env):
+        pot_idx = self._add(env)
+        env["results"].append([{"result": False, "msg": "invalid token", "retryable": False}])
+
+        env["service"]().process_batch()
+        row = self._row(env, pot_idx)
+        assert (row.pot_status, row.pot_attempts, row.pot_last_error) == ("dead", 1, "invalid token")
+
+    def test_poison_message_dead_after_max_attempts(self, env):
+        # 전송 중 워커가 중단되는 행: 매번 claim_timeout 뒤 다시 가져가지만 시도 횟수는 가져갈 때 올라감
+        pot_idx = self._add(env)
+        other_idx = self._add(env)
+        service = env["service"]()
+
+        for attempt in range(1, 4):
+            env["results"].append(RuntimeError("worker crashed"))
+            with pytest.raises(RuntimeError):
+                service.process_batch()
+            row = self._row(env, pot_idx)
+            assert (row.pot_status, row.pot_attempts) == ("sending", attempt)
+            # claim_timeout 전에는 다른 워커도 가져가지 않음
+            assert service.process_batch() == 0
+            self._make_due(env, pot_idx)
+            self._make_due(env, other_idx)
+
+        assert env["sent"] == [[pot_idx, other_idx]] * 3
+        assert service.process_batch() == 2
+        for idx in (pot_idx, other_idx):
+            row = self._row(env, idx)
+            assert (row.pot_status, row.pot_attempts, row.pot_claimed_at) == ("dead", 3, None)
+        assert len(env["sent"]) == 3
+        assert [log["plt_status"] for log in env["logs"]] == [4, 4]
+        assert service.get_stats()["dead"] == 2
@@ -0,0 +1,225 @@
+import importlib
+import sys
+import types
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core import leader_election as leader_election_module
+from app.core import scheduler as scheduler_module
+from app.core.leader_election import LeaderElection
+from app.models.member import Member
+from app.models.member_location_daily_summary import MemberLocationDailySummary
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+        self.rolled_back = 0
+
+    def rollback(self):
+        self.rolled_back += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestLeaderElection:
+    """DB 임대 기반 리더 선출 상태 전이"""
+
+    @pytest.fixture
+    def lease(self, monkeypatch):
+        state = {"owner": None, "error": None}
+
+        def try_acquire(db, name, owner, ttl):
+            if state["error"]:
+                raise state["error"]
+            if state["owner"] in (None, owner):
+                state["owner"] = owner
+            return state["owner"] == owner
+
+        monkeypatch.setattr(leader_election_module, "SessionLocal", FakeSession)
+        monkeypatch.setattr(leader_election_module.SchedulerLease, "try_acquire", staticmethod(try_acquire))
+        return state
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = {"value": 1000.0}
+        monkeypatch.setattr(leader_election_module.time, "monotonic", lambda: now["value"])
+        return now
+
+    def _election(self, calls):
+        return LeaderElection(
+            "test", ttl=30, safety_margin=5,
+            on_elected=lambda: calls.append("elected"),
+            on_revoked=lambda: calls.append("revoked")
+        )
+
+    def test_single_leader(self, lease, clock):
+        calls = []
+        first, second = self._election(calls), self._election([])
+        first._renew()
+        second._renew()
+        assert first.is_leader() and not second.is_leader()
+
+        # 갱신을 반복해도 선출 콜백은 한 번만 호출
+        first._renew()
+        assert calls == ["elected"]
+
+    def test_renew_error_keeps_leader_until_local_deadline(self, lease, clock):
+        calls = []
+        election = self._election(calls)
+        election._renew()
+
+        lease["error"] = RuntimeError("db down")
+        clock["value"] += 20
+        election._renew()
+        assert election.is_leader()
+
+        # ttl - safety_margin(25초)이 지나면 다른 워커가 임대를 가져가기 전에 스스로 물러남
+        clock["value"] += 6
+        assert not election.is_leader()
+        election._renew()
+        assert calls == ["elected", "revoked"]
+        assert election.get_stats()["renew_errors"] == 2
+
+    def test_lease_taken_by_other_worker(self, lease, clock):
+        calls = []
+        election = self._election(calls)
+        election._renew()
+        lease["owner"] = "other"
+        election._renew()
+        assert not election.is_leader()
+        assert calls == ["elected", "revoked"]
+
+
+class TestRunJob:
+    """작업 실행마다 DB 세션을 열고 닫음"""
+
+    @pytest.fixture
+    def sessions(self, monkeypatch):
+        opened = []
+
+        def session_factory():
+            opened.append(FakeSession())
+            return opened[-1]
+
+        monkeypatch.setattr(scheduler_module, "SessionLocal", session_factory)
+        return opened
+
+    def test_job_gets_own_session(self, monkeypatch, sessions):
+        seen = []
+        monkeypatch.setattr(scheduler_module.scheduler, "is_active", lambda: True)
+        monkeypatch.setattr(scheduler_module.scheduler, "probe_job", lambda: seen.append(scheduler_module.scheduler.db), raising=False)
+
+        scheduler_module.run_job("probe_job")
+        scheduler_module.run_job("probe_job")
+
+        assert seen == sessions and len(sessions) == 2
+        assert all(session.closed for session in sessions)
+        with pytest.raises(RuntimeError):
+            scheduler_module.scheduler.db
+
+    def test_session_closed_when_job_fails(self, monkeypatch, sessions):
+        def failing_job():
+            raise ValueError("boom")
+
+        monkeypatch.setattr(scheduler_module.scheduler, "is_active", lambda: True)
+        monkeypatch.setattr(scheduler_module.scheduler, "probe_job", failing_job, raising=False)
+        with pytest.raises(ValueError):
+            scheduler_module.run_job("probe_job")
+        assert sessions[0].closed
+
+    def test_not_leader_skips_without_session(self, monkeypatch, sessions):
+        monkeypatch.setattr(scheduler_module.scheduler, "is_active", lambda: False)
+        scheduler_module.run_job("background_task")
+        assert sessions == []
+
+
+class TestScheduleAllJobs:
+    """작업 등록"""
+
+    def test_registers_runnable_jobs_and_removes_stale(self, monkeypatch):
+        from apscheduler.jobstores.memory import MemoryJobStore
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        background = BackgroundScheduler(jobstores={'default': MemoryJobStore()})
+        background.start(paused=True)
+        try:
+            monkeypatch.setattr(scheduler_module.scheduler, "scheduler", background)
+            background.add_job(scheduler_module.run_job, IntervalTrigger(minutes=1), args=["schedule_notification"], id="schedule_notification")
+
+            scheduler_module.scheduler._schedule_all_jobs()
+            job_ids = {job.id for job in background.get_jobs()}
+            assert "schedule_notification" not in job_ids
+            assert {
+                "background_task", "location_entry_alert_schedule", "my_location_geofence_alert_schedule",
+                "send_daily_log_notifications", "trigger_app_execution_at_7_30pm", "notify_low_battery_at_9pm"
+            } <= job_ids
+            for job in background.get_jobs():
+                assert callable(getattr(scheduler_module.scheduler, job.args[0]))
+        finally:
+            background.shutdown(wait=False)
+
+
+class TestBroadcastJobs:
+    """전체 회원 대상 알림 작업"""
+
+    @pytest.fixture
+    def env(self, monkeypatch):
+        # FCM 전송은 가짜 firebase_service로 대체 (outbox 등록만 확인)
+        firebase = types.ModuleType("app.services.firebase_service")
+        firebase.firebase_service = types.SimpleNamespace()
+        monkeypatch.setitem(sys.modules, "app.services.firebase_service", firebase)
+        monkeypatch.delitem(sys.modules, "app.services.push_service", raising=False)
+        push_service = importlib.import_module("app.services.push_service")
+
+        engine = create_engine("sqlite://")
+        MemberLocationDailySummary.__table__.create(engine)
+        db = Session(engine)
+        state = {"db": db, "pushes": [], "members": []}
+        monkeypatch.setattr(push_service, "enqueue_pushes", lambda db, pushes: state["pushes"].extend(pushes))
+        monkeypatch.setattr(Member, "get_all_active", classmethod(lambda cls, db: state["members"]))
+        scheduler_module.scheduler._local.db = db
+        yield state
+        scheduler_module.scheduler._local.db = None
+        db.close()
+        engine.dispose()
+
+    def _member(self, mt_idx, lang):
+        return types.SimpleNamespace(mt_idx=mt_idx, mt_lang=lang, mt_token_id=f"token-{mt_idx}")
+
+    def test_daily_log_uses_today_summary(self, env):
+        env["members"] = [self._member(1, "en"), self._member(2, None), self._member(3, "ko")]
+        today = date.today()
+        env["db"].add_all([
+            MemberLocationDailySummary(mt_idx=1, mlds_date=today, mlds_moving_meters=1234.5),
+            MemberLocationDailySummary(mt_idx=2, mlds_date=today, mlds_moving_meters=10.0),
+            MemberLocationDailySummary(mt_idx=3, mlds_date=today - timedelta(days=1), mlds_moving_meters=500.0),
+        ])
+        env["db"].commit()
+
+        scheduler_module.scheduler.send_daily_log_notifications()
+
+        assert [(push["mt_idx"], push["plt_content"]) for push in env["pushes"]] == [
+            (1, "You moved 1,234.5m today!"),
+            # 언어가 없으면 한국어
+            (2, "오늘 총 10.0m를 이동했어요!"),
+        ]
+        assert env["pushes"][0]["token_id"] == "token-1"
+
+    def test_app_execution_and_battery_fall_back_to_korean(self, env):
+        env["members"] = [self._member(1, "en"), self._member(2, "ja")]
+
+        scheduler_module.scheduler.trigger_app_execution_at_7_30pm()
+        scheduler_module.scheduler.notify_low_battery_at_9pm()
+
+        assert [(push["mt_idx"], push["plt_title"]) for push in env["pushes"]] == [
+            (1, "How was your day? 🌙"),
+            (2, "오늘 하루는 어떠셨나요? 🌙"),
+            (1, "Low Battery Alert 🔋"),
+            (2, "배터리 부족 알림 🔋"),
+        ]
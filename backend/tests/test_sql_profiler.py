@@ -0,0 +1,20 @@
+from app.core.sql_profiler import normalize_statement
+
+
+class TestNormalizeStatement:
+    """요청 단위 SQL 프로파일러 쿼리 정규화"""
+
+    def test_literals_replaced(self):
+        statement = "SELECT * FROM member_t WHERE mt_idx = 12 AND mt_name = 'kim' AND mt_lat > 37.5"
+        assert normalize_statement(statement) == "SELECT * FROM member_t WHERE mt_idx = ? AND mt_name = ? AND mt_lat > ?"
+
+    def test_in_list_length_ignored(self):
+        short = normalize_statement("SELECT * FROM member_t WHERE mt_idx IN (%s, %s)")
+        long = normalize_statement("SELECT * FROM member_t WHERE mt_idx IN (%s, %s, %s, %s)")
+        assert short == long == "SELECT * FROM member_t WHERE mt_idx IN (...)"
+
+    def test_whitespace_collapsed(self):
+        assert normalize_statement("SELECT 1\n   FROM   dual ") == "SELECT ? FROM dual"
+
+    def test_identifiers_with_digits_kept(self):
+        assert normalize_statement("SELECT p202501.mt_idx FROM t1") == "SELECT p202501.mt_idx FROM t1"
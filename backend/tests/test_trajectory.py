@@ -0,0 +1,209 @@
+import math
+from datetime import datetime, timedelta
+from itertools import groupby
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.trajectory import segment_stays, simplify_track
+from app.crud import member_location_log as location_log_crud
+from app.models.member_location_log import MemberLocationLog
+
+DAY = "2025-03-10"
+T0 = datetime(2025, 3, 10, 8, 0, 0)
+
+
+def _fixture_day():
+    """
+    (초, 속도, 정확도, 위도, 경도) 하루치 로그
+
+    - 3분 체류(최소 체류시간 미달), 12분 체류, 정확도가 낮은 로그가 끼어 있는 체류,
+      속도 없는 로그(이동으로 분류), 1건짜리 체류 구간을 포함
+    """
+    fixes = []
+    lat, lng = 37.5665, 126.9780
+    second = 0
+
+    def add(speed, accuracy, count, step_sec=30, move_deg=0.0):
+        nonlocal lat, lng, second
+        for _ in range(count):
+            fixes.append((second, speed, accuracy, lat, lng))
+            second += step_sec
+            lat += move_deg
+            lng += move_deg
+
+    add(5.0, 10.0, 4, move_deg=0.0005)     # 이동
+    add(0.2, 10.0, 7)                       # 3분 체류 (미달)
+    add(4.0, 10.0, 3, move_deg=0.0004)     # 이동
+    add(0.5, 12.0, 25, move_deg=0.00001)   # 12분 체류
+    add(None, 20.0, 2, move_deg=0.0003)    # 속도 없음 → 이동
+    add(0.1, 8.0, 5)                        # 체류 앞부분
+    add(0.1, 80.0, 2)                       # 정확도 낮음 (max_accuracy=50에서 제외)
+    add(0.1, 8.0, 10)                       # 체류 뒷부분 (제외 로그를 건너 한 구간으로 이어짐)
+    add(6.0, 10.0, 2, move_deg=0.0005)     # 이동
+    add(0.3, 10.0, 1)                       # 1건짜리 체류 구간 (시작/종료가 없어 제외)
+    add(6.0, 10.0, 3, move_deg=0.0005)     # 이동
+    return fixes
+
+
+def _cte_stay_times(fixes, min_speed, max_accuracy, min_duration):
+    """기존 get_member_stay_times 윈도우 함수 CTE를 그대로 옮긴 기준 구현"""
+    rows = sorted(
+        (fix for fix in fixes if fix[2] is not None and fix[2] < max_accuracy),
+        key=lambda fix: fix[0]
+    )
+    labeled = []
+    grp = 0
+    prev = None
+    for second, speed, _, lat, lng in rows:
+        # NULL < :min_speed 는 NULL이므로 ELSE 'move'
+        label = 'stay' if speed is not None and speed < min_speed else 'move'
+        if prev is not None and label != prev["label"]:
+            grp += 1
+        labeled.append({
+            "second": second, "label": label, "grp": grp, "lat": lat, "lng": lng,
+            "prev_lat": prev["lat"] if prev else None, "prev_lng": prev["lng"] if prev else None
+        })
+        prev = labeled[-1]
+
+    results = []
+    for grp, members in groupby(labeled, key=lambda row: row["grp"]):
+        members = list(members)
+        # 시작(S) 1건 + 종료(E) 1건 이상: 로그가 2건 이상인 구간
+        if len(members) < 2:
+            continue
+        distance = 0.0
+        for row in members:
+            if row["prev_lat"] is not None:
+                cos_value = (
+                    math.cos(math.radians(row["lat"])) * math.cos(math.radians(row["prev_lat"]))
+                    * math.cos(math.radians(row["prev_lng"]) - math.radians(row["lng"]))
+                    + math.sin(math.radians(row["lat"])) * math.sin(math.radians(row["prev_lat"]))
+                )
+                distance += 6371 * math.acos(max(-1.0, min(1.0, cos_value)))
+        # MySQL TIMESTAMPDIFF(SECOND) / 60 → 소수점 4자리
+        duration = round((members[-1]["second"] - members[0]["second"]) / 60, 4)
+        if duration >= min_duration and members[0]["label"] == 'stay':
+            results.append({
+                "grp": grp,
+                "start_time": (T0 + timedelta(seconds=members[0]["second"])).strftime('%Y-%m-%d %H:%M:%S'),
+                "end_time": (T0 + timedelta(seconds=members[-1]["second"])).strftime('%Y-%m-%d %H:%M:%S'),
+                "duration": duration,
+                "distance": distance,
+                "start_lat": members[0]["lat"],
+                "start_long": members[0]["lng"]
+            })
+    return results
+
+
+def _segment(fixes, min_speed, max_accuracy, min_duration):
+    rows = [fix for fix in fixes if fix[2] is not None and fix[2] < max_accuracy]
+    return segment_stays(
+        [T0 + timedelta(seconds=fix[0]) for fix in rows],
+        [fix[1] for fix in rows],
+        [fix[3] for fix in rows],
+        [fix[4] for fix in rows],
+        min_speed=min_speed,
+        min_duration=min_duration
+    )
+
+
+def _assert_same_stays(actual, expected):
+    assert len(actual) == len(expected)
+    for stay, reference in zip(actual, expected):
+        assert stay["label"] == 'stay'
+        assert stay["grp"] == reference["grp"]
+        assert stay["start_time"] == reference["start_time"]
+        assert stay["end_time"] == reference["end_time"]
+        assert stay["duration"] == reference["duration"]
+        # CTE는 구면 코사인 법칙(ACOS)이라 짧은 거리에서 오차가 있으므로 10cm까지 허용
+        assert stay["distance"] == pytest.approx(reference["distance"], abs=1e-4)
+        assert stay["start_lat"] == pytest.approx(reference["start_lat"])
+        assert stay["start_long"] == pytest.approx(reference["start_long"])
+
+
+class TestSegmentStays:
+    """segment_stays와 기존 체류시간 CTE 결과 비교"""
+
+    @pytest.mark.parametrize("min_speed, max_accuracy, min_duration", [
+        (1.0, 50.0, 5),    # 기본값
+        (1.0, 50.0, 3),    # 3분 체류 포함
+        (1.0, 100.0, 5),   # 정확도 낮은 로그 포함
+        (0.4, 50.0, 5),    # 0.5m/s 로그가 이동으로 분류
+        (1.0, 15.0, 5),    # 정확도 기준이 엄격하여 대부분 제외
+    ])
+    def test_matches_cte(self, min_speed, max_accuracy, min_duration):
+        fixes = _fixture_day()
+        expected = _cte_stay_times(fixes, min_speed, max_accuracy, min_duration)
+        _assert_same_stays(_segment(fixes, min_speed, max_accuracy, min_duration), expected)
+
+    def test_fixture_covers_cutoffs(self):
+        """기본값에서 3분 체류와 1건짜리 체류는 빠지고, 정확도 낮은 로그를 건너 이어진 체류는 한 구간으로 집계"""
+        stays = _segment(_fixture_day(), 1.0, 50.0, 5)
+        assert [stay["duration"] for stay in stays] == [12.0, 8.0]
+
+    def test_too_few_fixes(self):
+        assert segment_stays([T0], [0.0], [37.5], [127.0]) == []
+
+    def test_exact_min_duration_included(self):
+        times = [T0 + timedelta(minutes=minute) for minute in range(6)]
+        stays = segment_stays(times, [0.0] * 6, [37.5] * 6, [127.0] * 6, min_duration=5)
+        assert len(stays) == 1 and stays[0]["duration"] == 5.0
+
+
+class TestMemberStayTimes:
+    """get_member_stay_times: DB에서 정확도 조건으로 읽은 결과가 CTE와 같은지 확인"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        MemberLocationLog.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_matches_cte(self, db):
+        fixes = _fixture_day()
+        db.add_all([
+            MemberLocationLog(
+                mt_idx=1, mlt_gps_time=T0 + timedelta(seconds=second), mlt_speed=speed,
+                mlt_accuacy=accuracy, mlt_lat=lat, mlt_long=lng
+            )
+            for second, speed, accuracy, lat, lng in fixes
+        ])
+        # 다른 회원/다른 날짜 로그는 제외
+        db.add(MemberLocationLog(mt_idx=2, mlt_gps_time=T0, mlt_speed=0.0, mlt_accuacy=5.0, mlt_lat=37.5, mlt_long=127.0))
+        db.add(MemberLocationLog(mt_idx=1, mlt_gps_time=T0 + timedelta(days=1), mlt_speed=0.0, mlt_accuacy=5.0, mlt_lat=37.5, mlt_long=127.0))
+        db.commit()
+
+        stays = location_log_crud.get_member_stay_times(db, 1, DAY)
+        _assert_same_stays(stays, _cte_stay_times(fixes, 1.0, 50.0, 5))
+
+
+class TestSimplifyTrack:
+    """경로 단순화 (Douglas–Peucker)"""
+
+    def test_straight_line_keeps_endpoints(self):
+        lats = np.linspace(37.50, 37.51, 50)
+        longs = np.linspace(127.00, 127.01, 50)
+        assert simplify_track(lats, longs, 1.0).tolist() == [0, 49]
+
+    def test_corner_is_kept(self):
+        lats = [37.50, 37.501, 37.502, 37.502, 37.502]
+        longs = [127.00, 127.00, 127.00, 127.001, 127.002]
+        assert simplify_track(lats, longs, 1.0).tolist() == [0, 2, 4]
+
+    def test_max_points(self):
+        rng = np.random.default_rng(0)
+        lats = 37.5 + np.cumsum(rng.normal(0, 0.0005, 300))
+        longs = 127.0 + np.cumsum(rng.normal(0, 0.0005, 300))
+        indices = simplify_track(lats, longs, 0.0, max_points=20)
+        assert len(indices) == 20
+        assert indices[0] == 0 and indices[-1] == 299
+        assert np.all(np.diff(indices) > 0)
+
+    def test_short_tracks(self):
+        assert simplify_track([], [], 5.0).tolist() == []
+        assert simplify_track([37.5, 37.6], [127.0, 127.1], 5.0).tolist() == [0, 1]